@@ -0,0 +1,115 @@
+"""
+Нагрузочная проверка одновременной записи ibases.v8i несколькими процессами.
+
+Каждый процесс-писатель, как отдельный экземпляр лончера, загружает список баз
+один раз и затем в цикле:
+    - меняет поле VersionFallbacks "своей" базы (значение с номером итерации);
+    - добавляет новую базу с уникальным ID;
+    - сохраняет через IbasesStore (блокировка + проверка версии + слияние).
+Список в памяти писателя устаревает после чужих записей — именно этот случай
+и должен закрывать трехсторонний merge.
+
+В конце проверяется, что ни одно изменение не потеряно: все добавленные базы
+на месте, у каждой "своей" базы — значение последней итерации.
+
+Запуск:
+    python benchmarks/concurrency_stress.py [--writers 8] [--iterations 25] [--bases 500]
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from generators import write_synthetic_ibases  # noqa: E402
+
+
+def writer(path, index, iterations, seed, results):
+    from models.database import Database1C
+    from services.base_reader import BaseReader
+    from services.ibases_store import IbasesStore
+    from services.tree_snapshot import stat_key
+
+    rng = random.Random(seed + index)
+    store = IbasesStore(path)
+    stat = stat_key(store.path)
+    bases = BaseReader(store.path).read_bases()
+    store.mark_loaded(bases, stat)
+    own = sorted(bases, key=lambda b: b.id)[index]
+
+    merges = conflicts = 0
+    for i in range(iterations):
+        own.version_fallbacks = f"w{index}-{i}"
+        bases.append(Database1C(
+            id=f"stress-{index}-{i}", name=f"Писатель {index} #{i}",
+            folder=f"/Нагрузка/{index}", connect=f'File="C:\\stress\\{index}\\{i}";',
+        ))
+        result = store.save(bases)
+        if result.merged is not None:
+            merges += 1
+            conflicts += len(result.conflicts)
+            bases = result.merged
+        time.sleep(rng.uniform(0, 0.005))
+    results.put((index, own.id, merges, conflicts))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--iterations', type=int, default=25)
+    parser.add_argument('--bases', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    from services.base_reader import BaseReader
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ibases = write_synthetic_ibases(Path(tmp), max(args.bases, args.writers))
+        results = multiprocessing.Queue()
+        started = time.perf_counter()
+        workers = [
+            multiprocessing.Process(target=writer, args=(ibases, i, args.iterations, args.seed, results))
+            for i in range(args.writers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        if any(worker.exitcode for worker in workers):
+            print("❌ Писатель завершился с ошибкой")
+            return 1
+
+        reports = [results.get() for _ in workers]
+        final = {base.id: base for base in BaseReader(ibases).read_bases()}
+
+    lost = []
+    for index, own_id, _, _ in reports:
+        expected = f"w{index}-{args.iterations - 1}"
+        if final.get(own_id) is None or final[own_id].version_fallbacks != expected:
+            lost.append(f"правка писателя {index}")
+        for i in range(args.iterations):
+            if f"stress-{index}-{i}" not in final:
+                lost.append(f"база stress-{index}-{i}")
+
+    writes = args.writers * args.iterations
+    merges = sum(report[2] for report in reports)
+    conflicts = sum(report[3] for report in reports)
+    print(f"Записей: {writes} за {elapsed:.2f} с ({writes / elapsed:.0f}/с), "
+          f"со слиянием: {merges}, конфликтов: {conflicts}, баз в итоге: {len(final)}")
+    if lost:
+        print(f"❌ Потеряно изменений: {len(lost)} (например: {', '.join(lost[:5])})")
+        return 1
+    print("✅ Потерянных изменений нет")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
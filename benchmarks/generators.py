@@ -0,0 +1,223 @@
+"""
+Синтетические данные для бенчмарков.
+
+- ibases.v8i: N баз, глубина папок D, доля недавних R (детерминированно по seed);
+- таблица процессов: клиенты 1С по части баз, отслеживаемые приложения и "шум";
+- список окон: главные окна процессов, дочерние и скрытые окна;
+- FakeBackend (services.backends) с этими процессами и окнами.
+
+Генераторы не зависят от кода лончера (кроме модели Database1C),
+чтобы бенчмарк разбора не измерял сам себя.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+CONFIGS = ['Бухгалтерия', 'ЗУП', 'УТ', 'ERP', 'Документооборот', 'Розница', 'КА', 'УНФ']
+CLIENTS = ['Ромашка', 'Василек', 'Стройторг', 'Агрохолдинг', 'Печерица', 'Север', 'Транзит', 'Меридиан']
+VERSIONS = ['8.3.24.1500', '8.3.25.1374', '8.3.23.2040']
+NOISE_PROCESSES = ['svchost.exe', 'explorer.exe', 'chrome.exe', 'RuntimeBroker.exe', 'conhost.exe', 'dllhost.exe']
+TRACKED_PROCESSES = ['Code.exe', 'TOTALCMD.EXE', 'WindowsTerminal.exe', 'msedge.exe']
+
+
+@dataclass
+class SyntheticBase:
+    """Параметры базы для записи в ibases.v8i"""
+    id: str
+    name: str
+    folder: str
+    connect: str
+    version: str
+    is_recent: bool
+    last_run_time: datetime = None
+    order_in_tree: int = 0
+
+
+@dataclass
+class FakeProcess:
+    """Строка таблицы процессов"""
+    pid: int
+    name: str
+    cmdline: List[str]
+
+
+@dataclass
+class FakeWindow:
+    """Окно верхнего уровня"""
+    hwnd: int
+    pid: int
+    title: str
+    visible: bool = True
+    parent: int = 0
+
+
+# Опорное время для LastRunTime: фиксированное, чтобы файлы совпадали между прогонами
+REFERENCE_TIME = datetime(2026, 1, 15, 12, 0, 0)
+
+
+def generate_bases(count: int, depth: int = 3, recent_ratio: float = 0.05, seed: int = 1,
+                   now: datetime = REFERENCE_TIME) -> List[SyntheticBase]:
+    """
+    Генерирует описания баз
+
+    Args:
+        count: Количество баз
+        depth: Глубина папок (0 — все в корне)
+        recent_ratio: Доля баз с IsRecent=1
+        seed: Зерно генератора
+        now: Опорное время для LastRunTime
+    """
+    rnd = random.Random(seed)
+    bases = []
+    for i in range(count):
+        config = rnd.choice(CONFIGS)
+        client = rnd.choice(CLIENTS)
+        levels = [client, config] + [f"Группа {rnd.randint(0, 9)}" for _ in range(max(0, depth - 2))]
+        folder = '/' + '/'.join(levels[:depth]) if depth else '/'
+        if rnd.random() < 0.8:
+            connect = f'Srvr="srv-1c-{i % 9}:1541";Ref="{config}_{client}_{i}";'
+        else:
+            connect = f'File="D:\\Bases\\{client}\\{config}_{i}";'
+        recent = rnd.random() < recent_ratio
+        last_run = now - timedelta(minutes=rnd.randint(1, 60 * 24 * 90)) if recent or rnd.random() < 0.2 else None
+        bases.append(SyntheticBase(
+            id=str(uuid.UUID(int=rnd.getrandbits(128))),
+            name=f"{config} {client} {i:05d}",
+            folder=folder,
+            connect=connect,
+            version=rnd.choice(VERSIONS),
+            is_recent=recent,
+            last_run_time=last_run,
+            order_in_tree=i,
+        ))
+    return bases
+
+
+def render_ibases(bases: List[SyntheticBase]) -> str:
+    """Текст ibases.v8i для списка баз"""
+    lines = []
+    for base in bases:
+        lines += [
+            f"[{base.name}]",
+            f"ID={base.id}",
+            f"Connect={base.connect}",
+            f"Folder={base.folder}",
+            f"OrderInList={base.order_in_tree}",
+            f"OrderInTree={base.order_in_tree}",
+            "External=0",
+            "ClientConnectionSpeed=Normal",
+            "App=Auto",
+            "WA=1",
+            f"Version={base.version}",
+            "DefaultApp=ThickClient",
+        ]
+        if base.is_recent:
+            lines.append("IsRecent=1")
+        if base.last_run_time:
+            lines.append(f"LastRunTime={base.last_run_time.isoformat()}")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def write_ibases(path: Path, count: int, depth: int = 3, recent_ratio: float = 0.05, seed: int = 1) -> Path:
+    """Записывает синтетический ibases.v8i и возвращает путь к нему"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_ibases(generate_bases(count, depth, recent_ratio, seed)), encoding='utf-8-sig')
+    return path
+
+
+def write_synthetic_ibases(profile_dir: Path, count: int, depth: int = 2, recent_ratio: float = 0.0) -> Path:
+    """Создает ibases.v8i в профиле пользователя profile_dir (см. config.IBASES_PATH)"""
+    path = Path(profile_dir) / 'AppData' / 'Roaming' / '1C' / '1CEStart' / 'ibases.v8i'
+    return write_ibases(path, count, depth, recent_ratio)
+
+
+def make_database_objects(count: int, depth: int = 3, recent_ratio: float = 0.05, seed: int = 1,
+                          now: datetime = REFERENCE_TIME):
+    """Те же базы сразу объектами Database1C (без разбора файла)"""
+    from models.database import Database1C
+
+    return [
+        Database1C(
+            id=base.id,
+            name=base.name,
+            folder=base.folder,
+            connect=base.connect,
+            version=base.version,
+            is_recent=base.is_recent,
+            last_run_time=base.last_run_time,
+            order_in_tree=base.order_in_tree,
+        )
+        for base in generate_bases(count, depth, recent_ratio, seed, now)
+    ]
+
+
+def make_process_table(bases: List[SyntheticBase], open_count: int = 20, noise: int = 250,
+                       seed: int = 1) -> List[FakeProcess]:
+    """
+    Таблица процессов: open_count клиентов 1С по случайным базам,
+    отслеживаемые приложения и noise посторонних процессов
+    """
+    rnd = random.Random(seed)
+    processes = []
+    pid = 1000
+    for base in rnd.sample(bases, min(open_count, len(bases))):
+        pid += 4
+        exe = '1cv8c.exe' if rnd.random() < 0.5 else '1cv8.exe'
+        mode = 'DESIGNER' if exe == '1cv8.exe' and rnd.random() < 0.3 else 'ENTERPRISE'
+        processes.append(FakeProcess(pid, exe, [f"C:\\Program Files\\1cv8\\{base.version}\\bin\\{exe}",
+                                                mode, f'/S"{base.connect}"']))
+    for name in TRACKED_PROCESSES:
+        pid += 4
+        processes.append(FakeProcess(pid, name, [name]))
+    for _ in range(noise):
+        pid += 4
+        name = rnd.choice(NOISE_PROCESSES)
+        processes.append(FakeProcess(pid, name, [name]))
+    return processes
+
+
+def make_fake_backend(processes: List[FakeProcess], windows: List[FakeWindow]):
+    """Бэкенд процессов в памяти с заданными процессами и окнами"""
+    from services.backends import FakeBackend
+
+    backend = FakeBackend()
+    for proc in processes:
+        backend.add_process(proc.pid, proc.name, proc.cmdline)
+    for window in windows:
+        backend.add_window(window.hwnd, window.pid, window.title, window.visible, window.parent)
+    return backend
+
+
+def make_window_list(processes: List[FakeProcess], bases: List[SyntheticBase] = None,
+                     hidden_per_process: int = 3, seed: int = 1) -> List[FakeWindow]:
+    """
+    Окна верхнего уровня: главное окно у каждого процесса с UI,
+    плюс скрытые и дочерние окна (их сканирование должно пропускать)
+    """
+    rnd = random.Random(seed)
+    names_by_connect = {base.connect: base.name for base in bases or []}
+    windows = []
+    hwnd = 0x10000
+    for proc in processes:
+        if proc.name in NOISE_PROCESSES and rnd.random() < 0.7:
+            # Большинство фоновых процессов окон не имеют
+            continue
+        hwnd += 2
+        title = proc.name
+        if proc.name.startswith('1cv8'):
+            connect = proc.cmdline[-1][3:-1] if len(proc.cmdline) > 2 else ''
+            title = names_by_connect.get(connect, '1С:Предприятие')
+            if 'DESIGNER' in proc.cmdline:
+                title = f"Конфигуратор - {title}"
+        main_hwnd = hwnd
+        windows.append(FakeWindow(main_hwnd, proc.pid, title))
+        for _ in range(hidden_per_process):
+            hwnd += 2
+            windows.append(FakeWindow(hwnd, proc.pid, '', visible=rnd.random() < 0.2, parent=main_hwnd))
+    return windows
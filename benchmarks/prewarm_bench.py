@@ -0,0 +1,143 @@
+"""
+Холодный старт клиента 1С с прогревом и без (services/prewarm.py).
+
+Вместо платформы — заглушка: каталог bin из случайных "DLL" и кэш базы в
+%LOCALAPPDATA%\\1C\\1cv8\\<ID>. "Клиент" — отдельный процесс, который читает
+все эти файлы, как загрузчик при старте, и сообщает свои чтения с диска
+(read_bytes из /proc/self/io, иначе ru_inblock).
+
+    cold   — файлы вытеснены из страничного кэша, клиент стартует сразу
+    warm   — файлы вытеснены, затем Prewarmer.warm_files (как при курсоре на базе)
+
+Вытеснение — posix_fadvise(DONTNEED), поэтому замер только для Linux/Unix.
+Каталог должен быть на диске (не tmpfs), иначе чтений с диска не будет в обоих случаях.
+
+Запуск:
+    python benchmarks/prewarm_bench.py [--dlls 120] [--mb 240] [--cache-mb 40]
+                                       [--rate 512] [--repeat 3] [--dir /var/tmp]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+# Заглушка клиента: читает файлы и печатает собственные чтения с диска
+CLIENT = r'''
+import json, resource, sys, time
+started = time.perf_counter()
+for path in sys.argv[1:]:
+    with open(path, 'rb') as f:
+        while f.read(1 << 20):
+            pass
+seconds = time.perf_counter() - started
+try:
+    with open('/proc/self/io') as f:
+        io = dict(line.split(': ') for line in f.read().splitlines())
+    read_bytes = int(io['read_bytes'])
+except OSError:
+    read_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_inblock * 512
+print(json.dumps({'seconds': seconds, 'read_bytes': read_bytes}))
+'''
+
+
+def write_random(path: Path, size: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        while size > 0:
+            chunk = min(size, 1 << 20)
+            f.write(os.urandom(chunk))
+            size -= chunk
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def make_stub(root: Path, dlls: int, total_mb: int, cache_mb: int):
+    """Платформа-заглушка и кэш базы. Returns: (исполняемый файл, база)"""
+    from models.database import Database1C
+
+    bin_dir = root / 'platform' / '8.3.99.1' / 'bin'
+    executable = bin_dir / '1cv8.exe'
+    per_dll = total_mb * (1 << 20) // (dlls + 1)
+    write_random(executable, per_dll)
+    for i in range(dlls):
+        write_random(bin_dir / f'lib{i:03}.dll', per_dll)
+
+    database = Database1C(id='prewarm-bench-0000', name='Заглушка', folder='/', connect='File="C:\\stub";')
+    os.environ['LOCALAPPDATA'] = str(root / 'Local')
+    os.environ['APPDATA'] = str(root / 'Roaming')
+    cache_dir = root / 'Local' / '1C' / '1cv8' / database.id
+    for i in range(20):
+        write_random(cache_dir / f'{i:02}' / f'cache{i:02}.bin', cache_mb * (1 << 20) // 20)
+    return executable, database
+
+
+def evict(files):
+    for path in files:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def run_client(files):
+    proc = subprocess.run([sys.executable, '-c', CLIENT, *map(str, files)],
+                          capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--dlls', type=int, default=120)
+    parser.add_argument('--mb', type=int, default=240, help='объем каталога bin, МБ')
+    parser.add_argument('--cache-mb', type=int, default=40, help='объем кэша базы, МБ')
+    parser.add_argument('--rate', type=float, default=512, help='бюджет прогрева, МБ/с')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--dir', default=None, help='каталог на диске для заглушки')
+    args = parser.parse_args()
+
+    if not hasattr(os, 'posix_fadvise'):
+        sys.exit('Нужен posix_fadvise (Linux/Unix): без него файлы не вытеснить из кэша')
+
+    from services.prewarm import MB, Prewarmer, prewarm_targets
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        executable, database = make_stub(Path(tmp), args.dlls, args.mb, args.cache_mb)
+        files = prewarm_targets(executable, database)
+        total = sum(path.stat().st_size for path in files)
+        print(f"Заглушка: файлов {len(files)}, {total / MB:.0f} МБ ({tmp})")
+
+        cold, warm, prewarm = [], [], []
+        for _ in range(args.repeat):
+            evict(files)
+            cold.append(run_client(files))
+
+            evict(files)
+            prewarmer = Prewarmer(rate_mb=args.rate, max_mb=total / MB + 1)
+            prewarm.append(prewarmer.warm_files(prewarm_targets(executable, database), database.id))
+            warm.append(run_client(files))
+
+    def row(title, runs):
+        seconds = statistics.median(run['seconds'] for run in runs) * 1000
+        read_mb = statistics.median(run['read_bytes'] for run in runs) / MB
+        print(f"{title:<28} {seconds:>10.1f} мс {read_mb:>10.1f} МБ с диска")
+
+    print(f"{'':<28} {'старт':>13} {'чтения':>21}")
+    row('cold (без прогрева)', cold)
+    row('warm (после прогрева)', warm)
+    prewarm_seconds = statistics.median(r.seconds for r in prewarm)
+    prewarm_mb = statistics.median(r.bytes_read for r in prewarm) / MB
+    print(f"прогрев: {prewarm_seconds * 1000:.1f} мс, прочитано {prewarm_mb:.0f} МБ "
+          f"при бюджете {args.rate:.0f} МБ/с")
+
+
+if __name__ == '__main__':
+    main()
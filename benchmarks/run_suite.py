@@ -0,0 +1,216 @@
+"""
+Набор бенчмарков горячих путей лончера. Работает без дисплея (offscreen Qt) и на Linux.
+
+Кейсы:
+    read_bases        — BaseReader.read_bases на синтетическом ibases.v8i
+    save_bases        — BaseWriter.write_bases (то, что делает save_bases окна)
+    build_tree        — TreeBuilder.build_tree в QStandardItemModel
+    scan_processes    — ProcessManager.get_running_processes (FakeBackend с процессами/окнами генератора)
+    scan_main_apps    — ProcessManager.get_running_main_processes
+    launch_command    — resolve + build_launch_command для всех баз
+
+Результат пишется в JSON (--json), чтобы регрессии были видны между версиями;
+--compare печатает изменение медиан относительно прошлого результата.
+
+Запуск:
+    python benchmarks/run_suite.py [--bases 5000] [--depth 3] [--recent 0.05]
+                                   [--repeat 7] [--only build_tree,read_bases]
+                                   [--json result.json] [--compare old.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import generators  # noqa: E402
+
+# Регрессия: медиана выросла больше чем на столько процентов
+REGRESSION_THRESHOLD = 10.0
+
+
+def timed(func, repeat):
+    """Медиана, минимум и максимум (мс) по repeat запускам после одного прогревочного"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'max_ms': round(max(timings), 3),
+    }
+
+
+def git_revision():
+    try:
+        proc = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, timeout=10)
+        return proc.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# --------------------------------------------------------------------------- #
+#  Кейсы: каждый получает контекст и возвращает функцию для замера             #
+# --------------------------------------------------------------------------- #
+
+def case_read_bases(ctx):
+    from services.base_reader import BaseReader
+    return lambda: BaseReader(ctx['ibases']).read_bases()
+
+
+def case_save_bases(ctx):
+    from services.base_writer import BaseWriter
+    writer = BaseWriter(ctx['tmp'] / 'ibases_out.v8i', 'utf-8-sig')
+    return lambda: writer.write_bases(ctx['bases'])
+
+
+def case_build_tree(ctx):
+    from PySide6.QtGui import QStandardItemModel
+    from gui.tree.tree_builder import TreeBuilder
+    ctx['qt_app']()
+    model = QStandardItemModel()
+    builder = TreeBuilder(model)
+    return lambda: builder.build_tree(ctx['bases'])
+
+
+def case_scan_processes(ctx):
+    from services.process_manager import ProcessManager
+    return ProcessManager.get_running_processes
+
+
+def case_scan_main_apps(ctx):
+    from services.process_manager import ProcessManager
+    return ProcessManager.get_running_main_processes
+
+
+def case_launch_command(ctx):
+    from services.launch_command import build_launch_command
+    executable = Path(r"C:\Program Files\1cv8\8.3.25.1374\bin\1cv8.exe")
+    bases = ctx['bases']
+
+    def run():
+        for base in bases:
+            build_launch_command(executable, 'ENTERPRISE', base)
+    return run
+
+
+CASES = {
+    'read_bases': case_read_bases,
+    'save_bases': case_save_bases,
+    'build_tree': case_build_tree,
+    'scan_processes': case_scan_processes,
+    'scan_main_apps': case_scan_main_apps,
+    'launch_command': case_launch_command,
+}
+
+
+def run_suite(args):
+    only = set(args.only.split(',')) if args.only else set(CASES)
+    unknown = only - set(CASES)
+    if unknown:
+        raise SystemExit(f"Неизвестные кейсы: {', '.join(sorted(unknown))}")
+
+    qt = {}
+
+    def qt_app():
+        if 'app' not in qt:
+            from PySide6.QtWidgets import QApplication
+            qt['app'] = QApplication.instance() or QApplication(sys.argv[:1])
+        return qt['app']
+
+    synthetic = generators.generate_bases(args.bases, args.depth, args.recent, args.seed)
+    processes = generators.make_process_table(synthetic, args.open, seed=args.seed)
+    windows = generators.make_window_list(processes, synthetic, seed=args.seed)
+    from services.backends import set_backend
+    set_backend(generators.make_fake_backend(processes, windows))
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        ibases = generators.write_ibases(tmp / 'ibases.v8i', args.bases, args.depth, args.recent, args.seed)
+        from services.base_reader import BaseReader
+        ctx = {
+            'tmp': tmp,
+            'ibases': ibases,
+            'bases': BaseReader(ibases).read_bases(),
+            'qt_app': qt_app,
+        }
+        for name, factory in CASES.items():
+            if name in only:
+                results[name] = timed(factory(ctx), args.repeat)
+                print(f"{name:16} медиана {results[name]['median_ms']:9.2f} мс  "
+                      f"(мин {results[name]['min_ms']:.2f}, макс {results[name]['max_ms']:.2f})")
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'params': {
+                'bases': args.bases, 'depth': args.depth, 'recent': args.recent,
+                'open': args.open, 'repeat': args.repeat, 'seed': args.seed,
+            },
+        },
+        'results': results,
+    }
+
+
+def compare(current, previous_path: Path):
+    previous = json.loads(previous_path.read_text(encoding='utf-8'))
+    if previous.get('meta', {}).get('params') != current['meta']['params']:
+        print("⚠️ Параметры прогонов различаются — сравнение ориентировочное")
+    print(f"\nСравнение с {previous_path.name} ({previous['meta'].get('revision')}):")
+    regressions = 0
+    for name, result in current['results'].items():
+        old = previous.get('results', {}).get(name)
+        if not old:
+            continue
+        delta = (result['median_ms'] - old['median_ms']) / old['median_ms'] * 100 if old['median_ms'] else 0.0
+        mark = "❌" if delta > REGRESSION_THRESHOLD else "✅"
+        regressions += delta > REGRESSION_THRESHOLD
+        print(f"{mark} {name:16} {old['median_ms']:9.2f} -> {result['median_ms']:9.2f} мс ({delta:+.1f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bases', type=int, default=5000)
+    parser.add_argument('--depth', type=int, default=3, help='глубина папок')
+    parser.add_argument('--recent', type=float, default=0.05, help='доля недавних баз')
+    parser.add_argument('--open', type=int, default=20, help='запущенных клиентов 1С')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--only', help='кейсы через запятую: ' + ', '.join(CASES))
+    parser.add_argument('--json', type=Path, help='куда сохранить результат')
+    parser.add_argument('--compare', type=Path, help='прошлый результат для сравнения')
+    args = parser.parse_args()
+
+    result = run_suite(args)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"💾 {args.json}")
+    if args.compare:
+        if compare(result, args.compare):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Поиск по базам: построение индекса, инкрементальное обновление и время запроса.
+
+Бюджет — одно нажатие клавиши: топ-50 за < 5 мс на 10 000 баз.
+
+Запуск:
+    python benchmarks/search_bench.py [--bases 10000] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from generators import make_database_objects  # noqa: E402
+from services.search_index import SearchIndex  # noqa: E402
+
+QUERIES = [
+    'бух', 'зуп печер', 'erp', 'бухгалтерия ромашка', 'бугалтерия',  # опечатка
+    'стройторг 0202', 'ут', 'документооборот север', 'ут_ромашка_1234', '8.3.24', 'мер',
+]
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bases', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    bases = make_database_objects(args.bases, now=datetime.now())
+    index = SearchIndex()
+    build_ms, _ = timed(lambda: index.sync(bases))
+    print(f"Баз: {args.bases}")
+    print(f"Построение индекса: {build_ms:.1f} мс")
+
+    unchanged_ms, _ = timed(lambda: index.sync(bases))
+    print(f"sync без изменений: {unchanged_ms:.1f} мс")
+
+    for base in bases[:20]:
+        base.name += " изм"
+    changed_ms, changed = timed(lambda: index.sync(bases))
+    print(f"sync с {changed} измененными базами: {changed_ms:.1f} мс")
+
+    print(f"\n{'запрос':28} {'найдено':>8} {'медиана, мс':>12} {'макс, мс':>9}")
+    worst = 0.0
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            elapsed, results = timed(lambda: index.search(query))
+            timings.append(elapsed)
+        worst = max(worst, max(timings))
+        print(f"{query:28} {len(results):>8} {statistics.median(timings):>12.2f} {max(timings):>9.2f}")
+        if query == QUERIES[0]:
+            top = ', '.join(base.name for base, _ in results[:3])
+            print(f"{'':28} топ: {top}")
+
+    print(f"\nХудший запрос: {worst:.2f} мс (бюджет 5 мс)")
+
+
+if __name__ == '__main__':
+    main()
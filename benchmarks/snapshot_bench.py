@@ -0,0 +1,82 @@
+"""
+Холодный и теплый старт дерева баз: полный разбор ibases.v8i против снимка дерева.
+
+    cold — BaseReader.read_bases + TreeBuilder.build_tree
+    warm — TreeSnapshotStore.load + TreeBuilder.build_tree
+
+Запуск:
+    python benchmarks/snapshot_bench.py [--bases 3000] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from generators import write_synthetic_ibases  # noqa: E402
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bases', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QStandardItemModel
+    from services.base_reader import BaseReader
+    from services.tree_snapshot import TreeSnapshot, TreeSnapshotStore, stat_key
+    from gui.tree.tree_builder import TreeBuilder
+
+    app = QApplication(sys.argv[:1])  # noqa: F841
+    model = QStandardItemModel()
+    builder = TreeBuilder(model)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ibases = write_synthetic_ibases(Path(tmp), args.bases)
+        store = TreeSnapshotStore(Path(tmp) / 'tree_snapshot.bin', ibases)
+
+        bases = BaseReader(ibases).read_bases()
+        store.save(TreeSnapshot(bases=bases, expanded_folders=[bases[0].folder.strip('/')]), stat_key(ibases))
+        snapshot_size = store.snapshot_path.stat().st_size
+        ibases_size = ibases.stat().st_size
+
+        def cold():
+            builder.build_tree(BaseReader(ibases).read_bases())
+
+        def warm():
+            snapshot = store.load()
+            assert snapshot is not None, "снимок должен быть актуален"
+            builder.build_tree(snapshot.bases)
+
+        parse_best, parse_median = best_of(lambda: BaseReader(ibases).read_bases(), args.repeat)
+        load_best, load_median = best_of(store.load, args.repeat)
+        cold_best, cold_median = best_of(cold, args.repeat)
+        warm_best, warm_median = best_of(warm, args.repeat)
+
+    print(f"Баз: {args.bases}, размер снимка: {snapshot_size / 1024:.1f} КБ (ibases.v8i: {ibases_size / 1024:.1f} КБ)")
+    print(f"разбор ibases.v8i:       лучший {parse_best:7.1f} мс, медиана {parse_median:7.1f} мс")
+    print(f"загрузка снимка:         лучший {load_best:7.1f} мс, медиана {load_median:7.1f} мс")
+    print(f"cold (разбор + дерево):  лучший {cold_best:7.1f} мс, медиана {cold_median:7.1f} мс")
+    print(f"warm (снимок + дерево):  лучший {warm_best:7.1f} мс, медиана {warm_median:7.1f} мс")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Замер холодного старта лончера.
+
+Снимает:
+- профиль импорта `python -X importtime -c "import gui.tree_window"` (топ модулей по накопленному времени);
+- время до первой отрисовки окна (time-to-first-paint) и до загрузки дерева баз —
+  в отдельном процессе, от запуска интерпретатора, на синтетическом ibases.v8i.
+
+Запуск (работает и без дисплея, через offscreen-платформу Qt):
+    python benchmarks/startup_bench.py [--runs 5] [--bases 1000] [--json result.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / 'src'
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from generators import write_synthetic_ibases  # noqa: E402
+
+
+def _child_env(profile_dir: Path) -> dict:
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONPATH'] = str(SRC)
+    # IBASES_PATH строится от USERPROFILE — подменяем на временный профиль
+    env['USERPROFILE'] = str(profile_dir)
+    return env
+
+
+def measure_importtime(env: dict):
+    """Возвращает (общее время импорта, топ модулей) в миллисекундах."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import gui.tree_window'],
+        cwd=SRC, env=env, capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((name.rstrip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    # Модули верхнего уровня имеют отступ в один пробел
+    total = sum(row[2] for row in rows if not row[0].startswith('  '))
+    top = sorted(rows, key=lambda row: row[2], reverse=True)[:15]
+    return total, [{'module': name.strip(), 'self_ms': s, 'cumulative_ms': c} for name, s, c in top]
+
+
+def run_child():
+    """Дочерний процесс: печатает отметки времени первой отрисовки и загрузки баз."""
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent, QTimer
+
+    marks = {}
+    app = QApplication(sys.argv[:1])
+
+    from gui.tree_window import TreeWindow
+
+    class PaintWatcher(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint' not in marks:
+                marks['first_paint'] = time.time()
+            return False
+
+    window = TreeWindow()
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    window.show()
+
+    def load():
+        window.start_loading()
+        marks['bases_loaded'] = time.time()
+        QTimer.singleShot(100, app.quit)
+
+    QTimer.singleShot(0, load)
+    QTimer.singleShot(10000, app.quit)
+    app.exec()
+    print(json.dumps(marks))
+
+
+def measure_first_paint(env: dict, runs: int):
+    results = []
+    for _ in range(runs):
+        started = time.time()
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--child'],
+            cwd=SRC, env=env, capture_output=True, text=True,
+        )
+        marks = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append({key: (value - started) * 1000 for key, value in marks.items()})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--bases', type=int, default=1000)
+    parser.add_argument('--json', type=Path)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profile_dir = Path(tmp)
+        write_synthetic_ibases(profile_dir, args.bases)
+        env = _child_env(profile_dir)
+
+        import_total, import_top = measure_importtime(env)
+        paint_runs = measure_first_paint(env, args.runs)
+
+    first_paint = [run['first_paint'] for run in paint_runs if 'first_paint' in run]
+    loaded = [run['bases_loaded'] for run in paint_runs if 'bases_loaded' in run]
+    result = {
+        'bases': args.bases,
+        'runs': args.runs,
+        'import_gui_tree_window_ms': round(import_total, 1),
+        'import_top': import_top,
+        'first_paint_ms_median': round(statistics.median(first_paint), 1) if first_paint else None,
+        'bases_loaded_ms_median': round(statistics.median(loaded), 1) if loaded else None,
+    }
+
+    print(f"Импорт gui.tree_window: {result['import_gui_tree_window_ms']} мс")
+    for row in import_top:
+        print(f"  {row['cumulative_ms']:8.1f} мс  {row['module']}")
+    print(f"Первая отрисовка окна (медиана из {args.runs}): {result['first_paint_ms_median']} мс")
+    print(f"Дерево баз загружено ({args.bases} баз): {result['bases_loaded_ms_median']} мс")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
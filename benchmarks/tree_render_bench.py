@@ -0,0 +1,182 @@
+"""
+Отрисовка большого дерева баз (offscreen Qt): раскрытие всех папок и прокрутка.
+
+Режимы отличаются только настройками дерева, последовательность вызовов общая:
+    plain — QTreeView по умолчанию: строки разной высоты (sizeHint каждой строки),
+            прежний делегат (префикс форматируется при каждой отрисовке),
+            перерисовка не отключается
+    fast  — setUniformRowHeights, NumberPrefixDelegate (готовые префиксы),
+            раскрытие внутри suspended_updates
+
+Кейсы (мс):
+    build        — TreeBuilder.build_tree в модель, подключенную к видимому дереву
+                   (построитель общий для режимов — разница только от дерева)
+    expand_all   — для каждой папки setFirstColumnSpanned + expand, как в
+                   restore_expanded_folders/expand_and_select_initial, + отрисовка
+    scroll       — прокрутка сверху вниз по странице с синхронной отрисовкой каждой
+    resize_col   — ширина первой колонки по содержимому (sizeHint всех видимых строк)
+
+Запуск:
+    python benchmarks/tree_render_bench.py [--bases 10000] [--depth 3] [--repeat 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import generators  # noqa: E402
+
+# PySide6 6.12 на Python 3.11: каждый вызов void-метода из Python уменьшает счетчик
+# ссылок None. За прогон таких вызовов — сотни тысяч (построение, раскрытие, прокрутка),
+# счетчик доходит до нуля и интерпретатор падает (none_dealloc). Резерв ссылок
+# пополняется между кейсами, вне замеров.
+NONE_MARGIN = 1_000_000
+_none_reserve = []
+
+
+def keep_none_alive():
+    shortfall = NONE_MARGIN - sys.getrefcount(None)
+    if shortfall > 0:
+        _none_reserve.extend([None] * shortfall)
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+        keep_none_alive()
+    return statistics.median(timings)
+
+
+def iter_folders(model, parent=None):
+    from PySide6.QtCore import QModelIndex
+    parent = parent or QModelIndex()
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        # Строки баз без потомков — остальные папки
+        if model.hasChildren(index):
+            yield index
+            yield from iter_folders(model, index)
+
+
+def make_view(fast):
+    from PySide6.QtGui import QStandardItemModel
+    from PySide6.QtWidgets import QStyledItemDelegate, QTreeView
+    from gui.tree.number_prefix_delegate import NumberPrefixDelegate
+
+    class PlainPrefixDelegate(QStyledItemDelegate):
+        """Делегат до оптимизации: префикс форматируется при каждой отрисовке"""
+
+        def initStyleOption(self, option, index):
+            super().initStyleOption(option, index)
+            if index.column() != 0:
+                return
+            n = index.row() + 1
+            if 1 <= n <= 10:
+                key = 0 if n == 10 else n
+                option.text = f"{key}. {option.text}"
+
+    model = QStandardItemModel()
+    model.setHorizontalHeaderLabels(["Имя базы", "Connect", "Версия"])
+    view = QTreeView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(0, NumberPrefixDelegate(view) if fast else PlainPrefixDelegate(view))
+    view.setUniformRowHeights(fast)
+    view.resize(1100, 600)
+    view.show()
+    return model, view
+
+
+def run_mode(fast, bases, repeat, app):
+    from gui.tree.batch_updates import suspended_updates
+    from gui.tree.tree_builder import TreeBuilder
+
+    model, view = make_view(fast)
+    builder = TreeBuilder(model)
+    results = {}
+
+    results['build'] = measure(lambda: (builder.build_tree(bases), app.processEvents()), repeat)
+    rows = sum(1 for _ in generators_rows(model))
+
+    def expand_all():
+        view.collapseAll()
+        app.processEvents()
+        started = time.perf_counter()
+        folders = list(iter_folders(model))
+        with suspended_updates(view) if fast else nullcontext():
+            for index in folders:
+                view.setFirstColumnSpanned(index.row(), index.parent(), True)
+                view.expand(index)
+        view.viewport().repaint()
+        elapsed = (time.perf_counter() - started) * 1000
+        keep_none_alive()
+        return elapsed
+
+    results['expand_all'] = statistics.median(expand_all() for _ in range(repeat))
+
+    def scroll():
+        bar = view.verticalScrollBar()
+        bar.setValue(0)
+        value = 0
+        while value < bar.maximum():
+            value = min(bar.maximum(), value + bar.pageStep())
+            bar.setValue(value)
+            view.viewport().repaint()
+
+    results['scroll'] = measure(scroll, repeat)
+    results['resize_col'] = measure(lambda: view.resizeColumnToContents(0), repeat)
+    # Дерево и модель удаляются здесь, пока QApplication жив
+    view.close()
+    view.setModel(None)
+    view.deleteLater()
+    model.deleteLater()
+    app.processEvents()
+    keep_none_alive()
+    return rows, results
+
+
+def generators_rows(model, parent=None):
+    from PySide6.QtCore import QModelIndex
+    parent = parent or QModelIndex()
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        yield index
+        yield from generators_rows(model, index)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bases', type=int, default=10000)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    from PySide6.QtWidgets import QApplication
+    keep_none_alive()
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    bases = generators.make_database_objects(args.bases, args.depth)
+    report = {}
+    for title, fast in (('plain', False), ('fast', True)):
+        rows, report[title] = run_mode(fast, bases, args.repeat, app)
+    print(f"Баз: {args.bases}, строк в дереве: {rows}")
+
+    print(f"{'кейс':<12} {'plain, мс':>12} {'fast, мс':>12} {'ускорение':>10}")
+    for case in report['plain']:
+        plain, fast = report['plain'][case], report['fast'][case]
+        print(f"{case:<12} {plain:>12.1f} {fast:>12.1f} {plain / fast if fast else 0:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,6 @@
 import sys
 import os
-
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
-from gui.tree_window import TreeWindow
-from gui.theme import ThemeManager
+import argparse
 
 def get_icon_path():
     """Получить путь к иконке приложения (dev + PyInstaller)."""
@@ -17,9 +13,42 @@ def get_icon_path():
         base_path = os.path.dirname(os.path.abspath(__file__))
         # __file__ сейчас где-то внутри src (например src/main.py)
         return os.path.abspath(os.path.join(base_path, 'resources', 'app_icon.ico'))
-    
+
+def parse_args(argv):
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description="Лончер баз 1С")
+    parser.add_argument('--launch', metavar='ID', help="Запустить базу с указанным ID (Предприятие)")
+    parser.add_argument('--designer', metavar='ID', help="Открыть конфигуратор базы с указанным ID")
+    parser.add_argument('--no-single-instance', action='store_true',
+                        help="Не передавать команду запущенному экземпляру, стартовать отдельно")
+    return parser.parse_args(argv)
+
+def build_message(args):
+    """Команда для экземпляра лончера по аргументам командной строки."""
+    if args.designer:
+        return {"command": "launch", "id": args.designer, "mode": "DESIGNER"}
+    if args.launch:
+        return {"command": "launch", "id": args.launch, "mode": "ENTERPRISE"}
+    return {"command": "show"}
+
 def main():
-    app = QApplication(sys.argv)
+    args = parse_args(sys.argv[1:])
+    message = build_message(args)
+
+    # Если лончер уже запущен — передаем ему команду и выходим,
+    # не загружая QtWidgets и дерево баз
+    if not args.no_single_instance:
+        from gui.single_instance import send_to_running_instance
+        if send_to_running_instance(message):
+            return
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from PySide6.QtCore import QTimer
+    from gui.tree_window import TreeWindow
+    from gui.theme import ThemeManager
+
+    app = QApplication(sys.argv[:1])
     
     # Установка иконки приложения
     icon_path = get_icon_path()
@@ -30,8 +59,14 @@ def main():
     ThemeManager.apply_theme(app, dark=True)
     
     window = TreeWindow()
+    if not args.no_single_instance:
+        window.setup_single_instance()
     window.show()
+    # Данные подгружаются уже после первой отрисовки окна
+    QTimer.singleShot(0, window.start_loading)
+    if message["command"] == "launch":
+        window.handle_ipc_message(message)
     sys.exit(app.exec())
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,205 @@
+"""
+Консольный интерфейс лончера для скриптов и ночной автоматизации.
+
+Работает без Qt: использует только services (чтение ibases.v8i, формирование
+командной строки, операции конфигуратора). Результат всегда выводится в stdout
+одним JSON-документом, служебные сообщения сервисов — в stderr.
+
+Примеры:
+    python src/cli.py list --folder /Разработка
+    python src/cli.py stats --stale-days 180
+    python src/cli.py launch <ID> --mode DESIGNER
+    python src/cli.py launch-set Утро --stagger 2
+    python src/cli.py update-cfg <ID> <ID> --repository --jobs 2
+    python src/cli.py dump-cf <ID> --update
+    python src/cli.py clear-cache <ID>
+    python src/cli.py run-manifest nightly.json
+
+Формат манифеста:
+    {
+      "max_workers": 4,
+      "jobs": [
+        {"op": "repo-update-and-dump-cf", "id": "<ID>"},
+        {"op": "update-cfg", "ids": ["<ID>", "<ID>"]},
+        {"op": "launch", "id": "<ID>", "mode": "ENTERPRISE"},
+        {"op": "clear-cache", "id": "<ID>"}
+      ]
+    }
+
+Код возврата: 0 — все операции успешны, 1 — есть ошибки, 2 — ошибка аргументов.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+
+from config import IBASES_PATH, ENCODING, LAUNCH_SET_STAGGER_MS, BASE_STATS_STALE_DAYS
+from services.base_reader import BaseReader
+from services.launch_command import LAUNCH_MODES
+
+
+
+def base_to_dict(base):
+    """Описание базы для JSON (без паролей)."""
+    return {
+        'id': base.id,
+        'name': base.name,
+        'folder': base.folder,
+        'connect': base.connect,
+        'version': base.version,
+        'app_arch': base.app_arch,
+        'client_type': base.client_type,
+        'version_policy': base.version_policy,
+        'is_recent': base.is_recent,
+        'last_run_time': base.last_run_time.isoformat() if base.last_run_time else None,
+    }
+
+
+# ------------------------------------------------------------------ #
+#  Разбор аргументов                                                   #
+# ------------------------------------------------------------------ #
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='cli.py', description="Лончер баз 1С: консольный интерфейс")
+    parser.add_argument('--ibases', type=Path, default=IBASES_PATH, help="Путь к ibases.v8i")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Только сформировать команды, ничего не запускать")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help="Список баз")
+    list_parser.add_argument('--folder', help="Только базы папки (с вложенными)")
+    list_parser.add_argument('--recent', action='store_true', help="Только недавние базы")
+
+    stats_parser = subparsers.add_parser('stats', help="Статистика баз: версии, серверы, давние запуски")
+    stats_parser.add_argument('--stale-days', type=int, default=BASE_STATS_STALE_DAYS,
+                              help="Сколько дней без запуска считать давним")
+
+    launch_parser = subparsers.add_parser('launch', help="Запустить базу")
+    launch_parser.add_argument('ids', nargs='+', metavar='ID')
+    launch_parser.add_argument('--mode', choices=LAUNCH_MODES, default='ENTERPRISE')
+
+    set_parser = subparsers.add_parser('launch-set', help="Запустить набор баз (по очереди, с паузой)")
+    set_parser.add_argument('name', help="Имя набора (создается в окне лончера, F9)")
+    set_parser.add_argument('--stagger', type=float, default=LAUNCH_SET_STAGGER_MS / 1000,
+                            help="Пауза между запусками, сек")
+
+    update_parser = subparsers.add_parser('update-cfg', help="Обновить конфигурацию БД (/UpdateDBCfg)")
+    update_parser.add_argument('ids', nargs='+', metavar='ID')
+    update_parser.add_argument('--repository', action='store_true',
+                               help="Предварительно обновить конфигурацию из хранилища")
+    update_parser.add_argument('--jobs', type=int, default=None,
+                               help="Параллельных операций (по умолчанию 4)")
+
+    dump_parser = subparsers.add_parser('dump-cf', help="Выгрузить конфигурацию в CF (/DumpCfg)")
+    dump_parser.add_argument('ids', nargs='+', metavar='ID')
+    dump_group = dump_parser.add_mutually_exclusive_group()
+    dump_group.add_argument('--update', action='store_true', help="Предварительно выполнить /UpdateDBCfg")
+    dump_group.add_argument('--repository', action='store_true',
+                            help="Предварительно обновить конфигурацию из хранилища")
+    dump_parser.add_argument('--jobs', type=int, default=None,
+                             help="Параллельных операций (по умолчанию 4)")
+
+    cache_parser = subparsers.add_parser('clear-cache', help="Очистить кэш базы")
+    cache_parser.add_argument('ids', nargs='+', metavar='ID')
+
+    manifest_parser = subparsers.add_parser('run-manifest', help="Выполнить операции из JSON-манифеста")
+    manifest_parser.add_argument('manifest', type=Path)
+    manifest_parser.add_argument('--jobs', type=int, default=None,
+                                 help="Параллельных операций (по умолчанию max_workers манифеста)")
+
+    return parser
+
+
+def execute(args):
+    """Выполняет команду и возвращает JSON-совместимый результат."""
+    bases = BaseReader(args.ibases, ENCODING).read_bases()
+
+    if args.command == 'list':
+        selected = bases
+        if args.folder:
+            folder = '/' + args.folder.strip('/')
+            selected = [b for b in selected if b.folder == folder or b.folder.startswith(folder + '/')]
+        if args.recent:
+            selected = [b for b in selected if b.is_recent]
+        return {'success': True, 'bases': [base_to_dict(b) for b in selected]}
+
+    if args.command == 'stats':
+        from services.base_stats import BaseStats
+        stats = BaseStats()
+        stats.sync(bases)
+        old, never = stats.stale(args.stale_days)
+        return {
+            'success': True,
+            'bases': len(stats),
+            'groups': {
+                column: [{'key': g.key, 'count': g.count} for g in stats.group_counts(column)]
+                for column in BaseStats.COLUMNS
+            },
+            'stale': [base_to_dict(b) for b in old],
+            'never_launched': [b.id for b in never],
+        }
+
+    # Пакетные операции (пул потоков, subprocess, BAT-билдеры) нужны только здесь —
+    # "list" и "stats" обходятся без их импорта
+    from services import batch_operations as batch
+    from services import designer_jobs as designer
+
+    bases_by_id = {base.id: base for base in bases}
+    max_workers = getattr(args, 'jobs', None) or batch.DEFAULT_WORKERS
+
+    if args.command == 'launch-set':
+        from services.launch_sets import get_launch_set_store
+        store = get_launch_set_store()
+        launch_set = store.get(args.name)
+        if launch_set is None:
+            raise ValueError(f"Набор не найден: {args.name} (есть: {', '.join(store.names()) or 'нет наборов'})")
+        operations = [{'op': batch.OP_LAUNCH, 'id': i.base_id, 'mode': i.mode} for i in launch_set.items]
+        results = batch.run_staggered(operations, bases_by_id, args.stagger, args.dry_run)
+        return {'success': all(r['success'] for r in results), 'results': results}
+
+    if args.command == 'run-manifest':
+        manifest = json.loads(args.manifest.read_text(encoding='utf-8'))
+        operations = batch.expand_manifest(manifest)
+        max_workers = args.jobs or manifest.get('max_workers') or batch.DEFAULT_WORKERS
+    elif args.command == 'launch':
+        operations = [{'op': batch.OP_LAUNCH, 'id': i, 'mode': args.mode} for i in args.ids]
+    elif args.command == 'update-cfg':
+        action = designer.ACTION_REPO_UPDATE_CFG if args.repository else designer.ACTION_UPDATE_CFG
+        operations = [{'op': action, 'id': i} for i in args.ids]
+    elif args.command == 'dump-cf':
+        if args.repository:
+            action = designer.ACTION_REPO_UPDATE_AND_DUMP_CF
+        elif args.update:
+            action = designer.ACTION_UPDATE_AND_DUMP_CF
+        else:
+            action = designer.ACTION_DUMP_CF
+        operations = [{'op': action, 'id': i} for i in args.ids]
+    else:
+        operations = [{'op': batch.OP_CLEAR_CACHE, 'id': i} for i in args.ids]
+
+    results = batch.run_operations(operations, bases_by_id, max_workers, args.dry_run)
+    return {'success': all(r['success'] for r in results), 'results': results}
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    out = sys.stdout
+
+    # Сервисы пишут диагностические сообщения через print — уводим их в stderr,
+    # чтобы stdout содержал только JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            report = execute(args)
+        except (OSError, ValueError) as e:
+            report = {'success': False, 'error': str(e)}
+
+    # В терминале — с отступами, в конвейере — компактно
+    json.dump(report, out, ensure_ascii=False, indent=2 if out.isatty() else None)
+    out.write('\n')
+    return 0 if report['success'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,115 @@ import os
 from pathlib import Path
 
 # Путь к файлу со списком баз 1С
-IBASES_PATH = Path(os.getenv('USERPROFILE')) / 'AppData' / 'Roaming' / '1C' / '1CEStart' / 'ibases.v8i'
+IBASES_PATH = Path(os.getenv('USERPROFILE', str(Path.home()))) / 'AppData' / 'Roaming' / '1C' / '1CEStart' / 'ibases.v8i'
 
 # Кодировка файла ibases.v8i
 ENCODING = 'utf-8-sig'
 
+# Настройки стартера 1С: общие списки баз (CommonInfoBases=...) подключаются из него
+ESTART_CONFIG_PATH = IBASES_PATH.with_name('1CEStart.cfg')
+
+# Задержка перечитывания ibases.v8i после изменения извне, мс (редакторы пишут файл в несколько приемов)
+IBASES_WATCH_DEBOUNCE_MS = 300
+
+# Журнал правок списка баз (JSON Lines рядом с ibases.v8i) для отмены и повтора
+EDIT_JOURNAL_PATH = IBASES_PATH.with_name('ibases.v8i.journal.jsonl')
+
+# Сколько последних правок можно отменить (Ctrl+Z)
+EDIT_JOURNAL_UNDO_LIMIT = 100
+
+# Журнал сжимается (остаются только правки для отмены/повтора), когда строк в нем больше
+EDIT_JOURNAL_COMPACT_LINES = 500
+
+# Задержка фоновой записи ibases.v8i после правки, мс (серия правок — одна запись)
+IBASES_SAVE_DELAY_MS = 500
+
+# Дополнительные общие списки баз (например, на сетевом ресурсе), через os.pathsep.
+# Только для чтения: лончер сохраняет изменения лишь в личный ibases.v8i
+SHARED_IBASES_PATHS = [Path(p) for p in os.getenv('LAUNCHER_SHARED_IBASES', '').split(os.pathsep) if p]
+
+# Каталог служебных файлов лончера (снимок дерева и т.п.)
+APP_DATA_DIR = Path(os.getenv('LOCALAPPDATA', str(Path.home() / '.local' / 'share'))) / '1c_launcher'
+
+# Одинаковая высота строк дерева: высота берется у одной строки, а не у каждой
+# (быстрее прокрутка и раскрытие больших папок). Отключается для многострочных имен
+TREE_UNIFORM_ROW_HEIGHTS = True
+
+# Снимок дерева баз для мгновенной первой отрисовки
+TREE_SNAPSHOT_PATH = APP_DATA_DIR / 'tree_snapshot.bin'
+
+# Развернутые папки и выбранная база дерева (между перестройками и сеансами)
+VIEW_STATE_PATH = APP_DATA_DIR / 'view_state.json'
+
+# Статистика запусков баз для рейтинга "Недавних"
+FRECENCY_PATH = APP_DATA_DIR / 'frecency.json'
+
+# Максимум баз в папке "Недавние" (остальные возвращаются в свои папки)
+RECENT_LIMIT = 15
+
+# Период полураспада вклада запуска в рейтинг "Недавних", дней
+FRECENCY_HALF_LIFE_DAYS = 14
+
+# Метрики запусков баз (JSON Lines, только добавление)
+LAUNCH_METRICS_PATH = APP_DATA_DIR / 'launch_metrics.jsonl'
+
+# Хранилище паролей баз: auto (системное хранилище через keyring, иначе зашифрованный файл), keyring или file
+CREDENTIAL_BACKEND = os.getenv('LAUNCHER_CREDENTIAL_BACKEND', 'auto')
+
+# Зашифрованный файл паролей и ключ к нему (в Windows ключ защищен DPAPI учетной записи,
+# в остальных системах лежит открыто с правами 0600 — только сокрытие)
+CREDENTIAL_VAULT_PATH = APP_DATA_DIR / 'credentials.vault'
+CREDENTIAL_KEY_PATH = APP_DATA_DIR / 'credentials.key'
+
+# Сколько секунд расшифрованные пароли и ключ хранилища остаются в памяти
+CREDENTIAL_CACHE_TTL = 900
+
+# Прогрев платформы и кэша базы под курсором (см. services/prewarm.py); включается и в меню "Вид"
+PREWARM_ENABLED = os.getenv('LAUNCHER_PREWARM', '0') == '1'
+
+# Сколько курсор должен простоять на базе до прогрева, мс
+PREWARM_DWELL_MS = 400
+
+# Бюджет ввода-вывода прогрева: скорость чтения (МБ/с) и объем на одну базу (МБ)
+PREWARM_IO_RATE_MB = 64
+PREWARM_MAX_MB_PER_BASE = 512
+
+# Прогретый файл не перечитывается столько секунд (пока ОС держит его в кэше)
+PREWARM_TTL = 600
+
+# Минимальный рейтинг базы для прогрева (1.0 — примерно один запуск "прямо сейчас")
+PREWARM_MIN_SCORE = 0.25
+
+# Наборы запуска ("утренний набор" баз)
+LAUNCH_SETS_PATH = APP_DATA_DIR / 'launch_sets.json'
+
+# Ступенчатый старт набора: пауза между запусками (мс) и сколько клиентов одновременно ждут окна
+LAUNCH_SET_STAGGER_MS = 1500
+LAUNCH_SET_MAX_STARTING = 2
+
+# Отслеживание запуска: интервал опроса процессов (мс) и сколько ждать окна (сек)
+LAUNCH_TRACE_POLL_MS = 250
+LAUNCH_TRACE_TIMEOUT = 120
+
+# Статистика баз: база считается давно не запускавшейся через столько дней
+BASE_STATS_STALE_DAYS = 180
+
+# Замеры горячих путей (чтение баз, построение дерева, сканирование процессов)
+HOT_PATH_TIMINGS = True
+HOT_PATH_BUFFER_SIZE = 512
+
+# Каталог результатов профилирования (.prof и отчеты по памяти)
+PROFILE_DIR = APP_DATA_DIR / 'profiles'
+
+# Бэкенд процессов и окон: auto, win32, x11 или fake (см. services/backends)
+PROCESS_BACKEND = os.getenv('LAUNCHER_PROCESS_BACKEND', 'auto')
+
+# Каталоги установки платформы 1С и соответствующая им разрядность
+PLATFORM_INSTALL_ROOTS = [
+    (Path(r"C:\Program Files\1cv8"), 'x86_64'),
+    (Path(r"C:\Program Files (x86)\1cv8"), 'x86'),
+]
+
 # Путь к обработке инструментов ИР
 IR_TOOLS_PATH = r"c:\ROOT\CodeBase\1C\data\Tools\ИР_Портативный\ирПортативный.epf"
 
@@ -9,11 +9,12 @@
 
 import uuid
 from datetime import datetime
-from pathlib import Path
-import shutil
-import os
 from PySide6.QtWidgets import QMessageBox, QApplication
 
+from services.cache_cleaner import clear_database_cache
+from services.credential_vault import get_credential_vault, move_passwords_to_vault
+from services.frecency import get_frecency_store
+
 class DatabaseOperations:
     def __init__(self, window, all_bases, save_callback, reload_callback):
         self.window = window
@@ -21,16 +22,18 @@ class DatabaseOperations:
         self.save_callback = save_callback
         self.reload_callback = reload_callback
 
-    def get_selected_database(self, model, tree):
+    def get_selected_database(self, model, tree, quiet=False):
         indexes = tree.selectedIndexes()
         if not indexes:
-            self.window.statusBar.showMessage("⚠️ Выберите базу данных")
+            if not quiet:
+                self.window.statusBar.showMessage("⚠️ Выберите базу данных")
             return None
         index = indexes[0]
         item = model.itemFromIndex(index)
         if item and item.data(256): # Qt.UserRole == 256
             return item.data(256)
-        self.window.statusBar.showMessage("⚠️ Выберите базу, а не папку")
+        if not quiet:
+            self.window.statusBar.showMessage("⚠️ Выберите базу, а не папку")
         return None
 
     def get_current_folder(self, model, tree):
@@ -87,42 +90,64 @@ class DatabaseOperations:
                 pwd_storage=database.pwd_storage,
                 storage_path=database.storage_path,
                 client_type=database.client_type,
+                version_policy=database.version_policy,
+                version_fallbacks=database.version_fallbacks,
             )
             current_date = datetime.now().strftime("%Y-%m-%d")
-            database.name = f"{database.name} {current_date}"
-            index = self.all_bases.index(database)
-            self.all_bases.insert(index + 1, new_database)
+            with self.window.edit_transaction(f"Копирование: {database.name}"):
+                database.name = f"{database.name} {current_date}"
+                index = self.all_bases.index(database)
+                self.all_bases.insert(index + 1, new_database)
+            get_credential_vault().copy_base(database.id, new_database.id)
             self.save_callback()
             self.reload_callback()
             self.window.statusBar.showMessage(f"✅ База скопирована. Исходная база переименована в '{database.name}'")
         except Exception as e:
             self.window.statusBar.showMessage(f"❌ Ошибка копирования базы: {e}")
 
+    def _ensure_local(self, database) -> bool:
+        """Изменять можно только базы личного ibases.v8i: общие списки лончер не перезаписывает"""
+        if database.is_local():
+            return True
+        self.window.statusBar.showMessage(
+            f"🔒 {database.name}: база из общего списка ({database.source}), скопируйте ее (Ctrl+D)", 5000
+        )
+        return False
+
     def edit_database_settings(self, database, DatabaseSettingsDialog):
+        if not self._ensure_local(database):
+            return
         dialog = DatabaseSettingsDialog(self.window, database)
         if dialog.exec():
             settings = dialog.get_settings()
-            database.name = settings['name']
-            database.folder = settings['folder']
-            database.connect = settings['connect']
-            database.usr = settings.get('usr')
-            database.pwd = settings.get('pwd')
-            database.version = settings['version']
-            database.app_arch = settings['app_arch']
-            database.app = settings['app']
-            database.storage_path = settings['storage_path']
-            database.usr_enterprise = settings['usr_enterprise']
-            database.pwd_enterprise = settings['pwd_enterprise']
-            database.usr_configurator = settings['usr_configurator']
-            database.pwd_configurator = settings['pwd_configurator']
-            database.usr_storage = settings['usr_storage']
-            database.pwd_storage = settings['pwd_storage']
-            database.client_type = settings['client_type']
+            with self.window.edit_transaction(f"Настройки: {database.name}"):
+                database.name = settings['name']
+                database.folder = settings['folder']
+                database.connect = settings['connect']
+                database.usr = settings.get('usr')
+                database.pwd = settings.get('pwd')
+                database.version = settings['version']
+                database.app_arch = settings['app_arch']
+                database.app = settings['app']
+                database.storage_path = settings['storage_path']
+                database.usr_enterprise = settings['usr_enterprise']
+                database.pwd_enterprise = settings['pwd_enterprise']
+                database.usr_configurator = settings['usr_configurator']
+                database.pwd_configurator = settings['pwd_configurator']
+                database.usr_storage = settings['usr_storage']
+                database.pwd_storage = settings['pwd_storage']
+                database.client_type = settings['client_type']
+                database.version_policy = settings['version_policy']
+                database.version_fallbacks = settings['version_fallbacks']
+            # Пароли (в том числе очищенные) — в хранилище паролей, в ibases.v8i их нет
+            move_passwords_to_vault(database, replace=True)
             self.save_callback()
             self.reload_callback()
             self.window.statusBar.showMessage(f"✅ Настройки базы {database.name} сохранены")
 
     def delete_database(self, database):
+        if not self._ensure_local(database):
+            return
         if database.is_recent:
             reply = QMessageBox.question(
                 self.window,
@@ -132,11 +157,14 @@ class DatabaseOperations:
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                database.is_recent = False
-                if database.original_folder:
-                    database.folder = database.original_folder
-                    database.original_folder = None
-                database.last_run_time = None
+                # Статистика запусков сбрасывается необратимо — правка без отмены
+                with self.window.edit_transaction(f"Из недавних: {database.name}", undoable=False):
+                    database.is_recent = False
+                    if database.original_folder:
+                        database.folder = database.original_folder
+                        database.original_folder = None
+                    database.last_run_time = None
+                self._forget_launches(database)
                 self.save_callback()
                 self.reload_callback()
                 self.window.statusBar.showMessage(f"✅ База '{database.name}' убрана из недавних")
@@ -149,8 +177,10 @@ class DatabaseOperations:
                 QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                cache_result = self._clear_database_cache(database)
-                self.all_bases.remove(database)
+                cache_result = clear_database_cache(database)
+                with self.window.edit_transaction(f"Удаление: {database.name}"):
+                    self.all_bases.remove(database)
+                self._forget_launches(database)
                 self.save_callback()
                 self.reload_callback()
                 result_message = f"✅ База '{database.name}' удалена из списка\n\nРезультат очистки кэша:\n" + "\n".join(cache_result)
@@ -159,7 +189,13 @@ class DatabaseOperations:
                     "База удалена",
                     result_message
                 )
-                self.window.statusBar.showMessage(f"✅ База '{database.name}' удалена")
+                self.window.statusBar.showMessage(f"✅ База '{database.name}' удалена (отменить — Ctrl+Z)")
+
+    def _forget_launches(self, database):
+        """Сбрасывает статистику запусков, чтобы база не вернулась в "Недавние" по рейтингу"""
+        store = get_frecency_store()
+        store.forget(database.id)
+        store.save()
 
     def clear_cache(self, database):
         reply = QMessageBox.question(
@@ -171,7 +207,7 @@ class DatabaseOperations:
         )
         if reply != QMessageBox.Yes:
             return
-        deleted_items = self._clear_database_cache(database)
+        deleted_items = clear_database_cache(database)
         result_message = "\n".join(deleted_items)
         QMessageBox.information(
             self.window,
@@ -204,6 +240,8 @@ class DatabaseOperations:
             pwd_storage=None,
             storage_path=None,
             client_type='thick',
+            version_policy=None,
+            version_fallbacks=None,
         )
         dialog = DatabaseSettingsDialog(self.window, new_database)
         if dialog.exec():
@@ -224,74 +262,11 @@ class DatabaseOperations:
             new_database.usr_storage = settings['usr_storage']
             new_database.pwd_storage = settings['pwd_storage']
             new_database.client_type = settings['client_type']
-            self.all_bases.append(new_database)
+            new_database.version_policy = settings['version_policy']
+            new_database.version_fallbacks = settings['version_fallbacks']
+            with self.window.edit_transaction(f"Добавление: {new_database.name}"):
+                self.all_bases.append(new_database)
+            move_passwords_to_vault(new_database)
             self.save_callback()
             self.reload_callback()
             self.window.statusBar.showMessage(f"✅ База '{new_database.name}' добавлена")
-
-    def _clear_database_cache(self, database):
-        try:
-            appdata_local = Path(os.environ.get('LOCALAPPDATA', ''))
-            appdata_roaming = Path(os.environ.get('APPDATA', ''))
-            deleted_items = []
-            program_cache_path = appdata_local / '1C' / '1cv8' / database.id
-            if program_cache_path.exists():
-                try:
-                    shutil.rmtree(program_cache_path)
-                    deleted_items.append(f"✅ Программный кэш: {program_cache_path}")
-                except Exception as e:
-                    deleted_items.append(f"⚠️ Ошибка удаления программного кэша: {e}")
-            else:
-                deleted_items.append("ℹ️ Программный кэш не найден")
-            
-            user_cache_path = appdata_roaming / '1C' / '1Cv82' / database.id
-            if user_cache_path.exists():
-                try:
-                    shutil.rmtree(user_cache_path)
-                    deleted_items.append(f"✅ Пользовательский кэш: {user_cache_path}")
-                except Exception as e:
-                    deleted_items.append(f"⚠️ Ошибка удаления пользовательского кэша: {e}")
-            else:
-                deleted_items.append("ℹ️ Пользовательский кэш не найден")
-
-            # Очистка кэша ИР Портативный
-            ir_folder_name = self._generate_ir_folder_name(database.connect)
-            if ir_folder_name:
-                ir_cache_path = appdata_local / '1C' / '1cv8' / ir_folder_name
-                if ir_cache_path.exists():
-                    try:
-                        shutil.rmtree(ir_cache_path)
-                        deleted_items.append(f"✅ Кэш ИР: {ir_cache_path}")
-                    except Exception as e:
-                        deleted_items.append(f"⚠️ Ошибка удаления кэша ИР: {e}")
-                else:
-                    deleted_items.append(f"ℹ️ Кэш ИР не найден ({ir_folder_name})")
-
-            return deleted_items
-        except Exception as e:
-            return [f"❌ Ошибка очистки кэша: {e}"]
-
-    def _generate_ir_folder_name(self, connection_string):
-        """
-        Генерирует имя папки кэша для ИР Портативный на основе строки подключения.
-        Пример: Srvr="srv-1c-8325:1541";Ref="ZUP_0202_Pechericadv_1";
-        Результат: Srvr__srv_1c_8325_1541__Ref__ZUP_0202_Pechericadv_1__
-        """
-        if not connection_string:
-            return ""
-        
-        name = connection_string
-        # Replace parameter separators and quotes
-        name = name.replace('="', '__')
-        name = name.replace('";', '__')
-        
-        # Replace unsafe characters in filenames
-        name = name.replace(':', '_')
-        name = name.replace('-', '_')
-        name = name.replace('.', '_')
-        name = name.replace(',', '_')
-        name = name.replace('\\', '_')
-        name = name.replace('/', '_')
-        name = name.replace(' ', '_')
-        
-        return name
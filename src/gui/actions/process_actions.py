@@ -4,8 +4,9 @@
 import os
 import subprocess
 from PySide6.QtCore import Qt, QTimer
-from services.process_manager import ProcessManager, Process1C
+from models.process import Process1C
 from typing import Optional, Union
+from services.profiling import hot_path
 
 
 class ProcessActions:
@@ -58,6 +59,8 @@ class ProcessActions:
         Args:
             process: Процесс для активации или TrackedApp для запуска, если None - берётся выбранный
         """
+        from services.process_manager import ProcessManager
+
         if process is None:
             process = self.get_selected_process()
         
@@ -98,6 +101,47 @@ class ProcessActions:
             else:
                 self.window.statusBar.showMessage(f"❌ Не удалось активировать: {process.name}", 3000)
     
+    def find_base_client(self, database, mode: Optional[str] = None) -> Optional[Process1C]:
+        """
+        Найти уже запущенный клиент базы с главным окном (по индексу процессов)
+        
+        Args:
+            database: База данных
+            mode: Режим клиента (ENTERPRISE, DESIGNER, IR_TOOLS); None - любой
+        
+        Returns:
+            Process1C с окном или None
+        """
+        from services.backends import get_backend
+        from services.process_index import get_process_index
+        from services.process_manager import ProcessManager
+
+        index = get_process_index()
+        for pid in index.pids_for_base(database.id, mode):
+            window = ProcessManager.get_main_window(pid)
+            if window is None:
+                # Процесс завершился после последнего обновления дерева (или окна еще нет)
+                if not get_backend().pid_exists(pid):
+                    index.forget(pid)
+                continue
+            hwnd, title = window
+            return Process1C(pid=pid, name=title or database.name, hwnd=hwnd, base_id=database.id)
+        return None
+
+    @hot_path("activate_base_client")
+    def activate_base_client(self, database, mode: Optional[str] = None) -> bool:
+        """
+        Активировать уже запущенный клиент базы
+        
+        Returns:
+            True если клиент найден и активирован, False если базу нужно запускать
+        """
+        process = self.find_base_client(database, mode)
+        if process is None:
+            return False
+        self.activate_process(process)
+        return True
+    
     def launch_application(self, tracked_app):
         """
         Запустить приложение
@@ -147,6 +191,8 @@ class ProcessActions:
             process: Процесс для закрытия
             force: True - принудительное завершение (Shift+Del), False - корректное (Del)
         """
+        from services.process_manager import ProcessManager
+
         if process is None:
             process = self.get_selected_process()
         
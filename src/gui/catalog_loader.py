@@ -0,0 +1,27 @@
+"""Фоновая загрузка общих списков баз (см. services/base_catalog.py).
+
+Источники читаются в фоновых потоках; результат каждого передается в главный
+поток сигналом (соединение между потоками Qt ставит его в очередь событий).
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from services.base_catalog import get_base_catalog
+
+
+class CatalogLoader(QObject):
+    """Чтение общих источников каталога без блокировки интерфейса."""
+
+    # CatalogSource, stat файла (или None), список Database1C
+    source_loaded = Signal(object, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.catalog = get_base_catalog()
+
+    def has_shared_sources(self):
+        return bool(self.catalog.shared)
+
+    def load_shared(self):
+        """Запускает чтение всех общих источников; результаты придут сигналом source_loaded."""
+        self.catalog.read_shared_async(self.source_loaded.emit)
@@ -2,5 +2,8 @@
 
 from .help_dialog import HelpDialog
 from .database_settings_dialog import DatabaseSettingsDialog
+from .launch_stats_dialog import LaunchStatsDialog
+from .launch_sets_dialog import LaunchSetsDialog
+from .base_stats_dialog import BaseStatsDialog
 
-__all__ = ['HelpDialog', 'DatabaseSettingsDialog']
+__all__ = ['HelpDialog', 'DatabaseSettingsDialog', 'LaunchStatsDialog', 'LaunchSetsDialog', 'BaseStatsDialog']
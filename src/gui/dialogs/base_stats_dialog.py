@@ -0,0 +1,93 @@
+"""Диалог статистики списка баз: версии платформы, серверы, давно не запускавшиеся базы"""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QHeaderView,
+)
+from PySide6.QtCore import Qt
+
+from config import BASE_STATS_STALE_DAYS
+from services.base_stats import BaseStats
+
+
+class BaseStatsDialog(QDialog):
+    """Сколько баз на каждой версии, ветке платформы, сервере; какие давно не запускались
+
+    Двойной щелчок по базе на вкладке давних запусков закрывает диалог,
+    ID базы — в selected_id (окно ставит на нее курсор).
+    """
+
+    TABS = [
+        ("По версиям платформы", 'version'),
+        ("По веткам", 'branch'),
+        ("По серверам", 'server'),
+        ("Разрядность", 'arch'),
+        ("Тип клиента", 'client_type'),
+    ]
+    COLUMNS = ["Группа", "Баз", "Доля"]
+    STALE_COLUMNS = ["База", "Папка", "Последний запуск"]
+    # Больше стольких строк давних баз таблица не показывает
+    STALE_ROWS_LIMIT = 1000
+
+    def __init__(self, stats: BaseStats, parent=None, stale_days=BASE_STATS_STALE_DAYS):
+        super().__init__(parent)
+        self.setWindowTitle("Статистика баз")
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(450)
+        self.selected_id = None
+
+        old, never = stats.stale(stale_days)
+        layout = QVBoxLayout()
+        text = (f"Баз: {len(stats)}. Не запускались больше {stale_days} дней: {len(old)}, "
+                f"без времени запуска: {len(never)}.")
+        if len(old) + len(never) > self.STALE_ROWS_LIMIT:
+            text += f" В таблице — первые {self.STALE_ROWS_LIMIT}, самые давние сверху."
+        layout.addWidget(QLabel(text))
+
+        tabs = QTabWidget()
+        for title, column in self.TABS:
+            tabs.addTab(self._build_table(stats.group_counts(column)), title)
+        tabs.addTab(self._build_stale_table(old + never), f"Не запускались > {stale_days} дн.")
+        layout.addWidget(tabs)
+
+        close_btn = QPushButton("Закрыть")
+        close_btn.clicked.connect(self.reject)
+        layout.addWidget(close_btn, alignment=Qt.AlignRight)
+        self.setLayout(layout)
+
+    def _make_table(self, rows, columns):
+        table = QTableWidget(rows, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.verticalHeader().hide()
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    def _build_table(self, groups):
+        table = self._make_table(len(groups), self.COLUMNS)
+        for row, group in enumerate(groups):
+            values = [group.key, str(group.count), f"{group.share:.1%}"]
+            for col, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                if col:
+                    cell.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, col, cell)
+        return table
+
+    def _build_stale_table(self, bases):
+        shown = bases[:self.STALE_ROWS_LIMIT]
+        table = self._make_table(len(shown), self.STALE_COLUMNS)
+        for row, base in enumerate(shown):
+            last_run = base.last_run_time.strftime("%d.%m.%Y") if base.last_run_time else "—"
+            for col, value in enumerate((base.name, base.get_folder_path(), last_run)):
+                cell = QTableWidgetItem(value)
+                if col == 0:
+                    cell.setData(Qt.UserRole, base.id)
+                table.setItem(row, col, cell)
+        table.cellDoubleClicked.connect(lambda row, _: self._go_to(table.item(row, 0)))
+        return table
+
+    def _go_to(self, cell):
+        self.selected_id = cell.data(Qt.UserRole)
+        self.accept()
@@ -1,13 +1,14 @@
 """Диалог настроек базы данных"""
 
 import re
-import platform
-from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QLineEdit,
     QDialogButtonBox, QComboBox, QTableWidget, QTableWidgetItem,
     QHeaderView, QLabel
 )
+from services.credential_vault import MODE_DESIGNER, MODE_ENTERPRISE, MODE_STORAGE, stored_password
+from services.platform_registry import get_platform_registry
+from services.version_resolver import POLICY_EXACT, POLICY_BRANCH, POLICY_LATEST
 
 
 class DatabaseSettingsDialog(QDialog):
@@ -72,6 +73,25 @@ class DatabaseSettingsDialog(QDialog):
         
         form_layout.addRow("Версия:", self.version_combo)
         
+        # Политика выбора версии, если указанная не установлена
+        self.version_policy_combo = QComboBox()
+        self.version_policy_combo.addItem("Точная версия", POLICY_EXACT)
+        self.version_policy_combo.addItem("Последняя в ветке (8.3.x.*)", POLICY_BRANCH)
+        self.version_policy_combo.addItem("Последняя установленная", POLICY_LATEST)
+        policy_index = self.version_policy_combo.findData(
+            (database.version_policy if database else None) or POLICY_EXACT
+        )
+        self.version_policy_combo.setCurrentIndex(max(policy_index, 0))
+        form_layout.addRow("Политика версии:", self.version_policy_combo)
+        
+        # Резервные версии
+        self.version_fallbacks_edit = QLineEdit()
+        self.version_fallbacks_edit.setText(
+            database.version_fallbacks if database and database.version_fallbacks else ""
+        )
+        self.version_fallbacks_edit.setPlaceholderText("Например: 8.3.25;8.3.24.1500;latest")
+        form_layout.addRow("Резервные версии:", self.version_fallbacks_edit)
+        
         # Тип клиента - выпадающий список
         self.client_type_combo = QComboBox()
         self.client_type_combo.addItem("Толстый клиент (1cv8.exe)", "thick")
@@ -118,8 +138,9 @@ class DatabaseSettingsDialog(QDialog):
             self.credentials_table.setItem(0, 0, QTableWidgetItem(
                 database.usr_enterprise or ""
             ))
+            # Пароли — из хранилища паролей (расшифровываются при открытии диалога)
             self.credentials_table.setItem(1, 0, QTableWidgetItem(
-                database.pwd_enterprise or ""
+                stored_password(database, MODE_ENTERPRISE) or ""
             ))
             
             # Конфигуратор
@@ -127,7 +148,7 @@ class DatabaseSettingsDialog(QDialog):
                 database.usr_configurator or ""
             ))
             self.credentials_table.setItem(1, 1, QTableWidgetItem(
-                database.pwd_configurator or ""
+                stored_password(database, MODE_DESIGNER) or ""
             ))
             
             # Хранилище
@@ -135,7 +156,7 @@ class DatabaseSettingsDialog(QDialog):
                 database.usr_storage or ""
             ))
             self.credentials_table.setItem(1, 2, QTableWidgetItem(
-                database.pwd_storage or ""
+                stored_password(database, MODE_STORAGE) or ""
             ))
         else:
             # Инициализируем пустые ячейки для новой базы
@@ -154,33 +175,8 @@ class DatabaseSettingsDialog(QDialog):
         self.setLayout(layout)
     
     def _get_installed_versions(self):
-        """Получает список установленных версий 1С из системы"""
-        versions = []
-        
-        if platform.system() == 'Windows':
-            # Проверяем оба пути - Program Files и Program Files (x86)
-            base_paths = [
-                (Path(r"C:\Program Files\1cv8"), "x64"),
-                (Path(r"C:\Program Files (x86)\1cv8"), "x86")
-            ]
-            
-            for base_path, bitness in base_paths:
-                if base_path.exists():
-                    # Ищем все подпапки с версиями
-                    for item in base_path.iterdir():
-                        if item.is_dir() and item.name != 'common':
-                            # Проверяем наличие bin/1cv8.exe
-                            exe_path = item / 'bin' / '1cv8.exe'
-                            if exe_path.exists():
-                                # Добавляем версию с пометкой разрядности
-                                version_str = f"{item.name} ({bitness})"
-                                if version_str not in versions:
-                                    versions.append(version_str)
-        
-        # Сортируем версии в обратном порядке (новые первыми)
-        versions.sort(reverse=True)
-        
-        return versions
+        """Получает список установленных версий 1С из реестра платформ (новые первыми)"""
+        return get_platform_registry().get_installed_versions_display()
     
     def get_settings(self):
         """Возвращает настройки в виде словаря"""
@@ -203,6 +199,11 @@ class DatabaseSettingsDialog(QDialog):
         # Получаем тип клиента
         client_type = self.client_type_combo.currentData()
         
+        # Политика "точная версия" — поведение по умолчанию, в файл не пишем
+        version_policy = self.version_policy_combo.currentData()
+        if version_policy == POLICY_EXACT:
+            version_policy = None
+        
         return {
             'name': self.name_edit.text(),
             'folder': self.folder_edit.text(),
@@ -212,6 +213,8 @@ class DatabaseSettingsDialog(QDialog):
             'app': self.app_edit.text() if self.app_edit.text() else None,
             'storage_path': self.storage_path_edit.text() if self.storage_path_edit.text() else None,
             'client_type': client_type,  # Добавляем тип клиента
+            'version_policy': version_policy,
+            'version_fallbacks': self.version_fallbacks_edit.text().strip() or None,
             # Данные из таблицы
             'usr_enterprise': self.credentials_table.item(0, 0).text() or None,
             'pwd_enterprise': self.credentials_table.item(1, 0).text() or None,
@@ -128,6 +128,10 @@ class HelpDialog(QDialog):
                     <td><span class="key">F4</span></td>
                     <td><b>Конфигуратор:</b> Открыть и свернуть в трей</td>
                 </tr>
+                <tr>
+                    <td><span class="key">Ctrl+F3 / Ctrl+F4</span></td>
+                    <td><b>Новый экземпляр:</b> запустить еще один клиент, даже если база уже открыта</td>
+                </tr>
                 <tr>
                     <td><span class="key">F5</span></td>
                     <td><b>Инструменты (ИР):</b> Portable Tools + <span class="cmd">/debug</span></td>
@@ -136,6 +140,10 @@ class HelpDialog(QDialog):
                     <td><span class="key">F6</span></td>
                     <td><b>Консоль сервера:</b> Открыть для версии платформы</td>
                 </tr>
+                <tr>
+                    <td><span class="key">F9</span></td>
+                    <td><b>Наборы запуска:</b> Несколько баз одной командой, по очереди</td>
+                </tr>
             </table>
             
             <h3>🛠️ Конфигурация</h3>
@@ -164,6 +172,14 @@ class HelpDialog(QDialog):
                     <th width="25%">Клавиша</th>
                     <th width="75%">Действие</th>
                 </tr>
+                <tr>
+                    <td><span class="key">Ctrl+F</span></td>
+                    <td>🔍 <b>Поиск:</b> имя, папка, Ref/File, версия (или начать печатать в дереве; Esc — закрыть)</td>
+                </tr>
+                <tr>
+                    <td><span class="key">Ctrl+Tab</span></td>
+                    <td>🔀 Переключиться на предыдущую открытую базу (как Alt+Tab)</td>
+                </tr>
                 <tr>
                     <td><span class="key">Shift+F10</span></td>
                     <td>Добавить новую базу (авто-папка)</td>
@@ -184,6 +200,10 @@ class HelpDialog(QDialog):
                     <td><span class="key">Ctrl+C</span></td>
                     <td>Копировать строку подключения</td>
                 </tr>
+                <tr>
+                    <td><span class="key">Ctrl+Z / Ctrl+Y</span></td>
+                    <td>↩️ Отменить / повторить правку списка баз</td>
+                </tr>
                 <tr>
                     <td><span class="key">Del</span></td>
                     <td>
@@ -0,0 +1,209 @@
+"""Диалог наборов запуска: состав и порядок баз, запуск набора"""
+
+from PySide6.QtWidgets import (
+    QDialog, QHBoxLayout, QVBoxLayout, QListWidget, QTableWidget, QTableWidgetItem,
+    QComboBox, QPushButton, QLabel, QInputDialog, QMessageBox, QHeaderView,
+)
+from PySide6.QtCore import Qt
+
+from services.launch_command import LAUNCH_MODES
+from services.launch_sets import LaunchSet, LaunchSetItem
+
+
+MODE_TITLES = {
+    'ENTERPRISE': "Предприятие",
+    'DESIGNER': "Конфигуратор",
+    'IR_TOOLS': "Инструменты ИР",
+}
+
+
+class LaunchSetsDialog(QDialog):
+    """Наборы баз, которые открываются одной командой
+
+    Изменения сохраняются в файл наборов сразу. После "Запустить" имя набора —
+    в run_name (диалог закрывается с accept).
+    """
+
+    def __init__(self, store, bases, current_database=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Наборы запуска")
+        self.setMinimumWidth(750)
+        self.setMinimumHeight(420)
+
+        self.store = store
+        self.names_by_id = {base.id: base.name for base in bases}
+        self.current_database = current_database
+        self.run_name = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(
+            "Базы набора запускаются по очереди с паузой, дерево обновляется один раз в конце."
+        ))
+
+        body = QHBoxLayout()
+
+        left = QVBoxLayout()
+        self.sets_list = QListWidget()
+        self.sets_list.currentRowChanged.connect(self._show_set)
+        left.addWidget(self.sets_list)
+        for title, handler in (("Новый", self._new_set), ("Переименовать", self._rename_set),
+                               ("Удалить", self._delete_set)):
+            btn = QPushButton(title)
+            btn.clicked.connect(handler)
+            left.addWidget(btn)
+        body.addLayout(left, 1)
+
+        right = QVBoxLayout()
+        self.table = QTableWidget(0, 2)
+        self.table.setHorizontalHeaderLabels(["База", "Режим"])
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        right.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        self.add_btn = QPushButton("Добавить текущую базу")
+        self.add_btn.setEnabled(current_database is not None)
+        self.add_btn.clicked.connect(self._add_current)
+        buttons.addWidget(self.add_btn)
+        for title, handler in (("Вверх", lambda: self._move(-1)), ("Вниз", lambda: self._move(1)),
+                               ("Убрать", self._remove_item)):
+            btn = QPushButton(title)
+            btn.clicked.connect(handler)
+            buttons.addWidget(btn)
+        right.addLayout(buttons)
+        body.addLayout(right, 3)
+        layout.addLayout(body)
+
+        bottom = QHBoxLayout()
+        bottom.addStretch()
+        run_btn = QPushButton("Запустить")
+        run_btn.setDefault(True)
+        run_btn.clicked.connect(self._run)
+        bottom.addWidget(run_btn)
+        close_btn = QPushButton("Закрыть")
+        close_btn.clicked.connect(self.reject)
+        bottom.addWidget(close_btn)
+        layout.addLayout(bottom)
+        self.setLayout(layout)
+
+        self._fill_sets()
+
+    # ------------------------------------------------------------------ #
+    #  Наборы                                                              #
+    # ------------------------------------------------------------------ #
+
+    def _fill_sets(self, select=None):
+        self.sets_list.clear()
+        self.sets_list.addItems(self.store.names())
+        names = self.store.names()
+        if names:
+            self.sets_list.setCurrentRow(names.index(select) if select in names else 0)
+        else:
+            self._show_set(-1)
+
+    def _current_set(self):
+        item = self.sets_list.currentItem()
+        return self.store.get(item.text()) if item else None
+
+    def _ask_name(self, title, value=""):
+        name, ok = QInputDialog.getText(self, title, "Имя набора:", text=value)
+        name = name.strip()
+        if not ok or not name:
+            return None
+        if name != value and self.store.get(name) is not None:
+            QMessageBox.warning(self, title, f"Набор «{name}» уже есть")
+            return None
+        return name
+
+    def _new_set(self):
+        name = self._ask_name("Новый набор")
+        if name:
+            items = []
+            if self.current_database is not None:
+                items.append(LaunchSetItem(self.current_database.id))
+            self.store.put(LaunchSet(name, items))
+            self.store.save()
+            self._fill_sets(select=name)
+
+    def _rename_set(self):
+        launch_set = self._current_set()
+        if launch_set is None:
+            return
+        name = self._ask_name("Переименование набора", launch_set.name)
+        if name and self.store.rename(launch_set.name, name):
+            self.store.save()
+            self._fill_sets(select=name)
+
+    def _delete_set(self):
+        launch_set = self._current_set()
+        if launch_set is None:
+            return
+        reply = QMessageBox.question(self, "Удаление набора", f"Удалить набор «{launch_set.name}»?")
+        if reply == QMessageBox.Yes:
+            self.store.remove(launch_set.name)
+            self.store.save()
+            self._fill_sets()
+
+    # ------------------------------------------------------------------ #
+    #  Базы набора                                                         #
+    # ------------------------------------------------------------------ #
+
+    def _show_set(self, row, select_row=None):
+        launch_set = self._current_set() if row >= 0 else None
+        items = launch_set.items if launch_set else []
+        self.table.setRowCount(len(items))
+        for index, item in enumerate(items):
+            name = self.names_by_id.get(item.base_id)
+            cell = QTableWidgetItem(name if name else f"⚠️ нет в списке: {item.base_id}")
+            self.table.setItem(index, 0, cell)
+            combo = QComboBox()
+            for mode in LAUNCH_MODES:
+                combo.addItem(MODE_TITLES.get(mode, mode), mode)
+            combo.setCurrentIndex(LAUNCH_MODES.index(item.mode))
+            combo.currentIndexChanged.connect(lambda _, item=item, combo=combo: self._set_mode(item, combo))
+            self.table.setCellWidget(index, 1, combo)
+        if select_row is not None:
+            self.table.selectRow(select_row)
+
+    def _set_mode(self, item, combo):
+        item.mode = combo.currentData()
+        self.store.save()
+
+    def _refresh_items(self, select_row=None):
+        self._show_set(self.sets_list.currentRow(), select_row)
+        self.store.save()
+
+    def _add_current(self):
+        launch_set = self._current_set()
+        if launch_set is None or self.current_database is None:
+            return
+        launch_set.items.append(LaunchSetItem(self.current_database.id))
+        self._refresh_items(len(launch_set.items) - 1)
+
+    def _move(self, step):
+        launch_set = self._current_set()
+        row = self.table.currentRow()
+        target = row + step
+        if launch_set is None or row < 0 or not 0 <= target < len(launch_set.items):
+            return
+        items = launch_set.items
+        items[row], items[target] = items[target], items[row]
+        self._refresh_items(target)
+
+    def _remove_item(self):
+        launch_set = self._current_set()
+        row = self.table.currentRow()
+        if launch_set is None or row < 0:
+            return
+        del launch_set.items[row]
+        self._refresh_items(min(row, len(launch_set.items) - 1) if launch_set.items else None)
+
+    def _run(self):
+        launch_set = self._current_set()
+        if launch_set is None or not launch_set.items:
+            return
+        self.run_name = launch_set.name
+        self.accept()
@@ -0,0 +1,73 @@
+"""Диалог статистики запусков: p50/p95 времени до окна 1С"""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QHeaderView,
+)
+from PySide6.QtCore import Qt
+
+from services.launch_metrics import LaunchMetricsLog, summarize
+
+
+class LaunchStatsDialog(QDialog):
+    """Время запуска баз в разрезе баз, версий платформы и серверов"""
+
+    TABS = [
+        ("По базам", 'base_name'),
+        ("По версиям платформы", 'version'),
+        ("По серверам", 'server'),
+    ]
+    COLUMNS = ["Группа", "Запусков", "Без окна", "p50, с", "p95, с", "Макс, с"]
+
+    def __init__(self, parent=None, log: LaunchMetricsLog = None):
+        super().__init__(parent)
+        self.setWindowTitle("Статистика запусков")
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(450)
+
+        log = log or LaunchMetricsLog()
+        records = log.read()
+
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(
+            f"Запусков в журнале: {len(records)}. Время — от нажатия до главного окна 1С.\n"
+            f"Файл: {log.path}"
+        ))
+
+        tabs = QTabWidget()
+        for title, key in self.TABS:
+            tabs.addTab(self._build_table(summarize(records, key)), title)
+        layout.addWidget(tabs)
+
+        close_btn = QPushButton("Закрыть")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn, alignment=Qt.AlignRight)
+        self.setLayout(layout)
+
+    def _build_table(self, stats):
+        table = QTableWidget(len(stats), len(self.COLUMNS))
+        table.setHorizontalHeaderLabels(self.COLUMNS)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.verticalHeader().hide()
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+        for row, item in enumerate(stats):
+            values = [
+                item.key,
+                str(item.launches),
+                str(item.failures),
+                self._seconds(item.p50),
+                self._seconds(item.p95),
+                self._seconds(item.max),
+            ]
+            for col, value in enumerate(values):
+                cell = QTableWidgetItem(value)
+                if col:
+                    cell.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, col, cell)
+        return table
+
+    @staticmethod
+    def _seconds(ms):
+        return "—" if ms is None else f"{ms / 1000:.1f}"
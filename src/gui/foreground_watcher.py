@@ -0,0 +1,74 @@
+"""Отслеживание активного окна 1С по событиям платформы (без опроса).
+
+Бэкенд процессов сообщает о смене активного окна (WinEvent-хук на Windows,
+PropertyNotify на X11). Окна процессов 1С попадают в MRU-список: по нему
+упорядочивается узел "Открытые базы" и работает переключение Ctrl+Tab.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QSocketNotifier, Signal
+
+from models.process import Process1C
+from services.backends import get_backend, normalize_process_name
+from services.window_mru import WindowMRU
+
+
+class ForegroundWatcher(QObject):
+    """Подписка на смену активного окна и MRU окон 1С."""
+
+    # Process1C окна 1С, ставшего активным
+    foreground_changed = Signal(object)
+
+    # Кэш имен процессов не должен расти бесконечно (PID переиспользуются)
+    NAME_CACHE_LIMIT = 512
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from services.process_manager import ProcessManager
+
+        self.mru = WindowMRU()
+        self._backend = get_backend()
+        self._tracked_names = {normalize_process_name(name) for name in ProcessManager.PROCESS_NAMES}
+        self._names = {}
+        self._notifier = None
+        self.active = self._backend.watch_foreground(self._on_foreground)
+        if self.active:
+            fd = self._backend.event_fd()
+            if fd is not None:
+                self._notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+                self._notifier.activated.connect(lambda *_: self._backend.dispatch_events())
+        else:
+            print("⚠️ Смена активного окна не отслеживается: бэкенд не поддерживает события")
+
+    def stop(self):
+        """Отписывается от событий платформы."""
+        if self._notifier:
+            self._notifier.setEnabled(False)
+        if self.active:
+            self._backend.unwatch_foreground()
+            self.active = False
+
+    def order_processes(self, processes):
+        """Процессы в порядке последнего использования; завершившиеся убираются из MRU."""
+        self.mru.prune(proc.pid for proc in processes)
+        ranks = self.mru.ranks()
+        last = len(ranks)
+        return sorted(processes, key=lambda proc: ranks.get(proc.pid, last))
+
+    def _process_name(self, pid):
+        name = self._names.get(pid)
+        if name is None:
+            if len(self._names) >= self.NAME_CACHE_LIMIT:
+                self._names.clear()
+            name = self._names[pid] = self._backend.process_name(pid)
+        return name
+
+    def _on_foreground(self, hwnd, pid, title):
+        if pid == os.getpid():
+            return
+        name = self._process_name(pid)
+        if normalize_process_name(name) not in self._tracked_names:
+            return
+        self.mru.touch(pid, hwnd, title)
+        self.foreground_changed.emit(Process1C(pid=pid, name=title or "Без имени", hwnd=hwnd, process_name=name))
@@ -0,0 +1,105 @@
+"""Фоновая запись ibases.v8i (см. services/ibases_store.py).
+
+Правка сразу попадает в журнал (services/edit_journal.py), а файл переписывается
+в фоновом потоке через IBASES_SAVE_DELAY_MS после последней правки — серия правок
+дает одну запись. Поток получает копии записей: список в памяти можно менять во время
+записи. Одновременно идет не больше одной записи; правки, сделанные за это время,
+попадают в следующую.
+
+Перед чтением файла и при выходе отложенная запись выполняется синхронно (flush).
+"""
+
+import copy
+import threading
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from config import IBASES_SAVE_DELAY_MS
+
+
+class IbasesSaver(QObject):
+    """Отложенная запись списка баз через IbasesStore."""
+
+    # SaveResult, отправленные на запись копии баз, метка снимка (см. snapshot)
+    saved = Signal(object, object, object)
+    # Исключение записи
+    failed = Signal(object)
+    # Фоновый поток закончил (соединение между потоками — через очередь событий)
+    _finished = Signal()
+
+    def __init__(self, store, snapshot, parent=None):
+        """
+        Args:
+            store: IbasesStore
+            snapshot: Функция () -> (список баз для записи, метка); метка возвращается в saved
+        """
+        super().__init__(parent)
+        self.store = store
+        self._snapshot = snapshot
+        self._dirty = False
+        self._thread = None
+        self._job = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(IBASES_SAVE_DELAY_MS)
+        self._timer.timeout.connect(self._start)
+        self._finished.connect(self._collect)
+
+    @property
+    def pending(self):
+        """Есть незаписанные правки или запись еще идет"""
+        return self._dirty or self._thread is not None
+
+    def schedule(self):
+        """Запись после паузы в правках"""
+        self._dirty = True
+        self._timer.start()
+
+    def flush(self):
+        """Синхронно записывает отложенные правки (дожидается текущей записи)"""
+        self._timer.stop()
+        self._collect()
+        if self._dirty:
+            job = self._take_job()
+            self._run(job, notify=False)
+            self._deliver(job)
+
+    def _take_job(self):
+        bases, tag = self._snapshot()
+        self._dirty = False
+        return {'sent': [copy.copy(base) for base in bases], 'tag': tag}
+
+    def _start(self):
+        if not self._dirty or self._thread is not None:
+            # Идет запись: следующая начнется по ее завершении (_collect)
+            return
+        self._job = self._take_job()
+        self._thread = threading.Thread(target=self._run, args=(self._job, True), daemon=True)
+        self._thread.start()
+
+    def _run(self, job, notify):
+        try:
+            # Слияние изменяет записи на месте — отправленные копии остаются базой для сверки
+            job['result'] = self.store.save([copy.copy(base) for base in job['sent']])
+        except Exception as e:
+            job['error'] = e
+        if notify:
+            self._finished.emit()
+
+    def _collect(self):
+        if self._thread is None:
+            return
+        self._thread.join()
+        self._thread = None
+        job, self._job = self._job, None
+        self._deliver(job)
+        if self._dirty and 'error' not in job:
+            self._timer.start()
+
+    def _deliver(self, job):
+        if 'error' in job:
+            # Правки остаются незаписанными: повтор при следующей правке или flush
+            self._dirty = True
+            self.failed.emit(job['error'])
+        else:
+            self.saved.emit(job['result'], job['sent'], job['tag'])
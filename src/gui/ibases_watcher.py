@@ -0,0 +1,50 @@
+"""Наблюдение за ibases.v8i: изменения извне (1CEStart, редакторы) без опроса.
+
+QFileSystemWatcher сообщает об изменении файла; события за IBASES_WATCH_DEBOUNCE_MS
+схлопываются в одно (редакторы часто пишут дважды). Редакторы, сохраняющие через
+замену файла, снимают его с наблюдения — поэтому наблюдается и каталог, а файл
+добавляется заново, как только появится.
+"""
+
+from pathlib import Path
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from config import IBASES_WATCH_DEBOUNCE_MS
+
+
+class IbasesWatcher(QObject):
+    """Сигнал changed — не чаще раза в IBASES_WATCH_DEBOUNCE_MS после серии изменений."""
+
+    changed = Signal()
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = str(path)
+        self._watcher = QFileSystemWatcher(self)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(IBASES_WATCH_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.changed)
+        self._watcher.fileChanged.connect(self._on_event)
+        self._watcher.directoryChanged.connect(self._on_event)
+
+    def start(self):
+        directory = str(Path(self.path).parent)
+        if Path(directory).is_dir() and directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        self._rewatch_file()
+
+    def stop(self):
+        self._debounce.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+
+    def _rewatch_file(self):
+        if self.path not in self._watcher.files() and Path(self.path).exists():
+            self._watcher.addPath(self.path)
+
+    def _on_event(self, _path):
+        self._rewatch_file()
+        self._debounce.start()
@@ -0,0 +1,148 @@
+"""Очередь запуска набора баз со ступенчатым стартом (см. services/launch_sets.py).
+
+Базы набора запускаются по очереди: StaggerScheduler выдерживает паузу между
+запусками и ограничивает число клиентов, ждущих окна. Окончание старта
+клиента приходит от LaunchTracker (окно, ошибка или таймаут). Дерево
+обновляется один раз — после последнего запуска, а не после каждого.
+Уже открытые базы не запускаются повторно и не активируются.
+"""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from services.launch_metrics import OUTCOME_OK, OUTCOME_TIMEOUT
+from services.launch_sets import (
+    STATUS_ERROR,
+    STATUS_MISSING,
+    STATUS_OK,
+    STATUS_RUNNING,
+    STATUS_TIMEOUT,
+    LaunchSetResult,
+    StaggerScheduler,
+)
+
+
+class LaunchQueue(QObject):
+    """Запуск набора баз без перегрузки сервера 1С."""
+
+    # LaunchSetResult очередной базы (после окна, ошибки или таймаута)
+    item_finished = Signal(object)
+    # LaunchSet, список LaunchSetResult в порядке набора
+    finished = Signal(object, object)
+
+    def __init__(self, window, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.launch_set = None
+        self.scheduler = None
+        self._pending = []
+        self._results = []
+        # (id базы, режим) -> LaunchSetResult клиента, ждущего окна
+        self._starting = {}
+        self._spawned = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._pump)
+        window.launch_tracker.finished.connect(self._on_trace_finished)
+
+    @property
+    def running(self):
+        return self.launch_set is not None
+
+    def start(self, launch_set):
+        """Запускает набор. Returns: False — предыдущий набор еще запускается"""
+        if self.running:
+            return False
+        self.launch_set = launch_set
+        self.scheduler = StaggerScheduler()
+        seen = set()
+        self._pending = []
+        for item in launch_set.items:
+            if (item.base_id, item.mode) not in seen:
+                seen.add((item.base_id, item.mode))
+                self._pending.append(item)
+        self._results = []
+        self._starting = {}
+        self._spawned = 0
+        self._timer.start(0)
+        return True
+
+    def cancel(self):
+        """Не запускать оставшиеся базы (уже запущенные дождутся окна)"""
+        self._pending = []
+        self._timer.start(0)
+
+    def _pump(self):
+        while self._pending:
+            delay = self.scheduler.delay()
+            if delay is None:
+                # Продолжим, когда один из стартующих клиентов покажет окно
+                return
+            if delay > 0:
+                self._timer.start(int(delay * 1000) + 1)
+                return
+            self._launch(self._pending.pop(0))
+
+        if self._spawned:
+            self._spawned = 0
+            self.window.refresh_bases_view()
+        self._finish_if_done()
+
+    def _launch(self, item):
+        bases_by_id = {base.id: base for base in self.window.all_bases}
+        database = bases_by_id.get(item.base_id)
+        result = LaunchSetResult(
+            base_id=item.base_id,
+            name=database.name if database else item.base_id,
+            mode=item.mode,
+        )
+        self._results.append(result)
+        self.window.statusBar.showMessage(
+            f"🚀 Набор «{self.launch_set.name}»: {len(self._results)} из {len(self._results) + len(self._pending)}"
+        )
+        if database is None:
+            self._settle(result, STATUS_MISSING)
+            return
+        if self.window.process_actions.find_base_client(database, item.mode):
+            self._settle(result, STATUS_RUNNING)
+            return
+
+        key = (database.id, item.mode)
+        self._starting[key] = result
+        self.scheduler.spawned()
+        actions = self.window.actions
+        if item.mode == 'DESIGNER':
+            launched = actions.open_configurator(database, force_new=True, reload=False)
+        elif item.mode == 'IR_TOOLS':
+            launched = actions.open_ir_tools(database, reload=False)
+        else:
+            launched = actions.open_database(database, force_new=True, reload=False)
+        if launched:
+            self._spawned += 1
+        elif self._starting.pop(key, None) is not None:
+            # Процесс не создан (нет платформы, не собрана команда)
+            self.scheduler.settled()
+            self._settle(result, STATUS_ERROR)
+
+    def _on_trace_finished(self, trace):
+        result = self._starting.pop((trace.base_id, trace.mode), None)
+        if result is None:
+            return
+        self.scheduler.settled()
+        if trace.outcome == OUTCOME_OK:
+            result.time_to_window = trace.time_to_window
+            self._settle(result, STATUS_OK)
+        elif trace.outcome == OUTCOME_TIMEOUT:
+            self._settle(result, STATUS_TIMEOUT)
+        else:
+            self._settle(result, STATUS_ERROR)
+        self._timer.start(0)
+
+    def _settle(self, result, status):
+        result.status = status
+        self.item_finished.emit(result)
+
+    def _finish_if_done(self):
+        if self.running and not self._pending and not self._starting:
+            launch_set, results = self.launch_set, self._results
+            self.launch_set = None
+            self.finished.emit(launch_set, results)
@@ -0,0 +1,125 @@
+"""Отслеживание запусков баз: от формирования команды до появления окна 1С.
+
+PID созданного процесса запоминается сразу. Если это стартер (1cestart.exe),
+а не клиент, он так и не появится среди процессов 1С, и клиент ищется среди
+новых процессов: перед запуском снимается множество PID процессов 1С; затем,
+пока есть незавершенные запуски, таймер опрашивает процессы. Новый PID
+приписывается запуску, только если командная строка указывает на его базу
+(Ref/File или ключ подключения /S, /F). Прочие клиенты (1CEStart, ярлык)
+не приписываются никому — их базу определяет индекс процессов по командной
+строке. Дальше ждем главное окно процесса; итог дописывается в файл метрик,
+а PID запоминается в индексе процессов (services/process_index.py).
+"""
+
+from typing import List, Optional, Set
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from config import LAUNCH_TRACE_POLL_MS, LAUNCH_TRACE_TIMEOUT
+from services.process_index import get_process_index, parse_command_line
+from services.launch_metrics import (
+    LaunchMetricsLog,
+    LaunchTrace,
+    OUTCOME_ERROR,
+    OUTCOME_OK,
+    OUTCOME_TIMEOUT,
+    STAGE_PROCESS,
+    STAGE_WINDOW,
+    start_trace,
+)
+
+
+class LaunchTracker(QObject):
+    """Временные шкалы запусков, ожидающих окна."""
+
+    # Запуск завершен (LaunchTrace с outcome): окно появилось, ошибка или таймаут
+    finished = Signal(object)
+
+    def __init__(self, parent=None, log: Optional[LaunchMetricsLog] = None):
+        super().__init__(parent)
+        self.log = log or LaunchMetricsLog()
+        self._pending: List[LaunchTrace] = []
+        self._known_pids: Set[int] = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(LAUNCH_TRACE_POLL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def begin(self, database, mode) -> LaunchTrace:
+        """Начинает запуск; вызывается до создания процесса."""
+        from services.process_manager import ProcessManager
+
+        if not self._pending:
+            # Пока есть ожидающие запуски, множество PID поддерживает _poll
+            self._known_pids = ProcessManager.get_process_pids()
+        return start_trace(database, mode)
+
+    def watch(self, trace: LaunchTrace, pid: Optional[int] = None):
+        """Процесс передан системе (pid — созданный процесс) — ждем его появления и окна."""
+        trace.pid = pid
+        self._pending.append(trace)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def fail(self, trace: LaunchTrace):
+        """Запуск не удался до создания процесса."""
+        self._finish(trace, OUTCOME_ERROR)
+
+    def _finish(self, trace: LaunchTrace, outcome: str):
+        trace.outcome = outcome
+        if trace in self._pending:
+            self._pending.remove(trace)
+        self.log.append(trace)
+        if outcome == OUTCOME_OK:
+            print(f"⏱️ {trace.base_name}: окно через {trace.time_to_window / 1000:.1f} с")
+        if not self._pending:
+            self._timer.stop()
+        self.finished.emit(trace)
+
+    def _poll(self):
+        from services.process_manager import ProcessManager
+
+        pids = ProcessManager.get_process_pids()
+        new_pids = sorted(pids - self._known_pids)
+        self._known_pids = pids
+
+        for pid in new_pids:
+            if any(trace.pid == pid for trace in self._pending):
+                continue
+            trace = self._match_process(pid, ProcessManager.get_command_line(pid))
+            if trace:
+                trace.pid = pid
+
+        for trace in list(self._pending):
+            if trace.pid is not None:
+                if trace.pid not in pids:
+                    if STAGE_PROCESS in trace.stages:
+                        # Процесс завершился, так и не показав окно
+                        self._finish(trace, OUTCOME_ERROR)
+                        continue
+                    # Создан не клиент (стартер) — клиента ищем по командной строке
+                    trace.pid = None
+                else:
+                    if STAGE_PROCESS not in trace.stages:
+                        trace.mark(STAGE_PROCESS)
+                        get_process_index().record(trace.pid, trace.base_id, trace.mode)
+                    if ProcessManager.get_main_window(trace.pid):
+                        trace.mark(STAGE_WINDOW)
+                        self._finish(trace, OUTCOME_OK)
+                        continue
+            if trace.elapsed() > LAUNCH_TRACE_TIMEOUT:
+                self._finish(trace, OUTCOME_TIMEOUT)
+
+    def _match_process(self, pid, command_line) -> Optional[LaunchTrace]:
+        """Запуск, которому принадлежит новый процесс (None — процесс не наш)."""
+        # PID стартера еще не подтвержден как клиент — такой запуск тоже ждет процесс
+        waiting = [trace for trace in self._pending if STAGE_PROCESS not in trace.stages]
+        if not waiting or not command_line:
+            return None
+        key, _ = parse_command_line(command_line)
+        command_line = command_line.lower()
+        for trace in waiting:
+            if trace.ref and trace.ref.lower() in command_line:
+                return trace
+            if key and trace._key == key:
+                return trace
+        return None
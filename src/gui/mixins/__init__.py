@@ -5,6 +5,13 @@ from .bases_data_mixin import BasesDataMixin
 from .tree_navigation_mixin import TreeNavigationMixin
 from .dbm_mixin import DbmMixin
 from .digit_navigation_mixin import DigitNavigationMixin
+from .ipc_mixin import IpcMixin
+from .search_mixin import SearchMixin
+from .profiling_mixin import ProfilingMixin
+from .foreground_mixin import ForegroundMixin
+from .edit_journal_mixin import EditJournalMixin
+from .prewarm_mixin import PrewarmMixin
+from .launch_sets_mixin import LaunchSetsMixin
 
 __all__ = [
     "TrayMixin",
@@ -14,4 +21,11 @@ __all__ = [
     "TreeNavigationMixin",
     "DbmMixin",
     "DigitNavigationMixin",
+    "IpcMixin",
+    "SearchMixin",
+    "ProfilingMixin",
+    "ForegroundMixin",
+    "EditJournalMixin",
+    "PrewarmMixin",
+    "LaunchSetsMixin",
 ]
@@ -1,64 +1,219 @@
-from services.base_reader import BaseReader
-from config import IBASES_PATH, ENCODING
+from PySide6.QtCore import QTimer
+
+from gui.tree.batch_updates import suspended_updates
+from models.database import Database1C
+from services.base_catalog import diff_bases, merge_catalog
+from services.credential_vault import move_passwords_to_vault
+from services.frecency import apply_recent_limit, get_frecency_store
+from services.ibases_store import merge_bases
+from services.process_index import get_process_index
+from services.profiling import hot_path
+from services.tree_snapshot import TreeSnapshot, TreeSnapshotStore, stat_key
+from config import IBASES_PATH, TREE_SNAPSHOT_PATH
 
 
 class BasesDataMixin:
     """Миксин для загрузки и сохранения данных баз 1С."""
 
+    @hot_path("load_bases")
     def load_bases(self):
-        """Загрузка баз из ibases.v8i."""
-        reader = BaseReader(IBASES_PATH, ENCODING)
+        """Загрузка баз из ibases.v8i (общие списки дочитываются в фоне)."""
+        catalog = self.catalog_loader.catalog
+        # Stat снимается до чтения: если файл изменится во время разбора,
+        # снимок при выходе окажется устаревшим, а не ошибочно актуальным
+        self._ibases_stat, local_bases = catalog.read(catalog.local)
+        self.ibases_store.mark_loaded(local_bases, self._ibases_stat)
+        # Базы общих списков остаются с прошлой загрузки, пока не придут свежие
+        shared_bases = [base for base in self.all_bases if not base.is_local()]
+        self.all_bases[:] = merge_catalog([local_bases, shared_bases])
+        self._apply_loaded_bases()
+        self.load_shared_bases()
+
+    @hot_path("load_bases_from_snapshot")
+    def load_bases_from_snapshot(self):
+        """Загрузка дерева из снимка прошлого сеанса.
+
+        Returns:
+            True, если снимок актуален для текущего ibases.v8i и дерево построено.
+        """
+        snapshot = TreeSnapshotStore(TREE_SNAPSHOT_PATH, IBASES_PATH).load()
+        if snapshot is None:
+            return False
+
+        self._ibases_stat = stat_key(IBASES_PATH)
         self.all_bases.clear()
-        self.all_bases.extend(reader.read_bases())
+        self.all_bases.extend(snapshot.bases)
+        self.ibases_store.mark_loaded([base for base in self.all_bases if base.is_local()], self._ibases_stat)
+        if not self.view_state.expanded and not self.view_state.selected_id:
+            # Состояние дерева еще не сохранялось отдельно — берем его из снимка
+            self.view_state.replace(snapshot.expanded_folders, snapshot.selected_id)
+        self._apply_loaded_bases()
+        self.restore_expanded_folders()
+        selected_id = self.view_state.selected_id
+        if selected_id:
+            self.last_launched_db = next(
+                (base for base in self.all_bases if base.id == selected_id), None
+            )
+            self.select_base_by_id(selected_id)
+        # В снимке — общие списки прошлого сеанса; актуальные дочитываются в фоне
+        self.load_shared_bases()
+        return True
+
+    def _apply_loaded_bases(self):
+        """Рейтинг "Недавних", индекс процессов, дерево и поиск по новому списку баз."""
+        self.move_plaintext_passwords()
+        self.apply_recent_ranking()
+        get_process_index().rebuild(self.all_bases)
         self.tree_builder.build_tree(self.all_bases)
+        self.invalidate_search_index()
+
+    def load_shared_bases(self):
+        """Фоновое чтение общих списков баз (1CEStart.cfg, SHARED_IBASES_PATHS)."""
+        if self.catalog_loader.has_shared_sources():
+            self.catalog_loader.load_shared()
+
+    def _on_shared_source_loaded(self, source, stat, bases):
+        """Общий список прочитан (главный поток): подмешиваем его базы в дерево."""
+        if stat is None:
+            # Ресурс недоступен — оставляем базы, которые уже показаны (например, из снимка)
+            return
+        kept = [base for base in self.all_bases if base.source != source.name]
+        old_shared = [base for base in self.all_bases if base.source == source.name]
+        # Неизмененные записи остаются прежними объектами: на них ссылаются строки дерева
+        current = {base.id: base for base in old_shared}
+        bases = [current[base.id] if current.get(base.id) == base else base for base in bases]
+        self.all_bases[:] = merge_catalog([kept, bases])
+        diff = diff_bases(old_shared, [base for base in self.all_bases if base.source == source.name])
+        if not diff:
+            # Список не изменился (например, совпал со снимком) — дерево не перестраиваем
+            return
+        print(f"📚 Общий список {source.path}: {len(bases)} баз ({diff})")
+        self._rebuild_tree_keeping_state()
+
+    def _on_ibases_changed(self):
+        """ibases.v8i изменен: перечитываем, если это не собственная запись лончера.
+
+        После фоновой записи запоминается (mtime_ns, size) файла — это поколение
+        собственной записи: событие с тем же stat пропускается без чтения файла.
+        """
+        if not self._bases_loaded:
+            return
+        # Незаписанные правки сначала в файл: слияние с внешними изменениями — в IbasesStore
+        self.flush_bases()
+        stat = stat_key(IBASES_PATH)
+        if stat is None or stat == self._ibases_stat:
+            return
+
+        catalog = self.catalog_loader.catalog
+        old_local = [base for base in self.all_bases if base.is_local()]
+        # Разбираются только измененные секции (кэш секций каталога)
+        self._ibases_stat, local_bases = catalog.read(catalog.local)
+        self.ibases_store.mark_loaded(local_bases, self._ibases_stat)
+        diff = diff_bases(old_local, local_bases)
+        if not diff:
+            return
+
+        shared_bases = [base for base in self.all_bases if not base.is_local()]
+        self.all_bases[:] = merge_catalog([local_bases, shared_bases])
+        self._rebuild_tree_keeping_state()
+        print(f"🔄 ibases.v8i изменен извне: {diff}")
+        self.statusBar.showMessage(f"🔄 ibases.v8i изменен извне: {diff}", 4000)
+
+    def _rebuild_tree_keeping_state(self):
+        """Перестраивает дерево, сохраняя развернутые папки и выбранную базу.
+
+        Развернутые папки уже известны состоянию дерева (см. setup_view_state) —
+        перед перестройкой дерево не обходится.
+        """
+        selected = self.operations.get_selected_database(self.model, self.tree, quiet=True)
+        with suspended_updates(self.tree):
+            self._apply_loaded_bases()
+            self.refresh_opened_bases()
+            self.refresh_main_processes()
+            self.restore_expanded_folders()
+            if isinstance(selected, Database1C):
+                self.select_base_by_id(selected.id)
+
+    def move_plaintext_passwords(self):
+        """Пароли Pwd* из ibases.v8i (прежние версии лончера, ручная правка) — в хранилище паролей."""
+        moved = [base for base in self.all_bases if base.is_local() and move_passwords_to_vault(base)]
+        if moved:
+            print(f"🔐 Пароли перенесены из ibases.v8i в хранилище паролей: {len(moved)} баз")
+            self.save_bases()
+
+    def apply_recent_ranking(self):
+        """Упорядочивает "Недавние" по рейтингу запусков и ограничивает их размер."""
+        if apply_recent_limit(self.all_bases, get_frecency_store()):
+            # Вытесненные базы вернулись в свои папки — фиксируем в ibases.v8i
+            self.save_bases()
+
+    def save_tree_snapshot(self):
+        """Сохранение снимка дерева (вызывается при выходе)."""
+        selected = self.operations.get_selected_database(self.model, self.tree, quiet=True)
+        snapshot = TreeSnapshot(
+            bases=list(self.all_bases),
+            expanded_folders=self.collect_expanded_folders(),
+            selected_id=selected.id if isinstance(selected, Database1C) else None,
+        )
+        TreeSnapshotStore(TREE_SNAPSHOT_PATH, IBASES_PATH).save(snapshot, self._ibases_stat)
 
     def save_bases(self):
-        """Сохранение баз в ibases.v8i."""
-        try:
-            with open(IBASES_PATH, 'w', encoding=ENCODING) as f:
-                for base in self.all_bases:
-                    f.write(f"[{base.name}]\n")
-                    f.write(f"ID={base.id}\n")
-                    f.write(f"Connect={base.connect}\n")
-                    f.write(f"Folder={base.folder}\n")
-                    if base.is_recent:
-                        f.write("IsRecent=1\n")
-                    if base.last_run_time:
-                        f.write(f"LastRunTime={base.last_run_time.isoformat()}\n")
-                    if base.app:
-                        f.write(f"App={base.app}\n")
-                    if base.version:
-                        f.write(f"Version={base.version}\n")
-                    if base.app_arch:
-                        f.write(f"AppArch={base.app_arch}\n")
-                    if base.client_type:
-                        f.write(f"ClientType={base.client_type}\n")
-                    if base.order_in_tree is not None:
-                        f.write(f"OrderInTree={base.order_in_tree}\n")
-                    if base.usr:
-                        f.write(f"Usr={base.usr}\n")
-                    if base.pwd:
-                        f.write(f"Pwd={base.pwd}\n")
-                    if base.storage_path:
-                        f.write(f"StoragePath={base.storage_path}\n")
-                    if base.usr_enterprise:
-                        f.write(f"UsrEnterprise={base.usr_enterprise}\n")
-                    if base.pwd_enterprise:
-                        f.write(f"PwdEnterprise={base.pwd_enterprise}\n")
-                    if base.usr_configurator:
-                        f.write(f"UsrConfigurator={base.usr_configurator}\n")
-                    if base.pwd_configurator:
-                        f.write(f"PwdConfigurator={base.pwd_configurator}\n")
-                    if base.usr_storage:
-                        f.write(f"UsrStorage={base.usr_storage}\n")
-                    if base.pwd_storage:
-                        f.write(f"PwdStorage={base.pwd_storage}\n")
-                    f.write("\n")
-        except Exception as e:
-            self.statusBar.showMessage(f"\u274c Ошибка сохранения: {e}")
+        """Сохранение баз в ibases.v8i (базы общих списков не сохраняются).
+
+        Файл переписывается в фоне после паузы в правках (см. gui/ibases_saver.py);
+        сами правки к этому моменту уже в журнале.
+        """
+        self.ibases_saver.schedule()
+
+    def flush_bases(self):
+        """Синхронная запись отложенных правок (перед чтением ibases.v8i и при выходе)."""
+        self.ibases_saver.flush()
+
+    def _bases_for_save(self):
+        """Снимок для фоновой записи: личные базы и номер последнего события журнала."""
+        return [base for base in self.all_bases if base.is_local()], self.edit_journal.last_event
+
+    def _on_bases_saved(self, result, sent, journal_event):
+        """ibases.v8i записан (главный поток).
+
+        Если файл изменили с момента загрузки (1CEStart, другой экземпляр лончера),
+        IbasesStore слил изменения с нашими по ID записей. Список в памяти за время
+        записи мог измениться — слияние с ним идет относительно отправленных копий.
+        """
+        self._ibases_stat = result.stat
+        self.edit_journal.mark_saved(journal_event)
+
+        if result.merged is not None:
+            local_bases = [base for base in self.all_bases if base.is_local()]
+            shared_bases = [base for base in self.all_bases if not base.is_local()]
+            merged, conflicts = merge_bases(sent, local_bases, result.merged)
+            self.all_bases[:] = merge_catalog([merged, shared_bases])
+            conflicts = list(dict.fromkeys(result.conflicts + conflicts))
+            message = "🔀 ibases.v8i изменен другим приложением — изменения объединены"
+            if conflicts:
+                message += f"; конфликты (оставлены наши значения): {', '.join(conflicts)}"
+            print(message)
+            self.statusBar.showMessage(message, 8000)
+            # Запись могла завершиться посреди обработчика (flush) — дерево перестраиваем после него
+            QTimer.singleShot(0, self._rebuild_tree_keeping_state)
+
+        if not self.ibases_saver.pending and self.edit_journal.needs_compaction:
+            self.edit_journal.compact()
+
+    def _on_bases_save_failed(self, error):
+        print(f"❌ Ошибка сохранения ibases.v8i: {error}")
+        self.statusBar.showMessage(f"\u274c Ошибка сохранения: {error}")
+
+    def refresh_bases_view(self):
+        """Перестроение дерева по списку в памяти после правки (без перечитывания ibases.v8i)."""
+        self._apply_loaded_bases()
+        self.refresh_opened_bases()
+        self.refresh_main_processes()
+        self.expand_and_select_initial()
 
     def reload_and_navigate(self):
         """Перечитать базы и обновить дерево с навигацией."""
+        self.flush_bases()
         self.load_bases()
         self.refresh_opened_bases()
         self.refresh_main_processes()
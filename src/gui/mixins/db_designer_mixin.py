@@ -1,16 +1,21 @@
-"""Миксин для Designer bat-операций: UpdateDBCfg, DumpCfg, RepositoryUpdateCfg."""
+"""Миксин для Designer bat-операций: UpdateDBCfg, DumpCfg, RepositoryUpdateCfg.
+
+Формирование BAT и выполнение вынесены в services.designer_jobs (без Qt),
+чтобы те же операции были доступны из консольного интерфейса cli.py.
+"""
 
-import os
-import re
-import tempfile
 import platform
-import subprocess
 import threading
-from pathlib import Path
-from datetime import datetime
-from PySide6.QtCore import QTimer
 
-from config import CF_DUMP_PATH, LOG_PATH
+from services.designer_jobs import (
+    ACTION_DUMP_CF,
+    ACTION_REPO_UPDATE_AND_DUMP_CF,
+    ACTION_REPO_UPDATE_CFG,
+    ACTION_UPDATE_AND_DUMP_CF,
+    ACTION_UPDATE_CFG,
+    build_designer_job,
+    run_designer_job,
+)
 
 
 class DbDesignerMixin:
@@ -22,47 +27,12 @@ class DbDesignerMixin:
 
     def save_cfg(self, database):
         """F7: обновление конфигурации БД (Designer /UpdateDBCfg)."""
-        if not database:
-            self.window.statusBar.showMessage("❌ База не выбрана")
-            return False
-
-        if platform.system() != 'Windows':
-            self.window.statusBar.showMessage("❌ Операция поддерживается только в Windows")
-            return False
-
-        executable = self._get_1c_executable(database, mode='DESIGNER')
-        if not executable:
-            self.window.statusBar.showMessage("❌ Не удалось найти 1cv8.exe для конфигуратора")
-            return False
-
-        try:
-            base_stem = self._build_base_stem(database)
-            log_file = self._build_action_log_path(base_stem, action_name="UpdateDBCfg")
-
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-
-            bat_text = self._build_update_db_cfg_bat(
-                executable=Path(executable),
-                database=database,
-                log_file=log_file,
-            )
-
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='utf-8'
-            ) as bat_file:
-                bat_file.write(bat_text)
-                bat_path = bat_file.name
-
-            self.window.statusBar.showMessage(f"💾 Обновление конфигурации запущено (log: {log_file})")
-            self._run_bat_and_cleanup(bat_path)
-            return True
-
-        except Exception as e:
-            self.window.statusBar.showMessage(f"❌ Ошибка подготовки UpdateDBCfg: {e}")
-            return False
+        return self._start_designer_job(
+            database,
+            ACTION_UPDATE_CFG,
+            started_message=lambda job: f"💾 Обновление конфигурации запущено (log: {job.log_files[0]})",
+            error_prefix="Ошибка подготовки UpdateDBCfg",
+        )
 
     def update_cfg_from_repository(self, database):
         """Ctrl+F7: обновление конфигурации из хранилища и сохранение (Designer).
@@ -70,152 +40,55 @@ class DbDesignerMixin:
         Делает ConfigurationRepositoryUpdateCfg и затем UpdateDBCfg в одном вызове,
         как в предоставленном примере BAT.
         """
-        if not database:
-            self.window.statusBar.showMessage("❌ База не выбрана")
-            return False
-
-        if platform.system() != 'Windows':
-            self.window.statusBar.showMessage("❌ Операция поддерживается только в Windows")
-            return False
-
-        executable = self._get_1c_executable(database, mode='DESIGNER')
-        if not executable:
-            self.window.statusBar.showMessage("❌ Не удалось найти 1cv8.exe для конфигуратора")
-            return False
-
-        try:
-            base_stem = self._build_base_stem(database)
-            log_file = self._build_action_log_path(base_stem, action_name="RepositoryUpdateCfg")
-
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-
-            bat_text = self._build_repo_update_cfg_bat(
-                executable=Path(executable),
-                database=database,
-                log_file=log_file,
-            )
-
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='utf-8'
-            ) as bat_file:
-                bat_file.write(bat_text)
-                bat_path = bat_file.name
-
-            self.window.statusBar.showMessage(f"📥 Обновление из хранилища запущено (log: {log_file})")
-            self._run_bat_and_cleanup(bat_path)
-            return True
-
-        except Exception as e:
-            self.window.statusBar.showMessage(f"❌ Ошибка подготовки RepositoryUpdateCfg: {e}")
-            return False
+        return self._start_designer_job(
+            database,
+            ACTION_REPO_UPDATE_CFG,
+            started_message=lambda job: f"📥 Обновление из хранилища запущено (log: {job.log_files[0]})",
+            error_prefix="Ошибка подготовки RepositoryUpdateCfg",
+        )
 
     def dump_cf(self, database):
         """Выгрузка конфигурации в CF (Designer /DumpCfg)."""
-        if not database:
-            self.window.statusBar.showMessage("❌ База не выбрана")
-            return False
-
-        if platform.system() != 'Windows':
-            self.window.statusBar.showMessage("❌ Выгрузка CF поддерживается только в Windows")
-            return False
-
-        executable = self._get_1c_executable(database, mode='DESIGNER')
-        if not executable:
-            self.window.statusBar.showMessage("❌ Не удалось найти 1cv8.exe для конфигуратора")
-            return False
-
-        try:
-            dump_file = self._build_cf_dump_path(database)
-            log_file = self._build_action_log_path(dump_file.stem, action_name="DumpCfg")
-
-            dump_file.parent.mkdir(parents=True, exist_ok=True)
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-
-            bat_text = self._build_dump_cf_bat(
-                executable=Path(executable),
-                database=database,
-                dump_file=dump_file,
-                log_file=log_file,
-            )
-
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='utf-8'
-            ) as bat_file:
-                bat_file.write(bat_text)
-                bat_path = bat_file.name
-
-            self.window.statusBar.showMessage(f"📦 Выгрузка CF запущена: {dump_file} (log: {log_file})")
-            self._run_bat_and_cleanup(bat_path)
-            return True
-
-        except Exception as e:
-            self.window.statusBar.showMessage(f"❌ Ошибка подготовки DumpCfg: {e}")
-            return False
+        return self._start_designer_job(
+            database,
+            ACTION_DUMP_CF,
+            started_message=lambda job: f"📦 Выгрузка CF запущена: {job.dump_file} (log: {job.log_files[0]})",
+            error_prefix="Ошибка подготовки DumpCfg",
+            unsupported_message="❌ Выгрузка CF поддерживается только в Windows",
+        )
 
     def save_and_dump_cf(self, database):
-        """Обновление конфигурации БД и выгрузка конфигурации в CF (Designer).
-
-        Создаёт BAT по образцу (chcp 65001, set PLATFORM/BASE/LOG/DUMP/CREDENTIALS),
-        затем запускает его через cmd.exe.
-        """
-        if not database:
-            self.window.statusBar.showMessage("❌ База не выбрана")
-            return False
-
-        if platform.system() != 'Windows':
-            self.window.statusBar.showMessage("❌ Выгрузка CF поддерживается только в Windows")
-            return False
-
-        executable = self._get_1c_executable(database, mode='DESIGNER')
-        if not executable:
-            self.window.statusBar.showMessage("❌ Не удалось найти 1cv8.exe для конфигуратора")
-            return False
-
-        try:
-            dump_file = self._build_cf_dump_path(database)
-
-            # Готовим директории
-            dump_file.parent.mkdir(parents=True, exist_ok=True)
-            log_dir = self._get_log_dir()
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            bat_text = self._build_save_and_dump_cf_bat(
-                executable=Path(executable),
-                database=database,
-                dump_file=dump_file
-            )
-
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='utf-8'
-            ) as bat_file:
-                bat_file.write(bat_text)
-                bat_path = bat_file.name
-
-            self.window.statusBar.showMessage(f"💾 Обновление и выгрузка CF запущена: {dump_file}")
-            self._run_bat_and_cleanup(bat_path)
-            return True
-
-        except Exception as e:
-            self.window.statusBar.showMessage(f"❌ Ошибка подготовки выгрузки CF: {e}")
-            return False
+        """Обновление конфигурации БД и выгрузка конфигурации в CF (Designer)."""
+        return self._start_designer_job(
+            database,
+            ACTION_UPDATE_AND_DUMP_CF,
+            started_message=lambda job: f"💾 Обновление и выгрузка CF запущена: {job.dump_file}",
+            error_prefix="Ошибка подготовки выгрузки CF",
+            unsupported_message="❌ Выгрузка CF поддерживается только в Windows",
+        )
 
     def update_cfg_from_repository_and_dump_cf(self, database):
         """Обновление конфигурации из хранилища, сохранение БД и выгрузка конфигурации в CF (Designer)."""
+        return self._start_designer_job(
+            database,
+            ACTION_REPO_UPDATE_AND_DUMP_CF,
+            started_message=lambda job: f"📥 Обновление из хранилища и выгрузка CF запущена (log: {job.log_files[0]})",
+            error_prefix="Ошибка подготовки RepositoryUpdateCfg+DumpCfg",
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Запуск                                                              #
+    # ------------------------------------------------------------------ #
+
+    def _start_designer_job(self, database, action, started_message, error_prefix,
+                            unsupported_message="❌ Операция поддерживается только в Windows"):
+        """Готовит операцию конфигуратора и выполняет ее в фоновом потоке."""
         if not database:
             self.window.statusBar.showMessage("❌ База не выбрана")
             return False
 
         if platform.system() != 'Windows':
-            self.window.statusBar.showMessage("❌ Операция поддерживается только в Windows")
+            self.window.statusBar.showMessage(unsupported_message)
             return False
 
         executable = self._get_1c_executable(database, mode='DESIGNER')
@@ -224,325 +97,17 @@ class DbDesignerMixin:
             return False
 
         try:
-            dump_file = self._build_cf_dump_path(database)
-            
-            # Готовим директории
-            dump_file.parent.mkdir(parents=True, exist_ok=True)
-            log_dir = self._get_log_dir()
-            log_dir.mkdir(parents=True, exist_ok=True)
-
-            base_stem = dump_file.stem
-            log_update = self._build_action_log_path(base_stem, "RepositoryUpdateCfg")
-            log_dump = self._build_action_log_path(base_stem, "DumpCfg")
-
-            bat_text = self._build_repo_update_and_dump_cf_bat(
-                executable=Path(executable),
-                database=database,
-                dump_file=dump_file,
-                log_update=log_update,
-                log_dump=log_dump,
-            )
-
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='utf-8'
-            ) as bat_file:
-                bat_file.write(bat_text)
-                bat_path = bat_file.name
-
-            self.window.statusBar.showMessage(f"📥 Обновление из хранилища и выгрузка CF запущена (log: {log_update})")
-            self._run_bat_and_cleanup(bat_path)
-            return True
-
+            job = build_designer_job(action, database, executable)
         except Exception as e:
-            self.window.statusBar.showMessage(f"❌ Ошибка подготовки RepositoryUpdateCfg+DumpCfg: {e}")
+            self.window.statusBar.showMessage(f"❌ {error_prefix}: {e}")
             return False
 
-    # ------------------------------------------------------------------ #
-    #  Вспомогательные методы путей / имён файлов                         #
-    # ------------------------------------------------------------------ #
-
-    def _build_base_stem(self, database) -> str:
-        """Формирует базовую часть имени файла: <REF>_<ИМЯ_БАЗЫ>_<YYMMDD>_<HHMM>."""
-        import re
-        from datetime import datetime
-        
-        # 1. Получаем и очищаем ИМЯ_БАЗЫ
-        base_name = (database.name or "database").strip()
-        safe_name = self._sanitize_filename(base_name)
-        if not safe_name:
-            safe_name = "database"
-
-        # 2. Получаем строку подключения и извлекаем REF
-        connect = (database.connect or "").strip()
-        safe_ref = ""
-        
-        if connect:
-            # Ищем значения Ref (серверная) или File (файловая)
-            ref_match = re.search(r'(?i)Ref\s*=\s*["\']?([^;"\']+)["\']?', connect)
-            file_match = re.search(r'(?i)File\s*=\s*["\']?([^;"\']+)["\']?', connect)
-            
-            raw_ref = ""
-            if ref_match:
-                raw_ref = ref_match.group(1)
-            elif file_match:
-                raw_ref = file_match.group(1)
-                
-            if raw_ref:
-                # Очищаем извлеченное имя (Ref/File) от спецсимволов
-                clean_ref = re.sub(r'[^\w\-]', '_', raw_ref)
-                clean_ref = re.sub(r'_+', '_', clean_ref).strip('_')
-                safe_ref = self._sanitize_filename(clean_ref)
-
-        # 3. Формируем дату и время
-        now = datetime.now()
-        timestamp = now.strftime("%y%m%d%H%M")
-        
-        # 4. Собираем финальную строку в нужном порядке
-        if safe_ref:
-            return f"{safe_name}_{timestamp}_{safe_ref}"
-        
-        # Fallback, если строка подключения пустая или в ней нет Ref/File
-        return f"{safe_name}_{timestamp}"
-
-    def _build_cf_dump_path(self, database) -> Path:
-        """Формирует путь к .cf для выгрузки в формате <ИМЯ_БАЗЫ>_<YYMMDD>_<HHMM>.cf"""
-        stem = self._build_base_stem(database)
-        return Path(CF_DUMP_PATH) / f"{stem}.cf"
-
-    def _get_log_dir(self) -> Path:
-        base = Path(LOG_PATH)
-        return base.parent if base.suffix else base
-
-    def _build_action_log_path(self, base_stem: str, action_name: str) -> Path:
-        """Формирует имя лог-файла: <STEM>_log_<ACTION><ext>."""
-        base = Path(LOG_PATH)
-        log_dir = base.parent if base.suffix else base
-        ext = base.suffix if base.suffix else ".txt"
-
-        safe_action = self._sanitize_filename(action_name) or "action"
-        return log_dir / f"{base_stem}_log_{safe_action}{ext}"
-
-    def _sanitize_filename(self, value: str) -> str:
-        """Очищает строку от символов, запрещённых в именах файлов Windows."""
-        value = re.sub(r'[<>:"/\\|?*\x00-\x1F]', '_', value)
-        value = value.strip().strip('.')
-        value = re.sub(r'\s+', ' ', value)
-        return value
-
-    # ------------------------------------------------------------------ #
-    #  BAT-билдеры и запуск                                                #
-    # ------------------------------------------------------------------ #
-
-    def _run_bat_and_cleanup(self, bat_path: str):
-        """Запускает BAT-файл в фоновом потоке и удаляет его только после полного завершения."""
-        def worker():
-            try:
-                subprocess.run(["cmd", "/c", bat_path], shell=False)
-            finally:
-                try:
-                    if hasattr(self, '_cleanup_temp_file'):
-                        self._cleanup_temp_file(bat_path)
-                    elif os.path.exists(bat_path):
-                        os.remove(bat_path)
-                except Exception as e:
-                    print(f"Ошибка удаления временного файла {bat_path}: {e}")
-                    
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _build_update_db_cfg_bat(self, executable: Path, database, log_file: Path) -> str:
-        """Генерирует BAT для Designer /UpdateDBCfg."""
-        base_param = self._build_base_param_for_bat(database)
-        credentials = self._build_credentials_for_bat(database)
-
-        bat = []
-        bat.append('@echo off')
-        bat.append('chcp 65001 >nul')
-        bat.append(f'set PLATFORM="{executable}"')
-        bat.append(f'set BASE={base_param}')
-        bat.append(f'set LOG="{log_file}"')
-        bat.append(f'set CREDENTIALS={credentials}')
-        bat.append('')
-
-        bat.append('echo Обновление конфигурации БД...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /UpdateDBCfg /Out%LOG%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при обновлении конфигурации!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-        bat.append('exit /b 0')
-        bat.append('')
-
-        return '\n'.join(bat)
-
-    def _build_repo_update_cfg_bat(self, executable: Path, database, log_file: Path) -> str:
-        """Генерирует BAT для обновления конфигурации из хранилища и сохранения.
-
-        Выполняет:
-        - /ConfigurationRepositoryUpdateCfg -v -1 -revised -force
-        - /UpdateDBCfg
-        """
-        base_param = self._build_base_param_for_bat(database)
-        credentials = self._build_credentials_for_bat(database)
-
-        bat = []
-        bat.append('@echo off')
-        bat.append('chcp 65001 >nul')
-        bat.append(f'set PLATFORM="{executable}"')
-        bat.append(f'set BASE={base_param}')
-        bat.append(f'set LOG="{log_file}"')
-        bat.append(f'set CREDENTIALS={credentials}')
-        bat.append('')
-
-        bat.append('echo Обновление конфигурации из хранилища...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /ConfigurationRepositoryUpdateCfg -v -1 -revised -force /UpdateDBCfg /Out%LOG%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при обновлении конфигурации!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-        bat.append('exit /b 0')
-        bat.append('')
-
-        return '\n'.join(bat)
-
-    def _build_dump_cf_bat(self, executable: Path, database, dump_file: Path, log_file: Path) -> str:
-        """Генерирует BAT для Designer /DumpCfg."""
-        base_param = self._build_base_param_for_bat(database)
-        credentials = self._build_credentials_for_bat(database)
-
-        bat = []
-        bat.append('@echo off')
-        bat.append('chcp 65001 >nul')
-        bat.append(f'set PLATFORM="{executable}"')
-        bat.append(f'set BASE={base_param}')
-        bat.append(f'set LOG="{log_file}"')
-        bat.append(f'set DUMP="{dump_file}"')
-        bat.append(f'set CREDENTIALS={credentials}')
-        bat.append('')
-
-        bat.append('echo Выгрузка конфигурации...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /DumpCfg%DUMP% /Out%LOG%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при выгрузке!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-        bat.append('exit /b 0')
-        bat.append('')
-
-        return '\n'.join(bat)
-
-    def _build_save_and_dump_cf_bat(self, executable: Path, database, dump_file: Path) -> str:
-        """Генерирует BAT-скрипт по образцу из задачи (UpdateDBCfg + DumpCfg)."""
-        base_param = self._build_base_param_for_bat(database)
-        credentials = self._build_credentials_for_bat(database)
-
-        base_stem = dump_file.stem
-
-        # Получаем пути к разным лог-файлам для каждого действия
-        log_update = self._build_action_log_path(base_stem, "UpdateDBCfg")
-        log_dump = self._build_action_log_path(base_stem, "DumpCfg")
-
-        bat = []
-        bat.append('@echo off')
-        bat.append('chcp 65001 >nul')
-        bat.append(f'set PLATFORM="{executable}"')
-        bat.append(f'set BASE={base_param}')
-        bat.append(f'set LOG_UPDATE="{log_update}"')
-        bat.append(f'set LOG_DUMP="{log_dump}"')
-        bat.append(f'set DUMP="{dump_file}"')
-        bat.append(f'set CREDENTIALS={credentials}')
-        bat.append('')
-
-        bat.append('echo Обновление конфигурации БД...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /UpdateDBCfg /Out%LOG_UPDATE%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при обновлении конфигурации!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-
-        bat.append('echo Выгрузка конфигурации...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /DumpCfg%DUMP% /Out%LOG_DUMP%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при выгрузке!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-        bat.append('exit /b 0')
-        bat.append('')
-
-        return '\n'.join(bat)
-        
-    def _build_repo_update_and_dump_cf_bat(self, executable: Path, database, dump_file: Path, log_update: Path, log_dump: Path) -> str:
-        """Генерирует BAT для обновления конфигурации из хранилища и выгрузки CF (Ctrl+F7 + F8)."""
-        base_param = self._build_base_param_for_bat(database)
-        credentials = self._build_credentials_for_bat(database)
-
-        bat = []
-        bat.append('@echo off')
-        bat.append('chcp 65001 >nul')
-        bat.append(f'set PLATFORM="{executable}"')
-        bat.append(f'set BASE={base_param}')
-        bat.append(f'set LOG_UPDATE="{log_update}"')
-        bat.append(f'set LOG_DUMP="{log_dump}"')
-        bat.append(f'set DUMP="{dump_file}"')
-        bat.append(f'set CREDENTIALS={credentials}')
-        bat.append('')
-
-        bat.append('echo Обновление конфигурации из хранилища...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /ConfigurationRepositoryUpdateCfg -v -1 -revised -force /UpdateDBCfg /Out%LOG_UPDATE%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при обновлении из хранилища!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-
-        bat.append('echo Выгрузка конфигурации...')
-        bat.append('%PLATFORM% DESIGNER %BASE% %CREDENTIALS% /DumpCfg%DUMP% /Out%LOG_DUMP%')
-        bat.append('if errorlevel 1 (')
-        bat.append('    echo ОШИБКА при выгрузке!')
-        bat.append('    exit /b 1')
-        bat.append(')')
-        bat.append('')
-        bat.append('exit /b 0')
-        bat.append('')
-
-        return '\n'.join(bat)
-
-    def _build_base_param_for_bat(self, database) -> str:
-        """Возвращает значение для переменной BASE в BAT (включая /S\"...\" если возможно)."""
-        connect = (database.connect or '').strip()
-        if not connect:
-            return ''
-
-        parsed = self._parse_server_connect_string(connect)
-        return f'/S"{parsed}"'
-
-    def _build_credentials_for_bat(self, database) -> str:
-        """Возвращает значение для переменной CREDENTIALS в BAT."""
-        usr = database.usr_configurator or database.usr
-        pwd = database.pwd_configurator or database.pwd
-
-        parts = []
-        if usr:
-            parts.append(f'/N"{usr}"')
-        if pwd:
-            parts.append(f'/P"{pwd}"')
-
-        # Расширение параметров для работы с хранилищем конфигурации
-        name_has_storage = bool(database.name) and ('хран' in database.name.casefold())
-        storage_path = (database.storage_path or '').strip()
-        usr_storage = (database.usr_storage or '').strip()
-        pwd_storage = (database.pwd_storage or '').strip()
-        
-        if storage_path and usr_storage and pwd_storage:
-            parts.append(f'/ConfigurationRepositoryF "{storage_path}"')
-            parts.append(f'/ConfigurationRepositoryN "{usr_storage}"')
-            parts.append(f'/ConfigurationRepositoryP "{pwd_storage}"')
+        self.window.statusBar.showMessage(started_message(job))
+        threading.Thread(target=self._run_designer_job, args=(job,), daemon=True).start()
+        return True
 
-        return ' '.join(parts)
+    def _run_designer_job(self, job):
+        """Выполняет операцию (в фоновом потоке) и пишет результат в консоль."""
+        result = run_designer_job(job)
+        if not result.success:
+            print(f"❌ {job.action} для {result.base_name}: {result.error}")
@@ -1,49 +1,62 @@
 """Миксин для запуска баз 1С: предприятие, конфигуратор, ИР-инструменты."""
 
-import os
-import re
-import tempfile
-import platform
-from pathlib import Path
-from PySide6.QtCore import QTimer
-
-from config import IR_TOOLS_PATH
+from services.launch_command import (
+    build_launch_command,
+    mask_secrets,
+    parse_server_connect_string,
+    resolve_executable,
+    spawn_client,
+)
+from services.launch_metrics import STAGE_COMMAND, STAGE_SPAWN, platform_version
 
 
 class DbLaunchMixin:
     """Запуск 1С-процессов: предприятие, конфигуратор, ИР-инструменты."""
 
-    def open_database(self, database):
-        """Открывает базу в режиме предприятия."""
+    def open_database(self, database, force_new=False, reload=True):
+        """Открывает базу в режиме предприятия.
+
+        Если клиент этой базы в режиме предприятия уже запущен, активирует его;
+        force_new — всегда запускать новый экземпляр. reload=False — без обновления
+        дерева после запуска (набор запуска обновляет его один раз в конце).
+        """
+        if not force_new and self._activate_running_client(database, "ENTERPRISE"):
+            return True
+
         executable = self._get_1c_executable(database)
         if not executable:
             self.window.statusBar.showMessage("❌ Не удалось найти исполняемый файл 1C")
             return False
 
         if self._launch_1c_process(executable, "ENTERPRISE", database):
-            self._move_to_recent(database)
-            self._delayed_reload_after_launch()
+            self._move_to_recent(database, "ENTERPRISE")
+            if reload:
+                self._delayed_reload_after_launch()
             return True
         else:
             self.window.statusBar.showMessage(f"❌ Ошибка при запуске базы {database.name}")
             return False
 
-    def open_configurator(self, database):
-        """Открывает базу в режиме конфигуратора."""
+    def open_configurator(self, database, force_new=False, reload=True):
+        """Открывает базу в режиме конфигуратора (или активирует уже открытый)."""
+        if not force_new and self._activate_running_client(database, "DESIGNER"):
+            return True
+
         executable = self._get_1c_executable(database, mode='DESIGNER')
         if not executable:
             self.window.statusBar.showMessage("❌ Не удалось найти исполняемый файл 1C")
             return False
 
         if self._launch_1c_process(executable, "DESIGNER", database):
-            self._move_to_recent(database)
-            self._delayed_reload_after_launch()
+            self._move_to_recent(database, "DESIGNER")
+            if reload:
+                self._delayed_reload_after_launch()
             return True
         else:
             self.window.statusBar.showMessage(f"❌ Ошибка при запуске конфигуратора для {database.name}")
             return False
 
-    def open_ir_tools(self, database):
+    def open_ir_tools(self, database, reload=True):
         """Открывает базу с запуском инструментов ИР (F5)."""
         executable = self._get_1c_executable(database, mode='IR_TOOLS')
         if not executable:
@@ -51,168 +64,59 @@ class DbLaunchMixin:
             return False
 
         if self._launch_1c_process(executable, "IR_TOOLS", database):
-            self._move_to_recent(database)
-            self._delayed_reload_after_launch()
+            self._move_to_recent(database, "IR_TOOLS")
+            if reload:
+                self._delayed_reload_after_launch()
             return True
         else:
             self.window.statusBar.showMessage(f"❌ Ошибка при запуске инструментов ИР для {database.name}")
             return False
 
+    def _activate_running_client(self, database, mode):
+        """Активирует запущенный клиент базы в режиме mode вместо второго запуска."""
+        if database is None:
+            return False
+        if self.window.process_actions.activate_base_client(database, mode):
+            print(f"↪️ {database.name}: уже открыта, активирован запущенный клиент")
+            return True
+        return False
+
     def _get_1c_executable(self, database, mode=None):
         """Определяет путь к исполняемому файлу 1C с учетом разрядности и типа клиента."""
-        bitness = database.app_arch or 'x86'
-        client_type = database.client_type or 'thick'
-
-        if client_type == 'thin':
-            exe_name = '1cv8c.exe'
-        else:
-            exe_name = '1cv8.exe'
-
-        if mode == 'IR_TOOLS' or mode == 'DESIGNER':
-            exe_name = '1cv8.exe'
-
-        if database.app:
-            path = Path(database.app)
-            if path.exists():
-                return path
-
-        if platform.system() == 'Windows':
-            if database.version:
-                version = database.version
-                if bitness == 'x86_64':
-                    path = Path(rf"C:\Program Files\1cv8\{version}\bin\{exe_name}")
-                else:
-                    path = Path(rf"C:\Program Files (x86)\1cv8\{version}\bin\{exe_name}")
-
-                if path.exists():
-                    return path
-
-            if client_type == 'thick':
-                common_paths = [
-                    Path(r"C:\Program Files\1cv8\common\1cestart.exe"),
-                    Path(r"C:\Program Files (x86)\1cv8\common\1cestart.exe"),
-                ]
-
-                for path in common_paths:
-                    if path.exists():
-                        return path
-
-        return None
+        return resolve_executable(database, mode)
 
     def _parse_server_connect_string(self, connect_string):
         """Парсит строку подключения серверной базы."""
-        try:
-            srvr_match = re.search(r'Srvr="([^"]+)"', connect_string, re.IGNORECASE)
-            ref_match = re.search(r'Ref="([^"]+)"', connect_string, re.IGNORECASE)
-
-            if srvr_match and ref_match:
-                server = srvr_match.group(1)
-                ref = ref_match.group(1)
-                return f"{server}\\{ref}"
-
-            return connect_string
-
-        except Exception as e:
-            print(f"Ошибка парсинга строки подключения: {e}")
-            return connect_string
+        return parse_server_connect_string(connect_string)
 
     def _build_launch_command(self, executable, mode, database):
         """Формирует командную строку для запуска 1С."""
-        try:
-            params = [mode if mode != 'IR_TOOLS' else 'ENTERPRISE']
-
-            if database.connect:
-                parsed_connect = self._parse_server_connect_string(database.connect)
-                params.append(f'/S"{parsed_connect}"')
-
-            usr = None
-            pwd = None
-
-            if mode == 'ENTERPRISE' or mode == 'IR_TOOLS':
-                usr = database.usr_enterprise or database.usr
-                pwd = database.pwd_enterprise or database.pwd
-            elif mode == 'DESIGNER':
-                usr = database.usr_configurator or database.usr
-                pwd = database.pwd_configurator or database.pwd
-
-            if usr:
-                params.append(f'/N"{usr}"')
-            if pwd:
-                params.append(f'/P"{pwd}"')
-
-            if mode == 'DESIGNER':
-                name_has_storage = bool(database.name) and ('хран' in database.name.casefold())
-                storage_path = (database.storage_path or '').strip()
-                usr_storage = (database.usr_storage or '').strip()
-                pwd_storage = (database.pwd_storage or '').strip()
-                if storage_path and usr_storage and pwd_storage:
-                    params.append(f'/ConfigurationRepositoryF "{storage_path}"')
-                    params.append(f'/ConfigurationRepositoryN "{usr_storage}"')
-                    params.append(f'/ConfigurationRepositoryP "{pwd_storage}"')
-
-            if mode == 'IR_TOOLS':
-                params.extend([
-                    '/RunModeOrdinaryApplication',
-                    '/Debug -attach',
-                    '/DebuggerURL tcp://localhost',
-                    '/UC""',
-                    f'/Execute"{IR_TOOLS_PATH}"',
-                    '/WA-',
-                ])
-
-            if mode == 'ENTERPRISE':
-                params.extend([
-                    '/Debug -attach',
-                    '/DebuggerURL tcp://localhost'
-                ])
-
-            cmd_line = f'"{executable}" ' + ' '.join(
-                f'"{p}"' if ' ' in p and not p.startswith('/') else p
-                for p in params
-            )
-
-            return cmd_line
-
-        except Exception as e:
-            print(f"Ошибка формирования командной строки: {e}")
-            return None
+        return build_launch_command(executable, mode, database)
 
     def _launch_1c_process(self, executable, mode, database):
-        """Запускает процесс 1С через временный BAT-файл."""
+        """Запускает процесс 1С напрямую (пароль не записывается во временные файлы)."""
+        tracker = self.window.launch_tracker
+        trace = tracker.begin(database, mode)
+        trace.version = platform_version(executable, database)
         try:
             cmd_line = self._build_launch_command(executable, mode, database)
 
             if not cmd_line:
+                tracker.fail(trace)
                 return False
+            trace.mark(STAGE_COMMAND)
 
-            self.window.statusBar.showMessage(f"🚀 Запуск: {cmd_line}")
+            self.window.statusBar.showMessage(f"🚀 Запуск: {mask_secrets(cmd_line)}")
 
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.bat',
-                delete=False,
-                encoding='cp866'
-            ) as bat_file:
-                bat_file.write('@echo off\n')
-                bat_file.write(f'start "" {cmd_line}\n')
-                bat_file.write('exit\n')
-                bat_path = bat_file.name
-
-            os.startfile(bat_path)
-            QTimer.singleShot(3000, lambda: self._cleanup_temp_file(bat_path))
+            pid = spawn_client(cmd_line)
+            trace.mark(STAGE_SPAWN)
+            tracker.watch(trace, pid)
 
             return True
 
         except Exception as e:
-            print(f"Ошибка запуска через BAT: {e}")
+            tracker.fail(trace)
+            print(f"Ошибка запуска 1С: {e}")
             import traceback
             traceback.print_exc()
             return False
-
-    def _cleanup_temp_file(self, filepath):
-        """Удаляет временный файл."""
-        try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
-        except Exception:
-            pass
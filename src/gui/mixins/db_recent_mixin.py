@@ -2,22 +2,28 @@
 
 from datetime import datetime
 
+from services.frecency import apply_recent_limit, get_frecency_store
+
 
 class DbRecentMixin:
     """Перемещение баз в список недавних и перезагрузка UI после запуска."""
 
-    def _move_to_recent(self, database):
-        """Помечает базу как недавнюю и перемещает в начало списка."""
-        if not database.is_recent and not database.original_folder:
-            database.original_folder = database.folder
+    def _move_to_recent(self, database, mode='ENTERPRISE'):
+        """Учитывает запуск в рейтинге и помещает базу в "Недавние" по рейтингу."""
+        # Запуск не отменяется Ctrl+Z и не сбрасывает повтор: в журнал — только для восстановления
+        with self.window.edit_transaction(f"В недавние: {database.name}", undoable=False):
+            if not database.is_recent and not database.original_folder:
+                database.original_folder = database.folder
 
-        database.is_recent = True
-        database.last_run_time = datetime.now()
+            database.is_recent = True
+            database.last_run_time = datetime.now()
 
-        if database in self.all_bases:
-            self.all_bases.remove(database)
+            store = get_frecency_store()
+            store.record(database.id, mode, database.last_run_time.timestamp())
+            store.save()
+            # Переставляются только недавние; лишние возвращаются в свои папки
+            apply_recent_limit(self.all_bases, store)
 
-        self.all_bases.insert(0, database)
         self.save_callback()
         self.last_launched_db = database
 
@@ -0,0 +1,81 @@
+from contextlib import contextmanager
+
+from services.edit_journal import REPLAY_APPLIED, REPLAY_CONFLICT, JournalConflict, replay_operation
+
+
+class EditJournalMixin:
+    """Миксин отмены и повтора правок списка баз (Ctrl+Z / Ctrl+Y)."""
+
+    def load_edit_journal(self):
+        """Чтение журнала и применение правок, не успевших попасть в ibases.v8i."""
+        self.edit_journal.load()
+        pending = self.edit_journal.pending()
+        if not pending:
+            return
+        results = [replay_operation(op, self.all_bases, forward) for op, forward in pending]
+        applied = results.count(REPLAY_APPLIED)
+        conflicts = results.count(REPLAY_CONFLICT)
+        if not applied:
+            # Все правки уже в файле (запись успела, отметка в журнале — нет)
+            self.edit_journal.mark_saved(self.edit_journal.last_event)
+            return
+        print(f"🩹 Восстановлено незаписанных правок: {applied}, пропущено из-за конфликтов: {conflicts}")
+        self.save_bases()
+        self._rebuild_tree_keeping_state()
+        self.statusBar.showMessage(f"🩹 Восстановлены правки, не записанные в прошлом сеансе: {applied}", 5000)
+
+    @contextmanager
+    def edit_transaction(self, label, undoable=True):
+        """Правка списка баз одной записью журнала (отменяется целиком).
+
+        with self.edit_transaction("Удаление: База"):
+            self.all_bases.remove(database)
+
+        undoable=False — правка только для восстановления после сбоя, Ctrl+Z ее не отменяет
+        (запуск базы и "Из недавних" меняют еще и рейтинг запусков).
+        """
+        capture = self.edit_journal.begin(self.all_bases)
+        try:
+            yield
+        finally:
+            self.edit_journal.commit(label, capture, self.all_bases, undoable)
+
+    def undo_edit(self):
+        """Отмена последней правки (Ctrl+Z)."""
+        try:
+            op = self.edit_journal.undo(self.all_bases)
+        except JournalConflict as e:
+            # База изменена после правки (извне) — правку отменить уже нельзя
+            label = self.edit_journal.undo_label
+            self.edit_journal.drop_undo()
+            self.statusBar.showMessage(f"⚠️ «{label}» не отменить: {e}", 5000)
+            return
+        if op is None:
+            self.statusBar.showMessage("Нечего отменять", 3000)
+            return
+        self._after_journal_step(op)
+        self.statusBar.showMessage(f"↩️ Отменено: {op.label}", 4000)
+
+    def redo_edit(self):
+        """Повтор отмененной правки (Ctrl+Y / Ctrl+Shift+Z)."""
+        try:
+            op = self.edit_journal.redo(self.all_bases)
+        except JournalConflict as e:
+            label = self.edit_journal.redo_label
+            self.edit_journal.drop_redo()
+            self.statusBar.showMessage(f"⚠️ «{label}» не повторить: {e}", 5000)
+            return
+        if op is None:
+            self.statusBar.showMessage("Нечего повторять", 3000)
+            return
+        self._after_journal_step(op)
+        self.statusBar.showMessage(f"↪️ Повторено: {op.label}", 4000)
+
+    def _after_journal_step(self, op):
+        """Запись файла и дерево после отмены/повтора; курсор — на затронутую базу."""
+        self.save_bases()
+        self._rebuild_tree_keeping_state()
+        ids = {base.id for base in self.all_bases}
+        target = next((base_id for base_id in op.base_ids() if base_id in ids), None)
+        if target:
+            self.select_base_by_id(target)
@@ -0,0 +1,49 @@
+from services.backends import get_backend
+
+
+class ForegroundMixin:
+    """Миксин для MRU окон 1С и переключения между базами (Ctrl+Tab)."""
+
+    foreground_watcher = None
+
+    def setup_foreground_watcher(self):
+        """Подписывается на смену активного окна.
+
+        Вызывается на втором этапе загрузки (_load_processes), а не в конструкторе
+        окна: наблюдатель тянет бэкенд процессов (psutil, win32) и ставит хук.
+        """
+        if self.foreground_watcher is not None:
+            return
+        from gui.foreground_watcher import ForegroundWatcher
+
+        self.foreground_watcher = ForegroundWatcher(self)
+        self.foreground_watcher.foreground_changed.connect(self._on_foreground_process)
+
+    def order_opened_processes(self, processes):
+        """Процессы "Открытых баз" по MRU; до запуска наблюдателя — как есть."""
+        if self.foreground_watcher is None:
+            return list(processes)
+        return self.foreground_watcher.order_processes(processes)
+
+    def _on_foreground_process(self, process):
+        """Пользователь переключился в окно 1С (в том числе минуя лончер)."""
+        self.last_activated_process = process
+
+    def switch_to_previous_base(self):
+        """Переключение "как Alt+Tab": предыдущее использованное окно 1С.
+
+        Лончер вызывают поверх последней базы, поэтому цель — второе окно в MRU
+        (или единственное). Окно берется из MRU без сканирования процессов.
+        """
+        entries = self.foreground_watcher.mru.entries() if self.foreground_watcher else []
+        candidates = entries[1:2] + entries[:1] + entries[2:]
+        backend = get_backend()
+        for entry in candidates:
+            if backend.window_exists(entry.hwnd) and backend.activate_window(entry.hwnd):
+                self.statusBar.showMessage(f"✅ Активирован: {entry.title}", 3000)
+                self.minimize_to_tray()
+                return True
+            # Окно закрыто — убираем из MRU и пробуем следующее
+            self.foreground_watcher.mru.discard(entry.pid)
+        self.statusBar.showMessage("ℹ️ Нет других открытых баз", 2000)
+        return False
@@ -23,6 +23,8 @@ class IbasesEditorMixin:
             )
             return
 
+        # Редактор должен увидеть правки, еще не записанные в фоне
+        self.flush_bases()
         proc = QProcess(self)
         proc.setProgram("notepad.exe")
         proc.setArguments([str(IBASES_PATH)])
@@ -0,0 +1,46 @@
+from gui.single_instance import SingleInstanceServer
+
+
+class IpcMixin:
+    """Миксин для приема команд от повторно запущенных экземпляров лончера."""
+
+    def setup_single_instance(self):
+        """Поднимает сервер команд. Возвращает False, если сервер не запущен."""
+        self._ipc_server = SingleInstanceServer(self)
+        self._ipc_server.message_received.connect(self.handle_ipc_message)
+        return self._ipc_server.listen()
+
+    def handle_ipc_message(self, message):
+        """Выполняет команду: показать окно или запустить базу по ID."""
+        command = message.get("command", "show")
+
+        if command == "show":
+            self.hotkey_manager.activate_window()
+            return
+
+        if command == "launch":
+            # Команда пришла до загрузки дерева — выполним после start_loading
+            if not self._bases_loaded:
+                self._pending_ipc_messages.append(message)
+                return
+
+            base_id = message.get("id")
+            db = next((base for base in self.all_bases if base.id == base_id), None)
+            if not db:
+                self.hotkey_manager.activate_window()
+                self.statusBar.showMessage(f"❌ База с ID {base_id} не найдена", 5000)
+                return
+
+            if message.get("mode") == "DESIGNER":
+                self.actions.open_configurator(db)
+            else:
+                self.actions.open_database(db)
+            return
+
+        print(f"⚠️ Неизвестная команда: {command}")
+
+    def _process_pending_ipc_messages(self):
+        """Выполняет команды, пришедшие во время загрузки."""
+        pending, self._pending_ipc_messages = self._pending_ipc_messages, []
+        for message in pending:
+            self.handle_ipc_message(message)
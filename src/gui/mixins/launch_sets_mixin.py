@@ -0,0 +1,58 @@
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QSystemTrayIcon
+
+from gui.launch_queue import LaunchQueue
+from services.launch_sets import STATUS_OK, STATUS_RUNNING, get_launch_set_store, summarize_results
+
+
+class LaunchSetsMixin:
+    """Миксин наборов запуска: несколько баз одной командой (F9)."""
+
+    def setup_launch_sets(self):
+        """Очередь запуска; итог каждой базы — в консоль, итог набора — в трей и строку состояния."""
+        self.launch_queue = LaunchQueue(self, self)
+        self.launch_queue.item_finished.connect(lambda result: print(result.format()))
+        self.launch_queue.finished.connect(self._on_launch_set_finished)
+
+    def fill_launch_sets_menu(self, menu):
+        """Пункты "Запустить набор" (меню строится при каждом открытии)."""
+        menu.clear()
+        names = get_launch_set_store().names()
+        for name in names:
+            action = QAction(name, menu)
+            action.triggered.connect(lambda _=False, name=name: self.run_launch_set(name))
+            menu.addAction(action)
+        if not names:
+            action = QAction("Нет наборов — создайте в «Наборы запуска…» [F9]", menu)
+            action.setEnabled(False)
+            menu.addAction(action)
+
+    def show_launch_sets(self):
+        """Диалог наборов запуска (F9); "Запустить" запускает выбранный набор."""
+        from ..dialogs import LaunchSetsDialog
+        database = self.operations.get_selected_database(self.model, self.tree, quiet=True)
+        dialog = LaunchSetsDialog(get_launch_set_store(), self.all_bases, database, self)
+        if dialog.exec() and dialog.run_name:
+            self.run_launch_set(dialog.run_name)
+
+    def run_launch_set(self, name):
+        launch_set = get_launch_set_store().get(name)
+        if launch_set is None or not launch_set.items:
+            self.statusBar.showMessage(f"⚠️ Набор «{name}» пуст или не найден", 3000)
+            return False
+        if not self.launch_queue.start(launch_set):
+            self.statusBar.showMessage(f"⏳ Еще запускается набор «{self.launch_queue.launch_set.name}»", 3000)
+            return False
+        print(f"🚀 Набор «{name}»: баз {len(launch_set.items)}")
+        self.minimize_to_tray()
+        return True
+
+    def _on_launch_set_finished(self, launch_set, results):
+        summary = summarize_results(results)
+        print(f"🏁 Набор «{launch_set.name}»: {summary}")
+        self.statusBar.showMessage(f"🏁 Набор «{launch_set.name}»: {summary}", 10000)
+        failed = [r for r in results if r.status not in (STATUS_OK, STATUS_RUNNING)]
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            icon = QSystemTrayIcon.Warning if failed else QSystemTrayIcon.Information
+            details = "\n".join(r.format() for r in failed[:5])
+            self.tray_icon.showMessage(f"Набор «{launch_set.name}»", f"{summary}\n{details}".strip(), icon, 10000)
@@ -0,0 +1,85 @@
+from PySide6.QtCore import QTimer, Qt
+
+from config import PREWARM_DWELL_MS, PREWARM_ENABLED
+from models.database import Database1C
+from services.frecency import get_frecency_store
+from services.launch_command import resolve_executable
+from services.launch_metrics import LaunchMetricsLog
+from services.platform_registry import get_platform_registry
+from services.prewarm import HISTORY_LIMIT, MB, LaunchPredictor, Prewarmer, prewarm_targets
+
+
+class PrewarmMixin:
+    """Миксин прогрева платформы и кэша базы, на которой стоит курсор."""
+
+    def setup_prewarm(self):
+        """Таймер задержки курсора; прогрев включается PREWARM_ENABLED или в меню "Вид"."""
+        self.prewarmer = None
+        self.prewarm_predictor = None
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.setInterval(PREWARM_DWELL_MS)
+        self._prewarm_timer.timeout.connect(self._prewarm_current)
+        self.tree.selectionModel().currentChanged.connect(self._on_prewarm_cursor)
+        self.set_prewarm_enabled(PREWARM_ENABLED)
+
+    @property
+    def prewarm_enabled(self):
+        return self.prewarmer is not None
+
+    def set_prewarm_enabled(self, enabled):
+        if enabled and self.prewarmer is None:
+            # История по часам читается при включении режима
+            records = LaunchMetricsLog().read(limit=HISTORY_LIMIT)
+            self.prewarm_predictor = LaunchPredictor(get_frecency_store(), records)
+            self.prewarmer = Prewarmer()
+        elif not enabled and self.prewarmer is not None:
+            self._prewarm_timer.stop()
+            self.prewarmer.cancel()
+            self.prewarmer = None
+            self.prewarm_predictor = None
+
+    def toggle_prewarm(self, checked):
+        """Переключатель в меню "Вид"."""
+        self.set_prewarm_enabled(checked)
+        status = "включен" if checked else "выключен"
+        self.statusBar.showMessage(f"🔥 Прогрев платформы {status}", 2000)
+        if checked:
+            self._prewarm_timer.start()
+
+    def _on_prewarm_cursor(self, current, previous):
+        if self.prewarmer is not None:
+            self._prewarm_timer.start()
+
+    def _prewarm_current(self):
+        """Курсор задержался на базе: прогрев, если ее вероятно запустят."""
+        if self.prewarmer is None:
+            return
+        item = self.model.itemFromIndex(self.tree.currentIndex().siblingAtColumn(0))
+        database = item.data(Qt.UserRole) if item else None
+        if not isinstance(database, Database1C):
+            return
+        if self.prewarm_predictor.is_likely(database.id):
+            self.prewarm_database(database)
+
+    def _prewarm_mode(self, database):
+        """Режим, в котором базу запускают чаще всего (от него зависит клиент)."""
+        stats = get_frecency_store().get_stats(database.id)
+        if not stats:
+            return 'ENTERPRISE'
+        return max(stats, key=lambda mode: stats[mode]['count'])
+
+    def prewarm_database(self, database):
+        """Прогрев в фоне: исполняемый файл и каталог bin платформы, кэш базы."""
+        executable = resolve_executable(database, self._prewarm_mode(database))
+        if executable is not None and executable == get_platform_registry().get_starter():
+            # Версию выберет стартер — какую платформу прогревать, неизвестно
+            executable = None
+        name = database.name
+
+        def report(result):
+            if result.bytes_read and not result.cancelled:
+                print(f"🔥 Прогрев «{name}»: файлов {result.files}, "
+                      f"{result.bytes_read / MB:.0f} МБ за {result.seconds:.1f} с")
+
+        self.prewarmer.start(database.id, lambda: prewarm_targets(executable, database), report)
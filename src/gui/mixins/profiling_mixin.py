@@ -0,0 +1,35 @@
+from PySide6.QtGui import QAction
+
+from services.profiling import ProfilerSession, get_recorder
+
+
+class ProfilingMixin:
+    """Миксин для скрытого переключателя профилирования (Ctrl+Shift+F12)."""
+
+    def setup_profiling(self):
+        """Регистрирует скрытое действие: в меню его нет, работает только сочетание."""
+        self.profiler_session = ProfilerSession()
+        action = QAction(self)
+        action.setShortcut("Ctrl+Shift+F12")
+        action.triggered.connect(self.toggle_profiling)
+        self.addAction(action)
+
+    def toggle_profiling(self):
+        """Печатает сводку горячих путей и включает/выключает cProfile + tracemalloc."""
+        print("📊 Горячие пути, мс:")
+        print(get_recorder().format_summary())
+
+        if not self.profiler_session.active:
+            self.profiler_session.start()
+            self.statusBar.showMessage("🔬 Профилирование включено (Ctrl+Shift+F12 — остановить)")
+            return
+
+        try:
+            paths = self.profiler_session.stop()
+        except OSError as e:
+            self.statusBar.showMessage(f"❌ Не удалось сохранить профиль: {e}")
+            return
+        if paths:
+            prof_path, memory_path = paths
+            print(f"💾 Профиль: {prof_path}\n💾 Память: {memory_path}")
+            self.statusBar.showMessage(f"💾 Профиль сохранен: {prof_path}", 10000)
@@ -0,0 +1,117 @@
+from PySide6.QtWidgets import QLineEdit
+from PySide6.QtCore import Qt, QEvent, QTimer
+
+from services.profiling import measure
+from services.search_index import SearchIndex
+from gui.tree.search_results_tree_builder import SearchResultsTreeBuilder
+
+
+class SearchMixin:
+    """Миксин для поиска баз по мере ввода (Ctrl+F или просто начать печатать в дереве)."""
+
+    # Клавиши, которые строка поиска забирает у горячих клавиш окна (Del, Backspace, Esc …)
+    _SEARCH_EDIT_KEYS = {
+        Qt.Key_Escape, Qt.Key_Backspace, Qt.Key_Delete,
+        Qt.Key_Left, Qt.Key_Right, Qt.Key_Home, Qt.Key_End,
+    }
+
+    def setup_search(self, layout):
+        """Создает строку поиска над деревом (скрыта до первого использования)."""
+        self.search_index = SearchIndex()
+        self._search_index_stale = True
+        self._search_sync_scheduled = False
+        self.search_builder = SearchResultsTreeBuilder(self.model)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Поиск базы: имя, папка, Ref/File, версия")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.hide()
+        self.search_edit.textChanged.connect(self._on_search_text_changed)
+        self.search_edit.installEventFilter(self)
+        self.tree.installEventFilter(self)
+        layout.insertWidget(0, self.search_edit)
+
+    def invalidate_search_index(self):
+        """Список баз перечитан: индекс обновится в следующей итерации цикла событий.
+
+        Синхронизация не ждет первой клавиши поиска: при наборе выполняются только запросы.
+        """
+        self._search_index_stale = True
+        if not self._search_sync_scheduled:
+            self._search_sync_scheduled = True
+            QTimer.singleShot(0, self._sync_search_index)
+
+    def _sync_search_index(self):
+        """Инкрементальная синхронизация индекса (переиндексируются только измененные базы)."""
+        self._search_sync_scheduled = False
+        if self._search_index_stale:
+            with measure("search_sync"):
+                self.search_index.sync(self.all_bases)
+            self._search_index_stale = False
+        if self.search_edit.isVisible() and self.search_edit.text().strip():
+            # Результаты открытого поиска — по новому списку
+            self._on_search_text_changed(self.search_edit.text())
+
+    def open_search(self, text=""):
+        """Показывает строку поиска и переводит в нее фокус."""
+        self.search_edit.show()
+        self.search_edit.setFocus()
+        if text:
+            self.search_edit.end(False)
+            self.search_edit.insert(text)
+        else:
+            self.search_edit.selectAll()
+
+    def close_search(self):
+        """Скрывает строку поиска и убирает ветку результатов."""
+        self.search_edit.clear()
+        self.search_edit.hide()
+        self.search_builder.remove()
+        self.tree.setFocus()
+
+    def _on_search_text_changed(self, text):
+        if not text.strip():
+            self.search_builder.remove()
+            return
+
+        if self._search_index_stale:
+            # Клавиша пришла раньше отложенной синхронизации (сразу после загрузки)
+            self._sync_search_index()
+            return
+
+        with measure("search"):
+            results = self.search_index.search(text)
+        folder_item = self.search_builder.build_tree([base for base, _ in results])
+        folder_index = self.model.indexFromItem(folder_item)
+        self.tree.expand(folder_index)
+        if results:
+            first_index = self.model.index(0, 0, folder_index)
+            self.tree.setCurrentIndex(first_index)
+            self.tree.scrollTo(first_index)
+        self.statusBar.showMessage(f"🔍 Найдено: {len(results)}", 2000)
+
+    def eventFilter(self, obj, event):
+        """Клавиатура строки поиска и запуск поиска набором текста в дереве."""
+        if obj is self.search_edit:
+            if event.type() == QEvent.ShortcutOverride:
+                # Печатные символы, Backspace, Del и Esc — строке поиска, а не горячим клавишам
+                text = event.text()
+                plain = not (event.modifiers() & (Qt.ControlModifier | Qt.AltModifier))
+                if event.key() in self._SEARCH_EDIT_KEYS or (plain and text and text.isprintable()):
+                    event.accept()
+                    return True
+            elif event.type() == QEvent.KeyPress:
+                if event.key() == Qt.Key_Escape:
+                    self.close_search()
+                    return True
+                if event.key() in (Qt.Key_Down, Qt.Key_PageDown):
+                    self.tree.setFocus()
+                    return True
+        elif obj is self.tree and event.type() == QEvent.KeyPress:
+            text = event.text()
+            plain = not (event.modifiers() & (Qt.ControlModifier | Qt.AltModifier))
+            # Цифры заняты цифровой навигацией, пробел — деревом
+            if plain and text and text.isprintable() and not text.isdigit() and not text.isspace():
+                self.open_search(text)
+                return True
+        return super().eventFilter(obj, event)
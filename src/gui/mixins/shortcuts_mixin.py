@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QKeySequence, QShortcut
-from ..dialogs import DatabaseSettingsDialog
 from models.database import Database1C
+from services.profiling import measure
 from gui.theme import ThemeManager
 
 
@@ -30,6 +30,9 @@ class ShortcutsMixin:
         else:
             db = self.operations.get_selected_database(self.model, self.tree)
             if db:
+                # База уже открыта — переключаемся на ее клиент вместо второго запуска
+                if self.process_actions.activate_base_client(db):
+                    return
                 open_success = self.actions.open_database(db)
                 if open_success:
                     self.minimize_to_tray()
@@ -42,6 +45,18 @@ class ShortcutsMixin:
             if open_success:
                 self.minimize_to_tray()
 
+    def handle_open_new_instance(self):
+        """Обработка Ctrl+F3 / Ctrl+Enter: новый экземпляр предприятия, даже если база уже открыта."""
+        db = self.operations.get_selected_database(self.model, self.tree)
+        if db and self.actions.open_database(db, force_new=True):
+            self.minimize_to_tray()
+
+    def handle_open_new_configurator(self):
+        """Обработка Ctrl+F4: новый экземпляр конфигуратора."""
+        db = self.operations.get_selected_database(self.model, self.tree)
+        if db and self.actions.open_configurator(db, force_new=True):
+            self.minimize_to_tray()
+
     def handle_f4_open(self):
         """Обработка F4: открытие конфигуратора."""
         open_success = self.actions.open_configurator(
@@ -95,6 +110,27 @@ class ShortcutsMixin:
             else:
                 self.actions.save_and_dump_cf(db)
 
+    def handle_add_database(self):
+        """Обработка Shift+F10: добавление новой базы в текущую папку."""
+        from ..dialogs import DatabaseSettingsDialog
+        self.operations.add_database(
+            Database1C, DatabaseSettingsDialog,
+            lambda: self.operations.get_current_folder(self.model, self.tree)
+        )
+
+    def handle_duplicate_database(self):
+        """Обработка Ctrl+D: копирование выбранной базы."""
+        self.operations.duplicate_database(
+            self.operations.get_selected_database(self.model, self.tree), Database1C
+        )
+
+    def handle_edit_database(self):
+        """Обработка Ctrl+E: редактирование настроек выбранной базы."""
+        from ..dialogs import DatabaseSettingsDialog
+        self.operations.edit_database_settings(
+            self.operations.get_selected_database(self.model, self.tree), DatabaseSettingsDialog
+        )
+
     def handle_delete(self):
         """Обработка Del: закрытие процесса или удаление базы."""
         process = self.process_actions.get_selected_process()
@@ -120,3 +156,22 @@ class ShortcutsMixin:
         from ..dialogs import HelpDialog
         dialog = HelpDialog(self)
         dialog.exec()
+
+    def show_launch_stats(self):
+        """Открыть статистику времени запуска баз."""
+        from ..dialogs import LaunchStatsDialog
+        dialog = LaunchStatsDialog(self, self.launch_tracker.log)
+        dialog.exec()
+
+    def show_base_stats(self):
+        """Открыть статистику списка баз (версии, серверы, давно не запускавшиеся)."""
+        from ..dialogs import BaseStatsDialog
+        from services.base_stats import BaseStats
+        if self.base_stats is None:
+            self.base_stats = BaseStats()
+        # Инкрементально: пересчитываются только строки измененных баз
+        with measure("base_stats"):
+            self.base_stats.sync(self.all_bases)
+        dialog = BaseStatsDialog(self.base_stats, self)
+        if dialog.exec() and dialog.selected_id:
+            self.select_base_by_id(dialog.selected_id)
@@ -50,6 +50,10 @@ class TrayMixin:
     def quit_application(self):
         """Полный выход из приложения."""
         self.hotkey_manager.unregister()
+        if self.foreground_watcher:
+            self.foreground_watcher.stop()
+        if self._ipc_server:
+            self._ipc_server.close()
         self.tray_icon.hide()
         QApplication.quit()
 
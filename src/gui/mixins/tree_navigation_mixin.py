@@ -1,22 +1,72 @@
-from PySide6.QtCore import Qt
-from services.process_manager import Process1C
+from PySide6.QtCore import Qt, QModelIndex, QPersistentModelIndex
+from models.database import Database1C
+from models.process import Process1C
+from services.process_index import get_process_index
+from services.profiling import hot_path
+from services.view_state import folder_paths, get_view_state_store
+from gui.tree.batch_updates import suspended_updates
 
 
 class TreeNavigationMixin:
     """Миксин для обновления и навигации по дереву баз/процессов."""
 
+    def setup_view_state(self):
+        """Развернутые папки и база под курсором отслеживаются по сигналам дерева.
+
+        Перед перестройкой модели обходить дерево не нужно: состояние уже в
+        ViewStateStore, а после перестройки папки находятся по пути через
+        словарь построителя — работа пропорциональна числу развернутых папок.
+        """
+        self.view_state = get_view_state_store()
+        # Папки "Открытые базы" и "Основное" (индексы сами становятся недействительными при их удалении)
+        self._opened_folder_index = QPersistentModelIndex()
+        self._main_folder_index = QPersistentModelIndex()
+        self.tree.expanded.connect(lambda index: self._on_folder_toggled(index, True))
+        self.tree.collapsed.connect(lambda index: self._on_folder_toggled(index, False))
+        self.tree.selectionModel().currentChanged.connect(self._on_current_changed)
+
+    def _folder_path(self, index):
+        parts = []
+        while index.isValid():
+            parts.append(index.data())
+            index = index.parent()
+        return "/".join(reversed(parts))
+
+    def _on_folder_toggled(self, index, expanded):
+        path = self._folder_path(index)
+        # Ветка "Поиск" временная — ее раскрытие не запоминается
+        if path.split("/", 1)[0] != self.search_builder.NODE_NAME:
+            self.view_state.set_expanded(path, expanded)
+
+    def _on_current_changed(self, current, previous):
+        data = current.data(Qt.UserRole)
+        if isinstance(data, Database1C):
+            self.view_state.select(data.id)
+
+    def save_view_state(self):
+        """Сохранение состояния дерева (вызывается при выходе); исчезнувшие папки забываются."""
+        known = folder_paths(self.all_bases)
+        known.update((self.tree_builder.RECENT_NAME, self.opened_bases_builder.NODE_NAME,
+                      self.main_processes_builder.NODE_NAME))
+        self.view_state.retain(known)
+        self.view_state.save()
+
+    @hot_path("refresh_opened_bases")
     def refresh_opened_bases(self):
         """Обновление папки с открытыми базами (запущенными процессами 1С)."""
         result = self.opened_bases_builder.build_tree()
+        self.tree_builder.mark_open_bases(get_process_index().open_base_ids())
         if result:
             folder_item, process_count = result
             folder_index = self.tree.model().indexFromItem(folder_item)
-            self.tree.setFirstColumnSpanned(folder_index.row(), folder_index.parent(), True)
-            for proc_row in range(process_count):
-                self.tree.setFirstColumnSpanned(proc_row, folder_index, True)
-                
-            # Раскрываем узел "Открытые базы" после его перестройки
-            self.tree.expand(folder_index)
+            self._opened_folder_index = QPersistentModelIndex(folder_index)
+            with suspended_updates(self.tree):
+                self.tree.setFirstColumnSpanned(folder_index.row(), folder_index.parent(), True)
+                for proc_row in range(process_count):
+                    self.tree.setFirstColumnSpanned(proc_row, folder_index, True)
+
+                # Раскрываем узел "Открытые базы" после его перестройки
+                self.tree.expand(folder_index)
             
             # Если после закрытия процесса остались другие процессы,
             # устанавливаем курсор на первый из них
@@ -28,108 +78,100 @@ class TreeNavigationMixin:
                 # Если процессов больше нет, устанавливаем курсор на саму папку "Открытые базы"
                 self.tree.setCurrentIndex(folder_index)
 
+    @hot_path("refresh_main_processes")
     def refresh_main_processes(self):
         """Обновление папки Основное с процессами."""
         result = self.main_processes_builder.build_tree()
         if result:
             folder_item, process_count = result
             folder_index = self.tree.model().indexFromItem(folder_item)
-            self.tree.setFirstColumnSpanned(folder_index.row(), folder_index.parent(), True)
-            for proc_row in range(process_count):
-                self.tree.setFirstColumnSpanned(proc_row, folder_index, True)
+            self._main_folder_index = QPersistentModelIndex(folder_index)
+            with suspended_updates(self.tree):
+                self.tree.setFirstColumnSpanned(folder_index.row(), folder_index.parent(), True)
+                for proc_row in range(process_count):
+                    self.tree.setFirstColumnSpanned(proc_row, folder_index, True)
+
+    def collect_expanded_folders(self):
+        """Возвращает пути развернутых папок (например, "Рабочие/Магазины") без обхода дерева."""
+        return sorted(self.view_state.expanded)
+
+    def restore_expanded_folders(self, paths=None):
+        """Разворачивает папки по путям (по умолчанию — запомненные в состоянии дерева)."""
+        if paths is None:
+            paths = self.view_state.expanded
+        with suspended_updates(self.tree):
+            for path in paths:
+                item = self.tree_builder.folder_item(path)
+                if item is not None:
+                    self.tree.expand(item.index())
+
+    def _set_current(self, index):
+        self.tree.setCurrentIndex(index)
+        self.tree.scrollTo(index)
+
+    def select_base_by_id(self, base_id):
+        """Устанавливает курсор на базу с указанным ID (первое вхождение)."""
+        items = self.tree_builder.items_for(base_id)
+        if not items:
+            return False
+        self._set_current(items[0].index())
+        return True
+
+    def _select_process(self, folder_index, rows_by_pid, process):
+        """Курсор на процесс в папке, иначе на первый процесс."""
+        row = rows_by_pid.get(process.pid, 0) if process is not None and hasattr(process, 'pid') else 0
+        self._set_current(self.model.index(row, 0, folder_index))
 
+    @hot_path("expand_and_select_initial")
     def expand_and_select_initial(self):
-        """Разворачивает нужные папки и устанавливает курсор."""
-        opened_folder_idx = None
-        main_folder_idx = None
-        recent_folder_idx = None
-
-        for folder_idx in range(self.model.rowCount()):
-            folder_item = self.model.item(folder_idx, 0)
-            if not folder_item:
-                continue
-            if "Открытые базы" in folder_item.text():
-                opened_folder_idx = folder_idx
-            elif "Основное" in folder_item.text():
-                main_folder_idx = folder_idx
-            elif "Недавние" in folder_item.text():
-                recent_folder_idx = folder_idx
+        """Разворачивает нужные папки и устанавливает курсор (одна перерисовка в конце).
 
-        # Раскрываем узлы "Открытые базы" и "Основное"
-        if opened_folder_idx is not None:
-            folder_item = self.model.item(opened_folder_idx, 0)
-            if folder_item and folder_item.rowCount() > 0:
-                self.tree.expand(self.model.index(opened_folder_idx, 0))
+        Папки ищутся не по тексту строк: "Открытые базы" и "Основное" — по
+        сохраненным индексам, остальные — по пути в словаре построителя.
+        """
+        with suspended_updates(self.tree):
+            self._expand_and_select_initial()
+
+    def _expand_and_select_initial(self):
+        opened_index = QModelIndex(self._opened_folder_index)
+        main_index = QModelIndex(self._main_folder_index)
+        recent_item = self.tree_builder.folder_item(self.tree_builder.RECENT_NAME)
+
+        # Папки, развернутые пользователем (в том числе до перестройки и в прошлом сеансе)
+        self.restore_expanded_folders()
 
-        if main_folder_idx is not None:
-            folder_item = self.model.item(main_folder_idx, 0)
-            if folder_item and folder_item.rowCount() > 0:
-                self.tree.expand(self.model.index(main_folder_idx, 0))
+        # Раскрываем узлы "Открытые базы" и "Основное"
+        for folder_index in (opened_index, main_index):
+            if folder_index.isValid() and self.model.rowCount(folder_index) > 0:
+                self.tree.expand(folder_index)
 
         # Приоритет 1: папка "Открытые базы"
-        if opened_folder_idx is not None:
-            folder_item = self.model.item(opened_folder_idx, 0)
-            folder_index = self.model.index(opened_folder_idx, 0)
-            if folder_item.rowCount() > 0:
-                if self.last_activated_process and isinstance(self.last_activated_process, Process1C):
-                    for proc_idx in range(folder_item.rowCount()):
-                        proc_item = folder_item.child(proc_idx, 0)
-                        if proc_item:
-                            proc = proc_item.data(Qt.UserRole)
-                            if (
-                                proc
-                                and isinstance(proc, Process1C)
-                                and proc.pid == self.last_activated_process.pid
-                            ):
-                                proc_index = self.model.index(proc_idx, 0, folder_index)
-                                self.tree.setCurrentIndex(proc_index)
-                                self.tree.scrollTo(proc_index)
-                                return
-                first_proc_index = self.model.index(0, 0, folder_index)
-                self.tree.setCurrentIndex(first_proc_index)
-                self.tree.scrollTo(first_proc_index)
-                return
+        if opened_index.isValid() and self.model.rowCount(opened_index) > 0:
+            process = self.last_activated_process
+            if not isinstance(process, Process1C):
+                process = None
+            self._select_process(opened_index, self.opened_bases_builder.rows_by_pid, process)
+            return
 
         # Приоритет 2: папка "Основное"
-        if main_folder_idx is not None:
-            folder_item = self.model.item(main_folder_idx, 0)
-            folder_index = self.model.index(main_folder_idx, 0)
-            if folder_item.rowCount() > 0:
-                if self.last_activated_main_process and hasattr(self.last_activated_main_process, 'pid'):
-                    for proc_idx in range(folder_item.rowCount()):
-                        proc_item = folder_item.child(proc_idx, 0)
-                        if proc_item:
-                            proc = proc_item.data(Qt.UserRole)
-                            if (
-                                proc
-                                and hasattr(proc, 'pid')
-                                and proc.pid == self.last_activated_main_process.pid
-                            ):
-                                proc_index = self.model.index(proc_idx, 0, folder_index)
-                                self.tree.setCurrentIndex(proc_index)
-                                self.tree.scrollTo(proc_index)
-                                return
-                first_proc_index = self.model.index(0, 0, folder_index)
-                self.tree.setCurrentIndex(first_proc_index)
-                self.tree.scrollTo(first_proc_index)
-                return
+        if main_index.isValid() and self.model.rowCount(main_index) > 0:
+            self._select_process(main_index, self.main_processes_builder.rows_by_pid,
+                                 self.last_activated_main_process)
+            return
 
-        # Приоритет 3: папка "Недавние"
-        if recent_folder_idx is not None:
-            folder_item = self.model.item(recent_folder_idx, 0)
-            folder_index = self.model.index(recent_folder_idx, 0)
-            self.tree.expand(folder_index)
+        # Приоритет 3: последняя запущенная база в папке "Недавние"
+        if recent_item is not None:
+            self.tree.expand(recent_item.index())
             if self.last_launched_db:
-                for db_idx in range(folder_item.rowCount()):
-                    db_item = folder_item.child(db_idx, 0)
-                    if db_item:
-                        db = db_item.data(Qt.UserRole)
-                        if db and db.id == self.last_launched_db.id:
-                            db_index = self.model.index(db_idx, 0, folder_index)
-                            self.tree.setCurrentIndex(db_index)
-                            self.tree.scrollTo(db_index)
-                            return
-            if folder_item.rowCount() > 0:
-                first_db_index = self.model.index(0, 0, folder_index)
-                self.tree.setCurrentIndex(first_db_index)
-                self.tree.scrollTo(first_db_index)
+                for item in self.tree_builder.items_for(self.last_launched_db.id):
+                    if item.parent() is recent_item:
+                        self._set_current(item.index())
+                        return
+
+        # Приоритет 4: база, выбранная до перестройки или в прошлом сеансе
+        if self.view_state.selected_id and self.select_base_by_id(self.view_state.selected_id):
+            return
+
+        # Приоритет 5: первая из "Недавних"
+        if recent_item is not None and recent_item.rowCount() > 0:
+            self._set_current(recent_item.child(0, 0).index())
@@ -0,0 +1,131 @@
+"""Единственный экземпляр лончера и передача команд через локальный сокет.
+
+Первый запущенный процесс поднимает QLocalServer. Повторный запуск
+подключается к нему, передает команду (показать окно / запустить базу)
+и сразу завершается — без загрузки QtWidgets и дерева баз.
+
+Протокол: одна JSON-строка на команду, завершенная '\\n', например
+    {"command": "show"}
+    {"command": "launch", "id": "<ID базы>", "mode": "ENTERPRISE"}
+"""
+
+import getpass
+import json
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+
+def _server_name() -> str:
+    """Имя сервера уникально для пользователя (несколько сеансов на одном сервере)."""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return f"1c_launcher-{user}"
+
+
+SERVER_NAME = _server_name()
+
+
+def send_to_running_instance(message: dict, timeout_ms: int = 200) -> bool:
+    """Передает команду запущенному экземпляру.
+
+    Args:
+        message: Команда в виде словаря
+        timeout_ms: Таймаут подключения и записи
+
+    Returns:
+        True, если работающий экземпляр найден и команда отправлена
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(SERVER_NAME)
+    if not socket.waitForConnected(timeout_ms):
+        return False
+
+    socket.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    socket.flush()
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    return True
+
+
+def _server_alive(attempts: int = 3, timeout_ms: int = 100) -> bool:
+    """Отвечает ли сервер с именем SERVER_NAME (несколько попыток подключения)."""
+    for _ in range(attempts):
+        socket = QLocalSocket()
+        socket.connectToServer(SERVER_NAME)
+        if socket.waitForConnected(timeout_ms):
+            socket.disconnectFromServer()
+            return True
+    return False
+
+
+class SingleInstanceServer(QObject):
+    """Локальный сервер команд работающего экземпляра."""
+
+    message_received = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}
+
+    def listen(self) -> bool:
+        """Начинает прием команд.
+
+        Имя может быть занято другим экземпляром, запущенным одновременно с этим
+        (оба не нашли сервер при старте), или остаться от аварийно завершенного
+        процесса. Перед удалением имени сервер проверяется повторным подключением:
+        отвечает — имя чужое и не удаляется, не отвечает — это "мусор".
+        """
+        if self._server.listen(SERVER_NAME):
+            return True
+        if _server_alive():
+            print("⚠️ Сервер команд уже запущен другим экземпляром лончера")
+            return False
+        QLocalServer.removeServer(SERVER_NAME)
+        if self._server.listen(SERVER_NAME):
+            return True
+        print(f"⚠️ Не удалось запустить сервер команд: {self._server.errorString()}")
+        return False
+
+    def close(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+
+    def _on_ready_read(self, socket):
+        buffer = self._buffers.get(socket, b"") + bytes(socket.readAll())
+        *lines, rest = buffer.split(b"\n")
+        self._buffers[socket] = rest
+        for line in lines:
+            self._emit_line(line)
+
+    def _on_disconnected(self, socket):
+        try:
+            if socket.bytesAvailable():
+                self._on_ready_read(socket)
+        except RuntimeError:
+            # Сокет уже удален вместе с сервером при выходе из приложения
+            self._buffers.pop(socket, None)
+            return
+        rest = self._buffers.pop(socket, b"")
+        if rest.strip():
+            self._emit_line(rest)
+        socket.deleteLater()
+
+    def _emit_line(self, line: bytes):
+        try:
+            message = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            print(f"⚠️ Некорректная команда от второго экземпляра: {line[:100]!r}")
+            return
+        if isinstance(message, dict):
+            self.message_received.emit(message)
@@ -1,5 +1,7 @@
 from .tree_builder import TreeBuilder
 from .opened_bases_tree_builder import OpenedBasesTreeBuilder
 from .main_processes_tree_builder import MainProcessesTreeBuilder
+from .search_results_tree_builder import SearchResultsTreeBuilder
+from .batch_updates import suspended_updates
 
-__all__ = ['TreeBuilder', 'OpenedBasesTreeBuilder', 'MainProcessesTreeBuilder']
+__all__ = ['TreeBuilder', 'OpenedBasesTreeBuilder', 'MainProcessesTreeBuilder', 'SearchResultsTreeBuilder', 'suspended_updates']
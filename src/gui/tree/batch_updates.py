@@ -0,0 +1,20 @@
+"""Пакетные изменения дерева без промежуточной перерисовки."""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def suspended_updates(view):
+    """Отключает перерисовку view на время блока (вложенные блоки не включают ее раньше времени).
+
+    Раскрытие папок, объединение колонок (setFirstColumnSpanned) и установка
+    курсора внутри блока дают одну перерисовку в конце вместо одной на операцию.
+    """
+    if not view.updatesEnabled():
+        yield
+        return
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setUpdatesEnabled(True)
@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Optional
 from PySide6.QtGui import QStandardItem
 from PySide6.QtCore import Qt
-from services.process_manager import ProcessManager
 from config import TRACKED_APPLICATIONS, get_launch_path
 
 
@@ -30,6 +29,8 @@ class MainProcessesTreeBuilder:
     def __init__(self, model):
         self.model = model
         self.folder_item = None
+        # PID процесса -> номер его строки в папке (восстановление курсора без перебора)
+        self.rows_by_pid = {}
 
     def build_tree(self):
         """
@@ -49,6 +50,10 @@ class MainProcessesTreeBuilder:
         self.folder_item = QStandardItem(self.NODE_NAME)
         self.folder_item.setEditable(False)
         self.folder_item.setData(None, Qt.UserRole)  # Отметка, что это не база ibases
+        self.rows_by_pid = {}
+
+        # Импорт отложен до первого построения: тянет бэкенд процессов (psutil, win32)
+        from services.process_manager import ProcessManager
 
         # Получаем список запущенных процессов
         running_processes = ProcessManager.get_running_main_processes()
@@ -56,16 +61,7 @@ class MainProcessesTreeBuilder:
         # Создаем словарь для быстрого поиска запущенных процессов
         process_map = {}
         for proc in running_processes:
-            # Получаем имя процесса из psutil
-            try:
-                import psutil
-                ps_proc = psutil.Process(proc.pid)
-                proc_name = ps_proc.name()
-                if proc_name not in process_map:
-                    process_map[proc_name] = []
-                process_map[proc_name].append(proc)
-            except:
-                continue
+            process_map.setdefault(proc.process_name, []).append(proc)
 
         # Проходим по всем отслеживаемым приложениям
         process_count = 0
@@ -92,6 +88,7 @@ class MainProcessesTreeBuilder:
                         item.setEditable(False)
                     # Сохраняем как процесс (Process1C объект) для совместимости
                     row[0].setData(proc, Qt.UserRole)
+                    self.rows_by_pid[proc.pid] = process_count
                     self.folder_item.appendRow(row)
                     process_count += 1
             else:
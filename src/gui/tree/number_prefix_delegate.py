@@ -1,12 +1,22 @@
 from PySide6.QtWidgets import QStyledItemDelegate
 
+# Префиксы номеров первых десяти строк: "1. " ... "9. ", "0. " (цифры 1-9, 0 — переход)
+PREFIXES = tuple(f"{0 if n == 10 else n}. " for n in range(1, 11))
+
+
 class NumberPrefixDelegate(QStyledItemDelegate):
+    """Номер строки перед именем в первой колонке (цифровая навигация).
+
+    Префиксы вычислены заранее. Размеры ячеек (метрики шрифта) делегат
+    не считает сам: при setUniformRowHeights дерево спрашивает высоту
+    один раз и дальше использует ее для всех строк.
+    """
+
     def initStyleOption(self, option, index):
         super().initStyleOption(option, index)
         if index.column() != 0:
             return
 
-        n = index.row() + 1
-        if 1 <= n <= 10:
-            key = 0 if n == 10 else n
-            option.text = f"{key}. {option.text}"
+        row = index.row()
+        if row < 10:
+            option.text = PREFIXES[row] + option.text
@@ -3,14 +3,21 @@
 """
 from PySide6.QtGui import QStandardItem, QColor
 from PySide6.QtCore import Qt
-from services.process_manager import ProcessManager, Process1C
 
 class OpenedBasesTreeBuilder:
     NODE_NAME = "Открытые базы"
 
-    def __init__(self, model):
+    def __init__(self, model, sort_processes=None):
+        """
+        Args:
+            model: Модель дерева
+            sort_processes: Функция упорядочивания процессов (например, по последнему использованию)
+        """
         self.model = model
+        self.sort_processes = sort_processes
         self.folder_item = None
+        # PID процесса -> номер его строки в папке (восстановление курсора без перебора)
+        self.rows_by_pid = {}
 
     def build_tree(self):
         """
@@ -28,9 +35,22 @@ class OpenedBasesTreeBuilder:
         self.folder_item = QStandardItem(self.NODE_NAME)
         self.folder_item.setEditable(False)
         self.folder_item.setData(None, Qt.UserRole)  # Отметка, что это не база ibases
+        self.rows_by_pid = {}
+
+        # Импорт отложен до первого построения: тянет бэкенд процессов (psutil, win32)
+        from services.backends import get_backend
+        from services.process_index import get_process_index
+        from services.process_manager import ProcessManager
 
         # Вставляем процессы (только имя, без hwnd и pid)
         processes = ProcessManager.get_running_processes()
+        if self.sort_processes:
+            processes = self.sort_processes(processes)
+        # Командные строки читаются только для новых PID
+        index = get_process_index()
+        index.sync((proc.pid for proc in processes), get_backend().command_line)
+        for proc in processes:
+            proc.base_id = index.base_for_pid(proc.pid)
         process_count = 0
         for proc in processes:
             row = [QStandardItem(proc.name)]
@@ -43,6 +63,7 @@ class OpenedBasesTreeBuilder:
             for item in row:
                 item.setEditable(False)
             row[0].setData(proc, Qt.UserRole)
+            self.rows_by_pid[proc.pid] = process_count
             self.folder_item.appendRow(row)
             process_count += 1
 
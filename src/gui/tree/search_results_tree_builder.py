@@ -0,0 +1,50 @@
+"""
+Модуль для построения ветки "Поиск" (результаты поиска баз) для дерева
+"""
+from PySide6.QtGui import QStandardItem
+from PySide6.QtCore import Qt
+
+
+class SearchResultsTreeBuilder:
+    NODE_NAME = "Поиск"
+
+    def __init__(self, model):
+        self.model = model
+        self.folder_item = None
+
+    def remove(self):
+        """Удаляет ветку "Поиск", если она есть"""
+        root = self.model
+        for i in range(root.rowCount()):
+            item = root.item(i, 0)
+            if item and item.text() == self.NODE_NAME and item.data(Qt.UserRole) is None:
+                root.removeRow(i)
+                break
+        self.folder_item = None
+
+    def build_tree(self, bases):
+        """
+        Создает/обновляет ветку "Поиск" с найденными базами (в порядке ранга)
+        Возвращает folder_item
+        """
+        self.remove()
+
+        self.folder_item = QStandardItem(self.NODE_NAME)
+        self.folder_item.setEditable(False)
+        self.folder_item.setData(None, Qt.UserRole)  # Отметка, что это не база ibases
+
+        for base in bases:
+            row = [
+                QStandardItem(base.name),
+                QStandardItem(base.connect),
+                QStandardItem(base.get_full_version()),
+            ]
+            for item in row:
+                item.setEditable(False)
+            row[0].setData(base, Qt.UserRole)
+            row[0].setToolTip(base.folder)
+            self.folder_item.appendRow(row)
+
+        # Вставляем её первой!
+        self.model.insertRow(0, [self.folder_item] + [QStandardItem("") for _ in range(2)])
+        return self.folder_item
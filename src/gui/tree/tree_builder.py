@@ -5,9 +5,48 @@ from collections import defaultdict
 from PySide6.QtGui import QStandardItem
 from PySide6.QtCore import Qt
 
+from services.profiling import hot_path
+
 class TreeBuilder:
+    RECENT_NAME = "Недавние"
+
     def __init__(self, model):
         self.model = model
+        # Путь папки ("Рабочие/Магазины") -> ее строка в дереве
+        self._folders = {}
+        # ID базы -> ее строки в дереве (база может быть и в "Недавних", и в папке)
+        self._items_by_id = defaultdict(list)
+        # ID баз с запущенными клиентами (выделяются жирным)
+        self._open_ids = set()
+
+    def _register(self, base, item):
+        item.setData(base, Qt.UserRole)
+        if base.source:
+            item.setToolTip(f"Общий список: {base.source}")
+        self._items_by_id[base.id].append(item)
+
+    def folder_item(self, path):
+        """Строка папки по пути от корня или None."""
+        return self._folders.get(path)
+
+    def items_for(self, base_id):
+        """Строки базы в дереве (в "Недавних" — первая)."""
+        return self._items_by_id.get(base_id, ())
+
+    def _set_open(self, base_id, is_open):
+        for item in self._items_by_id.get(base_id, ()):
+            font = item.font()
+            font.setBold(is_open)
+            item.setFont(font)
+
+    def mark_open_bases(self, base_ids):
+        """Выделяет жирным базы с запущенными клиентами (перерисовываются только изменения)."""
+        base_ids = set(base_ids)
+        for base_id in self._open_ids - base_ids:
+            self._set_open(base_id, False)
+        for base_id in base_ids - self._open_ids:
+            self._set_open(base_id, True)
+        self._open_ids = base_ids
 
     def add_bases_to_folder(self, folder_item, folder_path, bases):
         subfolders = defaultdict(list)
@@ -26,6 +65,7 @@ class TreeBuilder:
             subfolder_item = QStandardItem(subfolder_name)
             subfolder_item.setEditable(False)
             subfolder_path = folder_path + "/" + subfolder_name
+            self._folders[subfolder_path] = subfolder_item
             self.add_bases_to_folder(subfolder_item, subfolder_path, subfolders[subfolder_name])
             row = [subfolder_item] + [QStandardItem("") for _ in range(2)]
             folder_item.appendRow(row)
@@ -38,18 +78,23 @@ class TreeBuilder:
             ]
             for item in row:
                 item.setEditable(False)
-            row[0].setData(base, Qt.UserRole)
+            self._register(base, row[0])
             folder_item.appendRow(row)
 
+    @hot_path("build_tree")
     def build_tree(self, bases):
         self.model.removeRows(0, self.model.rowCount())
+        self._items_by_id.clear()
+        self._folders.clear()
         recent_bases = [base for base in bases if base.is_recent]
         regular_bases = [base for base in bases if not base.is_recent]
+        # Папки верхнего уровня заполняются до вставки в модель: дерево получает
+        # одно событие rowsInserted на папку, а не на каждую базу
         if recent_bases:
-            folder_item = QStandardItem("Недавние")
+            folder_item = QStandardItem(self.RECENT_NAME)
             folder_item.setEditable(False)
+            self._folders[self.RECENT_NAME] = folder_item
             row = [folder_item] + [QStandardItem("") for _ in range(2)]
-            self.model.appendRow(row)
             for base in recent_bases:
                 vers = base.get_full_version()
                 base_row = [
@@ -59,8 +104,9 @@ class TreeBuilder:
                 ]
                 for item in base_row:
                     item.setEditable(False)
-                base_row[0].setData(base, Qt.UserRole)
+                self._register(base, base_row[0])
                 folder_item.appendRow(base_row)
+            self.model.appendRow(row)
         root_folders = defaultdict(list)
         for base in regular_bases:
             folder = base.folder.lstrip("/")
@@ -75,6 +121,9 @@ class TreeBuilder:
             folder_bases = root_folders[root_folder_name]
             folder_item = QStandardItem(root_folder_name)
             folder_item.setEditable(False)
+            self._folders[root_folder_name] = folder_item
             row = [folder_item] + [QStandardItem("") for _ in range(2)]
-            self.model.appendRow(row)
             self.add_bases_to_folder(folder_item, root_folder_name, folder_bases)
+            self.model.appendRow(row)
+        for base_id in self._open_ids:
+            self._set_open(base_id, True)
@@ -1,10 +1,19 @@
 from PySide6.QtWidgets import (
     QMainWindow, QTreeView, QVBoxLayout, QWidget,
-    QStatusBar,
+    QStatusBar, QApplication,
 )
 from PySide6.QtGui import QStandardItemModel, QAction
+from PySide6.QtCore import QTimer
+
+from config import IBASES_PATH, ENCODING, TREE_UNIFORM_ROW_HEIGHTS
 
 from gui.hotkeys import GlobalHotkeyManager
+from gui.launch_tracker import LaunchTracker
+from gui.catalog_loader import CatalogLoader
+from gui.ibases_watcher import IbasesWatcher
+from gui.ibases_saver import IbasesSaver
+from services.ibases_store import IbasesStore
+from services.edit_journal import EditJournal
 from gui.actions import DatabaseActions, DatabaseOperations, ProcessActions
 from gui.tree import TreeBuilder, OpenedBasesTreeBuilder, MainProcessesTreeBuilder
 from gui.mixins import (
@@ -15,9 +24,14 @@ from gui.mixins import (
     TreeNavigationMixin,
     DbmMixin,
     DigitNavigationMixin,
+    IpcMixin,
+    SearchMixin,
+    ProfilingMixin,
+    ForegroundMixin,
+    EditJournalMixin,
+    PrewarmMixin,
+    LaunchSetsMixin,
 )
-from models.database import Database1C
-from gui.dialogs import DatabaseSettingsDialog
 
 
 class TreeWindow(
@@ -28,6 +42,13 @@ class TreeWindow(
     TreeNavigationMixin,
     DbmMixin,
     DigitNavigationMixin,
+    IpcMixin,
+    SearchMixin,
+    ProfilingMixin,
+    ForegroundMixin,
+    EditJournalMixin,
+    PrewarmMixin,
+    LaunchSetsMixin,
     QMainWindow,
 ):
     """Основное окно с деревом баз 1С и управлением процессами."""
@@ -49,6 +70,7 @@ class TreeWindow(
         from gui.tree.number_prefix_delegate import NumberPrefixDelegate
         self.tree.setItemDelegateForColumn(0, NumberPrefixDelegate(self.tree))
 
+        self.tree.setUniformRowHeights(TREE_UNIFORM_ROW_HEIGHTS)
         self.tree.setEditTriggers(QTreeView.NoEditTriggers)
         self.tree.setSelectionBehavior(QTreeView.SelectRows)
         self.tree.setColumnWidth(0, 350)
@@ -61,9 +83,14 @@ class TreeWindow(
         container = QWidget()
         container.setLayout(layout)
         self.setCentralWidget(container)
+        self.setup_search(layout)
 
         # Данные
         self.all_bases = []
+        self._ibases_stat = None
+        self._bases_loaded = False
+        self._pending_ipc_messages = []
+        self._ipc_server = None
         self.last_launched_db = None
         self.last_activated_process = None
         self.last_activated_main_process = None
@@ -72,17 +99,57 @@ class TreeWindow(
         # Инициализация
         self.setup_tray_icon()
         self.hotkey_manager = GlobalHotkeyManager(self)
-        self.actions = DatabaseActions(self, self.all_bases, self.save_bases, self.reload_and_navigate)
-        self.operations = DatabaseOperations(self, self.all_bases, self.save_bases, self.reload_and_navigate)
+        self.launch_tracker = LaunchTracker(self)
+        self.catalog_loader = CatalogLoader(self)
+        self.catalog_loader.source_loaded.connect(self._on_shared_source_loaded)
+        self.ibases_store = IbasesStore(IBASES_PATH, ENCODING)
+        self.edit_journal = EditJournal()
+        self.base_stats = None  # BaseStats — при первом открытии статистики
+        self.ibases_saver = IbasesSaver(self.ibases_store, self._bases_for_save, self)
+        self.ibases_saver.saved.connect(self._on_bases_saved)
+        self.ibases_saver.failed.connect(self._on_bases_save_failed)
+        self.ibases_watcher = IbasesWatcher(IBASES_PATH, self)
+        self.ibases_watcher.changed.connect(self._on_ibases_changed)
+        self.ibases_watcher.start()
+        self.actions = DatabaseActions(self, self.all_bases, self.save_bases, self.refresh_bases_view)
+        self.operations = DatabaseOperations(self, self.all_bases, self.save_bases, self.refresh_bases_view)
         self.process_actions = ProcessActions(self)
+        self.setup_launch_sets()
         self.tree_builder = TreeBuilder(self.model)
-        self.opened_bases_builder = OpenedBasesTreeBuilder(self.model)
+        self.opened_bases_builder = OpenedBasesTreeBuilder(self.model, self.order_opened_processes)
         self.main_processes_builder = MainProcessesTreeBuilder(self.model)
 
+        self.setup_view_state()
+        self.setup_prewarm()
         self.setup_menu()
         self.setup_digit_navigation()
+        self.setup_profiling()
         self.hotkey_manager.register()
-        self.load_bases()
+        self.statusBar.showMessage("⏳ Загрузка списка баз...")
+        # При любом штатном выходе: отложенная запись ibases.v8i, затем снимок дерева
+        QApplication.instance().aboutToQuit.connect(self.flush_bases)
+        QApplication.instance().aboutToQuit.connect(self.save_tree_snapshot)
+        QApplication.instance().aboutToQuit.connect(self.save_view_state)
+
+    def start_loading(self):
+        """Загрузка данных после первой отрисовки окна.
+
+        Этапы разнесены по итерациям цикла событий: сначала дерево баз
+        (из снимка прошлого сеанса, если ibases.v8i не менялся), затем
+        процессы — их сканирование требует psutil/win32 и заметно дольше.
+        """
+        if not self.load_bases_from_snapshot():
+            self.load_bases()
+            self.expand_and_select_initial()
+        self._bases_loaded = True
+        self.statusBar.clearMessage()
+        self.load_edit_journal()
+        QTimer.singleShot(0, self._load_processes)
+        QTimer.singleShot(0, self._process_pending_ipc_messages)
+
+    def _load_processes(self):
+        """Второй этап загрузки: открытые базы и отслеживаемые приложения."""
+        self.setup_foreground_watcher()
         self.refresh_opened_bases()
         self.refresh_main_processes()
         self.expand_and_select_initial()
@@ -109,11 +176,31 @@ class TreeWindow(
         a.triggered.connect(self.handle_f4_open)
         menu_actions.addAction(a)
 
+        a = QAction("Открыть новый экземпляр\t[Ctrl+F3 / Ctrl+Enter]", self)
+        a.setShortcuts(["Ctrl+F3", "Ctrl+Return"])
+        a.triggered.connect(self.handle_open_new_instance)
+        menu_actions.addAction(a)
+
+        a = QAction("Новый экземпляр конфигуратора\t[Ctrl+F4]", self)
+        a.setShortcut("Ctrl+F4")
+        a.triggered.connect(self.handle_open_new_configurator)
+        menu_actions.addAction(a)
+
         a = QAction("Инструменты ИР\t[F5]", self)
         a.setShortcut("F5")
         a.triggered.connect(self.handle_f5_ir_tools)
         menu_actions.addAction(a)
 
+        a = QAction("Предыдущая база\t[Ctrl+Tab]", self)
+        a.setShortcut("Ctrl+Tab")
+        a.triggered.connect(self.switch_to_previous_base)
+        menu_actions.addAction(a)
+
+        a = QAction("Поиск базы\t[Ctrl+F]", self)
+        a.setShortcut("Ctrl+F")
+        a.triggered.connect(lambda: self.open_search())
+        menu_actions.addAction(a)
+
         a = QAction("Консоль сервера\t[F6]", self)
         a.setShortcut("F6")
         a.triggered.connect(self.handle_f6_server_console)
@@ -121,6 +208,16 @@ class TreeWindow(
 
         menu_actions.addSeparator()
 
+        a = QAction("Наборы запуска…\t[F9]", self)
+        a.setShortcut("F9")
+        a.triggered.connect(self.show_launch_sets)
+        menu_actions.addAction(a)
+
+        menu_sets = menu_actions.addMenu("Запустить набор")
+        menu_sets.aboutToShow.connect(lambda: self.fill_launch_sets_menu(menu_sets))
+
+        menu_actions.addSeparator()
+
         a = QAction("Запустить DBM API", self)
         a.triggered.connect(self.run_dbm_app)
         menu_actions.addAction(a)
@@ -158,26 +255,31 @@ class TreeWindow(
         # ── Редактирование ────────────────────────────────────
         menu_edit = menubar.addMenu("Редактирование")
 
+        a = QAction("Отменить\t[Ctrl+Z]", self)
+        a.setShortcut("Ctrl+Z")
+        a.triggered.connect(self.undo_edit)
+        menu_edit.addAction(a)
+
+        a = QAction("Повторить\t[Ctrl+Y / Ctrl+Shift+Z]", self)
+        a.setShortcuts(["Ctrl+Y", "Ctrl+Shift+Z"])
+        a.triggered.connect(self.redo_edit)
+        menu_edit.addAction(a)
+
+        menu_edit.addSeparator()
+
         a = QAction("Добавить базу\t[Shift+F10]", self)
         a.setShortcut("Shift+F10")
-        a.triggered.connect(lambda: self.operations.add_database(
-            Database1C, DatabaseSettingsDialog,
-            lambda: self.operations.get_current_folder(self.model, self.tree)
-        ))
+        a.triggered.connect(self.handle_add_database)
         menu_edit.addAction(a)
 
         a = QAction("Дублировать базу\t[Ctrl+D]", self)
         a.setShortcut("Ctrl+D")
-        a.triggered.connect(lambda: self.operations.duplicate_database(
-            self.operations.get_selected_database(self.model, self.tree), Database1C
-        ))
+        a.triggered.connect(self.handle_duplicate_database)
         menu_edit.addAction(a)
 
         a = QAction("Настройки базы\t[Ctrl+E]", self)
         a.setShortcut("Ctrl+E")
-        a.triggered.connect(lambda: self.operations.edit_database_settings(
-            self.operations.get_selected_database(self.model, self.tree), DatabaseSettingsDialog
-        ))
+        a.triggered.connect(self.handle_edit_database)
         menu_edit.addAction(a)
 
         a = QAction("Копировать строку соединения\t[Ctrl+C]", self)
@@ -212,6 +314,20 @@ class TreeWindow(
         a.triggered.connect(self.toggle_theme)
         menu_view.addAction(a)
 
+        a = QAction("Статистика запусков", self)
+        a.triggered.connect(self.show_launch_stats)
+        menu_view.addAction(a)
+
+        a = QAction("Статистика баз", self)
+        a.triggered.connect(self.show_base_stats)
+        menu_view.addAction(a)
+
+        a = QAction("Прогрев платформы под курсором", self)
+        a.setCheckable(True)
+        a.setChecked(self.prewarm_enabled)
+        a.toggled.connect(self.toggle_prewarm)
+        menu_view.addAction(a)
+
         # ── Справка ───────────────────────────────────────────
         menu_help = menubar.addMenu("Справка")
 
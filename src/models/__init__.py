@@ -3,7 +3,9 @@
 """
 
 from .database import Database1C
+from .process import Process1C
 
 __all__ = [
     "Database1C",
+    "Process1C",
 ]
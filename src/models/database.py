@@ -19,6 +19,7 @@ class Database1C:
     original_folder: Optional[str] = None  # Оригинальная папка (только в памяти, не сохраняется)
     is_recent: bool = False  # Флаг принадлежности к "Недавним"
     last_run_time: Optional[datetime] = None  # Время последнего запуска для сортировки недавних
+    source: Optional[str] = None  # Общий список, из которого прочитана база (None — личный ibases.v8i; не сохраняется)
 
     # Новые поля для таблицы учетных данных
     usr_enterprise: Optional[str] = None  # Пользователь для Предприятия
@@ -32,6 +33,11 @@ class Database1C:
     # Тип клиента: 'thin' (тонкий, 1cv8c.exe) или 'thick' (толстый, 1cv8.exe)
     client_type: Optional[str] = 'thick'  # По умолчанию толстый клиент
 
+    # Политика выбора версии платформы: 'exact' (по умолчанию), 'branch' или 'latest'
+    version_policy: Optional[str] = None
+    # Резервные версии через ';' (например "8.3.25;8.3.24.1500;latest")
+    version_fallbacks: Optional[str] = None
+
     def __str__(self):
         return self.name
 
@@ -43,6 +49,10 @@ class Database1C:
         """
         return bool(self.connect and self.connect.strip())
 
+    def is_local(self) -> bool:
+        """База из личного ibases.v8i (только такие лончер сохраняет)"""
+        return not self.source
+
     def get_connection_type(self):
         """Определяет тип подключения: File или Srvr"""
         if 'File=' in self.connect:
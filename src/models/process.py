@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class Process1C:
+    """
+    Представление процесса 1C
+    """
+    pid: int
+    name: str  # Имя окна (как в диспетчере задач)
+    hwnd: int  # Handle окна
+    process_name: str = ''  # Имя исполняемого файла (например, Code.exe)
+    base_id: Optional[str] = None  # ID базы из ibases.v8i, если процесс с ней сопоставлен
+    
+    def __eq__(self, other):
+        if not isinstance(other, Process1C):
+            return False
+        return self.pid == other.pid
+    
+    def __hash__(self):
+        return hash(self.pid)
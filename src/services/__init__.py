@@ -1,14 +1,29 @@
 """
 Пакет сервисов: чтение баз, запуск 1С, управление процессами.
+
+Экспорт ленивый: модули подгружаются при первом обращении к имени, чтобы
+импорт, например, services.base_reader не тянул psutil и win32 из process_manager.
 """
 
-from .base_launcher import BaseLauncher
-from .base_reader import BaseReader
-from .process_manager import ProcessManager, Process1C
+import importlib
+
+_EXPORTS = {
+    "BaseLauncher": ".base_launcher",
+    "BaseReader": ".base_reader",
+    "BaseWriter": ".base_writer",
+    "ProcessManager": ".process_manager",
+    "Process1C": ".process_manager",
+    "PlatformRegistry": ".platform_registry",
+    "get_platform_registry": ".platform_registry",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "BaseLauncher",
-    "BaseReader",
-    "ProcessManager",
-    "Process1C",
-]
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,66 @@
+"""
+Платформенные бэкенды процессов и окон.
+
+Бэкенд выбирается при первом обращении (get_backend) по PROCESS_BACKEND:
+    auto  — Windows: win32; Linux с X-сервером и python-xlib: x11; иначе fake
+    win32 / x11 / fake — явно (например, LAUNCHER_PROCESS_BACKEND=fake)
+
+Реализации импортируются только при выборе: на Linux модуль не тянет pywin32.
+"""
+
+import os
+import sys
+from typing import Optional
+
+from config import PROCESS_BACKEND
+from .base import ProcessBackend, normalize_process_name
+from .fake_backend import FakeBackend, FakeWindow
+
+__all__ = [
+    'ProcessBackend', 'FakeBackend', 'FakeWindow', 'normalize_process_name',
+    'create_backend', 'get_backend', 'set_backend',
+]
+
+_backend: Optional[ProcessBackend] = None
+
+
+def create_backend(kind: str = 'auto') -> ProcessBackend:
+    """
+    Создает бэкенд
+
+    Args:
+        kind: 'auto', 'win32', 'x11' или 'fake'
+    """
+    if kind == 'win32':
+        from .win32_backend import Win32Backend
+        return Win32Backend()
+    if kind == 'x11':
+        from .x11_backend import X11Backend
+        return X11Backend()
+    if kind == 'fake':
+        return FakeBackend()
+    if kind != 'auto':
+        raise ValueError(f"Неизвестный бэкенд процессов: {kind}")
+
+    if sys.platform == 'win32':
+        return create_backend('win32')
+    if os.environ.get('DISPLAY'):
+        try:
+            return create_backend('x11')
+        except Exception as e:
+            print(f"⚠️ X11-бэкенд недоступен ({e}), окна процессов отслеживаться не будут")
+    return FakeBackend()
+
+
+def get_backend() -> ProcessBackend:
+    """Бэкенд приложения (создается при первом обращении)"""
+    global _backend
+    if _backend is None:
+        _backend = create_backend(PROCESS_BACKEND)
+    return _backend
+
+
+def set_backend(backend: Optional[ProcessBackend]):
+    """Подменяет бэкенд приложения (None — выбрать заново при следующем обращении)"""
+    global _backend
+    _backend = backend
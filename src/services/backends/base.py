@@ -0,0 +1,138 @@
+"""
+Интерфейс платформенного бэкенда процессов и окон.
+
+Процессы по умолчанию перечисляются через psutil (он кроссплатформенный),
+окна — реализацией конкретной платформы. Окно описывается так же, как
+раньше в ProcessManager: идентификатор (hwnd на Windows, XID на X11) и заголовок.
+
+Смена активного окна — событием, а не опросом: watch_foreground() подписывает
+callback(hwnd, pid, title). Если событиям нужен цикл чтения (X11), бэкенд отдает
+дескриптор event_fd(), а GUI вызывает dispatch_events(), когда он готов к чтению.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+ForegroundCallback = Callable[[int, int, str], None]
+
+
+def normalize_process_name(name: Optional[str]) -> str:
+    """Имя процесса без регистра и суффикса .exe: 1cv8c.exe и 1cv8c совпадают"""
+    name = (name or '').lower()
+    return name[:-4] if name.endswith('.exe') else name
+
+
+class ProcessBackend(ABC):
+    """
+    Базовый бэкенд: процессы через psutil, операции с окнами (абстрактные методы) —
+    в наследниках
+    """
+
+    name = 'base'
+
+    # ------------------------------------------------------------------ #
+    #  Процессы                                                            #
+    # ------------------------------------------------------------------ #
+
+    def iter_processes(self) -> Iterator[Tuple[int, str]]:
+        """Пары (pid, имя исполняемого файла) всех процессов"""
+        import psutil
+
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                yield proc.info['pid'], proc.info['name'] or ''
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    def process_name(self, pid: int) -> str:
+        """Имя исполняемого файла процесса ('' если процесса нет)"""
+        import psutil
+
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return ''
+
+    def command_line(self, pid: int) -> str:
+        """Командная строка процесса ('' если недоступна)"""
+        import psutil
+
+        try:
+            return ' '.join(psutil.Process(pid).cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return ''
+
+    def pid_exists(self, pid: int) -> bool:
+        import psutil
+
+        return psutil.pid_exists(pid)
+
+    def terminate(self, pid: int, force: bool = False) -> bool:
+        """Завершает процесс (force — kill). Уже завершенный процесс — успех"""
+        import psutil
+
+        try:
+            proc = psutil.Process(pid)
+            if force:
+                proc.kill()
+            else:
+                proc.terminate()
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return True
+
+    # ------------------------------------------------------------------ #
+    #  Окна                                                                #
+    # ------------------------------------------------------------------ #
+
+    @abstractmethod
+    def main_windows(self) -> Dict[int, Tuple[int, str]]:
+        """
+        Главные окна всех процессов за один проход по окнам
+
+        Returns:
+            {pid: (hwnd, title)} — первое видимое окно верхнего уровня процесса
+        """
+
+    def find_main_window(self, pid: int) -> Optional[Tuple[int, str]]:
+        """Главное окно процесса (hwnd, title) или None"""
+        return self.main_windows().get(pid)
+
+    @abstractmethod
+    def activate_window(self, hwnd: int) -> bool:
+        """Разворачивает окно, если свернуто, и переводит на него фокус"""
+
+    @abstractmethod
+    def request_close(self, hwnd: int) -> bool:
+        """Просит окно закрыться (как кнопка "закрыть"), не дожидаясь результата"""
+
+    @abstractmethod
+    def window_exists(self, hwnd: int) -> bool:
+        """Существует ли окно"""
+
+    @abstractmethod
+    def foreground_window(self) -> Optional[Tuple[int, int, str]]:
+        """Активное окно: (hwnd, pid, title) или None"""
+
+    # ------------------------------------------------------------------ #
+    #  События смены активного окна                                        #
+    # ------------------------------------------------------------------ #
+
+    def watch_foreground(self, callback: ForegroundCallback) -> bool:
+        """
+        Подписывает callback(hwnd, pid, title) на смену активного окна
+
+        Returns:
+            False, если платформа не сообщает о смене активного окна
+        """
+        return False
+
+    def unwatch_foreground(self):
+        """Отменяет подписку watch_foreground"""
+
+    def event_fd(self) -> Optional[int]:
+        """Дескриптор, готовность которого к чтению означает новые события (или None)"""
+        return None
+
+    def dispatch_events(self):
+        """Обрабатывает накопившиеся события (вызывается, когда event_fd готов)"""
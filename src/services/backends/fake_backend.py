@@ -0,0 +1,117 @@
+"""
+Бэкенд в памяти: процессы и окна задаются вручную
+
+Используется бенчмарками и для запуска лончера там, где нет ни Win32, ни X11.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .base import ProcessBackend
+
+
+@dataclass
+class FakeWindow:
+    """Окно верхнего уровня"""
+    hwnd: int
+    pid: int
+    title: str = ''
+    visible: bool = True
+    parent: int = 0
+    minimized: bool = False
+
+
+class FakeBackend(ProcessBackend):
+    """
+    Таблица процессов и список окон в памяти
+    """
+
+    name = 'fake'
+
+    def __init__(self):
+        # pid -> (имя, командная строка)
+        self.processes: Dict[int, Tuple[str, List[str]]] = {}
+        self.windows: List[FakeWindow] = []
+        self.foreground: Optional[int] = None
+        self._foreground_callback = None
+
+    def add_process(self, pid: int, name: str, cmdline: Sequence[str] = ()):
+        self.processes[pid] = (name, list(cmdline))
+
+    def add_window(self, hwnd: int, pid: int, title: str = '', visible: bool = True, parent: int = 0):
+        self.windows.append(FakeWindow(hwnd, pid, title, visible, parent))
+
+    def remove_process(self, pid: int):
+        """Завершает процесс вместе с его окнами"""
+        self.processes.pop(pid, None)
+        self.windows = [window for window in self.windows if window.pid != pid]
+
+    # --- процессы ---
+
+    def iter_processes(self) -> Iterator[Tuple[int, str]]:
+        for pid, (name, _) in list(self.processes.items()):
+            yield pid, name
+
+    def process_name(self, pid: int) -> str:
+        return self.processes.get(pid, ('', []))[0]
+
+    def command_line(self, pid: int) -> str:
+        return ' '.join(self.processes.get(pid, ('', []))[1])
+
+    def pid_exists(self, pid: int) -> bool:
+        return pid in self.processes
+
+    def terminate(self, pid: int, force: bool = False) -> bool:
+        self.remove_process(pid)
+        return True
+
+    # --- окна ---
+
+    def main_windows(self) -> Dict[int, Tuple[int, str]]:
+        result = {}
+        for window in self.windows:
+            if window.visible and not window.parent and window.pid not in result:
+                result[window.pid] = (window.hwnd, window.title)
+        return result
+
+    def _get(self, hwnd: int) -> Optional[FakeWindow]:
+        return next((window for window in self.windows if window.hwnd == hwnd), None)
+
+    def activate_window(self, hwnd: int) -> bool:
+        window = self._get(hwnd)
+        if window is None:
+            return False
+        window.minimized = False
+        self.set_foreground(hwnd)
+        return True
+
+    def set_foreground(self, hwnd: int):
+        """Делает окно активным (как щелчок пользователя) и сообщает подписчику"""
+        self.foreground = hwnd
+        window = self._get(hwnd)
+        if window is not None and self._foreground_callback:
+            self._foreground_callback(window.hwnd, window.pid, window.title)
+
+    def request_close(self, hwnd: int) -> bool:
+        window = self._get(hwnd)
+        if window is None:
+            return False
+        # Приложение послушно закрывается вместе с процессом
+        self.remove_process(window.pid)
+        return True
+
+    def window_exists(self, hwnd: int) -> bool:
+        return self._get(hwnd) is not None
+
+    def foreground_window(self) -> Optional[Tuple[int, int, str]]:
+        window = self._get(self.foreground) if self.foreground else None
+        if window is None:
+            return None
+        return window.hwnd, window.pid, window.title
+
+    def watch_foreground(self, callback) -> bool:
+        self._foreground_callback = callback
+        return True
+
+    def unwatch_foreground(self):
+        self._foreground_callback = None
@@ -0,0 +1,131 @@
+"""
+Бэкенд Windows: окна через pywin32 (win32gui / win32process)
+
+Смена активного окна — через SetWinEventHook(EVENT_SYSTEM_FOREGROUND) вне
+контекста процесса: Windows вызывает callback из цикла сообщений потока,
+установившего хук (главный поток Qt), опрос не нужен.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .base import ProcessBackend
+
+
+class Win32Backend(ProcessBackend):
+    """
+    Окна верхнего уровня через EnumWindows, процессы через psutil
+    """
+
+    name = 'win32'
+
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WINEVENT_SKIPOWNPROCESS = 0x0002
+
+    def __init__(self):
+        import win32con
+        import win32gui
+        import win32process
+
+        self._win32con = win32con
+        self._win32gui = win32gui
+        self._win32process = win32process
+        self._hook = None
+        # Ссылка на ctypes-обертку callback'а обязана жить, пока живет хук
+        self._hook_proc = None
+
+    def main_windows(self) -> Dict[int, Tuple[int, str]]:
+        win32gui = self._win32gui
+        get_pid = self._win32process.GetWindowThreadProcessId
+        result = {}
+
+        def callback(hwnd, _):
+            if not win32gui.IsWindowVisible(hwnd):
+                return True
+            # Только главные окна (без родителя); окна без заголовка тоже принимаются
+            if win32gui.GetParent(hwnd) != 0:
+                return True
+            _, pid = get_pid(hwnd)
+            if pid not in result:
+                result[pid] = (hwnd, win32gui.GetWindowText(hwnd))
+            return True
+
+        try:
+            win32gui.EnumWindows(callback, None)
+        except Exception:
+            pass
+        return result
+
+    def activate_window(self, hwnd: int) -> bool:
+        try:
+            win32gui = self._win32gui
+            if win32gui.IsIconic(hwnd):
+                win32gui.ShowWindow(hwnd, self._win32con.SW_RESTORE)
+            win32gui.SetForegroundWindow(hwnd)
+            return True
+        except Exception as e:
+            print(f"Ошибка активации окна: {e}")
+            return False
+
+    def request_close(self, hwnd: int) -> bool:
+        try:
+            self._win32gui.PostMessage(hwnd, self._win32con.WM_CLOSE, 0, 0)
+            return True
+        except Exception:
+            return False
+
+    def window_exists(self, hwnd: int) -> bool:
+        try:
+            return bool(self._win32gui.IsWindow(hwnd))
+        except Exception:
+            return False
+
+    def foreground_window(self) -> Optional[Tuple[int, int, str]]:
+        try:
+            hwnd = self._win32gui.GetForegroundWindow()
+            if not hwnd:
+                return None
+            return self._describe(hwnd)
+        except Exception:
+            return None
+
+    def _describe(self, hwnd) -> Tuple[int, int, str]:
+        _, pid = self._win32process.GetWindowThreadProcessId(hwnd)
+        return hwnd, pid, self._win32gui.GetWindowText(hwnd)
+
+    def watch_foreground(self, callback) -> bool:
+        import ctypes
+        from ctypes import wintypes
+
+        self.unwatch_foreground()
+        proc_type = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD,
+        )
+
+        def on_event(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            if not hwnd:
+                return
+            try:
+                callback(*self._describe(hwnd))
+            except Exception as e:
+                print(f"⚠️ Ошибка обработки смены активного окна: {e}")
+
+        self._hook_proc = proc_type(on_event)
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        self._hook = user32.SetWinEventHook(
+            self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND, 0, self._hook_proc, 0, 0,
+            self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS,
+        )
+        if not self._hook:
+            self._hook_proc = None
+            return False
+        return True
+
+    def unwatch_foreground(self):
+        if self._hook:
+            import ctypes
+            ctypes.windll.user32.UnhookWinEvent(self._hook)
+        self._hook = None
+        self._hook_proc = None
@@ -0,0 +1,147 @@
+"""
+Бэкенд Linux/X11: окна через EWMH (python-xlib)
+
+Список окон — свойство _NET_CLIENT_LIST корневого окна (его ведет оконный
+менеджер), PID — _NET_WM_PID, активация и закрытие — клиентские сообщения
+_NET_ACTIVE_WINDOW и _NET_CLOSE_WINDOW. Смена активного окна — событие
+PropertyNotify корневого окна по _NET_ACTIVE_WINDOW (дескриптор соединения
+отдается в event_fd для QSocketNotifier). Зависимость необязательная:
+без python-xlib бэкенд не создается (см. backends.create_backend).
+"""
+
+from typing import Dict, Optional, Tuple
+
+from .base import ProcessBackend
+
+
+class X11Backend(ProcessBackend):
+    """
+    Окна верхнего уровня X11 через EWMH, процессы через psutil
+    """
+
+    name = 'x11'
+
+    def __init__(self, display_name: Optional[str] = None):
+        from Xlib import X, display, protocol
+
+        self._X = X
+        self._protocol = protocol
+        self._display = display.Display(display_name)
+        self._root = self._display.screen().root
+        self._foreground_callback = None
+        atom = self._display.intern_atom
+        self._atoms = {
+            name: atom(name)
+            for name in (
+                '_NET_CLIENT_LIST', '_NET_WM_PID', '_NET_WM_NAME', 'UTF8_STRING',
+                '_NET_ACTIVE_WINDOW', '_NET_CLOSE_WINDOW', 'WM_TRANSIENT_FOR',
+            )
+        }
+
+    # ------------------------------------------------------------------ #
+
+    def _property(self, window, name, prop_type=None):
+        try:
+            prop = window.get_full_property(self._atoms[name], prop_type or self._X.AnyPropertyType)
+        except Exception:
+            return None
+        return prop.value if prop is not None else None
+
+    def _client_ids(self):
+        return list(self._property(self._root, '_NET_CLIENT_LIST') or [])
+
+    def _window(self, xid):
+        return self._display.create_resource_object('window', xid)
+
+    def _title(self, window) -> str:
+        value = self._property(window, '_NET_WM_NAME', self._atoms['UTF8_STRING'])
+        if value is None:
+            try:
+                value = window.get_wm_name()
+            except Exception:
+                value = None
+        if isinstance(value, bytes):
+            value = value.decode('utf-8', 'replace')
+        return value or ''
+
+    def _send(self, xid, message, data):
+        event = self._protocol.event.ClientMessage(
+            window=self._window(xid),
+            client_type=self._atoms[message],
+            data=(32, list(data) + [0] * (5 - len(data))),
+        )
+        mask = self._X.SubstructureRedirectMask | self._X.SubstructureNotifyMask
+        self._root.send_event(event, event_mask=mask)
+        self._display.flush()
+
+    # ------------------------------------------------------------------ #
+
+    def main_windows(self) -> Dict[int, Tuple[int, str]]:
+        result = {}
+        for xid in self._client_ids():
+            window = self._window(xid)
+            pids = self._property(window, '_NET_WM_PID')
+            if not pids:
+                continue
+            # Диалоги (transient) — не главные окна
+            if self._property(window, 'WM_TRANSIENT_FOR'):
+                continue
+            pid = int(pids[0])
+            if pid not in result:
+                result[pid] = (xid, self._title(window))
+        return result
+
+    def activate_window(self, hwnd: int) -> bool:
+        try:
+            # source indication 2 — запрос от "пейджера": WM не игнорирует его из-за фокуса
+            self._send(hwnd, '_NET_ACTIVE_WINDOW', [2, self._X.CurrentTime, 0])
+            return True
+        except Exception as e:
+            print(f"Ошибка активации окна: {e}")
+            return False
+
+    def request_close(self, hwnd: int) -> bool:
+        try:
+            self._send(hwnd, '_NET_CLOSE_WINDOW', [self._X.CurrentTime, 2])
+            return True
+        except Exception:
+            return False
+
+    def window_exists(self, hwnd: int) -> bool:
+        return hwnd in self._client_ids()
+
+    def foreground_window(self) -> Optional[Tuple[int, int, str]]:
+        active = self._property(self._root, '_NET_ACTIVE_WINDOW')
+        if not active or not active[0]:
+            return None
+        xid = int(active[0])
+        window = self._window(xid)
+        pids = self._property(window, '_NET_WM_PID')
+        if not pids:
+            return None
+        return xid, int(pids[0]), self._title(window)
+
+    def watch_foreground(self, callback) -> bool:
+        self._foreground_callback = callback
+        self._root.change_attributes(event_mask=self._X.PropertyChangeMask)
+        self._display.flush()
+        return True
+
+    def unwatch_foreground(self):
+        self._foreground_callback = None
+        self._root.change_attributes(event_mask=self._X.NoEventMask)
+        self._display.flush()
+
+    def event_fd(self) -> Optional[int]:
+        return self._display.fileno()
+
+    def dispatch_events(self):
+        changed = False
+        while self._display.pending_events():
+            event = self._display.next_event()
+            if event.type == self._X.PropertyNotify and event.atom == self._atoms['_NET_ACTIVE_WINDOW']:
+                changed = True
+        if changed and self._foreground_callback:
+            foreground = self.foreground_window()
+            if foreground:
+                self._foreground_callback(*foreground)
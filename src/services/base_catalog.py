@@ -0,0 +1,241 @@
+"""
+Каталог баз из нескольких источников.
+
+Источники:
+    - личный ibases.v8i пользователя (config.IBASES_PATH) — единственный, в который пишет лончер;
+    - общие списки из 1CEStart.cfg (строки CommonInfoBases=...), как их подключает сама 1С;
+    - дополнительные списки из config.SHARED_IBASES_PATHS (например, на сетевом ресурсе).
+
+Каждый источник читается BaseReader'ом и кэшируется по (mtime_ns, size): неизменный
+файл повторно не разбирается (отдаются копии записей — лончер их изменяет),
+а в измененном разбираются только измененные секции.
+Общие источники читаются параллельно в фоновых потоках, результат отдается
+callback'ом по мере готовности каждого — медленный сетевой ресурс не задерживает
+ни личный список, ни другие источники. Для каждого источника идет не больше одного
+чтения: пока оно не закончилось (например, завис сетевой ресурс), повторная загрузка
+новый поток для него не запускает.
+
+Слияние: записи источников идут в порядке приоритета (личный список первым), повторы
+по ID или по строке подключения отбрасываются. У записей общих источников заполнено
+поле source (путь к файлу), у личных оно пустое.
+"""
+
+import copy
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import ENCODING, ESTART_CONFIG_PATH, IBASES_PATH, SHARED_IBASES_PATHS
+from models.database import Database1C
+from services.base_reader import BaseReader
+from services.process_index import connection_key
+from services.tree_snapshot import stat_key
+
+
+@dataclass(frozen=True)
+class CatalogSource:
+    """Файл со списком баз"""
+    path: Path
+    local: bool = False
+
+    @property
+    def name(self) -> str:
+        """Значение Database1C.source для записей источника ('' — личный список)"""
+        return '' if self.local else str(self.path)
+
+
+def read_common_info_bases(cfg_path: Path) -> List[Path]:
+    """
+    Пути общих списков баз из 1CEStart.cfg (CommonInfoBases=...)
+
+    Адреса веб-серверов (http/https) пропускаются: лончер читает только файлы.
+    """
+    try:
+        raw = Path(cfg_path).read_bytes()
+    except OSError:
+        return []
+    encoding = 'utf-16' if raw[:2] in (b'\xff\xfe', b'\xfe\xff') else 'utf-8-sig'
+    paths = []
+    for line in raw.decode(encoding, errors='replace').splitlines():
+        key, sep, value = line.partition('=')
+        value = value.strip().strip('"')
+        if not sep or key.strip().lower() != 'commoninfobases' or not value:
+            continue
+        if value.lower().startswith(('http://', 'https://')):
+            continue
+        paths.append(Path(value))
+    return paths
+
+
+def discover_sources(
+    local_path: Path = IBASES_PATH,
+    cfg_path: Optional[Path] = ESTART_CONFIG_PATH,
+    extra_paths: Iterable[Path] = SHARED_IBASES_PATHS,
+) -> List[CatalogSource]:
+    """Источники в порядке приоритета: личный список, 1CEStart.cfg, дополнительные"""
+    sources = [CatalogSource(Path(local_path), local=True)]
+    seen = {str(local_path).lower()}
+    shared = (read_common_info_bases(cfg_path) if cfg_path else []) + [Path(p) for p in extra_paths]
+    for path in shared:
+        if str(path).lower() not in seen:
+            seen.add(str(path).lower())
+            sources.append(CatalogSource(path))
+    return sources
+
+
+def merge_catalog(groups: Iterable[Iterable[Database1C]]) -> List[Database1C]:
+    """
+    Объединяет списки баз (в порядке приоритета) без повторов по ID и строке подключения
+
+    Строка подключения сравнивается только между списками: внутри одного списка
+    копии базы (Ctrl+D) с тем же Connect — разные записи.
+    """
+    merged = []
+    seen_ids = set()
+    seen_keys = set()
+    for bases in groups:
+        group_keys = set()
+        for base in bases:
+            key = connection_key(base.connect)
+            if (base.id and base.id in seen_ids) or (key and key in seen_keys):
+                continue
+            if base.id:
+                seen_ids.add(base.id)
+            if key:
+                group_keys.add(key)
+            merged.append(base)
+        seen_keys |= group_keys
+    return merged
+
+
+class BaseCatalog:
+    """
+    Чтение источников с кэшем по stat
+    """
+
+    def __init__(self, sources: Optional[List[CatalogSource]] = None, encoding: str = ENCODING):
+        self.sources = sources if sources is not None else discover_sources()
+        self.encoding = encoding
+        # путь -> (stat, базы)
+        self._cache: Dict[Path, Tuple[Tuple[int, int], List[Database1C]]] = {}
+        # путь -> кэш секций BaseReader
+        self._sections: Dict[Path, dict] = {}
+        # Пути общих источников, чтение которых еще идет
+        self._in_flight = set()
+        # Кэши меняются и из фоновых потоков чтения
+        self._lock = threading.Lock()
+
+    @property
+    def local(self) -> CatalogSource:
+        return self.sources[0]
+
+    @property
+    def shared(self) -> List[CatalogSource]:
+        return self.sources[1:]
+
+    def read(self, source: CatalogSource) -> Tuple[Optional[Tuple[int, int]], List[Database1C]]:
+        """
+        Базы источника (из кэша, если файл не менялся)
+
+        Returns:
+            (stat файла или None, если его нет; список баз)
+        """
+        stat = stat_key(source.path)
+        if stat is None:
+            with self._lock:
+                self._cache.pop(source.path, None)
+            if not source.local:
+                print(f"⚠️ Общий список баз недоступен: {source.path}")
+            return None, []
+        with self._lock:
+            cached = self._cache.get(source.path)
+            sections = self._sections.setdefault(source.path, {})
+        if not cached or cached[0] != stat:
+            # Разбор — без блокировки: кэш секций источника читает один поток
+            bases = BaseReader(source.path, self.encoding, sections).read_bases()
+            for base in bases:
+                base.source = source.name or None
+            cached = (stat, bases)
+            with self._lock:
+                self._cache[source.path] = cached
+        return stat, [copy.copy(base) for base in cached[1]]
+
+    def read_local(self) -> List[Database1C]:
+        return self.read(self.local)[1]
+
+    def read_shared_async(self, on_source: Callable[[CatalogSource, Optional[Tuple[int, int]], List[Database1C]], None]):
+        """
+        Читает общие источники в фоновых потоках (по одному на источник)
+
+        Источник, прошлое чтение которого еще не закончилось, пропускается:
+        его результат придет от того чтения.
+
+        Args:
+            on_source: callback(source, stat, bases), вызывается из фонового потока
+                по готовности каждого источника
+
+        Returns:
+            Количество запущенных чтений
+        """
+        started = 0
+        for source in self.shared:
+            with self._lock:
+                if source.path in self._in_flight:
+                    print(f"⏳ Общий список баз еще читается: {source.path}")
+                    continue
+                self._in_flight.add(source.path)
+            # Потоки-демоны: зависший сетевой ресурс не задерживает выход из приложения
+            threading.Thread(target=self._read_in_background, args=(source, on_source), daemon=True).start()
+            started += 1
+        return started
+
+    def _read_in_background(self, source, on_source):
+        try:
+            stat, bases = self.read(source)
+        except Exception as e:
+            print(f"❌ Ошибка чтения списка баз {source.path}: {e}")
+            stat, bases = None, []
+        finally:
+            with self._lock:
+                self._in_flight.discard(source.path)
+        on_source(source, stat, bases)
+
+
+@dataclass
+class BasesDiff:
+    """Изменения списка баз между двумя чтениями (по ID)"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __str__(self):
+        return f"+{len(self.added)} −{len(self.removed)} ~{len(self.changed)}"
+
+
+def diff_bases(old: Iterable[Database1C], new: Iterable[Database1C]) -> BasesDiff:
+    """Сравнивает два списка баз по ID и значениям полей"""
+    old_by_id = {base.id: base for base in old}
+    new_by_id = {base.id: base for base in new}
+    return BasesDiff(
+        added=[base_id for base_id in new_by_id if base_id not in old_by_id],
+        removed=[base_id for base_id in old_by_id if base_id not in new_by_id],
+        changed=[
+            base_id for base_id, base in new_by_id.items()
+            if base_id in old_by_id and old_by_id[base_id] != base
+        ],
+    )
+
+
+_catalog: Optional[BaseCatalog] = None
+
+
+def get_base_catalog() -> BaseCatalog:
+    """Возвращает общий для приложения каталог (источники определяются при первом обращении)"""
+    global _catalog
+    if _catalog is None:
+        _catalog = BaseCatalog()
+    return _catalog
@@ -1,15 +1,25 @@
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from models.database import Database1C
 from datetime import datetime
+from services.profiling import hot_path
 
 class BaseReader:
     """Сервис для чтения списка баз из ibases.v8i"""
     
-    def __init__(self, ibases_path: Path, encoding: str = 'utf-8-sig'):
+    def __init__(self, ibases_path: Path, encoding: str = 'utf-8-sig', section_cache: Optional[Dict] = None):
+        """
+        Args:
+            ibases_path: Путь к ibases.v8i
+            encoding: Кодировка файла
+            section_cache: Кэш разобранных секций между чтениями одного файла
+                (при повторном чтении разбираются только измененные секции)
+        """
         self.ibases_path = ibases_path
         self.encoding = encoding
+        self.section_cache = section_cache
     
+    @hot_path("read_bases")
     def read_bases(self) -> List[Database1C]:
         """Читает список баз из файла ibases.v8i"""
         if not self.ibases_path.exists():
@@ -17,46 +27,20 @@ class BaseReader:
             return []
         
         bases = []
-        current_base = {}
-        current_section_name = None
+        cache = self.section_cache
+        parsed = {}
         
         try:
             with open(self.ibases_path, 'r', encoding=self.encoding) as file:
-                for line in file:
-                    line = line.strip()
-                    
-                    # Пропускаем пустые строки
-                    if not line:
-                        continue
-                    
-                    # Если встретили новую секцию [НАЗВАНИЕ], сохраняем предыдущую базу
-                    if line.startswith('[') and line.endswith(']'):
-                        # Сохраняем предыдущую базу, если она была и у нее непустой connect
-                        if current_base and current_section_name:
-                            # Проверяем наличие непустого connect
-                            connect = current_base.get('Connect', '').strip()
-                            if connect:  # Пропускаем записи с пустым connect
-                                current_base['SectionName'] = current_section_name
-                                bases.append(self._create_database(current_base))
-                        
-                        # Начинаем новую базу
-                        current_base = {}
-                        # Извлекаем имя секции из [Название]
-                        current_section_name = line[1:-1].strip()
-                        continue
-                    
-                    # Парсим остальные параметры
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        current_base[key] = value
-                
-                # Добавляем последнюю базу, если есть и у нее непустой connect
-                if current_base and current_section_name:
-                    # Проверяем наличие непустого connect
-                    connect = current_base.get('Connect', '').strip()
-                    if connect:  # Пропускаем записи с пустым connect
-                        current_base['SectionName'] = current_section_name
-                        bases.append(self._create_database(current_base))
+                for section in self._iter_sections(file):
+                    if cache is None:
+                        base = self._parse_section(*section)
+                    else:
+                        # Неизмененная секция (то же имя и те же строки) не разбирается повторно
+                        base = cache[section] if section in cache else self._parse_section(*section)
+                        parsed[section] = base
+                    if base is not None:
+                        bases.append(base)
             
             # Сортируем: сначала недавние (по времени запуска, самые свежие первыми), потом по папкам и OrderInTree
             bases.sort(key=lambda x: (
@@ -70,8 +54,52 @@ class BaseReader:
             print(f"❌ Ошибка при чтении файла: {e}")
             return []
         
+        if cache is not None:
+            # В кэше остаются только секции текущей версии файла
+            cache.clear()
+            cache.update(parsed)
         return bases
     
+    @staticmethod
+    def _iter_sections(file) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+        """Секции файла: (имя из [Название], непустые строки секции)"""
+        section_name = None
+        lines = []
+        for line in file:
+            line = line.strip()
+            
+            # Пропускаем пустые строки
+            if not line:
+                continue
+            
+            # Новая секция [НАЗВАНИЕ] — отдаем предыдущую
+            if line.startswith('[') and line.endswith(']'):
+                if section_name is not None:
+                    yield section_name, tuple(lines)
+                section_name = line[1:-1].strip()
+                lines = []
+                continue
+            
+            lines.append(line)
+        
+        # Последняя секция
+        if section_name is not None:
+            yield section_name, tuple(lines)
+    
+    def _parse_section(self, section_name: str, lines: Tuple[str, ...]) -> Optional[Database1C]:
+        """Создает базу из секции (None для записей с пустым Connect — это папки)"""
+        data = {}
+        for line in lines:
+            if '=' in line:
+                key, value = line.split('=', 1)
+                data[key] = value
+        
+        # Пропускаем записи с пустым connect
+        if not data or not data.get('Connect', '').strip():
+            return None
+        data['SectionName'] = section_name
+        return self._create_database(data)
+    
     def _create_database(self, data: dict) -> Database1C:
         """Создает объект Database1C из словаря"""
         # Преобразуем OrderInTree в float
@@ -123,6 +151,8 @@ class BaseReader:
             pwd_storage=data.get('PwdStorage', None),
             storage_path=data.get('StoragePath', None),
             client_type=client_type,  # Тип клиента
+            version_policy=data.get('VersionPolicy', None),
+            version_fallbacks=data.get('VersionFallbacks', None),
         )
     
     def print_bases_list(self, bases: List[Database1C]):
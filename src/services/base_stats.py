@@ -0,0 +1,223 @@
+"""
+Статистика списка баз: сколько баз на каждой версии платформы, сервере,
+разрядности и типе клиента, какие базы давно не запускались. Без зависимости от Qt.
+
+Базы хранятся по столбцам: категориальные поля — коды значений в array('i')
+(значение -> код по словарю столбца), время последнего запуска — array('d')
+(0 — неизвестно). Группировка — подсчет кодов: numpy.bincount по тем же буферам
+без копирования, без NumPy — collections.Counter. NumPy импортируется при первом
+sync(), а не при импорте модуля: окно лончера не платит за него при старте.
+
+Столбцы обновляются инкрементально, как поисковый индекс: sync() сравнивает
+подпись каждой базы и вычисляет заново только строки добавленных и измененных баз.
+Если состав списка не менялся, сравнение идет списками целиком; иначе строки
+неизмененных баз копируются на новые места (порядок строк — порядок списка).
+"""
+
+import time
+from array import array
+from collections import Counter
+from itertools import repeat
+from dataclasses import dataclass
+from operator import attrgetter, ne
+from typing import Dict, List, Optional, Tuple
+
+from services.launch_metrics import server_name
+
+# numpy или None (нет NumPy); _UNSET — еще не импортировали (см. _load_numpy)
+_UNSET = object()
+np = _UNSET
+
+
+DAY = 86400
+
+NO_VERSION = "не указана"
+ARCH_TITLES = {'x86_64': "x64", 'x86': "x86"}
+DEFAULT_ARCH = "по умолчанию"
+CLIENT_TITLES = {'thin': "тонкий", 'thick': "толстый"}
+
+_BASE_ID = attrgetter('id')
+
+
+def _load_numpy():
+    """Импортирует NumPy при первом обращении (NumPy не обязателен)"""
+    global np
+    if np is _UNSET:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # группировка через Counter
+            np = None
+    return np
+
+
+def version_branch(version: Optional[str]) -> str:
+    """Ветка платформы: 8.3.22.1750 -> 8.3.22"""
+    if not version:
+        return NO_VERSION
+    return '.'.join(version.split('.')[:3])
+
+
+@dataclass
+class GroupCount:
+    """Значение столбца и число баз с ним"""
+    key: str
+    count: int
+    share: float  # доля от всех баз, 0..1
+
+
+class _Column:
+    """Категориальный столбец: коды строк и словарь значений"""
+    __slots__ = ('values', 'codes', 'data')
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.data = array('i')
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class BaseStats:
+    """
+    Столбцовый снимок списка баз с инкрементальным обновлением
+    """
+
+    COLUMNS = ('version', 'branch', 'server', 'arch', 'client_type')
+
+    def __init__(self):
+        self._columns = {name: _Column() for name in self.COLUMNS}
+        self._last_run = array('d')
+        self._bases = []
+        self._ids = []
+        self._signatures = []
+        self._row_by_id: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self._bases)
+
+    # Подпись базы: при ее изменении строка переписывается
+    signature = staticmethod(attrgetter('version', 'app_arch', 'client_type', 'connect', 'last_run_time'))
+
+    @staticmethod
+    def _values(base) -> tuple:
+        """Значения категориальных столбцов в порядке COLUMNS"""
+        return (
+            base.version or NO_VERSION,
+            version_branch(base.version),
+            server_name(base.connect),
+            ARCH_TITLES.get(base.app_arch, DEFAULT_ARCH),
+            CLIENT_TITLES.get(base.client_type or 'thick', base.client_type),
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Обновление                                                          #
+    # ------------------------------------------------------------------ #
+
+    def sync(self, bases) -> int:
+        """
+        Приводит столбцы в соответствие списку баз (строки — в порядке списка)
+
+        Returns:
+            Количество добавленных, измененных и удаленных баз
+        """
+        _load_numpy()
+        bases = list(bases)
+        ids = list(map(_BASE_ID, bases))
+        signatures = list(map(self.signature, bases))
+        removed = 0
+
+        if ids == self._ids:
+            # Состав не менялся (частый случай — правка базы): переписываются измененные строки
+            rows = [row for row, differs in enumerate(map(ne, signatures, self._signatures)) if differs]
+        else:
+            # Базы добавлены, удалены или переставлены: неизмененные строки копируются
+            # на новые места, остальные вычисляются заново. Новым базам достается -1
+            # (последняя строка) — их строки все равно переписываются
+            old_rows = list(map(self._row_by_id.get, ids, repeat(-1, len(ids))))
+            added = [row for row, old in enumerate(old_rows) if old < 0]
+            old_signatures = map(self._signatures.__getitem__, old_rows) if self._ids else repeat(None)
+            rows = sorted(set(added).union(
+                row for row, differs in enumerate(map(ne, signatures, old_signatures)) if differs
+            ))
+            removed = len(self._ids) - (len(ids) - len(added))
+            source = np.array(old_rows, dtype=np.intp) if np is not None else old_rows
+            for column in self._columns.values():
+                column.data = self._gather(column.data, source, 'i')
+            self._last_run = self._gather(self._last_run, source, 'd')
+            self._ids = ids
+            self._row_by_id = dict(zip(ids, range(len(ids))))
+
+        self._bases = bases
+        self._signatures = signatures
+        for row in rows:
+            self._write(row, bases[row])
+        return len(rows) + removed
+
+    @staticmethod
+    def _gather(data, source, typecode):
+        """Новый столбец: значения старого по номерам source (из пустого — нули)"""
+        if not data:
+            return array(typecode, bytes(array(typecode).itemsize * len(source)))
+        if np is not None:
+            return array(typecode, np.frombuffer(data, dtype=typecode)[source].tobytes())
+        return array(typecode, map(data.__getitem__, source))
+
+    def _write(self, row, base):
+        self._last_run[row] = base.last_run_time.timestamp() if base.last_run_time else 0.0
+        for column, value in zip(self._columns.values(), self._values(base)):
+            column.data[row] = column.code(value)
+
+    # ------------------------------------------------------------------ #
+    #  Запросы                                                             #
+    # ------------------------------------------------------------------ #
+
+    def group_counts(self, name: str) -> List[GroupCount]:
+        """Число баз по значениям столбца (по убыванию)"""
+        column = self._columns[name]
+        total = len(self._bases)
+        if not total:
+            return []
+        if _load_numpy() is not None:
+            # Представление буфера array без копирования; отпускается до выхода,
+            # иначе array нельзя будет расширить
+            counts = np.bincount(np.frombuffer(column.data, dtype=np.intc),
+                                 minlength=len(column.values)).tolist()
+            pairs = [(column.values[code], n) for code, n in enumerate(counts) if n]
+        else:
+            pairs = [(column.values[code], n) for code, n in Counter(column.data).items()]
+        pairs.sort(key=lambda pair: (-pair[1], pair[0]))
+        return [GroupCount(key, n, n / total) for key, n in pairs]
+
+    def stale(self, days: float, now: Optional[float] = None) -> Tuple[list, list]:
+        """
+        Базы, которые давно не запускались
+
+        Returns:
+            (базы с последним запуском раньше чем days дней назад — самые старые первыми,
+             базы без времени запуска)
+        """
+        cutoff = (now if now is not None else time.time()) - days * DAY
+        if _load_numpy() is not None:
+            last_run = np.frombuffer(self._last_run, dtype=np.float64)
+            never = np.flatnonzero(last_run == 0.0).tolist()
+            old = np.flatnonzero((last_run > 0.0) & (last_run < cutoff))
+            old = old[np.argsort(last_run[old], kind='stable')].tolist()
+            del last_run
+        else:
+            last_run = self._last_run
+            never = [row for row, value in enumerate(last_run) if value == 0.0]
+            old = sorted((row for row, value in enumerate(last_run) if 0.0 < value < cutoff),
+                         key=last_run.__getitem__)
+        return [self._bases[row] for row in old], [self._bases[row] for row in never]
+
+
+def backend_name() -> str:
+    """Чем считается группировка (для диагностики и бенчмарка)"""
+    numpy = _load_numpy()
+    return f"numpy {numpy.__version__}" if numpy is not None else "array + Counter"
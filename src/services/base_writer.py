@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import List
+from models.database import Database1C
+
+
+class BaseWriter:
+    """Сервис для записи списка баз в ibases.v8i"""
+
+    def __init__(self, ibases_path: Path, encoding: str = 'utf-8-sig'):
+        self.ibases_path = ibases_path
+        self.encoding = encoding
+
+    def write_bases(self, bases: List[Database1C]):
+        """
+        Записывает список баз в файл ibases.v8i
+
+        Raises:
+            OSError: Если файл не удалось записать
+        """
+        with open(self.ibases_path, 'w', encoding=self.encoding) as f:
+            for base in bases:
+                f.write(self.format_base(base))
+
+    def format_base(self, base: Database1C) -> str:
+        """Формирует секцию ibases.v8i для одной базы"""
+        lines = [
+            f"[{base.name}]",
+            f"ID={base.id}",
+            f"Connect={base.connect}",
+            f"Folder={base.folder}",
+        ]
+        if base.is_recent:
+            lines.append("IsRecent=1")
+        if base.last_run_time:
+            lines.append(f"LastRunTime={base.last_run_time.isoformat()}")
+        if base.app:
+            lines.append(f"App={base.app}")
+        if base.version:
+            lines.append(f"Version={base.version}")
+        if base.app_arch:
+            lines.append(f"AppArch={base.app_arch}")
+        if base.client_type:
+            lines.append(f"ClientType={base.client_type}")
+        if base.version_policy:
+            lines.append(f"VersionPolicy={base.version_policy}")
+        if base.version_fallbacks:
+            lines.append(f"VersionFallbacks={base.version_fallbacks}")
+        if base.order_in_tree is not None:
+            lines.append(f"OrderInTree={base.order_in_tree}")
+        if base.usr:
+            lines.append(f"Usr={base.usr}")
+        if base.pwd:
+            lines.append(f"Pwd={base.pwd}")
+        if base.storage_path:
+            lines.append(f"StoragePath={base.storage_path}")
+        if base.usr_enterprise:
+            lines.append(f"UsrEnterprise={base.usr_enterprise}")
+        if base.pwd_enterprise:
+            lines.append(f"PwdEnterprise={base.pwd_enterprise}")
+        if base.usr_configurator:
+            lines.append(f"UsrConfigurator={base.usr_configurator}")
+        if base.pwd_configurator:
+            lines.append(f"PwdConfigurator={base.pwd_configurator}")
+        if base.usr_storage:
+            lines.append(f"UsrStorage={base.usr_storage}")
+        if base.pwd_storage:
+            lines.append(f"PwdStorage={base.pwd_storage}")
+        return "\n".join(lines) + "\n\n"
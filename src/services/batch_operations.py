@@ -0,0 +1,161 @@
+"""
+Пакетное выполнение операций над базами 1С без зависимости от Qt.
+
+Операция — словарь {"op": ..., "id": <ID базы>, "mode": ...}:
+    launch                   — запуск 1С (mode: ENTERPRISE / DESIGNER / IR_TOOLS)
+    clear-cache              — очистка кэша базы
+    update-cfg, dump-cf, ... — операции конфигуратора (см. services.designer_jobs)
+
+Операции выполняются параллельно в пуле потоков: каждая — отдельный процесс
+1cv8.exe, потоки только ждут их завершения. Результат каждой операции —
+JSON-совместимый словарь с ключом success.
+"""
+
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.cache_cleaner import clear_database_cache
+from services.designer_jobs import DESIGNER_ACTIONS, build_designer_job, run_designer_job
+from services.launch_command import (
+    LAUNCH_MODES,
+    build_launch_command,
+    mask_secrets,
+    resolve_executable,
+    spawn_client,
+)
+
+
+OP_LAUNCH = 'launch'
+OP_CLEAR_CACHE = 'clear-cache'
+OPERATIONS = (OP_LAUNCH, OP_CLEAR_CACHE) + DESIGNER_ACTIONS
+
+DEFAULT_WORKERS = 4
+
+# ------------------------------------------------------------------ #
+#  Операции                                                            #
+# ------------------------------------------------------------------ #
+
+def launch_base(database, mode, dry_run=False):
+    """Запускает 1С для базы без ожидания завершения."""
+    result = {'op': OP_LAUNCH, 'id': database.id, 'name': database.name, 'mode': mode, 'success': False}
+
+    executable = resolve_executable(database, mode)
+    if not executable:
+        result['error'] = "Не удалось найти исполняемый файл 1C"
+        return result
+
+    cmd_line = build_launch_command(executable, mode, database)
+    if not cmd_line:
+        result['error'] = "Не удалось сформировать командную строку"
+        return result
+
+    result['executable'] = str(executable)
+    result['command'] = mask_secrets(cmd_line)
+    if dry_run:
+        result['success'] = True
+        return result
+
+    if platform.system() != 'Windows':
+        result['error'] = "Запуск поддерживается только в Windows"
+        return result
+
+    try:
+        result['pid'] = spawn_client(cmd_line)
+        result['success'] = True
+    except OSError as e:
+        result['error'] = str(e)
+    return result
+
+
+def run_designer_action(database, action, dry_run=False):
+    """Выполняет операцию конфигуратора и ждет ее завершения."""
+    try:
+        job = build_designer_job(action, database)
+    except ValueError as e:
+        return {'op': action, 'id': database.id, 'name': database.name, 'success': False, 'error': str(e)}
+
+    if dry_run:
+        return {
+            'op': action,
+            'id': database.id,
+            'name': database.name,
+            'success': True,
+            'executable': str(job.executable),
+            'log_files': [str(path) for path in job.log_files],
+            'dump_file': str(job.dump_file) if job.dump_file else None,
+            'bat': mask_secrets(job.bat_text),
+        }
+
+    result = run_designer_job(job).to_dict()
+    return {'op': result.pop('action'), **result}
+
+
+def clear_cache(database, dry_run=False):
+    """Очищает кэш базы."""
+    result = {'op': OP_CLEAR_CACHE, 'id': database.id, 'name': database.name}
+    if dry_run:
+        result.update(success=True, messages=[])
+        return result
+    messages = clear_database_cache(database)
+    result.update(success=not any(m.startswith(('⚠️', '❌')) for m in messages), messages=messages)
+    return result
+
+
+def run_operation(operation, bases_by_id, dry_run=False):
+    """
+    Выполняет одну операцию манифеста
+
+    Args:
+        operation: {"op": ..., "id": ..., "mode": ...}
+        bases_by_id: Словарь ID -> Database1C
+    """
+    op = operation.get('op')
+    base_id = operation.get('id')
+    database = bases_by_id.get(base_id)
+    if database is None:
+        return {'op': op, 'id': base_id, 'success': False, 'error': f"База с ID {base_id} не найдена"}
+
+    if op == OP_LAUNCH:
+        return launch_base(database, operation.get('mode') or 'ENTERPRISE', dry_run)
+    if op == OP_CLEAR_CACHE:
+        return clear_cache(database, dry_run)
+    if op in DESIGNER_ACTIONS:
+        return run_designer_action(database, op, dry_run)
+    return {'op': op, 'id': base_id, 'success': False, 'error': f"Неизвестная операция: {op}"}
+
+
+def run_operations(operations, bases_by_id, max_workers=DEFAULT_WORKERS, dry_run=False):
+    """Выполняет операции параллельно; результаты — в порядке операций."""
+    if not operations:
+        return []
+    workers = max(1, min(max_workers, len(operations)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda op: run_operation(op, bases_by_id, dry_run), operations))
+
+
+def run_staggered(operations, bases_by_id, interval, dry_run=False):
+    """Выполняет операции по очереди с паузой interval секунд после каждого запуска (наборы запуска)."""
+    results = []
+    for operation in operations:
+        if results and results[-1]['success'] and not dry_run:
+            time.sleep(interval)
+        results.append(run_operation(operation, bases_by_id, dry_run))
+    return results
+
+
+def expand_manifest(manifest):
+    """Разворачивает задания манифеста ("ids" -> по одной операции на базу)."""
+    operations = []
+    for job in manifest.get('jobs', []):
+        op = job.get('op')
+        if op not in OPERATIONS:
+            raise ValueError(f"Неизвестная операция в манифесте: {op}")
+        if job.get('mode') and job['mode'] not in LAUNCH_MODES:
+            raise ValueError(f"Неизвестный режим запуска: {job['mode']}")
+        ids = job.get('ids') or ([job['id']] if job.get('id') else [])
+        if not ids:
+            raise ValueError(f"Не указан ID базы для операции {op}")
+        for base_id in ids:
+            operations.append({'op': op, 'id': base_id, 'mode': job.get('mode')})
+    return operations
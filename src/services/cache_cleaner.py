@@ -0,0 +1,103 @@
+"""
+Очистка локального кэша базы 1С без зависимости от Qt.
+
+Удаляются:
+- программный кэш  %LOCALAPPDATA%\\1C\\1cv8\\<ID базы>
+- пользовательский кэш  %APPDATA%\\1C\\1Cv82\\<ID базы>
+- кэш ИР Портативный  %LOCALAPPDATA%\\1C\\1cv8\\<имя по строке подключения>
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+
+def generate_ir_folder_name(connection_string: str) -> str:
+    """
+    Генерирует имя папки кэша для ИР Портативный на основе строки подключения.
+    Пример: Srvr="srv-1c-8325:1541";Ref="ZUP_0202_Pechericadv_1";
+    Результат: Srvr__srv_1c_8325_1541__Ref__ZUP_0202_Pechericadv_1__
+    """
+    if not connection_string:
+        return ""
+
+    name = connection_string
+    # Replace parameter separators and quotes
+    name = name.replace('="', '__')
+    name = name.replace('";', '__')
+
+    # Replace unsafe characters in filenames
+    name = name.replace(':', '_')
+    name = name.replace('-', '_')
+    name = name.replace('.', '_')
+    name = name.replace(',', '_')
+    name = name.replace('\\', '_')
+    name = name.replace('/', '_')
+    name = name.replace(' ', '_')
+
+    return name
+
+
+def program_cache_path(database) -> Path:
+    """Программный кэш базы: %LOCALAPPDATA%\\1C\\1cv8\\<ID базы>"""
+    return Path(os.environ.get('LOCALAPPDATA', '')) / '1C' / '1cv8' / database.id
+
+
+def user_cache_path(database) -> Path:
+    """Пользовательский кэш базы: %APPDATA%\\1C\\1Cv82\\<ID базы>"""
+    return Path(os.environ.get('APPDATA', '')) / '1C' / '1Cv82' / database.id
+
+
+def ir_cache_path(database) -> Optional[Path]:
+    """Кэш ИР Портативный (None, если у базы нет строки подключения)"""
+    ir_folder_name = generate_ir_folder_name(database.connect)
+    if not ir_folder_name:
+        return None
+    return Path(os.environ.get('LOCALAPPDATA', '')) / '1C' / '1cv8' / ir_folder_name
+
+
+def clear_database_cache(database) -> List[str]:
+    """
+    Удаляет кэш базы
+
+    Returns:
+        Список строк с результатом по каждому виду кэша
+    """
+    try:
+        deleted_items = []
+        program_cache = program_cache_path(database)
+        if program_cache.exists():
+            try:
+                shutil.rmtree(program_cache)
+                deleted_items.append(f"✅ Программный кэш: {program_cache}")
+            except Exception as e:
+                deleted_items.append(f"⚠️ Ошибка удаления программного кэша: {e}")
+        else:
+            deleted_items.append("ℹ️ Программный кэш не найден")
+
+        user_cache = user_cache_path(database)
+        if user_cache.exists():
+            try:
+                shutil.rmtree(user_cache)
+                deleted_items.append(f"✅ Пользовательский кэш: {user_cache}")
+            except Exception as e:
+                deleted_items.append(f"⚠️ Ошибка удаления пользовательского кэша: {e}")
+        else:
+            deleted_items.append("ℹ️ Пользовательский кэш не найден")
+
+        # Очистка кэша ИР Портативный
+        ir_cache = ir_cache_path(database)
+        if ir_cache is not None:
+            if ir_cache.exists():
+                try:
+                    shutil.rmtree(ir_cache)
+                    deleted_items.append(f"✅ Кэш ИР: {ir_cache}")
+                except Exception as e:
+                    deleted_items.append(f"⚠️ Ошибка удаления кэша ИР: {e}")
+            else:
+                deleted_items.append(f"ℹ️ Кэш ИР не найден ({ir_cache.name})")
+
+        return deleted_items
+    except Exception as e:
+        return [f"❌ Ошибка очистки кэша: {e}"]
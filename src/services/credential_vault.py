@@ -0,0 +1,466 @@
+"""
+Хранилище паролей баз 1С вместо полей Pwd* в ibases.v8i.
+
+Пароль хранится по ключу (ID базы, режим):
+    ENTERPRISE — предприятие, DESIGNER — конфигуратор, STORAGE — хранилище конфигурации,
+    DEFAULT — устаревшее поле Pwd (общий пароль для предприятия и конфигуратора).
+
+Бэкенды (CREDENTIAL_BACKEND):
+    keyring — системное хранилище (Windows Credential Manager, Secret Service, Keychain)
+              через пакет keyring, если он установлен и в системе есть хранилище;
+    file    — файл CREDENTIAL_VAULT_PATH, записи шифруются AES-GCM (пакет cryptography;
+              без него файловое хранилище недоступно и пароли остаются в ibases.v8i).
+              Ключ — одно из двух, режим задается при создании файла:
+              * фраза LAUNCHER_VAULT_PASSPHRASE, ключ выводится из нее scrypt'ом;
+              * случайный ключ CREDENTIAL_KEY_PATH. В Windows он защищен DPAPI учетной
+                записи. В остальных системах ключ лежит открыто (права 0600) рядом с
+                файлом паролей — это лишь сокрытие от случайного взгляда, а не защита:
+                кто может прочитать файл паролей, прочитает и ключ. Для защиты нужен
+                keyring или фраза.
+
+Расшифровка ленивая: файл читается при первом обращении, ключ получается только когда
+нужен пароль, который в хранилище действительно есть. Ключ и полученные пароли
+(в том числе "пароля нет") держатся в памяти CREDENTIAL_CACHE_TTL секунд:
+повторные запуски не платят ни за KDF, ни за обращение к системному хранилищу.
+
+Пароли, найденные в ibases.v8i (прежние версии лончера), переносятся в хранилище
+при загрузке списка (move_passwords_to_vault), и файл переписывается без них.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from config import CREDENTIAL_BACKEND, CREDENTIAL_CACHE_TTL, CREDENTIAL_KEY_PATH, CREDENTIAL_VAULT_PATH
+
+
+MODE_DEFAULT = 'DEFAULT'
+MODE_ENTERPRISE = 'ENTERPRISE'
+MODE_DESIGNER = 'DESIGNER'
+MODE_STORAGE = 'STORAGE'
+
+# Поле Database1C -> режим пароля в хранилище
+SECRET_FIELDS = {
+    'pwd': MODE_DEFAULT,
+    'pwd_enterprise': MODE_ENTERPRISE,
+    'pwd_configurator': MODE_DESIGNER,
+    'pwd_storage': MODE_STORAGE,
+}
+_FIELD_BY_MODE = {mode: name for name, mode in SECRET_FIELDS.items()}
+
+KEYRING_SERVICE = '1c-launcher'
+PASSPHRASE_ENV = 'LAUNCHER_VAULT_PASSPHRASE'
+
+FORMAT_VERSION = 2  # 2 — AES-GCM (cryptography)
+_SCRYPT = {'name': 'scrypt', 'n': 2 ** 14, 'r': 8, 'p': 1}
+_KEY_SIZE = 32
+_NONCE_SIZE = 12
+
+
+class CredentialError(Exception):
+    """Хранилище паролей недоступно или поврежден ключ"""
+
+
+class TTLCache:
+    """Словарь, записи которого устаревают через ttl секунд после записи"""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._items: Dict[object, Tuple[float, object]] = {}
+
+    def get(self, key, default=None):
+        item = self._items.get(key)
+        if item is None:
+            return default
+        if item[0] <= self._clock():
+            del self._items[key]
+            return default
+        return item[1]
+
+    def __contains__(self, key) -> bool:
+        marker = object()
+        return self.get(key, marker) is not marker
+
+    def put(self, key, value):
+        self._items[key] = (self._clock() + self.ttl, value)
+
+    def discard(self, key):
+        self._items.pop(key, None)
+
+    def evict_expired(self) -> int:
+        now = self._clock()
+        expired = [key for key, (deadline, _) in self._items.items() if deadline <= now]
+        for key in expired:
+            del self._items[key]
+        return len(expired)
+
+    def clear(self):
+        self._items.clear()
+
+
+# ------------------------------------------------------------------ #
+#  Шифрование записей файла (AES-GCM из пакета cryptography)           #
+# ------------------------------------------------------------------ #
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text.encode('ascii'))
+
+
+def _cipher(key: bytes):
+    """AES-GCM с ключом key"""
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        raise CredentialError("для файла паролей нужен пакет cryptography") from None
+    return AESGCM(key)
+
+
+def _seal(cipher, aad: str, plaintext: bytes) -> dict:
+    nonce = os.urandom(_NONCE_SIZE)
+    return {'n': _b64(nonce), 'c': _b64(cipher.encrypt(nonce, plaintext, aad.encode()))}
+
+
+def _open(cipher, aad: str, sealed: dict) -> bytes:
+    from cryptography.exceptions import InvalidTag
+
+    try:
+        return cipher.decrypt(_unb64(sealed['n']), _unb64(sealed['c']), aad.encode())
+    except (InvalidTag, KeyError, ValueError):
+        raise CredentialError("неверный ключ хранилища паролей или файл поврежден") from None
+
+
+def _passphrase_key(passphrase: str, kdf: dict) -> bytes:
+    return hashlib.scrypt(passphrase.encode(), salt=_unb64(kdf['salt']),
+                          n=kdf['n'], r=kdf['r'], p=kdf['p'], dklen=_KEY_SIZE)
+
+
+# ------------------------------------------------------------------ #
+#  Секрет для ключа файла                                              #
+# ------------------------------------------------------------------ #
+
+def _dpapi(data: bytes, protect: bool) -> bytes:
+    """CryptProtectData / CryptUnprotectData: данные, расшифровать которые может только эта учетная запись"""
+    import ctypes
+    from ctypes import wintypes
+
+    class DataBlob(ctypes.Structure):
+        _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+    crypt32 = ctypes.windll.crypt32
+    kernel32 = ctypes.windll.kernel32
+    buffer = ctypes.create_string_buffer(data, len(data))
+    blob_in = DataBlob(len(data), buffer)
+    blob_out = DataBlob()
+    function = crypt32.CryptProtectData if protect else crypt32.CryptUnprotectData
+    if not function(ctypes.byref(blob_in), None, None, None, None, 0x01, ctypes.byref(blob_out)):
+        raise CredentialError(f"DPAPI: ошибка {ctypes.GetLastError()}")
+    try:
+        return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+    finally:
+        kernel32.LocalFree(blob_out.pbData)
+
+
+def _load_key_file(path: Path) -> bytes:
+    """Случайный ключ хранилища (создается при первом обращении)"""
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        secret = os.urandom(_KEY_SIZE)
+        stored = _dpapi(secret, protect=True) if sys.platform == 'win32' else secret
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(stored)
+        return secret
+    return _dpapi(raw, protect=False) if sys.platform == 'win32' else raw
+
+
+# ------------------------------------------------------------------ #
+#  Бэкенды                                                             #
+# ------------------------------------------------------------------ #
+
+def _entry_name(base_id: str, mode: str) -> str:
+    return f"{base_id}:{mode}"
+
+
+class KeyringBackend:
+    """Системное хранилище паролей через пакет keyring"""
+
+    name = 'keyring'
+
+    def __init__(self):
+        import keyring
+        from keyring.backends import fail
+        if isinstance(keyring.get_keyring(), fail.Keyring):
+            raise CredentialError("в системе нет хранилища для keyring")
+        self._keyring = keyring
+
+    def get(self, base_id: str, mode: str) -> Optional[str]:
+        return self._keyring.get_password(KEYRING_SERVICE, _entry_name(base_id, mode))
+
+    def set(self, base_id: str, mode: str, secret: Optional[str]):
+        name = _entry_name(base_id, mode)
+        if secret:
+            self._keyring.set_password(KEYRING_SERVICE, name, secret)
+            return
+        try:
+            self._keyring.delete_password(KEYRING_SERVICE, name)
+        except self._keyring.errors.PasswordDeleteError:
+            pass
+
+
+class EncryptedFileBackend:
+    """
+    Зашифрованный файл: {"version", "kdf", "check", "entries": {"ID:РЕЖИМ": запись}}
+
+    kdf — параметры scrypt с солью (ключ из фразы) или null (ключ из CREDENTIAL_KEY_PATH)
+    """
+
+    name = 'file'
+
+    def __init__(self, path: Path = CREDENTIAL_VAULT_PATH, key_path: Path = CREDENTIAL_KEY_PATH,
+                 keys_cache: Optional[TTLCache] = None):
+        try:
+            import cryptography  # noqa: F401
+        except ImportError:
+            raise CredentialError("для файла паролей нужен пакет cryptography") from None
+        self.path = Path(path)
+        self.key_path = Path(key_path)
+        # Шифр с выведенным ключом живет столько же, сколько пароли в кэше хранилища
+        self._keys = keys_cache or TTLCache(CREDENTIAL_CACHE_TTL)
+        self._data: Optional[dict] = None
+        self._stat = None
+
+    def _load(self) -> dict:
+        """Содержимое файла (перечитывается, если файл изменил другой экземпляр лончера)"""
+        try:
+            st = self.path.stat()
+            stat = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            stat = None
+        if self._data is None or stat != self._stat:
+            if stat is None:
+                kdf = None
+                if os.environ.get(PASSPHRASE_ENV):
+                    kdf = dict(_SCRYPT, salt=_b64(os.urandom(16)))
+                self._data = {'version': FORMAT_VERSION, 'kdf': kdf, 'check': None, 'entries': {}}
+            else:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') != FORMAT_VERSION:
+                    raise CredentialError(
+                        f"файл паролей {self.path} другого формата (версия {data.get('version')}); "
+                        f"удалите его и введите пароли заново"
+                    )
+                self._data = data
+            self._stat = stat
+        return self._data
+
+    def _unlock(self, data: dict):
+        """Шифр файла (ключ — только если его нет в кэше)"""
+        kdf = data.get('kdf')
+        cache_key = kdf['salt'] if kdf else 'key-file'
+        cipher = self._keys.get(cache_key)
+        if cipher is not None:
+            return cipher
+        started = time.perf_counter()
+        if kdf:
+            passphrase = os.environ.get(PASSPHRASE_ENV)
+            if not passphrase:
+                raise CredentialError(f"файл паролей защищен фразой: задайте {PASSPHRASE_ENV}")
+            key = _passphrase_key(passphrase, kdf)
+        else:
+            key = _load_key_file(self.key_path)
+        cipher = _cipher(key)
+        print(f"🔐 Хранилище паролей открыто за {(time.perf_counter() - started) * 1000:.0f} мс")
+        if data.get('check'):
+            _open(cipher, 'check', data['check'])
+        else:
+            data['check'] = _seal(cipher, 'check', b'1c-launcher')
+        self._keys.put(cache_key, cipher)
+        return cipher
+
+    def get(self, base_id: str, mode: str) -> Optional[str]:
+        data = self._load()
+        name = _entry_name(base_id, mode)
+        sealed = data['entries'].get(name)
+        if sealed is None:
+            # Пароля нет — ключ не нужен, KDF не выполняется
+            return None
+        return _open(self._unlock(data), name, sealed).decode('utf-8')
+
+    def set(self, base_id: str, mode: str, secret: Optional[str]):
+        data = self._load()
+        name = _entry_name(base_id, mode)
+        if secret:
+            data['entries'][name] = _seal(self._unlock(data), name, secret.encode('utf-8'))
+        elif data['entries'].pop(name, None) is None:
+            return
+        self._write(data)
+
+    def _write(self, data: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        st = self.path.stat()
+        self._stat = (st.st_mtime_ns, st.st_size)
+
+
+def create_backend(kind: str = CREDENTIAL_BACKEND, cache: Optional[TTLCache] = None):
+    """
+    Бэкенд хранилища паролей
+
+    Args:
+        kind: 'auto' (keyring, если доступен, иначе файл), 'keyring' или 'file'
+    """
+    if kind == 'file':
+        return EncryptedFileBackend(keys_cache=cache)
+    if kind == 'keyring':
+        return KeyringBackend()
+    if kind != 'auto':
+        raise ValueError(f"Неизвестное хранилище паролей: {kind}")
+    try:
+        return KeyringBackend()
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"⚠️ Системное хранилище паролей недоступно ({e}), используется зашифрованный файл")
+    return EncryptedFileBackend(keys_cache=cache)
+
+
+# ------------------------------------------------------------------ #
+#  Хранилище                                                           #
+# ------------------------------------------------------------------ #
+
+_MISSING = object()
+
+
+class CredentialVault:
+    """
+    Пароли по (ID базы, режим) с кэшем в памяти на ttl секунд
+    """
+
+    def __init__(self, backend=None, ttl: float = CREDENTIAL_CACHE_TTL):
+        self.ttl = ttl
+        self._cache = TTLCache(ttl)
+        self._backend = backend
+        # Пакетные операции CLI обращаются к хранилищу из нескольких потоков
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = create_backend(cache=TTLCache(self.ttl))
+        return self._backend
+
+    def get(self, base_id: str, mode: str) -> Optional[str]:
+        """Пароль или None (ошибка хранилища — тоже None, с сообщением в консоль)"""
+        key = (base_id, mode)
+        with self._lock:
+            self._cache.evict_expired()
+            secret = self._cache.get(key, _MISSING)
+            if secret is _MISSING:
+                try:
+                    secret = self.backend.get(base_id, mode)
+                except Exception as e:
+                    print(f"❌ Хранилище паролей: {e}")
+                    return None
+                self._cache.put(key, secret)
+            return secret
+
+    def set(self, base_id: str, mode: str, secret: Optional[str]):
+        """
+        Сохраняет пароль (пустой — удаляет)
+
+        Raises:
+            CredentialError, OSError: Хранилище недоступно
+        """
+        with self._lock:
+            self.backend.set(base_id, mode, secret or None)
+            self._cache.put((base_id, mode), secret or None)
+
+    def copy_base(self, source_id: str, target_id: str):
+        """Пароли копии базы (Ctrl+D)"""
+        for mode in SECRET_FIELDS.values():
+            secret = self.get(source_id, mode)
+            if secret:
+                self.set(target_id, mode, secret)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+_vault: Optional[CredentialVault] = None
+
+
+def get_credential_vault() -> CredentialVault:
+    """Возвращает общий для приложения экземпляр CredentialVault (бэкенд — при первом обращении)"""
+    global _vault
+    if _vault is None:
+        _vault = CredentialVault()
+    return _vault
+
+
+# ------------------------------------------------------------------ #
+#  Пароли баз                                                          #
+# ------------------------------------------------------------------ #
+
+def stored_password(database, mode: str) -> Optional[str]:
+    """
+    Пароль базы для режима: из поля Database1C (еще не перенесенный или общий список),
+    иначе из хранилища
+    """
+    value = getattr(database, _FIELD_BY_MODE[mode])
+    if value:
+        return value
+    return get_credential_vault().get(database.id, mode)
+
+
+def launch_password(database, mode: str) -> Optional[str]:
+    """Пароль для запуска в режиме ENTERPRISE/IR_TOOLS или DESIGNER (с запасным общим Pwd)"""
+    mode = MODE_DESIGNER if mode == MODE_DESIGNER else MODE_ENTERPRISE
+    return stored_password(database, mode) or stored_password(database, MODE_DEFAULT)
+
+
+def move_passwords_to_vault(database, replace: bool = False) -> bool:
+    """
+    Переносит пароли из полей базы в хранилище и очищает поля
+
+    Args:
+        replace: Записать все режимы, в том числе пустые (пароль удален в настройках);
+            иначе переносятся только заполненные поля
+
+    Returns:
+        True, если поля базы изменились (ibases.v8i нужно переписать)
+    """
+    vault = get_credential_vault()
+    changed = False
+    for name, mode in SECRET_FIELDS.items():
+        value = getattr(database, name)
+        if not value and not replace:
+            continue
+        try:
+            vault.set(database.id, mode, value)
+        except Exception as e:
+            # Поле остается в ibases.v8i — пароль не теряется
+            print(f"❌ Пароль базы {database.name} не сохранен в хранилище: {e}")
+            continue
+        if value:
+            setattr(database, name, None)
+            changed = True
+    return changed
@@ -0,0 +1,403 @@
+"""
+Пакетные операции конфигуратора 1С (Designer) без зависимости от Qt.
+
+Каждая операция описывается заданием DesignerJob: для базы формируется BAT
+(chcp 65001, set PLATFORM/BASE/LOG/DUMP) и пути к логам и .cf. Пользователь и пароли
+(переменная CREDENTIALS) в BAT не пишутся: они передаются процессу cmd через окружение.
+Задание выполняется синхронно (run_designer_job) — окно лончера вызывает его
+в фоновом потоке, консольный интерфейс — напрямую или пачкой (run_designer_jobs).
+
+Операции:
+    update-cfg               — /UpdateDBCfg (F7)
+    repo-update-cfg          — /ConfigurationRepositoryUpdateCfg + /UpdateDBCfg (Ctrl+F7)
+    dump-cf                  — /DumpCfg
+    update-and-dump-cf       — /UpdateDBCfg, затем /DumpCfg (F8)
+    repo-update-and-dump-cf  — обновление из хранилища, затем /DumpCfg (Ctrl+F8)
+"""
+
+import os
+import platform
+import re
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import CF_DUMP_PATH, LOG_PATH
+from services.credential_vault import MODE_DESIGNER, MODE_STORAGE, launch_password, stored_password
+from services.launch_command import parse_server_connect_string, resolve_executable
+
+
+ACTION_UPDATE_CFG = 'update-cfg'
+ACTION_REPO_UPDATE_CFG = 'repo-update-cfg'
+ACTION_DUMP_CF = 'dump-cf'
+ACTION_UPDATE_AND_DUMP_CF = 'update-and-dump-cf'
+ACTION_REPO_UPDATE_AND_DUMP_CF = 'repo-update-and-dump-cf'
+
+DESIGNER_ACTIONS = (
+    ACTION_UPDATE_CFG,
+    ACTION_REPO_UPDATE_CFG,
+    ACTION_DUMP_CF,
+    ACTION_UPDATE_AND_DUMP_CF,
+    ACTION_REPO_UPDATE_AND_DUMP_CF,
+)
+
+
+@dataclass
+class DesignerJob:
+    """Подготовленная операция конфигуратора"""
+    action: str
+    database: object  # Database1C
+    executable: Path
+    bat_text: str
+    log_files: List[Path] = field(default_factory=list)
+    dump_file: Optional[Path] = None
+    # Переменные окружения BAT с секретами (CREDENTIALS) — только в памяти
+    env: Dict[str, str] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class DesignerJobResult:
+    """Результат выполнения операции конфигуратора"""
+    action: str
+    base_id: str
+    base_name: str
+    success: bool
+    returncode: Optional[int] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+    log_files: List[str] = field(default_factory=list)
+    dump_file: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'action': self.action,
+            'id': self.base_id,
+            'name': self.base_name,
+            'success': self.success,
+            'returncode': self.returncode,
+            'error': self.error,
+            'duration': round(self.duration, 3),
+            'log_files': self.log_files,
+            'dump_file': self.dump_file,
+        }
+
+
+# ------------------------------------------------------------------ #
+#  Пути / имена файлов                                                #
+# ------------------------------------------------------------------ #
+
+def sanitize_filename(value: str) -> str:
+    """Очищает строку от символов, запрещённых в именах файлов Windows."""
+    value = re.sub(r'[<>:"/\\|?*\x00-\x1F]', '_', value)
+    value = value.strip().strip('.')
+    value = re.sub(r'\s+', ' ', value)
+    return value
+
+
+def build_base_stem(database) -> str:
+    """Формирует базовую часть имени файла: <ИМЯ_БАЗЫ>_<YYMMDDHHMM>_<REF>."""
+    # 1. Получаем и очищаем ИМЯ_БАЗЫ
+    base_name = (database.name or "database").strip()
+    safe_name = sanitize_filename(base_name)
+    if not safe_name:
+        safe_name = "database"
+
+    # 2. Получаем строку подключения и извлекаем REF
+    connect = (database.connect or "").strip()
+    safe_ref = ""
+
+    if connect:
+        # Ищем значения Ref (серверная) или File (файловая)
+        ref_match = re.search(r'(?i)Ref\s*=\s*["\']?([^;"\']+)["\']?', connect)
+        file_match = re.search(r'(?i)File\s*=\s*["\']?([^;"\']+)["\']?', connect)
+
+        raw_ref = ""
+        if ref_match:
+            raw_ref = ref_match.group(1)
+        elif file_match:
+            raw_ref = file_match.group(1)
+
+        if raw_ref:
+            # Очищаем извлеченное имя (Ref/File) от спецсимволов
+            clean_ref = re.sub(r'[^\w\-]', '_', raw_ref)
+            clean_ref = re.sub(r'_+', '_', clean_ref).strip('_')
+            safe_ref = sanitize_filename(clean_ref)
+
+    # 3. Формируем дату и время
+    timestamp = datetime.now().strftime("%y%m%d%H%M")
+
+    # 4. Собираем финальную строку в нужном порядке
+    if safe_ref:
+        return f"{safe_name}_{timestamp}_{safe_ref}"
+
+    # Fallback, если строка подключения пустая или в ней нет Ref/File
+    return f"{safe_name}_{timestamp}"
+
+
+def build_cf_dump_path(database) -> Path:
+    """Формирует путь к .cf для выгрузки."""
+    return Path(CF_DUMP_PATH) / f"{build_base_stem(database)}.cf"
+
+
+def get_log_dir() -> Path:
+    base = Path(LOG_PATH)
+    return base.parent if base.suffix else base
+
+
+def build_action_log_path(base_stem: str, action_name: str) -> Path:
+    """Формирует имя лог-файла: <STEM>_log_<ACTION><ext>."""
+    base = Path(LOG_PATH)
+    ext = base.suffix if base.suffix else ".txt"
+
+    safe_action = sanitize_filename(action_name) or "action"
+    return get_log_dir() / f"{base_stem}_log_{safe_action}{ext}"
+
+
+# ------------------------------------------------------------------ #
+#  BAT-билдеры                                                         #
+# ------------------------------------------------------------------ #
+
+def build_base_param(database) -> str:
+    """Возвращает значение для переменной BASE в BAT (включая /S\"...\" если возможно)."""
+    connect = (database.connect or '').strip()
+    if not connect:
+        return ''
+
+    return f'/S"{parse_server_connect_string(connect)}"'
+
+
+def build_credentials(database) -> str:
+    """Возвращает значение для переменной CREDENTIALS (пароли — из хранилища паролей)."""
+    usr = database.usr_configurator or database.usr
+    pwd = launch_password(database, MODE_DESIGNER)
+
+    parts = []
+    if usr:
+        parts.append(f'/N"{usr}"')
+    if pwd:
+        parts.append(f'/P"{pwd}"')
+
+    # Расширение параметров для работы с хранилищем конфигурации
+    storage_path = (database.storage_path or '').strip()
+    usr_storage = (database.usr_storage or '').strip()
+    pwd_storage = (stored_password(database, MODE_STORAGE) or '').strip() if storage_path and usr_storage else ''
+
+    if storage_path and usr_storage and pwd_storage:
+        parts.append(f'/ConfigurationRepositoryF "{storage_path}"')
+        parts.append(f'/ConfigurationRepositoryN "{usr_storage}"')
+        parts.append(f'/ConfigurationRepositoryP "{pwd_storage}"')
+
+    return ' '.join(parts)
+
+
+def _bat_header(executable: Path, database, variables: List[tuple]) -> List[str]:
+    """Шапка BAT: кодировка, PLATFORM, BASE и переменные путей.
+
+    CREDENTIALS в BAT не задается — приходит из окружения (DesignerJob.env).
+    """
+    bat = [
+        '@echo off',
+        'chcp 65001 >nul',
+        f'set PLATFORM="{executable}"',
+        f'set BASE={build_base_param(database)}',
+    ]
+    bat.extend(f'set {name}="{value}"' for name, value in variables)
+    bat.append('')
+    return bat
+
+
+def _bat_step(title: str, arguments: str, error_text: str) -> List[str]:
+    """Шаг BAT: вызов конфигуратора с выходом по ошибке."""
+    return [
+        f'echo {title}',
+        f'%PLATFORM% DESIGNER %BASE% %CREDENTIALS% {arguments}',
+        'if errorlevel 1 (',
+        f'    echo {error_text}',
+        '    exit /b 1',
+        ')',
+        '',
+    ]
+
+
+_UPDATE_DB_CFG = ('Обновление конфигурации БД...', 'ОШИБКА при обновлении конфигурации!')
+_REPO_UPDATE_CFG = ('Обновление конфигурации из хранилища...', 'ОШИБКА при обновлении конфигурации!')
+_DUMP_CFG = ('Выгрузка конфигурации...', 'ОШИБКА при выгрузке!')
+_REPO_UPDATE_ARGS = '/ConfigurationRepositoryUpdateCfg -v -1 -revised -force /UpdateDBCfg'
+
+
+def build_update_db_cfg_bat(executable: Path, database, log_file: Path) -> str:
+    """Генерирует BAT для Designer /UpdateDBCfg."""
+    bat = _bat_header(executable, database, [('LOG', log_file)])
+    bat += _bat_step(_UPDATE_DB_CFG[0], '/UpdateDBCfg /Out%LOG%', _UPDATE_DB_CFG[1])
+    bat += ['exit /b 0', '']
+    return '\n'.join(bat)
+
+
+def build_repo_update_cfg_bat(executable: Path, database, log_file: Path) -> str:
+    """Генерирует BAT для обновления конфигурации из хранилища и сохранения.
+
+    Выполняет:
+    - /ConfigurationRepositoryUpdateCfg -v -1 -revised -force
+    - /UpdateDBCfg
+    """
+    bat = _bat_header(executable, database, [('LOG', log_file)])
+    bat += _bat_step(_REPO_UPDATE_CFG[0], f'{_REPO_UPDATE_ARGS} /Out%LOG%', _REPO_UPDATE_CFG[1])
+    bat += ['exit /b 0', '']
+    return '\n'.join(bat)
+
+
+def build_dump_cf_bat(executable: Path, database, dump_file: Path, log_file: Path) -> str:
+    """Генерирует BAT для Designer /DumpCfg."""
+    bat = _bat_header(executable, database, [('LOG', log_file), ('DUMP', dump_file)])
+    bat += _bat_step(_DUMP_CFG[0], '/DumpCfg%DUMP% /Out%LOG%', _DUMP_CFG[1])
+    bat += ['exit /b 0', '']
+    return '\n'.join(bat)
+
+
+def build_save_and_dump_cf_bat(executable: Path, database, dump_file: Path,
+                               log_update: Path, log_dump: Path) -> str:
+    """Генерирует BAT: UpdateDBCfg, затем DumpCfg."""
+    bat = _bat_header(executable, database, [
+        ('LOG_UPDATE', log_update), ('LOG_DUMP', log_dump), ('DUMP', dump_file),
+    ])
+    bat += _bat_step(_UPDATE_DB_CFG[0], '/UpdateDBCfg /Out%LOG_UPDATE%', _UPDATE_DB_CFG[1])
+    bat += _bat_step(_DUMP_CFG[0], '/DumpCfg%DUMP% /Out%LOG_DUMP%', _DUMP_CFG[1])
+    bat += ['exit /b 0', '']
+    return '\n'.join(bat)
+
+
+def build_repo_update_and_dump_cf_bat(executable: Path, database, dump_file: Path,
+                                      log_update: Path, log_dump: Path) -> str:
+    """Генерирует BAT для обновления конфигурации из хранилища и выгрузки CF (Ctrl+F7 + F8)."""
+    bat = _bat_header(executable, database, [
+        ('LOG_UPDATE', log_update), ('LOG_DUMP', log_dump), ('DUMP', dump_file),
+    ])
+    bat += _bat_step(_REPO_UPDATE_CFG[0], f'{_REPO_UPDATE_ARGS} /Out%LOG_UPDATE%',
+                     'ОШИБКА при обновлении из хранилища!')
+    bat += _bat_step(_DUMP_CFG[0], '/DumpCfg%DUMP% /Out%LOG_DUMP%', _DUMP_CFG[1])
+    bat += ['exit /b 0', '']
+    return '\n'.join(bat)
+
+
+# ------------------------------------------------------------------ #
+#  Задания                                                             #
+# ------------------------------------------------------------------ #
+
+def build_designer_job(action: str, database, executable: Optional[Path] = None) -> DesignerJob:
+    """
+    Подготавливает операцию конфигуратора для базы
+
+    Args:
+        action: Одна из DESIGNER_ACTIONS
+        database: Объект Database1C
+        executable: Путь к 1cv8.exe; по умолчанию определяется по настройкам базы
+
+    Raises:
+        ValueError: Неизвестная операция или не найден 1cv8.exe
+    """
+    if action not in DESIGNER_ACTIONS:
+        raise ValueError(f"Неизвестная операция конфигуратора: {action}")
+
+    executable = executable or resolve_executable(database, mode='DESIGNER')
+    if not executable:
+        raise ValueError("Не удалось найти 1cv8.exe для конфигуратора")
+    executable = Path(executable)
+    env = {'CREDENTIALS': build_credentials(database)}
+
+    if action == ACTION_UPDATE_CFG:
+        log_file = build_action_log_path(build_base_stem(database), "UpdateDBCfg")
+        bat_text = build_update_db_cfg_bat(executable, database, log_file)
+        return DesignerJob(action, database, executable, bat_text, [log_file], env=env)
+
+    if action == ACTION_REPO_UPDATE_CFG:
+        log_file = build_action_log_path(build_base_stem(database), "RepositoryUpdateCfg")
+        bat_text = build_repo_update_cfg_bat(executable, database, log_file)
+        return DesignerJob(action, database, executable, bat_text, [log_file], env=env)
+
+    dump_file = build_cf_dump_path(database)
+    log_dump = build_action_log_path(dump_file.stem, "DumpCfg")
+
+    if action == ACTION_DUMP_CF:
+        bat_text = build_dump_cf_bat(executable, database, dump_file, log_dump)
+        return DesignerJob(action, database, executable, bat_text, [log_dump], dump_file, env=env)
+
+    if action == ACTION_UPDATE_AND_DUMP_CF:
+        log_update = build_action_log_path(dump_file.stem, "UpdateDBCfg")
+        bat_text = build_save_and_dump_cf_bat(executable, database, dump_file, log_update, log_dump)
+    else:
+        log_update = build_action_log_path(dump_file.stem, "RepositoryUpdateCfg")
+        bat_text = build_repo_update_and_dump_cf_bat(executable, database, dump_file, log_update, log_dump)
+    return DesignerJob(action, database, executable, bat_text, [log_update, log_dump], dump_file, env=env)
+
+
+def write_temp_bat(bat_text: str, encoding: str = 'utf-8') -> str:
+    """Записывает BAT во временный файл и возвращает его путь."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.bat', delete=False, encoding=encoding) as bat_file:
+        bat_file.write(bat_text)
+        return bat_file.name
+
+
+def run_designer_job(job: DesignerJob) -> DesignerJobResult:
+    """
+    Выполняет операцию конфигуратора синхронно и удаляет временный BAT
+
+    Returns:
+        DesignerJobResult; success=True, если BAT завершился с кодом 0
+    """
+    result = DesignerJobResult(
+        action=job.action,
+        base_id=job.database.id,
+        base_name=job.database.name,
+        success=False,
+        log_files=[str(path) for path in job.log_files],
+        dump_file=str(job.dump_file) if job.dump_file else None,
+    )
+
+    if platform.system() != 'Windows':
+        result.error = "Операция поддерживается только в Windows"
+        return result
+
+    started = time.monotonic()
+    bat_path = None
+    try:
+        for path in job.log_files:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        if job.dump_file:
+            job.dump_file.parent.mkdir(parents=True, exist_ok=True)
+
+        bat_path = write_temp_bat(job.bat_text)
+        # Пароли — только в окружении дочернего cmd, на диск они не попадают
+        completed = subprocess.run(["cmd", "/c", bat_path], shell=False, env={**os.environ, **job.env})
+        result.returncode = completed.returncode
+        result.success = completed.returncode == 0
+        if not result.success:
+            result.error = f"Конфигуратор завершился с кодом {completed.returncode}"
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        result.duration = time.monotonic() - started
+        if bat_path:
+            try:
+                os.remove(bat_path)
+            except OSError as e:
+                print(f"Ошибка удаления временного файла {bat_path}: {e}")
+
+    return result
+
+
+def run_designer_jobs(jobs: List[DesignerJob], max_workers: int = 4) -> List[DesignerJobResult]:
+    """
+    Выполняет несколько операций параллельно
+
+    Каждая операция — отдельный процесс 1cv8.exe, поэтому потоки только ждут
+    их завершения. Результаты возвращаются в порядке заданий.
+    """
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+        return list(executor.map(run_designer_job, jobs))
@@ -0,0 +1,428 @@
+"""
+Журнал правок списка баз с отменой и повтором (JSON Lines рядом с ibases.v8i).
+
+Каждая правка (добавление, удаление, копирование, настройки, перенос в "Недавние")
+дописывается одной строкой — дельтой только по затронутым записям:
+    {"n": 12, "kind": "op", "seq": 7, "label": "Удаление: База", "t": ..., "changes": [
+        {"id": "...", "index": 5, "before": {все поля}, "after": null},   — запись удалена
+        {"id": "...", "index": 6, "before": null, "after": {все поля}},   — запись добавлена
+        {"id": "...", "before": {"name": "А"}, "after": {"name": "Б"}}]}  — изменены поля
+Отмена и повтор — строки {"kind": "undo"} / {"kind": "redo"}; правка, которую нельзя
+отменить, снимается строкой {"kind": "drop"}. Правки с "undoable": false (перенос в
+"Недавние" при запуске, "Из недавних") пишутся только для восстановления после сбоя:
+в стек отмены они не попадают и стек повтора не очищают — рейтинг запусков, который
+они меняют вместе с записями, журнал не отменяет. После записи ibases.v8i добавляется
+{"kind": "saved", "upto": n}: события до n включительно уже есть в файле.
+
+Запись правки — дописывание строки, O(1); сам ibases.v8i переписывается в фоне
+(gui/ibases_saver.py). Если лончер завершился раньше, события после последней
+отметки saved применяются при следующем запуске (см. replay_operation).
+
+Отмена и повтор проверяют, что записи сейчас в том состоянии, в котором их оставила
+правка: если базу с тех пор изменили (например, через 1CEStart), возникает JournalConflict.
+
+Когда строк в файле больше compact_lines, журнал переписывается: в нем остаются
+только правки, доступные для отмены и повтора.
+"""
+
+import json
+import operator
+import os
+import time
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import EDIT_JOURNAL_COMPACT_LINES, EDIT_JOURNAL_PATH, EDIT_JOURNAL_UNDO_LIMIT
+from models.database import Database1C
+from services.credential_vault import SECRET_FIELDS
+
+
+# source — признак общего списка, такие базы лончер не изменяет;
+# пароли — в хранилище паролей, в журнал они не попадают
+FIELDS = tuple(f.name for f in fields(Database1C) if f.name != 'source' and f.name not in SECRET_FIELDS)
+_values = operator.attrgetter(*FIELDS)
+
+REPLAY_APPLIED = 'applied'
+REPLAY_ALREADY = 'already'
+REPLAY_CONFLICT = 'conflict'
+
+
+class JournalConflict(Exception):
+    """Правку нельзя отменить или повторить: записи изменены после нее"""
+
+
+def _encode(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _decode(name: str, value):
+    if name == 'last_run_time' and value:
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _record(values: Tuple) -> dict:
+    return {name: _encode(value) for name, value in zip(FIELDS, values)}
+
+
+@dataclass
+class Change:
+    """Изменение одной записи (before/after: None — записи нет)"""
+    id: str
+    before: Optional[dict]
+    after: Optional[dict]
+    # Позиция в списке баз (для удаленной — до удаления, для добавленной — после добавления)
+    index: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        data = {'id': self.id, 'before': self.before, 'after': self.after}
+        if self.index is not None:
+            data['index'] = self.index
+        return data
+
+
+@dataclass
+class Operation:
+    """Правка списка баз — набор изменений, отменяемый целиком"""
+    seq: int
+    label: str
+    changes: List[Change]
+    t: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return {
+            'seq': self.seq, 'label': self.label, 't': self.t,
+            'changes': [change.to_dict() for change in self.changes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Operation':
+        return cls(
+            seq=data['seq'], label=data.get('label', ''), t=data.get('t', 0.0),
+            changes=[Change(c['id'], c.get('before'), c.get('after'), c.get('index')) for c in data['changes']],
+        )
+
+    def base_ids(self) -> List[str]:
+        return [change.id for change in self.changes]
+
+
+class Capture:
+    """Состояние личных баз до правки: ID -> (позиция, значения полей)"""
+
+    __slots__ = ('values',)
+
+    def __init__(self, bases: List[Database1C]):
+        self.values: Dict[str, Tuple[int, Tuple]] = {
+            base.id: (index, _values(base)) for index, base in enumerate(bases) if base.is_local()
+        }
+
+
+def diff_capture(capture: Capture, bases: List[Database1C]) -> List[Change]:
+    """Изменения списка после capture (только измененные поля для измененных записей)"""
+    changes = []
+    seen = set()
+    for index, base in enumerate(bases):
+        if not base.is_local():
+            continue
+        seen.add(base.id)
+        new = _values(base)
+        old = capture.values.get(base.id)
+        if old is None:
+            changes.append(Change(base.id, None, _record(new), index))
+        elif old[1] != new:
+            differ = [i for i, (a, b) in enumerate(zip(old[1], new)) if a != b]
+            changes.append(Change(
+                base.id,
+                {FIELDS[i]: _encode(old[1][i]) for i in differ},
+                {FIELDS[i]: _encode(new[i]) for i in differ},
+            ))
+    for base_id, (index, values) in capture.values.items():
+        if base_id not in seen:
+            changes.append(Change(base_id, _record(values), None, index))
+    return changes
+
+
+def _matches(changes: List[Change], by_id: Dict[str, Database1C], side: str) -> bool:
+    """Записи в состоянии side ('before' или 'after') каждого изменения"""
+    for change in changes:
+        state = getattr(change, side)
+        base = by_id.get(change.id)
+        if state is None:
+            if base is not None:
+                return False
+        elif base is None or any(_encode(getattr(base, name)) != value for name, value in state.items()):
+            return False
+    return True
+
+
+def _apply(changes: List[Change], bases: List[Database1C], by_id: Dict[str, Database1C], target: str):
+    removed = [c for c in changes if getattr(c, target) is None]
+    added = sorted((c for c in changes if getattr(c, target) is not None and c.id not in by_id),
+                   key=lambda c: c.index or 0)
+    if removed:
+        removed_ids = {c.id for c in removed}
+        bases[:] = [base for base in bases if not (base.is_local() and base.id in removed_ids)]
+    for change in changes:
+        state = getattr(change, target)
+        base = by_id.get(change.id)
+        if state is not None and base is not None:
+            for name, value in state.items():
+                setattr(base, name, _decode(name, value))
+    for change in added:
+        state = getattr(change, target)
+        index = len(bases) if change.index is None else min(change.index, len(bases))
+        bases.insert(index, Database1C(**{name: _decode(name, value) for name, value in state.items()}))
+
+
+def _local_by_id(bases: List[Database1C]) -> Dict[str, Database1C]:
+    return {base.id: base for base in bases if base.is_local()}
+
+
+def apply_operation(op: Operation, bases: List[Database1C], forward: bool = True):
+    """
+    Применяет правку (forward) или ее обратную к списку bases на месте
+
+    Raises:
+        JournalConflict: Записи не в том состоянии, из которого выполняется переход
+    """
+    source, target = ('before', 'after') if forward else ('after', 'before')
+    by_id = _local_by_id(bases)
+    if not _matches(op.changes, by_id, source):
+        raise JournalConflict(f"базы изменены после правки «{op.label}»")
+    _apply(op.changes, bases, by_id, target)
+
+
+def replay_operation(op: Operation, bases: List[Database1C], forward: bool = True) -> str:
+    """
+    Применение незаписанной правки после перезапуска
+
+    Returns:
+        REPLAY_APPLIED, REPLAY_ALREADY (в файле уже есть) или REPLAY_CONFLICT
+    """
+    source, target = ('before', 'after') if forward else ('after', 'before')
+    by_id = _local_by_id(bases)
+    if _matches(op.changes, by_id, target):
+        return REPLAY_ALREADY
+    if not _matches(op.changes, by_id, source):
+        return REPLAY_CONFLICT
+    _apply(op.changes, bases, by_id, target)
+    return REPLAY_APPLIED
+
+
+class EditJournal:
+    """
+    Стеки отмены/повтора и их журнал на диске
+    """
+
+    def __init__(
+        self,
+        path: Path = EDIT_JOURNAL_PATH,
+        undo_limit: int = EDIT_JOURNAL_UNDO_LIMIT,
+        compact_lines: int = EDIT_JOURNAL_COMPACT_LINES,
+    ):
+        self.path = Path(path)
+        self.undo_limit = undo_limit
+        self.compact_lines = compact_lines
+        self._undo: List[Operation] = []
+        self._redo: List[Operation] = []
+        # События после последней отметки saved: (номер события, правка, вперед/назад)
+        self._pending: List[Tuple[int, Operation, bool]] = []
+        self._n = 0
+        self._seq = 0
+        self._saved_upto = 0
+        self._lines = 0
+
+    # ── Чтение ───────────────────────────────────────────
+
+    def load(self):
+        """Восстанавливает стеки и незаписанные события из файла журнала"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"⚠️ Журнал правок не прочитан: {e}")
+            return
+
+        for line in lines:
+            try:
+                event = json.loads(line)
+                self._replay_event(event)
+            except (ValueError, KeyError, TypeError):
+                # Оборванная последняя строка (сбой во время дописывания)
+                print("⚠️ Журнал правок: пропущена поврежденная строка")
+                continue
+            self._n = max(self._n, event.get('n', 0))
+        self._lines = len(lines)
+        del self._undo[:-self.undo_limit]
+
+    def _replay_event(self, event: dict):
+        kind = event['kind']
+        n = event.get('n', 0)
+        if kind == 'op':
+            op = Operation.from_dict(event)
+            self._seq = max(self._seq, op.seq)
+            if not event.get('undoable', True):
+                self._pending.append((n, op, True))
+                return
+            self._undo.append(op)
+            # Как в commit: правки за пределом стека отмены не возвращаются после перезапуска
+            del self._undo[:-self.undo_limit]
+            self._redo.clear()
+            self._pending.append((n, op, True))
+        elif kind == 'undo' and self._undo:
+            op = self._undo.pop()
+            self._redo.append(op)
+            self._pending.append((n, op, False))
+        elif kind == 'redo' and self._redo:
+            op = self._redo.pop()
+            self._undo.append(op)
+            self._pending.append((n, op, True))
+        elif kind == 'drop' and self._undo:
+            self._undo.pop()
+        elif kind == 'saved':
+            self._saved_upto = max(self._saved_upto, event['upto'])
+            self._pending = [entry for entry in self._pending if entry[0] > self._saved_upto]
+
+    def pending(self) -> List[Tuple[Operation, bool]]:
+        """Правки, которые не успели попасть в ibases.v8i: [(правка, вперед)]"""
+        return [(op, forward) for _, op, forward in self._pending]
+
+    # ── Правки ───────────────────────────────────────────
+
+    @property
+    def last_event(self) -> int:
+        """Номер последнего записанного события (метка для mark_saved)"""
+        return self._n
+
+    @property
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].label if self._undo else None
+
+    @property
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
+
+    def begin(self, bases: List[Database1C]) -> Capture:
+        """Запоминает состояние перед правкой"""
+        return Capture(bases)
+
+    def commit(self, label: str, capture: Capture, bases: List[Database1C],
+               undoable: bool = True) -> Optional[Operation]:
+        """
+        Записывает правку (разницу с capture)
+
+        Args:
+            undoable: False — правка только для восстановления после сбоя: стеки
+                отмены и повтора не меняются
+
+        Returns:
+            Правка или None, если ничего не изменилось
+        """
+        changes = diff_capture(capture, bases)
+        if not changes:
+            return None
+        self._seq += 1
+        op = Operation(self._seq, label, changes)
+        if not undoable:
+            self._append({'kind': 'op', 'undoable': False, **op.to_dict()})
+            return op
+        self._undo.append(op)
+        del self._undo[:-self.undo_limit]
+        self._redo.clear()
+        self._append({'kind': 'op', **op.to_dict()})
+        return op
+
+    def undo(self, bases: List[Database1C]) -> Optional[Operation]:
+        """
+        Отменяет последнюю правку в bases
+
+        Returns:
+            Отмененная правка или None, если отменять нечего
+        Raises:
+            JournalConflict: Записи изменены после правки (правка остается в стеке)
+        """
+        if not self._undo:
+            return None
+        op = self._undo[-1]
+        apply_operation(op, bases, forward=False)
+        self._redo.append(self._undo.pop())
+        self._append({'kind': 'undo', 'seq': op.seq})
+        return op
+
+    def redo(self, bases: List[Database1C]) -> Optional[Operation]:
+        """Повторяет последнюю отмененную правку (см. undo)"""
+        if not self._redo:
+            return None
+        op = self._redo[-1]
+        apply_operation(op, bases, forward=True)
+        self._undo.append(self._redo.pop())
+        self._append({'kind': 'redo', 'seq': op.seq})
+        return op
+
+    def drop_undo(self):
+        """Снимает последнюю правку со стека отмены (ее уже нельзя отменить)"""
+        if self._undo:
+            op = self._undo.pop()
+            self._append({'kind': 'drop', 'seq': op.seq})
+
+    def drop_redo(self):
+        """Очищает стек повтора (отмененные правки больше нельзя повторить)"""
+        self._redo.clear()
+
+    # ── Запись ───────────────────────────────────────────
+
+    def mark_saved(self, upto: int):
+        """Отмечает, что события до upto включительно записаны в ibases.v8i"""
+        if upto <= self._saved_upto:
+            return
+        self._saved_upto = upto
+        self._pending = [entry for entry in self._pending if entry[0] > upto]
+        self._append({'kind': 'saved', 'upto': upto}, numbered=False)
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self._lines > self.compact_lines and self._saved_upto >= self._n
+
+    def compact(self):
+        """Переписывает журнал: только правки из стеков отмены и повтора"""
+        events = [{'kind': 'op', **op.to_dict()} for op in self._undo + self._redo[::-1]]
+        events += [{'kind': 'undo', 'seq': op.seq} for op in self._redo[::-1]]
+        lines = []
+        for event in events:
+            self._n += 1
+            lines.append(self._dump({'n': self._n, **event}))
+        self._saved_upto = self._n
+        lines.append(self._dump({'kind': 'saved', 'upto': self._n}))
+
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Журнал правок не сжат: {e}")
+            return
+        print(f"🗜️ Журнал правок сжат: {self._lines} → {len(lines)} строк")
+        self._lines = len(lines)
+
+    @staticmethod
+    def _dump(event: dict) -> str:
+        return json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    def _append(self, event: dict, numbered: bool = True):
+        if numbered:
+            self._n += 1
+            event = {'n': self._n, **event}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(self._dump(event))
+            self._lines += 1
+        except OSError as e:
+            # Журнал — не источник данных: без него пропадает только отмена после перезапуска
+            print(f"⚠️ Журнал правок не записан: {e}")
@@ -0,0 +1,243 @@
+"""
+Частота + давность запусков баз (frecency) для папки "Недавние".
+
+Каждый запуск базы в режиме mode добавляет вклад, экспоненциально затухающий
+с периодом полураспада HALF_LIFE: score(t) = sum(exp(-lambda * (t - t_i))).
+Хранится логарифм суммы относительно эпохи: v = log(sum(exp(lambda * t_i))).
+Тогда новый запуск — это v = logaddexp(v, lambda * now), а текущий вес —
+exp(v - lambda * now). Поскольку множитель exp(-lambda * now) общий для всех баз,
+порядок баз по v от времени не зависит и меняется только при запуске.
+
+Поэтому порядок поддерживается инкрементально: отсортированный список (-v, id)
+обновляется bisect'ом на одну запись при каждом запуске, а "топ N" —
+это первые N элементов без пересортировки.
+"""
+
+import bisect
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import FRECENCY_PATH, FRECENCY_HALF_LIFE_DAYS, RECENT_LIMIT
+
+
+FORMAT_VERSION = 1
+
+
+def logaddexp(a: float, b: float) -> float:
+    """log(exp(a) + exp(b)) без переполнения"""
+    if a == -math.inf:
+        return b
+    if b == -math.inf:
+        return a
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log1p(math.exp(low - high))
+
+
+class FrecencyStore:
+    """
+    Статистика запусков баз по режимам с рейтингом по затухающей частоте
+    """
+
+    def __init__(self, path: Optional[Path] = None, half_life_days: float = FRECENCY_HALF_LIFE_DAYS):
+        """
+        Args:
+            path: Файл статистики (JSON); None — только в памяти
+            half_life_days: Период полураспада вклада запуска, дней
+        """
+        self.path = Path(path) if path else None
+        self.decay = math.log(2) / (half_life_days * 86400.0)
+        # id базы -> режим -> {'v': лог-вес, 'count': число запусков, 'last': время последнего}
+        self._entries: Dict[str, Dict[str, dict]] = {}
+        # id базы -> лог-вес по всем режимам
+        self._base_v: Dict[str, float] = {}
+        # Отсортированный по убыванию веса список (-v, id)
+        self._order: List[Tuple[float, str]] = []
+
+    def __contains__(self, base_id: str) -> bool:
+        return base_id in self._base_v
+
+    # ------------------------------------------------------------------ #
+    #  Запись                                                              #
+    # ------------------------------------------------------------------ #
+
+    def record(self, base_id: str, mode: str = 'ENTERPRISE', when: Optional[float] = None):
+        """
+        Учитывает запуск базы
+
+        Args:
+            base_id: ID базы
+            mode: Режим запуска (ENTERPRISE / DESIGNER / IR_TOOLS)
+            when: Время запуска (timestamp), по умолчанию — сейчас
+        """
+        when = time.time() if when is None else when
+        modes = self._entries.setdefault(base_id, {})
+        entry = modes.setdefault(mode, {'v': -math.inf, 'count': 0, 'last': 0.0})
+        entry['v'] = logaddexp(entry['v'], self.decay * when)
+        entry['count'] += 1
+        entry['last'] = max(entry['last'], when)
+        self._reposition(base_id, logaddexp(self._base_v.get(base_id, -math.inf), self.decay * when))
+
+    def forget(self, base_id: str):
+        """Удаляет статистику базы (убрана из недавних или удалена)"""
+        if base_id not in self._base_v:
+            return
+        self._unlink(base_id)
+        del self._base_v[base_id]
+        self._entries.pop(base_id, None)
+
+    def _reposition(self, base_id: str, new_v: float):
+        if base_id in self._base_v:
+            self._unlink(base_id)
+        self._base_v[base_id] = new_v
+        bisect.insort(self._order, (-new_v, base_id))
+
+    def _unlink(self, base_id: str):
+        key = (-self._base_v[base_id], base_id)
+        index = bisect.bisect_left(self._order, key)
+        if index < len(self._order) and self._order[index] == key:
+            del self._order[index]
+
+    # ------------------------------------------------------------------ #
+    #  Запросы                                                             #
+    # ------------------------------------------------------------------ #
+
+    def top(self, limit: int, known_ids=None) -> List[str]:
+        """
+        ID баз с наибольшим весом (лучшие первыми)
+
+        Args:
+            limit: Сколько баз вернуть
+            known_ids: Если задано — учитываются только эти ID (существующие базы)
+        """
+        result = []
+        for _, base_id in self._order:
+            if known_ids is None or base_id in known_ids:
+                result.append(base_id)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def score(self, base_id: str, now: Optional[float] = None) -> float:
+        """Текущий вес базы в "эквивалентных запусках прямо сейчас" """
+        v = self._base_v.get(base_id)
+        if v is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return math.exp(v - self.decay * now)
+
+    def get_stats(self, base_id: str) -> Dict[str, dict]:
+        """Статистика базы по режимам: {'ENTERPRISE': {'count': ..., 'last': ...}, ...}"""
+        return {
+            mode: {'count': entry['count'], 'last': entry['last']}
+            for mode, entry in self._entries.get(base_id, {}).items()
+        }
+
+    # ------------------------------------------------------------------ #
+    #  Хранение                                                            #
+    # ------------------------------------------------------------------ #
+
+    def load(self) -> bool:
+        """Загружает статистику из файла. Returns: True если файл прочитан"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') != FORMAT_VERSION:
+                return False
+            entries = data.get('entries', {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Не удалось прочитать статистику запусков: {e}")
+            return False
+
+        self._entries = {}
+        self._base_v = {}
+        for base_id, modes in entries.items():
+            base_v = -math.inf
+            clean = {}
+            for mode, entry in modes.items():
+                v = float(entry['v'])
+                clean[mode] = {'v': v, 'count': int(entry.get('count', 1)), 'last': float(entry.get('last', 0))}
+                base_v = logaddexp(base_v, v)
+            if clean:
+                self._entries[base_id] = clean
+                self._base_v[base_id] = base_v
+        # Полная сортировка — только при загрузке файла
+        self._order = sorted((-v, base_id) for base_id, v in self._base_v.items())
+        return True
+
+    def save(self) -> bool:
+        """Сохраняет статистику (атомарно, через временный файл)"""
+        if not self.path:
+            return False
+        data = {'version': FORMAT_VERSION, 'entries': self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить статистику запусков: {e}")
+            return False
+
+
+def apply_recent_limit(bases: list, store: FrecencyStore, limit: int = RECENT_LIMIT) -> bool:
+    """
+    Упорядочивает "Недавние" по рейтингу и оставляет в них не больше limit баз
+
+    Недавние (по рейтингу) переносятся в начало списка, остальные базы сохраняют
+    свой порядок. Вытесненные базы возвращаются в original_folder.
+    Базы с IsRecent=1, которых еще нет в статистике (прежние версии лончера
+    или стартер 1С), учитываются одним запуском во время last_run_time.
+
+    Args:
+        bases: Список баз (изменяется на месте)
+        store: Статистика запусков
+        limit: Максимум баз в "Недавних"
+
+    Returns:
+        True, если состав "Недавних" изменился и список нужно сохранить
+    """
+    recent_by_id = {}
+    seeded = False
+    for base in bases:
+        if base.is_recent:
+            recent_by_id[base.id] = base
+            if base.id not in store:
+                when = base.last_run_time.timestamp() if base.last_run_time else None
+                store.record(base.id, 'ENTERPRISE', when)
+                seeded = True
+    if seeded:
+        store.save()
+
+    kept_ids = store.top(limit, recent_by_id)
+    evicted = len(recent_by_id) - len(kept_ids)
+    if evicted:
+        kept = set(kept_ids)
+        for base_id, base in recent_by_id.items():
+            if base_id not in kept:
+                base.is_recent = False
+                if base.original_folder:
+                    base.folder = base.original_folder
+                    base.original_folder = None
+        print(f"🕘 Из недавних вытеснено баз: {evicted}")
+
+    recent = [recent_by_id[base_id] for base_id in kept_ids]
+    bases[:] = recent + [base for base in bases if not base.is_recent]
+    return bool(evicted)
+
+
+_store: Optional[FrecencyStore] = None
+
+
+def get_frecency_store() -> FrecencyStore:
+    """Возвращает общий для приложения экземпляр FrecencyStore (загружается при первом обращении)"""
+    global _store
+    if _store is None:
+        _store = FrecencyStore(FRECENCY_PATH)
+        _store.load()
+    return _store
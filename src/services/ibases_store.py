@@ -0,0 +1,238 @@
+"""
+Запись ibases.v8i с оптимистичной блокировкой и трехсторонним слиянием.
+
+При загрузке запоминается версия файла: stat (mtime_ns, size), хэш содержимого
+и копии записей ("база" слияния). Перед записью:
+    - stat не изменился — файл никто не трогал, пишем сразу (кроме "подозрительно
+      свежего" файла: если mtime попадает в окно грубости часов файловой системы
+      от момента загрузки, две записи могли получить одинаковый stat — сверяется хэш);
+    - stat изменился, но хэш тот же — содержимое прежнее, пишем сразу;
+    - иначе файл перечитывается и изменения в памяти ("мои") сливаются
+      с изменениями на диске ("их") относительно базы — по ID записей.
+
+Правила слияния записи:
+    изменена только одной стороной            — берется эта сторона;
+    изменена обеими                           — по полям: поле, измененное у нас,
+                                                берется наше, иначе — с диска (конфликт, если поле
+                                                изменено обеими сторонами по-разному);
+    удалена одной стороной, не изменена другой — удаляется;
+    удалена одной стороной, изменена другой    — остается измененная (конфликт);
+    добавлена любой стороной                   — добавляется.
+
+Чтение-слияние-запись выполняются под рекомендательной блокировкой файла
+ibases.v8i.lock (flock на Linux, msvcrt.locking на Windows): другие экземпляры
+лончера ждут, 1CEStart ее не учитывает — от него защищает проверка версии.
+Запись атомарная: временный файл рядом и os.replace.
+"""
+
+import copy
+import hashlib
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from models.database import Database1C
+from services.base_reader import BaseReader
+from services.base_writer import BaseWriter
+from services.tree_snapshot import stat_key
+
+
+# Поля только в памяти: в ibases.v8i не пишутся и в слиянии не участвуют
+_TRANSIENT_FIELDS = {'original_folder', 'source'}
+_MERGE_FIELDS = tuple(f.name for f in fields(Database1C) if f.name not in _TRANSIENT_FIELDS)
+
+LOCK_TIMEOUT = 10.0
+_LOCK_POLL = 0.05
+
+# Грубость mtime файловых систем (FAT — 2 с): записи в пределах окна неразличимы по stat
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_digest(path: Path) -> Optional[str]:
+    """Хэш содержимого файла (None, если файла нет)"""
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT):
+    """
+    Рекомендательная эксклюзивная блокировка файла path (через path.lock)
+
+    Raises:
+        TimeoutError: Блокировку держит другой процесс дольше timeout секунд
+    """
+    lock_path = Path(str(path) + '.lock')
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            import fcntl
+
+            def try_lock():
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            def unlock():
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except ImportError:
+            import msvcrt
+
+            def try_lock():
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+            def unlock():
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                try_lock()
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"ibases.v8i заблокирован другим процессом: {lock_path}")
+                time.sleep(_LOCK_POLL)
+        try:
+            yield
+        finally:
+            unlock()
+    finally:
+        os.close(fd)
+
+
+def _values(base: Database1C) -> Tuple:
+    return tuple(getattr(base, name) for name in _MERGE_FIELDS)
+
+
+def merge_bases(
+    base: List[Database1C], mine: List[Database1C], theirs: List[Database1C]
+) -> Tuple[List[Database1C], List[str]]:
+    """
+    Трехстороннее слияние списков баз по ID
+
+    Returns:
+        (итоговый список, имена баз с конфликтами)
+        Порядок: записи в порядке "моего" списка, затем добавленные на диске.
+    """
+    base_by_id = {b.id: b for b in base}
+    theirs_by_id = {b.id: b for b in theirs}
+    mine_ids = {b.id for b in mine}
+    result = []
+    conflicts = []
+
+    for my in mine:
+        old = base_by_id.get(my.id)
+        their = theirs_by_id.get(my.id)
+        if old is None:
+            # Добавлена у нас (или одновременно с тем же ID на диске — наша важнее)
+            result.append(my)
+            continue
+        mine_changed = _values(my) != _values(old)
+        if their is None:
+            # Удалена на диске
+            if mine_changed:
+                conflicts.append(my.name)
+                result.append(my)
+            continue
+        theirs_changed = _values(their) != _values(old)
+        if not theirs_changed or not mine_changed:
+            if theirs_changed:
+                # Поля с диска, служебные поля — наши
+                for name in _MERGE_FIELDS:
+                    setattr(my, name, getattr(their, name))
+            result.append(my)
+            continue
+        # Изменена обеими сторонами — слияние по полям
+        for name in _MERGE_FIELDS:
+            my_value, old_value, their_value = getattr(my, name), getattr(old, name), getattr(their, name)
+            if my_value == old_value:
+                setattr(my, name, their_value)
+            elif their_value != old_value and their_value != my_value:
+                if my.name not in conflicts:
+                    conflicts.append(my.name)
+        result.append(my)
+
+    for their in theirs:
+        if their.id in mine_ids:
+            continue
+        old = base_by_id.get(their.id)
+        if old is None:
+            # Добавлена на диске
+            result.append(their)
+        elif _values(their) != _values(old):
+            # Удалена у нас, изменена на диске
+            conflicts.append(their.name)
+            result.append(their)
+    return result, conflicts
+
+
+@dataclass
+class SaveResult:
+    """Итог записи"""
+    stat: Optional[Tuple[int, int]]
+    # Список после слияния (None — файл на диске не менялся, записан список из памяти)
+    merged: Optional[List[Database1C]] = None
+    conflicts: List[str] = field(default_factory=list)
+
+
+class IbasesStore:
+    """
+    Версия ibases.v8i, с которой работает лончер, и запись с проверкой версии
+    """
+
+    def __init__(self, path: Path, encoding: str = 'utf-8-sig'):
+        self.path = Path(path)
+        self.encoding = encoding
+        self._stat: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._marked_at_ns = 0
+        self._base: List[Database1C] = []
+
+    def mark_loaded(self, bases: List[Database1C], stat: Optional[Tuple[int, int]]):
+        """Запоминает версию файла, из которой получены bases (база слияния)"""
+        self._stat = stat
+        self._marked_at_ns = time.time_ns()
+        self._digest = None
+        if stat is not None:
+            digest = file_digest(self.path)
+            # Хэш годится, только если файл не заменили после разбора bases;
+            # иначе версия неизвестна и следующая запись пройдет через слияние
+            if stat_key(self.path) == stat:
+                self._digest = digest
+        self._base = [copy.copy(b) for b in bases]
+
+    def _changed_on_disk(self) -> bool:
+        stat = stat_key(self.path)
+        if stat == self._stat and (stat is None or stat[0] < self._marked_at_ns - _RACY_WINDOW_NS):
+            return False
+        if stat is None:
+            # Файла нет — писать его заново, сливать не с чем
+            return False
+        return file_digest(self.path) != self._digest
+
+    def save(self, bases: List[Database1C]) -> SaveResult:
+        """
+        Записывает bases, сливая их с изменениями на диске, если они были
+
+        Raises:
+            OSError: Файл не удалось записать (в т.ч. TimeoutError блокировки)
+        """
+        with file_lock(self.path):
+            result = SaveResult(stat=None)
+            if self._changed_on_disk():
+                theirs = BaseReader(self.path, self.encoding).read_bases()
+                bases, result.conflicts = merge_bases(self._base, bases, theirs)
+                result.merged = bases
+
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            BaseWriter(tmp_path, self.encoding).write_bases(bases)
+            os.replace(tmp_path, self.path)
+            result.stat = stat_key(self.path)
+            self.mark_loaded(bases, result.stat)
+        return result
@@ -0,0 +1,180 @@
+"""
+Формирование командной строки запуска 1С без зависимости от Qt.
+
+Используется и окном лончера (DbLaunchMixin), и консольным интерфейсом (cli.py).
+Режимы запуска: ENTERPRISE, DESIGNER, IR_TOOLS (предприятие с обработкой ИР).
+"""
+
+import re
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+from config import IR_TOOLS_PATH
+from services.credential_vault import MODE_STORAGE, launch_password, stored_password
+from services.platform_registry import get_platform_registry
+from services.version_resolver import get_version_resolver
+
+
+LAUNCH_MODES = ('ENTERPRISE', 'DESIGNER', 'IR_TOOLS')
+
+# Пароли в командной строке и BAT не выводятся
+_SECRET_RE = re.compile(r'(/P|/ConfigurationRepositoryP\s*)"[^"]*"')
+
+
+def mask_secrets(text):
+    return _SECRET_RE.sub(r'\1"***"', text) if text else text
+
+
+def resolve_executable(database, mode: Optional[str] = None) -> Optional[Path]:
+    """
+    Определяет путь к исполняемому файлу 1C с учетом разрядности и типа клиента
+
+    Args:
+        database: Объект Database1C
+        mode: Режим запуска; для DESIGNER и IR_TOOLS всегда нужен толстый клиент
+
+    Returns:
+        Path к исполняемому файлу или None
+    """
+    client_type = database.client_type or 'thick'
+
+    if mode == 'IR_TOOLS' or mode == 'DESIGNER':
+        client_type = 'thick'
+
+    if database.app:
+        path = Path(database.app)
+        if path.exists():
+            return path
+
+    path = get_version_resolver().resolve(database, client_type)
+    if path:
+        return path
+
+    # Платформы в стандартных каталогах не найдены — остается только стартер
+    if client_type == 'thick':
+        return get_platform_registry().get_starter()
+
+    return None
+
+
+def parse_server_connect_string(connect_string: str) -> str:
+    """Преобразует Srvr="host";Ref="base"; в host\\base (остальные строки — как есть)"""
+    try:
+        srvr_match = re.search(r'Srvr="([^"]+)"', connect_string, re.IGNORECASE)
+        ref_match = re.search(r'Ref="([^"]+)"', connect_string, re.IGNORECASE)
+
+        if srvr_match and ref_match:
+            server = srvr_match.group(1)
+            ref = ref_match.group(1)
+            return f"{server}\\{ref}"
+
+        return connect_string
+
+    except Exception as e:
+        print(f"Ошибка парсинга строки подключения: {e}")
+        return connect_string
+
+
+def build_launch_command(executable, mode: str, database) -> Optional[str]:
+    """
+    Формирует командную строку для запуска 1С
+
+    Args:
+        executable: Путь к исполняемому файлу 1С
+        mode: ENTERPRISE / DESIGNER / IR_TOOLS
+        database: Объект Database1C
+
+    Returns:
+        Командная строка или None при ошибке
+    """
+    try:
+        params = [mode if mode != 'IR_TOOLS' else 'ENTERPRISE']
+
+        if database.connect:
+            parsed_connect = parse_server_connect_string(database.connect)
+            params.append(f'/S"{parsed_connect}"')
+
+        usr = None
+        pwd = None
+
+        # Пароль — из хранилища паролей (расшифровывается только здесь, при запуске)
+        if mode == 'ENTERPRISE' or mode == 'IR_TOOLS':
+            usr = database.usr_enterprise or database.usr
+            pwd = launch_password(database, mode)
+        elif mode == 'DESIGNER':
+            usr = database.usr_configurator or database.usr
+            pwd = launch_password(database, mode)
+
+        if usr:
+            params.append(f'/N"{usr}"')
+        if pwd:
+            params.append(f'/P"{pwd}"')
+
+        if mode == 'DESIGNER':
+            storage_path = (database.storage_path or '').strip()
+            usr_storage = (database.usr_storage or '').strip()
+            pwd_storage = (stored_password(database, MODE_STORAGE) or '').strip() if storage_path and usr_storage else ''
+            if storage_path and usr_storage and pwd_storage:
+                params.append(f'/ConfigurationRepositoryF "{storage_path}"')
+                params.append(f'/ConfigurationRepositoryN "{usr_storage}"')
+                params.append(f'/ConfigurationRepositoryP "{pwd_storage}"')
+
+        if mode == 'IR_TOOLS':
+            params.extend([
+                '/RunModeOrdinaryApplication',
+                '/Debug -attach',
+                '/DebuggerURL tcp://localhost',
+                '/UC""',
+                f'/Execute"{IR_TOOLS_PATH}"',
+                '/WA-',
+            ])
+
+        if mode == 'ENTERPRISE':
+            params.extend([
+                '/Debug -attach',
+                '/DebuggerURL tcp://localhost'
+            ])
+
+        cmd_line = f'"{executable}" ' + ' '.join(
+            f'"{p}"' if ' ' in p and not p.startswith('/') else p
+            for p in params
+        )
+
+        return cmd_line
+
+    except Exception as e:
+        print(f"Ошибка формирования командной строки: {e}")
+        return None
+
+
+def spawn_client(cmd_line: str) -> int:
+    """
+    Запускает клиент 1С отдельным процессом, без консоли и временных файлов
+
+    Пароль передается только в командной строке нового процесса — на диск
+    (как раньше во временный BAT) он не попадает.
+
+    Returns:
+        PID созданного процесса (клиента или стартера 1cestart.exe)
+    Raises:
+        OSError: Процесс не удалось создать
+    """
+    if sys.platform == 'win32':
+        # Строка передается CreateProcess как есть: кавычки внутри /S"..." разбирает сама 1С
+        process = subprocess.Popen(
+            cmd_line,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+        )
+    else:
+        process = subprocess.Popen(
+            shlex.split(cmd_line),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    return process.pid
@@ -0,0 +1,212 @@
+"""
+Телеметрия запусков баз 1С.
+
+Каждый запуск — это временная шкала этапов (мс от начала запуска):
+    command  — командная строка сформирована
+    spawn    — процесс клиента (или стартера) создан
+    process  — новый процесс 1cv8/1cv8c замечен среди процессов
+    window   — у процесса появилось главное окно
+
+Завершенные запуски дописываются строкой JSON в локальный файл (только добавление).
+По ним считаются p50/p95 времени до окна в разрезе баз, версий платформы и серверов.
+"""
+
+import json
+import math
+import re
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from config import LAUNCH_METRICS_PATH
+from services.process_index import connection_key
+
+
+STAGE_COMMAND = 'command'
+STAGE_SPAWN = 'spawn'
+STAGE_PROCESS = 'process'
+STAGE_WINDOW = 'window'
+STAGES = (STAGE_COMMAND, STAGE_SPAWN, STAGE_PROCESS, STAGE_WINDOW)
+
+OUTCOME_OK = 'ok'
+OUTCOME_ERROR = 'error'
+OUTCOME_TIMEOUT = 'timeout'
+
+FILE_SERVER = 'Файловая'
+
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+_SRVR_RE = re.compile(r'Srvr="?([^;"]+)"?', re.IGNORECASE)
+_REF_RE = re.compile(r'(?:Ref|File)="?([^;"]+)"?', re.IGNORECASE)
+
+
+def platform_version(executable, database=None) -> str:
+    """Версия платформы из пути к исполняемому файлу (...\\8.3.24.1500\\bin\\...)"""
+    match = _VERSION_RE.search(str(executable or ''))
+    if match:
+        return match.group(1)
+    if database is not None and database.version:
+        return database.version
+    return 'авто'
+
+
+def server_name(connect: Optional[str]) -> str:
+    """Сервер 1С из строки подключения (для файловых баз — FILE_SERVER)"""
+    match = _SRVR_RE.search(connect or '')
+    return match.group(1) if match else FILE_SERVER
+
+
+@dataclass
+class LaunchTrace:
+    """Временная шкала одного запуска"""
+    base_id: str
+    base_name: str
+    mode: str
+    version: str = ''
+    server: str = ''
+    # Строка для сопоставления процесса с запуском (Ref или путь файловой базы)
+    ref: str = ''
+    launch_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: float = field(default_factory=time.time)
+    stages: Dict[str, float] = field(default_factory=dict)
+    pid: Optional[int] = None
+    outcome: str = ''
+    # Монотонное время начала (в файл не пишется)
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+    # Ключ подключения базы для сопоставления процесса (в файл не пишется)
+    _key: str = field(default='', repr=False)
+
+    def mark(self, stage: str) -> float:
+        """Отмечает этап (повторная отметка игнорируется). Returns: мс от начала"""
+        if stage not in self.stages:
+            self.stages[stage] = round((time.perf_counter() - self._t0) * 1000, 1)
+        return self.stages[stage]
+
+    def elapsed(self) -> float:
+        """Секунд с начала запуска"""
+        return time.perf_counter() - self._t0
+
+    @property
+    def time_to_window(self) -> Optional[float]:
+        return self.stages.get(STAGE_WINDOW)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop('_t0')
+        data.pop('_key')
+        return data
+
+
+def start_trace(database, mode: str) -> LaunchTrace:
+    """Начинает временную шкалу запуска базы"""
+    match = _REF_RE.search(database.connect or '')
+    return LaunchTrace(
+        base_id=database.id,
+        base_name=database.name,
+        mode=mode,
+        server=server_name(database.connect),
+        ref=match.group(1) if match else '',
+        _key=connection_key(database.connect),
+    )
+
+
+class LaunchMetricsLog:
+    """
+    Файл метрик запусков (JSON Lines, только добавление)
+    """
+
+    def __init__(self, path: Path = LAUNCH_METRICS_PATH):
+        self.path = Path(path)
+
+    def append(self, trace: LaunchTrace) -> bool:
+        """Дописывает завершенный запуск в конец файла"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(trace.to_dict(), ensure_ascii=False)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            return True
+        except OSError as e:
+            print(f"⚠️ Не удалось записать метрики запуска: {e}")
+            return False
+
+    def read(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Читает записи (битые строки пропускаются)
+
+        Args:
+            limit: Только последние limit записей
+        """
+        if not self.path.exists():
+            return []
+        records = []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError as e:
+            print(f"⚠️ Не удалось прочитать метрики запусков: {e}")
+        return records[-limit:] if limit else records
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Перцентиль q (0..100) отсортированного списка с линейной интерполяцией"""
+    if not sorted_values:
+        return None
+    pos = (len(sorted_values) - 1) * q / 100.0
+    low = math.floor(pos)
+    high = math.ceil(pos)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+@dataclass
+class LaunchStats:
+    """Сводка по группе запусков"""
+    key: str
+    launches: int = 0
+    failures: int = 0
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    max: Optional[float] = None
+
+
+def summarize(records: Iterable[dict], key: str) -> List[LaunchStats]:
+    """
+    Группирует запуски и считает p50/p95 времени до окна (мс)
+
+    Args:
+        records: Записи из LaunchMetricsLog.read()
+        key: Поле группировки: 'base_name', 'version' или 'server'
+
+    Returns:
+        Список LaunchStats, самые медленные (по p95) первыми
+    """
+    groups: Dict[str, LaunchStats] = {}
+    timings: Dict[str, List[float]] = {}
+    for record in records:
+        name = record.get(key) or '—'
+        stats = groups.get(name)
+        if stats is None:
+            stats = groups[name] = LaunchStats(key=name)
+            timings[name] = []
+        stats.launches += 1
+        window = (record.get('stages') or {}).get(STAGE_WINDOW)
+        if record.get('outcome') == OUTCOME_OK and window is not None:
+            timings[name].append(window)
+        else:
+            stats.failures += 1
+
+    for name, stats in groups.items():
+        values = sorted(timings[name])
+        if values:
+            stats.p50 = percentile(values, 50)
+            stats.p95 = percentile(values, 95)
+            stats.max = values[-1]
+
+    return sorted(groups.values(), key=lambda s: (s.p95 is None, -(s.p95 or 0), s.key))
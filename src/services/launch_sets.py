@@ -0,0 +1,234 @@
+"""
+Наборы запуска: именованные списки "база + режим" (например, утренний набор), без зависимости от Qt.
+
+Наборы хранятся в LAUNCH_SETS_PATH:
+    {"version": 1, "sets": [{"name": "Утро", "items": [{"id": "<ID>", "mode": "ENTERPRISE"}, ...]}]}
+Порядок наборов и баз внутри набора сохраняется — в этом порядке базы и запускаются.
+
+Ступенчатый старт (StaggerScheduler): следующий клиент запускается не раньше
+чем через LAUNCH_SET_STAGGER_MS после предыдущего и только пока клиентов,
+еще не показавших окно, меньше LAUNCH_SET_MAX_STARTING. Менеджер кластера
+(аутентификация, выделение сеанса) и процессор не получают все запуски разом.
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from config import LAUNCH_SET_MAX_STARTING, LAUNCH_SET_STAGGER_MS, LAUNCH_SETS_PATH
+from services.launch_command import LAUNCH_MODES
+
+
+FORMAT_VERSION = 1
+
+# Итог запуска базы из набора
+STATUS_OK = 'ok'
+STATUS_RUNNING = 'running'
+STATUS_MISSING = 'missing'
+STATUS_ERROR = 'error'
+STATUS_TIMEOUT = 'timeout'
+
+_STATUS_ICONS = {
+    STATUS_OK: '✅',
+    STATUS_RUNNING: 'ℹ️',
+    STATUS_MISSING: '⚠️',
+    STATUS_ERROR: '❌',
+    STATUS_TIMEOUT: '⌛',
+}
+
+
+@dataclass
+class LaunchSetItem:
+    """База в наборе"""
+    base_id: str
+    mode: str = 'ENTERPRISE'
+
+
+@dataclass
+class LaunchSet:
+    """Именованный набор баз"""
+    name: str
+    items: List[LaunchSetItem] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {'name': self.name, 'items': [{'id': i.base_id, 'mode': i.mode} for i in self.items]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LaunchSet':
+        items = [
+            LaunchSetItem(item['id'], item.get('mode') or 'ENTERPRISE')
+            for item in data.get('items', [])
+            if item.get('id') and (item.get('mode') or 'ENTERPRISE') in LAUNCH_MODES
+        ]
+        return cls(name=data['name'], items=items)
+
+
+class LaunchSetStore:
+    """
+    Наборы запуска в JSON-файле
+    """
+
+    def __init__(self, path: Optional[Path] = LAUNCH_SETS_PATH):
+        """
+        Args:
+            path: Файл наборов; None — только в памяти
+        """
+        self.path = Path(path) if path else None
+        self.sets: List[LaunchSet] = []
+
+    def names(self) -> List[str]:
+        return [launch_set.name for launch_set in self.sets]
+
+    def get(self, name: str) -> Optional[LaunchSet]:
+        return next((s for s in self.sets if s.name == name), None)
+
+    def put(self, launch_set: LaunchSet):
+        """Добавляет набор или заменяет набор с тем же именем (на его месте)"""
+        for index, existing in enumerate(self.sets):
+            if existing.name == launch_set.name:
+                self.sets[index] = launch_set
+                return
+        self.sets.append(launch_set)
+
+    def remove(self, name: str) -> bool:
+        launch_set = self.get(name)
+        if launch_set is None:
+            return False
+        self.sets.remove(launch_set)
+        return True
+
+    def rename(self, old: str, new: str) -> bool:
+        """Переименовывает набор. Returns: False — набора нет или имя занято"""
+        launch_set = self.get(old)
+        if launch_set is None or (new != old and self.get(new) is not None):
+            return False
+        launch_set.name = new
+        return True
+
+    def load(self) -> bool:
+        """Загружает наборы из файла. Returns: True если файл прочитан"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') != FORMAT_VERSION:
+                return False
+            self.sets = [LaunchSet.from_dict(item) for item in data.get('sets', [])]
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ Не удалось прочитать наборы запуска: {e}")
+            return False
+
+    def save(self) -> bool:
+        """Сохраняет наборы (атомарно, через временный файл)"""
+        if not self.path:
+            return False
+        data = {'version': FORMAT_VERSION, 'sets': [s.to_dict() for s in self.sets]}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить наборы запуска: {e}")
+            return False
+
+
+_store: Optional[LaunchSetStore] = None
+
+
+def get_launch_set_store() -> LaunchSetStore:
+    """Возвращает общий для приложения экземпляр LaunchSetStore (загружается при первом обращении)"""
+    global _store
+    if _store is None:
+        _store = LaunchSetStore()
+        _store.load()
+    return _store
+
+
+# --------------------------------------------------------------------------- #
+#  Ступенчатый старт                                                           #
+# --------------------------------------------------------------------------- #
+
+class StaggerScheduler:
+    """
+    Когда можно запускать следующего клиента набора
+    """
+
+    def __init__(
+        self,
+        interval: float = LAUNCH_SET_STAGGER_MS / 1000,
+        max_starting: int = LAUNCH_SET_MAX_STARTING,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            interval: Минимальная пауза между запусками, секунд
+            max_starting: Сколько клиентов одновременно могут ждать окна
+        """
+        self.interval = interval
+        self.max_starting = max(1, max_starting)
+        self.starting = 0
+        self._clock = clock
+        self._last_spawn: Optional[float] = None
+
+    def delay(self) -> Optional[float]:
+        """Секунд до следующего запуска (0 — можно сейчас, None — ждать окна стартующего клиента)"""
+        if self.starting >= self.max_starting:
+            return None
+        if self._last_spawn is None:
+            return 0.0
+        return max(0.0, self._last_spawn + self.interval - self._clock())
+
+    def spawned(self):
+        """Клиент запущен и ждет окна"""
+        self.starting += 1
+        self._last_spawn = self._clock()
+
+    def settled(self):
+        """Клиент показал окно (или запуск завершился неудачей)"""
+        self.starting = max(0, self.starting - 1)
+
+
+@dataclass
+class LaunchSetResult:
+    """Итог запуска одной базы набора"""
+    base_id: str
+    name: str
+    mode: str
+    status: str = ''
+    # Время до окна, мс (для STATUS_OK)
+    time_to_window: Optional[float] = None
+    error: str = ''
+
+    def format(self) -> str:
+        """Строка отчета: "✅ База (ENTERPRISE): окно через 4.2 с" """
+        icon = _STATUS_ICONS.get(self.status, '•')
+        if self.status == STATUS_OK and self.time_to_window is not None:
+            detail = f"окно через {self.time_to_window / 1000:.1f} с"
+        elif self.status == STATUS_RUNNING:
+            detail = "уже открыта"
+        elif self.status == STATUS_MISSING:
+            detail = "нет в списке баз"
+        elif self.status == STATUS_TIMEOUT:
+            detail = "окно не появилось"
+        else:
+            detail = self.error or "ошибка запуска"
+        return f"{icon} {self.name} ({self.mode}): {detail}"
+
+
+def summarize_results(results: List[LaunchSetResult]) -> str:
+    """Итог набора одной строкой: "открыто 7 из 8, уже были открыты: 1" """
+    opened = sum(1 for r in results if r.status == STATUS_OK)
+    running = sum(1 for r in results if r.status == STATUS_RUNNING)
+    failed = len(results) - opened - running
+    parts = [f"открыто {opened} из {len(results) - running}"]
+    if running:
+        parts.append(f"уже были открыты: {running}")
+    if failed:
+        parts.append(f"с ошибкой: {failed}")
+    return ", ".join(parts)
@@ -0,0 +1,233 @@
+"""
+Реестр установленных платформ 1С.
+
+Один раз обходит каталоги установки (Program Files\\1cv8, Program Files (x86)\\1cv8),
+индексирует версии, разрядности и исполняемые файлы и отвечает на запрос
+"exe для (версия, разрядность, тип клиента)" поиском в словаре.
+Повторный обход выполняется лениво — только если изменилось mtime каталога установки.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import PLATFORM_INSTALL_ROOTS
+
+
+# Исполняемые файлы, которые индексируются в каталоге bin каждой версии
+THICK_CLIENT_EXE = '1cv8.exe'
+THIN_CLIENT_EXE = '1cv8c.exe'
+STARTER_EXE = '1cestart.exe'
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Преобразует строку версии в кортеж чисел для числового сравнения
+
+    Args:
+        version: Строка версии, например "8.3.25.1374"
+
+    Returns:
+        Кортеж чисел (8, 3, 25, 1374) или пустой кортеж, если строка не является версией
+    """
+    parts = (version or '').strip().split('.')
+    if not all(part.isdigit() for part in parts):
+        return ()
+    return tuple(int(part) for part in parts)
+
+
+def exe_name_for(client_type: Optional[str]) -> str:
+    """Возвращает имя исполняемого файла для типа клиента ('thin' / 'thick')"""
+    return THIN_CLIENT_EXE if client_type == 'thin' else THICK_CLIENT_EXE
+
+
+@dataclass
+class PlatformInstall:
+    """Установленная версия платформы 1С"""
+    version: str
+    arch: str  # 'x86' или 'x86_64'
+    bin_dir: Path
+    executables: Dict[str, Path] = field(default_factory=dict)  # имя exe -> полный путь
+
+    @property
+    def version_key(self) -> Tuple[int, ...]:
+        return parse_version(self.version)
+
+    def get_display_name(self) -> str:
+        """Версия с разрядностью в формате диалога настроек: "8.3.25.1374 (x64)" """
+        arch_display = 'x64' if self.arch == 'x86_64' else 'x86'
+        return f"{self.version} ({arch_display})"
+
+
+class PlatformRegistry:
+    """
+    Индекс установленных платформ 1С с ленивым обновлением по mtime каталогов установки
+    """
+
+    # Не чаще одного stat() каталогов установки за этот интервал (секунды)
+    REFRESH_CHECK_INTERVAL = 2.0
+
+    def __init__(self, install_roots: Optional[List[Tuple[Path, str]]] = None):
+        """
+        Args:
+            install_roots: Список (каталог установки, разрядность). По умолчанию из config
+        """
+        self.install_roots = [
+            (Path(root), arch) for root, arch in (install_roots or PLATFORM_INSTALL_ROOTS)
+        ]
+        # Поколение индекса: увеличивается при каждом пересканировании
+        self.generation = 0
+        self._stamps = None
+        self._last_check = 0.0
+        self._installs: List[PlatformInstall] = []
+        self._exe_index: Dict[Tuple[str, str, str], Path] = {}
+        self._prefix_index: Dict[Tuple[Tuple[int, ...], str, str], Path] = {}
+        self._starters: List[Path] = []
+
+    # ------------------------------------------------------------------ #
+    #  Обновление индекса                                                  #
+    # ------------------------------------------------------------------ #
+
+    def _read_stamps(self) -> tuple:
+        """Снимает mtime каталогов установки (None — каталога нет)"""
+        stamps = []
+        for root, _ in self.install_roots:
+            try:
+                stamps.append(root.stat().st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def refresh(self, force: bool = False):
+        """
+        Пересканирует каталоги установки, если они изменились с прошлого обхода
+
+        Args:
+            force: Пересканировать без проверки mtime и интервала
+        """
+        now = time.monotonic()
+        if not force and self._stamps is not None and now - self._last_check < self.REFRESH_CHECK_INTERVAL:
+            return
+        self._last_check = now
+
+        stamps = self._read_stamps()
+        if not force and stamps == self._stamps:
+            return
+
+        self._scan()
+        self._stamps = stamps
+        self.generation += 1
+
+    def _scan(self):
+        """Полный обход каталогов установки"""
+        installs = []
+        exe_index = {}
+        starters = []
+
+        for root, arch in self.install_roots:
+            try:
+                entries = list(root.iterdir())
+            except OSError:
+                continue
+
+            starter = root / 'common' / STARTER_EXE
+            if starter.exists():
+                starters.append(starter)
+
+            for entry in entries:
+                if not parse_version(entry.name) or not entry.is_dir():
+                    continue
+
+                bin_dir = entry / 'bin'
+                install = PlatformInstall(version=entry.name, arch=arch, bin_dir=bin_dir)
+                for exe_name in (THICK_CLIENT_EXE, THIN_CLIENT_EXE):
+                    exe_path = bin_dir / exe_name
+                    if exe_path.exists():
+                        install.executables[exe_name] = exe_path
+                        exe_index[(entry.name, arch, exe_name)] = exe_path
+
+                if install.executables:
+                    installs.append(install)
+
+        # Новые версии первыми; при равной версии x64 раньше x86
+        installs.sort(key=lambda i: (i.version_key, i.arch == 'x86_64'), reverse=True)
+
+        # Индекс "префикс версии -> самая новая версия с этим префиксом":
+        # (), (8,), (8, 3), (8, 3, 25), (8, 3, 25, 1374). Т.к. список отсортирован
+        # от новых к старым, первая запись для префикса — самая свежая.
+        prefix_index = {}
+        for install in installs:
+            key = install.version_key
+            for exe_name, exe_path in install.executables.items():
+                for length in range(len(key) + 1):
+                    prefix_index.setdefault((key[:length], install.arch, exe_name), exe_path)
+
+        self._installs = installs
+        self._exe_index = exe_index
+        self._prefix_index = prefix_index
+        self._starters = starters
+
+    # ------------------------------------------------------------------ #
+    #  Запросы                                                             #
+    # ------------------------------------------------------------------ #
+
+    def get_executable(self, version: str, arch: Optional[str], client_type: Optional[str] = 'thick') -> Optional[Path]:
+        """
+        Возвращает путь к исполняемому файлу установленной версии
+
+        Args:
+            version: Точная версия платформы, например "8.3.25.1374"
+            arch: Разрядность ('x86' или 'x86_64'), None трактуется как 'x86'
+            client_type: 'thin' (1cv8c.exe) или 'thick' (1cv8.exe)
+
+        Returns:
+            Path к исполняемому файлу или None, если версия не установлена
+        """
+        self.refresh()
+        return self._exe_index.get((version, arch or 'x86', exe_name_for(client_type)))
+
+    def find_latest(self, prefix: Tuple[int, ...], arch: Optional[str], client_type: Optional[str] = 'thick') -> Optional[Path]:
+        """
+        Возвращает исполняемый файл самой новой версии, начинающейся с prefix
+
+        Args:
+            prefix: Префикс версии в виде кортежа: (8, 3, 25) — "последняя 8.3.25.x",
+                    () — "последняя установленная"
+            arch: Разрядность ('x86' или 'x86_64'), None трактуется как 'x86'
+            client_type: 'thin' (1cv8c.exe) или 'thick' (1cv8.exe)
+        """
+        self.refresh()
+        return self._prefix_index.get((tuple(prefix), arch or 'x86', exe_name_for(client_type)))
+
+    def get_installs(self, arch: Optional[str] = None) -> List[PlatformInstall]:
+        """
+        Возвращает установленные версии, отсортированные от новых к старым (численно)
+
+        Args:
+            arch: Фильтр по разрядности, None — все
+        """
+        self.refresh()
+        if arch is None:
+            return list(self._installs)
+        return [install for install in self._installs if install.arch == arch]
+
+    def get_installed_versions_display(self) -> List[str]:
+        """Список версий для выпадающего списка: "8.3.25.1374 (x64)", новые первыми"""
+        return [install.get_display_name() for install in self.get_installs()]
+
+    def get_starter(self) -> Optional[Path]:
+        """Возвращает путь к 1cestart.exe из каталога common (если установлен)"""
+        self.refresh()
+        return self._starters[0] if self._starters else None
+
+
+_registry: Optional[PlatformRegistry] = None
+
+
+def get_platform_registry() -> PlatformRegistry:
+    """Возвращает общий для приложения экземпляр реестра платформ"""
+    global _registry
+    if _registry is None:
+        _registry = PlatformRegistry()
+    return _registry
@@ -0,0 +1,283 @@
+"""
+Прогрев платформы 1С перед запуском базы (необязательный режим, без зависимости от Qt).
+
+Пока курсор стоит на базе, файлы, которые клиент прочитает при старте, заранее
+читаются в страничный кэш ОС: каталог bin платформы (исполняемый файл, DLL)
+и кэш базы (программный и пользовательский, см. cache_cleaner). Процесс 1С
+не запускается — холодный старт после прогрева берет эти файлы из памяти.
+
+Прогревается не каждая база под курсором, а только вероятная к запуску:
+рейтинг frecency (services/frecency.py) усиливается, если базу обычно
+запускают в этот час (по истории launch_metrics).
+
+Чтение ограничено бюджетом ввода-вывода: скорость (ведро токенов, общее для
+всех прогревов) и объем на одну базу. Прогретые файлы (путь + stat) не
+перечитываются PREWARM_TTL секунд. Файлы читаются блоками в один переиспользуемый
+буфер; смена базы под курсором прерывает прогрев между блоками.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    PREWARM_IO_RATE_MB, PREWARM_MAX_MB_PER_BASE, PREWARM_MIN_SCORE, PREWARM_TTL,
+)
+from services.cache_cleaner import program_cache_path, user_cache_path
+from services.tree_snapshot import stat_key
+
+
+MB = 1024 * 1024
+CHUNK_SIZE = MB
+
+# Сколько последних запусков учитывается в распределении по часам
+HISTORY_LIMIT = 5000
+
+# Во сколько раз сильнее рейтинг базы, которую запускают только в этот час
+HOUR_BOOST = 2.0
+
+
+# --------------------------------------------------------------------------- #
+#  Что прогревать                                                              #
+# --------------------------------------------------------------------------- #
+
+def _walk_files(root: Path) -> List[Path]:
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        files.extend(Path(dirpath) / name for name in sorted(filenames))
+    return files
+
+
+def prewarm_targets(executable: Optional[Path], database) -> List[Path]:
+    """
+    Файлы для прогрева в порядке чтения клиентом
+
+    Args:
+        executable: Исполняемый файл платформы (resolve_executable); None — только кэш базы
+        database: Объект Database1C
+
+    Returns:
+        Исполняемый файл, остальные файлы его каталога bin, файлы кэшей базы
+    """
+    files = []
+    if executable is not None:
+        executable = Path(executable)
+        files.append(executable)
+        try:
+            files.extend(sorted(
+                entry for entry in executable.parent.iterdir()
+                if entry != executable and entry.is_file()
+            ))
+        except OSError:
+            pass
+    for cache_dir in (program_cache_path(database), user_cache_path(database)):
+        if cache_dir.is_dir():
+            files.extend(_walk_files(cache_dir))
+    return files
+
+
+# --------------------------------------------------------------------------- #
+#  Какую базу прогревать                                                       #
+# --------------------------------------------------------------------------- #
+
+class LaunchPredictor:
+    """
+    Вероятность запуска базы: рейтинг frecency с поправкой на время суток
+    """
+
+    def __init__(self, store, records: Iterable[dict] = ()):
+        """
+        Args:
+            store: FrecencyStore
+            records: Записи LaunchMetricsLog.read() (нужны base_id и started_at)
+        """
+        self.store = store
+        # id базы -> число запусков по часам суток (местное время)
+        self._hours: Dict[str, List[int]] = {}
+        for record in records:
+            base_id, started_at = record.get('base_id'), record.get('started_at')
+            if base_id and started_at:
+                hours = self._hours.setdefault(base_id, [0] * 24)
+                hours[time.localtime(started_at).tm_hour] += 1
+
+    def hour_share(self, base_id: str, now: Optional[float] = None) -> float:
+        """Доля запусков базы в этот час (соседние часы — с весом 0.5), 0..1"""
+        hours = self._hours.get(base_id)
+        if not hours:
+            return 0.0
+        hour = time.localtime(now).tm_hour
+        near = hours[hour] + 0.5 * (hours[(hour - 1) % 24] + hours[(hour + 1) % 24])
+        return near / sum(hours)
+
+    def score(self, base_id: str, now: Optional[float] = None) -> float:
+        """Рейтинг базы сейчас: frecency * (1 + HOUR_BOOST * доля запусков в этот час)"""
+        now = time.time() if now is None else now
+        return self.store.score(base_id, now) * (1 + HOUR_BOOST * self.hour_share(base_id, now))
+
+    def is_likely(self, base_id: str, now: Optional[float] = None) -> bool:
+        return self.score(base_id, now) >= PREWARM_MIN_SCORE
+
+
+# --------------------------------------------------------------------------- #
+#  Чтение с бюджетом                                                           #
+# --------------------------------------------------------------------------- #
+
+class IoBudget:
+    """
+    Ведро токенов: в среднем не больше rate байт/с, всплеск до burst байт
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: int) -> float:
+        """Списывает amount (можно в долг). Returns: сколько секунд ждать до погашения долга"""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def consume(self, amount: int, cancel: Optional[threading.Event] = None) -> bool:
+        """Ждет, пока бюджет позволит прочитать amount байт. Returns: False — прогрев отменен"""
+        wait = self._reserve(amount)
+        if wait <= 0:
+            return not (cancel and cancel.is_set())
+        if cancel is None:
+            time.sleep(wait)
+            return True
+        return not cancel.wait(wait)
+
+
+@dataclass
+class PrewarmResult:
+    """Итог прогрева одной базы"""
+    base_id: str = ''
+    files: int = 0
+    bytes_read: int = 0
+    # Файлы, прогретые раньше (в пределах PREWARM_TTL)
+    skipped: int = 0
+    seconds: float = 0.0
+    cancelled: bool = False
+    # Достигнут лимит объема на базу
+    truncated: bool = False
+
+
+class Prewarmer:
+    """
+    Прогрев файлов в фоне: одновременно не больше одного, новый отменяет предыдущий
+    """
+
+    def __init__(
+        self,
+        rate_mb: float = PREWARM_IO_RATE_MB,
+        max_mb: float = PREWARM_MAX_MB_PER_BASE,
+        ttl: float = PREWARM_TTL,
+    ):
+        self.budget = IoBudget(rate_mb * MB, burst=CHUNK_SIZE * 4)
+        self.max_bytes = int(max_mb * MB)
+        self.ttl = ttl
+        # Путь -> (stat файла, когда прогрет)
+        self._warm: Dict[Path, Tuple[Tuple[int, int], float]] = {}
+        self._warm_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+        # Прочитанное не используется: буфер общий, в том числе с отменяемым потоком
+        self._buffer = bytearray(CHUNK_SIZE)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _is_warm(self, path: Path, stat, now: float) -> bool:
+        with self._warm_lock:
+            entry = self._warm.get(path)
+        return entry is not None and entry[0] == stat and now - entry[1] < self.ttl
+
+    def _read_file(self, path: Path, limit: int, cancel: threading.Event) -> Tuple[int, bool]:
+        """Читает файл блоками (не больше limit байт). Returns: (прочитано байт, дочитан до конца)"""
+        done = 0
+        view = memoryview(self._buffer)
+        with open(path, 'rb', buffering=0) as f:
+            while done < limit:
+                if not self.budget.consume(CHUNK_SIZE, cancel):
+                    return done, False
+                n = f.readinto(view[:min(CHUNK_SIZE, limit - done)])
+                if not n:
+                    return done, True
+                done += n
+        return done, False
+
+    def warm_files(self, files: Iterable[Path], base_id: str = '',
+                   cancel: Optional[threading.Event] = None) -> PrewarmResult:
+        """Прогревает файлы синхронно в вызывающем потоке"""
+        cancel = cancel or threading.Event()
+        result = PrewarmResult(base_id=base_id)
+        started = time.perf_counter()
+        for path in files:
+            if cancel.is_set():
+                result.cancelled = True
+                break
+            left = self.max_bytes - result.bytes_read
+            if left <= 0:
+                result.truncated = True
+                break
+            stat = stat_key(path)
+            if stat is None:
+                continue
+            if self._is_warm(path, stat, time.monotonic()):
+                result.skipped += 1
+                continue
+            try:
+                done, complete = self._read_file(path, left, cancel)
+            except OSError:
+                continue
+            result.bytes_read += done
+            if complete:
+                result.files += 1
+                with self._warm_lock:
+                    self._warm[path] = (stat, time.monotonic())
+            elif cancel.is_set():
+                result.cancelled = True
+                break
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def start(self, base_id: str, files_func: Callable[[], List[Path]],
+              on_done: Optional[Callable[[PrewarmResult], None]] = None):
+        """
+        Прогрев в фоновом потоке (предыдущий отменяется)
+
+        Args:
+            files_func: Список файлов (вызывается в фоновом потоке: обход каталогов — тоже там)
+            on_done: Вызывается в фоновом потоке с PrewarmResult
+        """
+        self.cancel()
+        cancel = self._cancel = threading.Event()
+
+        def run():
+            try:
+                files = files_func()
+            except OSError:
+                files = []
+            result = self.warm_files(files, base_id, cancel)
+            if on_done:
+                on_done(result)
+
+        self._thread = threading.Thread(target=run, name='prewarm', daemon=True)
+        self._thread.start()
+
+    def cancel(self, wait: bool = False):
+        """Прерывает текущий прогрев (между блоками чтения)"""
+        self._cancel.set()
+        if wait and self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,173 @@
+"""
+Сопоставление запущенных процессов 1С с базами из ibases.v8i.
+
+PID запущенного лончером клиента записывается при обнаружении процесса
+(см. gui/launch_tracker.py). Клиенты, запущенные в обход лончера, распознаются
+по командной строке: параметр /S (сервер\\база) или /F (каталог файловой базы)
+сводится к ключу подключения и ищется в индексе строк Connect всех баз.
+
+Поиск базы по PID и PID по базе — обращение к словарю, O(1).
+Командная строка читается один раз на PID: и удачный, и неудачный результат
+запоминаются до завершения процесса.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from services.launch_command import parse_server_connect_string
+
+
+MODE_ENTERPRISE = 'ENTERPRISE'
+MODE_DESIGNER = 'DESIGNER'
+MODE_IR_TOOLS = 'IR_TOOLS'
+
+_FILE_RE = re.compile(r'File\s*=\s*"?([^;"]+)"?', re.IGNORECASE)
+# Значение ключа /S или /F: до следующего ключа (" /") или конца строки.
+# psutil отдает аргументы уже без кавычек, поэтому кавычки необязательны
+_SWITCH_RE = re.compile(r'(?:^|\s)/([SF])\s*"?(.+?)"?(?=\s+/|\s*$)', re.IGNORECASE)
+_MODE_RE = re.compile(r'(?:^|\s)(ENTERPRISE|DESIGNER)(?=\s|$)', re.IGNORECASE)
+_EXECUTE_RE = re.compile(r'(?:^|\s)/Execute', re.IGNORECASE)
+
+
+def _normalize_path(path: str) -> str:
+    return path.strip().replace('/', '\\').rstrip('\\').lower()
+
+
+def connection_key(connect: Optional[str]) -> str:
+    """
+    Ключ подключения: "srvr:сервер\\база" или "file:каталог" ('' если не распознан)
+
+    Принимает и строку Connect из ibases.v8i, и значение ключа /S командной строки.
+    """
+    connect = (connect or '').strip()
+    if not connect:
+        return ''
+    match = _FILE_RE.search(connect)
+    if match:
+        return 'file:' + _normalize_path(match.group(1))
+    server_ref = parse_server_connect_string(connect)
+    if '=' in server_ref or '\\' not in server_ref:
+        return ''
+    return 'srvr:' + server_ref.strip().strip(';').lower()
+
+
+def parse_command_line(command_line: str) -> Tuple[str, str]:
+    """
+    Ключ подключения и режим запуска из командной строки клиента 1С
+
+    Returns:
+        (ключ подключения или '', ENTERPRISE / DESIGNER / IR_TOOLS)
+    """
+    key = ''
+    for switch, value in _SWITCH_RE.findall(command_line or ''):
+        if switch.upper() == 'F':
+            key = 'file:' + _normalize_path(value)
+        else:
+            key = connection_key(value)
+        if key:
+            break
+
+    match = _MODE_RE.search(command_line or '')
+    mode = match.group(1).upper() if match else MODE_ENTERPRISE
+    # ИР-инструменты — предприятие с внешней обработкой (/Execute)
+    if mode == MODE_ENTERPRISE and _EXECUTE_RE.search(command_line or ''):
+        mode = MODE_IR_TOOLS
+    return key, mode
+
+
+class ProcessBaseIndex:
+    """
+    Таблица PID -> (ID базы, режим) и обратная ей ID базы -> PID
+    """
+
+    def __init__(self):
+        # ключ подключения -> ID базы (первая из дублирующихся)
+        self._by_key: Dict[str, str] = {}
+        self._by_pid: Dict[int, Tuple[str, str]] = {}
+        self._by_base: Dict[str, Set[int]] = {}
+        # PID, командная строка которых не указала ни на одну базу
+        self._unresolved: Set[int] = set()
+
+    def rebuild(self, bases: Iterable):
+        """Перестраивает индекс строк подключения (после загрузки ibases.v8i)"""
+        by_key = {}
+        for base in bases:
+            key = connection_key(base.connect)
+            if key and key not in by_key:
+                by_key[key] = base.id
+        self._by_key = by_key
+        # Нераспознанные раньше процессы могли относиться к только что добавленным базам
+        self._unresolved.clear()
+
+    def record(self, pid: int, base_id: str, mode: str = MODE_ENTERPRISE):
+        """Запоминает базу процесса (вызывается при запуске из лончера)"""
+        self.forget(pid)
+        self._by_pid[pid] = (base_id, mode)
+        self._by_base.setdefault(base_id, set()).add(pid)
+
+    def forget(self, pid: int):
+        """Убирает завершившийся процесс"""
+        self._unresolved.discard(pid)
+        entry = self._by_pid.pop(pid, None)
+        if entry:
+            pids = self._by_base.get(entry[0])
+            if pids is not None:
+                pids.discard(pid)
+                if not pids:
+                    del self._by_base[entry[0]]
+
+    def resolve(self, pid: int, command_line: str) -> Optional[str]:
+        """Определяет базу процесса по командной строке. Returns: ID базы или None"""
+        key, mode = parse_command_line(command_line)
+        base_id = self._by_key.get(key) if key else None
+        if base_id is None:
+            self._unresolved.add(pid)
+            return None
+        self.record(pid, base_id, mode)
+        return base_id
+
+    def sync(self, pids: Iterable[int], command_line: Callable[[int], str]):
+        """
+        Приводит индекс к набору живых процессов
+
+        Args:
+            pids: PID запущенных процессов 1С
+            command_line: Функция pid -> командная строка (вызывается только для новых PID)
+        """
+        alive = set(pids)
+        for pid in [pid for pid in self._by_pid if pid not in alive]:
+            self.forget(pid)
+        self._unresolved &= alive
+        for pid in alive:
+            if pid not in self._by_pid and pid not in self._unresolved:
+                self.resolve(pid, command_line(pid))
+
+    def base_for_pid(self, pid: int) -> Optional[str]:
+        entry = self._by_pid.get(pid)
+        return entry[0] if entry else None
+
+    def mode_for_pid(self, pid: int) -> Optional[str]:
+        entry = self._by_pid.get(pid)
+        return entry[1] if entry else None
+
+    def pids_for_base(self, base_id: str, mode: Optional[str] = None) -> List[int]:
+        """PID клиентов базы (только режима mode, если он указан)"""
+        pids = self._by_base.get(base_id, ())
+        if mode is None:
+            return sorted(pids)
+        return sorted(pid for pid in pids if self._by_pid[pid][1] == mode)
+
+    def open_base_ids(self) -> Set[str]:
+        """ID баз, у которых есть запущенные клиенты"""
+        return set(self._by_base)
+
+
+_index: Optional[ProcessBaseIndex] = None
+
+
+def get_process_index() -> ProcessBaseIndex:
+    """Возвращает общий для приложения экземпляр ProcessBaseIndex"""
+    global _index
+    if _index is None:
+        _index = ProcessBaseIndex()
+    return _index
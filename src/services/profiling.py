@@ -0,0 +1,177 @@
+"""
+Замеры горячих путей и профилировщик по требованию.
+
+Горячие пути (чтение ibases.v8i, построение дерева, сканирование процессов …)
+размечаются декоратором @hot_path("имя") или контекстом measure("имя").
+Длительности складываются в кольцевой буфер последних HOT_PATH_BUFFER_SIZE
+замеров; сводка по нему показывает, что именно тормозит на конкретной машине.
+
+Когда замеры выключены (HOT_PATH_TIMINGS = False), декоратор стоит одну
+проверку флага на вызов. cProfile и tracemalloc включаются только вручную
+(ProfilerSession) и пишут результат в PROFILE_DIR.
+"""
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import HOT_PATH_TIMINGS, HOT_PATH_BUFFER_SIZE, PROFILE_DIR
+
+
+class HotPathRecorder:
+    """
+    Кольцевой буфер замеров (имя, начало, длительность в мс)
+    """
+
+    def __init__(self, size: int = HOT_PATH_BUFFER_SIZE, enabled: bool = HOT_PATH_TIMINGS):
+        self.enabled = enabled
+        self._samples: deque = deque(maxlen=size)
+
+    def record(self, name: str, started: float, duration_ms: float):
+        self._samples.append((name, started, duration_ms))
+
+    def clear(self):
+        self._samples.clear()
+
+    def samples(self) -> List[Tuple[str, float, float]]:
+        return list(self._samples)
+
+    def summary(self) -> Dict[str, dict]:
+        """Сводка по именам: count, last, median, p95, max, total (мс)"""
+        grouped: Dict[str, List[float]] = {}
+        last: Dict[str, float] = {}
+        for name, _, duration in self._samples:
+            grouped.setdefault(name, []).append(duration)
+            last[name] = duration
+
+        result = {}
+        for name, values in grouped.items():
+            values.sort()
+            count = len(values)
+            result[name] = {
+                'count': count,
+                'last': last[name],
+                'median': values[count // 2],
+                'p95': values[min(count - 1, int(count * 0.95))],
+                'max': values[-1],
+                'total': sum(values),
+            }
+        return result
+
+    def format_summary(self) -> str:
+        """Сводка текстом (самые затратные суммарно — первыми)"""
+        summary = self.summary()
+        if not summary:
+            return "Замеров горячих путей нет"
+        lines = [f"{'путь':32} {'вызовов':>8} {'посл.':>9} {'медиана':>9} {'p95':>9} {'макс':>9} {'всего':>10}"]
+        for name, s in sorted(summary.items(), key=lambda item: -item[1]['total']):
+            lines.append(
+                f"{name:32} {s['count']:>8} {s['last']:>9.1f} {s['median']:>9.1f} "
+                f"{s['p95']:>9.1f} {s['max']:>9.1f} {s['total']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+_recorder = HotPathRecorder()
+
+
+def get_recorder() -> HotPathRecorder:
+    """Общий для приложения буфер замеров"""
+    return _recorder
+
+
+def hot_path(name: str):
+    """Декоратор: замеряет длительность вызова функции под именем name"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if not recorder.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.record(name, started, (time.perf_counter() - started) * 1000)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def measure(name: str):
+    """Контекст: замеряет длительность блока под именем name"""
+    recorder = _recorder
+    if not recorder.enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.record(name, started, (time.perf_counter() - started) * 1000)
+
+
+class ProfilerSession:
+    """
+    Захват cProfile + tracemalloc между start() и stop()
+    """
+
+    # Сколько строк tracemalloc сохранять в отчет
+    TOP_ALLOCATIONS = 30
+
+    def __init__(self, output_dir: Path = PROFILE_DIR):
+        self.output_dir = Path(output_dir)
+        self._profiler = None
+        self._started_tracemalloc = False
+
+    @property
+    def active(self) -> bool:
+        return self._profiler is not None
+
+    def start(self):
+        """Начинает захват"""
+        import cProfile
+        import tracemalloc
+
+        if self.active:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self) -> Optional[Tuple[Path, Path]]:
+        """
+        Останавливает захват и сохраняет результат
+
+        Returns:
+            (путь к .prof, путь к отчету по памяти) или None, если захват не шел
+        """
+        import tracemalloc
+
+        if not self.active:
+            return None
+        self._profiler.disable()
+        profiler, self._profiler = self._profiler, None
+
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        prof_path = self.output_dir / f"launcher-{stamp}.prof"
+        memory_path = self.output_dir / f"launcher-{stamp}-memory.txt"
+        profiler.dump_stats(str(prof_path))
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        lines = [f"Текущая память: {current / 1024:.0f} КБ, пик: {peak / 1024:.0f} КБ", ""]
+        lines += [str(stat) for stat in snapshot.statistics('lineno')[:self.TOP_ALLOCATIONS]]
+        lines += ["", "Горячие пути:", get_recorder().format_summary()]
+        memory_path.write_text("\n".join(lines), encoding='utf-8')
+        return prof_path, memory_path
@@ -0,0 +1,307 @@
+"""
+Индекс нечеткого поиска по базам 1С.
+
+Для каждой базы индексируются имя, папка, Ref/File из строки подключения и версия.
+Тексты нормализуются (регистр, ё -> е, знаки препинания -> пробел) и раскладываются
+на триграммы с границами слов: "бух" -> " бу", "бух", "ух ".
+Постинги триграмм — множества номеров документов.
+
+Запрос раскладывается на триграммы так же; кандидаты — документы, в которых
+совпала достаточная доля триграмм запроса (опечатки и перестановки допускаются).
+Итоговый ранг учитывает долю совпавших триграмм, точное вхождение слов запроса
+(в имени — весомее) и давность последнего запуска (last_run_time).
+
+Индекс обновляется инкрементально: sync() сравнивает подпись каждой базы
+(ID + индексируемые поля) и переиндексирует только добавленные/измененные.
+"""
+
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+
+_NON_WORD_RE = re.compile(r'[^\w]+')
+_REF_RE = re.compile(r'(?i)(?:Ref|File)\s*=\s*"?([^;"]+)"?')
+_EMPTY = frozenset()
+
+
+def normalize(text: Optional[str]) -> str:
+    """Приводит текст к виду для поиска: нижний регистр, ё -> е, слова через пробел"""
+    if not text:
+        return ''
+    text = text.casefold().replace('ё', 'е').replace('_', ' ')
+    return _NON_WORD_RE.sub(' ', text).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Триграммы нормализованного текста с границами слов"""
+    return {
+        padded[i:i + 3]
+        for padded in [f" {word} " for word in text.split()]
+        for i in range(len(padded) - 2)
+    }
+
+
+def index_grams(text: str) -> Set[str]:
+    """Ключи постингов документа: триграммы и первая буква каждого слова (" x")"""
+    grams = trigrams(text)
+    grams.update(' ' + word[0] for word in text.split())
+    return grams
+
+
+def extract_ref(connect: Optional[str]) -> str:
+    """Имя базы на сервере (Ref) или путь файловой базы (File) из строки подключения"""
+    match = _REF_RE.search(connect or '')
+    return match.group(1) if match else ''
+
+
+class _Document:
+    """Проиндексированная база"""
+    __slots__ = ('base', 'signature', 'name', 'padded_name', 'text', 'grams', 'last_run', 'recency')
+
+    def __init__(self, base, signature):
+        self.base = base
+        self.signature = signature
+        self.name = normalize(base.name)
+        self.padded_name = f" {self.name} "
+        self.text = ' '.join(filter(None, (
+            self.name,
+            normalize(base.folder),
+            normalize(extract_ref(base.connect)),
+            normalize(base.version),
+        )))
+        self.grams = index_grams(self.text)
+        self.last_run = base.last_run_time.timestamp() if base.last_run_time else 0.0
+        self.recency = 0.0
+
+
+class SearchIndex:
+    """
+    Триграммный индекс баз с инкрементальным обновлением и ранжированием по давности
+    """
+
+    # Сколько результатов возвращать по умолчанию
+    RESULTS_LIMIT = 50
+    # Минимальная доля триграмм запроса, которая должна совпасть
+    MIN_GRAM_RATIO = 0.6
+    # Вклад давности запуска: RECENCY_WEIGHT * 0.5 ** (возраст / период полураспада)
+    RECENCY_WEIGHT = 0.5
+    RECENCY_HALF_LIFE_DAYS = 14.0
+    # Бонусы за вхождение слова запроса в имя (подстрока / начало слова / слово целиком)
+    # и в любое другое поле
+    NAME_MATCH_BONUS = 1.0
+    NAME_PREFIX_BONUS = 0.5
+    NAME_WORD_BONUS = 0.25
+    TEXT_MATCH_BONUS = 0.3
+    # Больше стольких кандидатов точно не ранжируются (см. search)
+    MAX_SCORED = 500
+
+    def __init__(self):
+        self._docs: Dict[int, _Document] = {}
+        self._slot_by_id: Dict[str, int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._next_slot = 0
+        self._recency_time: Optional[float] = None
+        # Номера документов по убыванию давности запуска (строится лениво)
+        self._order: Optional[List[int]] = None
+
+    def __len__(self):
+        return len(self._docs)
+
+    @staticmethod
+    def signature(base) -> tuple:
+        """Подпись базы: при ее изменении документ переиндексируется"""
+        return (base.name, base.folder, base.connect, base.version, base.last_run_time)
+
+    # ------------------------------------------------------------------ #
+    #  Обновление                                                          #
+    # ------------------------------------------------------------------ #
+
+    def sync(self, bases) -> int:
+        """
+        Приводит индекс в соответствие списку баз
+
+        Returns:
+            Количество добавленных, измененных и удаленных документов
+        """
+        changed = 0
+        seen = set()
+        for base in bases:
+            seen.add(base.id)
+            slot = self._slot_by_id.get(base.id)
+            signature = self.signature(base)
+            if slot is not None:
+                doc = self._docs[slot]
+                if doc.signature == signature:
+                    # Объект базы мог быть пересоздан при перечитывании файла
+                    doc.base = base
+                    continue
+                self._remove_slot(slot)
+            self._add(base, signature)
+            changed += 1
+
+        for base_id in [base_id for base_id in self._slot_by_id if base_id not in seen]:
+            self._remove_slot(self._slot_by_id[base_id])
+            changed += 1
+
+        if changed:
+            # Давность и порядок считаются здесь, чтобы не тратить на них первое нажатие
+            self._refresh_recency(time.time(), force=True)
+            self._build_order()
+        return changed
+
+    def _add(self, base, signature):
+        self._order = None
+        slot = self._next_slot
+        self._next_slot += 1
+        doc = _Document(base, signature)
+        if self._recency_time is not None:
+            doc.recency = self._recency_for(doc.last_run, self._recency_time)
+        self._docs[slot] = doc
+        self._slot_by_id[base.id] = slot
+        postings = self._postings
+        for gram in doc.grams:
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = {slot}
+            else:
+                posting.add(slot)
+
+    def _remove_slot(self, slot):
+        self._order = None
+        doc = self._docs.pop(slot)
+        if self._slot_by_id.get(doc.base.id) == slot:
+            del self._slot_by_id[doc.base.id]
+        for gram in doc.grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(slot)
+                if not posting:
+                    del self._postings[gram]
+
+    # ------------------------------------------------------------------ #
+    #  Поиск                                                               #
+    # ------------------------------------------------------------------ #
+
+    def search(self, query: str, limit: Optional[int] = None, now: Optional[float] = None) -> List[Tuple[object, float]]:
+        """
+        Ищет базы по запросу
+
+        Args:
+            query: Строка запроса (несколько слов — все должны найтись)
+            limit: Максимум результатов (по умолчанию RESULTS_LIMIT)
+            now: Текущее время (timestamp) для расчета давности
+
+        Returns:
+            Список (Database1C, ранг), лучшие первыми
+        """
+        words = normalize(query).split()
+        if not words:
+            return []
+        limit = limit or self.RESULTS_LIMIT
+        self._refresh_recency(time.time() if now is None else now)
+
+        candidates = self._find_candidates(words, limit)
+        if len(candidates) > self.MAX_SCORED:
+            # Совпадений слишком много (короткий запрос): точный ранг считаем
+            # только для недавно запускавшихся кандидатов
+            candidates = self._take_by_recency(candidates)
+
+        docs = self._docs
+        name_bonus = self.NAME_MATCH_BONUS
+        prefix_bonus = self.NAME_PREFIX_BONUS
+        word_bonus = self.NAME_WORD_BONUS
+        text_bonus = self.TEXT_MATCH_BONUS
+        spaced_words = [(word, ' ' + word, f" {word} ") for word in words]
+        scored = []
+        append = scored.append
+        for slot, score in candidates.items():
+            doc = docs[slot]
+            name = doc.padded_name
+            for word, prefix, whole in spaced_words:
+                if word in name:
+                    score += name_bonus
+                    if prefix in name:
+                        score += prefix_bonus
+                        if whole in name:
+                            score += word_bonus
+                elif word in doc.text:
+                    score += text_bonus
+            append((score + doc.recency, -slot, doc.base))
+
+        best = heapq.nlargest(limit, scored)
+        return [(base, score) for score, _, base in best]
+
+    def _find_candidates(self, words: List[str], limit: int) -> Dict[int, float]:
+        """Документы-кандидаты с долей совпавших триграмм запроса"""
+        postings = self._postings
+
+        # Короткие слова (1-2 символа) не дают полноценных триграмм — они фильтруют
+        # по началу слова (постинг " x" / " xy"), длинные ищутся по триграммам
+        short_filter = None
+        for word in words:
+            if len(word) < 3:
+                posting = postings.get(' ' + word, _EMPTY)
+                short_filter = posting if short_filter is None else short_filter & posting
+
+        long_words = [word for word in words if len(word) >= 3]
+        if not long_words:
+            return dict.fromkeys(short_filter, 1.0)
+
+        query_grams = trigrams(' '.join(long_words))
+        gram_postings = [postings.get(gram, _EMPTY) for gram in query_grams]
+        if short_filter is not None:
+            gram_postings.append(short_filter)
+
+        # Сначала точное совпадение всех триграмм — пересечение множеств
+        # выполняется целиком в C; нечеткий подсчет нужен, только если его мало
+        gram_postings.sort(key=len)
+        exact = gram_postings[0].intersection(*gram_postings[1:])
+        if len(exact) >= limit:
+            return dict.fromkeys(exact, 1.0)
+
+        counts = Counter()
+        for gram in query_grams:
+            posting = postings.get(gram)
+            if posting:
+                counts.update(posting)
+        total = len(query_grams)
+        threshold = max(1, math.ceil(total * self.MIN_GRAM_RATIO))
+        return {
+            slot: count / total for slot, count in counts.items()
+            if count >= threshold and (short_filter is None or slot in short_filter)
+        }
+
+    def _take_by_recency(self, candidates: Dict[int, float]) -> Dict[int, float]:
+        """Оставляет MAX_SCORED кандидатов, запускавшихся последними"""
+        if self._order is None:
+            self._build_order()
+        taken = {}
+        for slot in self._order:
+            if slot in candidates:
+                taken[slot] = candidates[slot]
+                if len(taken) >= self.MAX_SCORED:
+                    break
+        return taken
+
+    def _build_order(self):
+        docs = self._docs
+        self._order = sorted(docs, key=lambda slot: (-docs[slot].recency, slot))
+
+    def _refresh_recency(self, now: float, force: bool = False):
+        """Пересчитывает вклад давности запуска, если с прошлого расчета прошло больше часа"""
+        if not force and self._recency_time is not None and abs(now - self._recency_time) < 3600:
+            return
+        self._recency_time = now
+        self._order = None
+        for doc in self._docs.values():
+            doc.recency = self._recency_for(doc.last_run, now)
+
+    def _recency_for(self, last_run: float, now: float) -> float:
+        if not last_run:
+            return 0.0
+        age = max(0.0, now - last_run)
+        return self.RECENCY_WEIGHT * 0.5 ** (age / (self.RECENCY_HALF_LIFE_DAYS * 86400.0))
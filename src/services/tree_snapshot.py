@@ -0,0 +1,182 @@
+"""
+Снимок дерева баз для мгновенной первой отрисовки.
+
+При выходе лончер сохраняет компактный бинарный снимок: разобранный список
+Database1C, развернутые папки и последнюю выбранную базу. Снимок привязан
+к mtime и размеру ibases.v8i: при старте, если файл не менялся, дерево строится
+из снимка без разбора ibases.v8i; иначе снимок считается устаревшим.
+
+Формат файла:
+    заголовок (MAGIC, версия формата, mtime_ns и размер ibases.v8i, длина и CRC32 данных)
+    + zlib(pickle) с кортежами значений полей (только примитивы и datetime).
+Снимок с другой версией формата, неверной CRC или обрезанный — игнорируется.
+
+Пароли (credential_vault.SECRET_FIELDS) в строки снимка не попадают: у личных баз
+они в хранилище паролей, у баз общих списков — в самом списке, который после старта
+из снимка дочитывается в фоне (до этого у таких баз пароля нет). Если пароль остался
+в полях личной базы (хранилище было недоступно), снимок не пишется: старт из него
+потерял бы пароль, а следующая запись ibases.v8i — стерла бы. Пароли в общих списках
+лончер изменить не может, поэтому на снимок они не влияют.
+"""
+
+import io
+import os
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from models.database import Database1C
+from services.credential_vault import SECRET_FIELDS
+
+
+MAGIC = b'1CLS'
+FORMAT_VERSION = 2  # 2 — без полей паролей
+
+# magic, версия формата, mtime_ns источника, размер источника, длина данных, crc32 данных
+_HEADER = struct.Struct('<4sHqqII')
+
+_FIELD_NAMES = tuple(f.name for f in fields(Database1C) if f.name not in SECRET_FIELDS)
+# Поля паролей у баз из снимка пустые
+_NO_SECRETS = tuple((name, None) for name in SECRET_FIELDS)
+
+
+def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """Возвращает (mtime_ns, size) файла или None, если файла нет"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass
+class TreeSnapshot:
+    """Содержимое снимка дерева"""
+    bases: List[Database1C]
+    expanded_folders: List[str] = field(default_factory=list)  # пути развернутых папок
+    selected_id: Optional[str] = None  # ID выбранной базы
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Разрешает только datetime — снимок не может создать произвольные объекты"""
+
+    def find_class(self, module, name):
+        if module == 'datetime' and name == 'datetime':
+            from datetime import datetime
+            return datetime
+        raise pickle.UnpicklingError(f"Недопустимый тип в снимке: {module}.{name}")
+
+
+class TreeSnapshotStore:
+    """Чтение и запись снимка дерева"""
+
+    def __init__(self, snapshot_path: Path, source_path: Path):
+        """
+        Args:
+            snapshot_path: Путь к файлу снимка
+            source_path: Путь к ibases.v8i, по которому проверяется актуальность
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.source_path = Path(source_path)
+
+    def save(self, snapshot: TreeSnapshot, source_stat: Optional[Tuple[int, int]]) -> bool:
+        """
+        Сохраняет снимок
+
+        Args:
+            snapshot: Данные снимка
+            source_stat: (mtime_ns, size) ibases.v8i, которому соответствуют snapshot.bases
+
+        Returns:
+            True если снимок записан
+        """
+        if source_stat is None:
+            return False
+        if any(getattr(base, name) for base in snapshot.bases if base.is_local() for name in SECRET_FIELDS):
+            print("⚠️ В ibases.v8i есть пароли вне хранилища паролей — снимок дерева не сохранен")
+            # Прежний снимок (возможно, старого формата с паролями) тоже не нужен
+            try:
+                self.snapshot_path.unlink()
+            except OSError:
+                pass
+            return False
+
+        payload = {
+            'fields': _FIELD_NAMES,
+            'rows': [tuple(getattr(base, name) for name in _FIELD_NAMES) for base in snapshot.bases],
+            'expanded_folders': list(snapshot.expanded_folders),
+            'selected_id': snapshot.selected_id,
+        }
+        data = zlib.compress(pickle.dumps(payload, protocol=4), 1)
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, source_stat[0], source_stat[1], len(data), zlib.crc32(data)
+        )
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                f.write(data)
+            os.replace(tmp_path, self.snapshot_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить снимок дерева: {e}")
+            return False
+
+    def load(self) -> Optional[TreeSnapshot]:
+        """
+        Загружает снимок, если он актуален для текущего ibases.v8i
+
+        Returns:
+            TreeSnapshot или None (снимка нет, он устарел или поврежден)
+        """
+        source_stat = stat_key(self.source_path)
+        if source_stat is None:
+            return None
+
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                header = f.read(_HEADER.size)
+                if len(header) != _HEADER.size:
+                    return None
+                magic, version, mtime_ns, size, length, crc = _HEADER.unpack(header)
+                if magic != MAGIC or version != FORMAT_VERSION:
+                    return None
+                if (mtime_ns, size) != source_stat:
+                    return None
+                data = f.read(length)
+        except OSError:
+            return None
+
+        if len(data) != length or zlib.crc32(data) != crc:
+            print("⚠️ Снимок дерева поврежден — будет выполнен полный разбор ibases.v8i")
+            return None
+
+        try:
+            payload = _SnapshotUnpickler(io.BytesIO(zlib.decompress(data))).load()
+            names = tuple(payload['fields'])
+            if names == _FIELD_NAMES:
+                # Набор полей совпадает: заполняем __dict__ напрямую, минуя __init__ —
+                # это в разы быстрее конструктора с именованными аргументами
+                bases = []
+                for row in payload['rows']:
+                    base = object.__new__(Database1C)
+                    base.__dict__.update(zip(names, row))
+                    base.__dict__.update(_NO_SECRETS)
+                    bases.append(base)
+            else:
+                # Поля паролей не восстанавливаются, даже если они есть в снимке
+                known = [(i, name) for i, name in enumerate(names) if name in _FIELD_NAMES]
+                bases = [Database1C(**{name: row[i] for i, name in known}) for row in payload['rows']]
+            return TreeSnapshot(
+                bases=bases,
+                expanded_folders=list(payload.get('expanded_folders', [])),
+                selected_id=payload.get('selected_id'),
+            )
+        except Exception as e:
+            print(f"⚠️ Не удалось прочитать снимок дерева: {e}")
+            return None
@@ -0,0 +1,149 @@
+"""
+Выбор версии платформы 1С для базы по политике версий.
+
+Политики (поле Database1C.version_policy):
+- exact  — точная версия из Version (по умолчанию)
+- branch — последняя установленная версия ветки Version (8.3.25.x для 8.3.25.1374)
+- latest — последняя установленная версия
+
+Дополнительно база может задать упорядоченный список резервных версий
+(Database1C.version_fallbacks, через ';'): точные версии ("8.3.24.1500"),
+ветки ("8.3.25", "8.3") или "latest".
+
+Для политик branch и latest цепочку завершает неявный хвост: ветка версии
+базы, затем последняя установленная версия. Так запуск идет сразу в нужный
+1cv8.exe / 1cv8c.exe без промежуточного 1cestart.exe. Политика exact хвоста
+не имеет: только версия базы и явно заданные резервные версии; если ни одна
+не установлена, версия не разрешается (запуск через стартер).
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from services.platform_registry import PlatformRegistry, get_platform_registry, parse_version
+
+
+POLICY_EXACT = 'exact'
+POLICY_BRANCH = 'branch'
+POLICY_LATEST = 'latest'
+
+VERSION_POLICIES = (POLICY_EXACT, POLICY_BRANCH, POLICY_LATEST)
+
+# Длина префикса ветки: 8.3.25 из 8.3.25.1374
+BRANCH_LENGTH = 3
+
+
+def parse_fallbacks(value: Optional[str]) -> List[str]:
+    """Разбирает строку резервных версий "8.3.25;latest" в список"""
+    if not value:
+        return []
+    return [part.strip() for part in value.replace(',', ';').split(';') if part.strip()]
+
+
+class VersionResolver:
+    """
+    Разрешает версию платформы для базы с кэшированием результата по базе
+    """
+
+    def __init__(self, registry: Optional[PlatformRegistry] = None):
+        self.registry = registry or get_platform_registry()
+        # (id базы, тип клиента) -> (ключ параметров, поколение реестра, результат)
+        self._cache: Dict[Tuple[str, str], Tuple[tuple, int, Optional[Path]]] = {}
+
+    def build_chain(self, database) -> List[Tuple[int, ...]]:
+        """
+        Формирует цепочку префиксов версий для поиска (в порядке приоритета)
+
+        Returns:
+            Список кортежей-префиксов; () означает "последняя установленная"
+        """
+        policy = (database.version_policy or POLICY_EXACT).lower()
+        version_key = parse_version(database.version or '')
+
+        chain = []
+        if policy == POLICY_LATEST or not version_key:
+            chain.append(())
+        elif policy == POLICY_BRANCH:
+            chain.append(version_key[:BRANCH_LENGTH])
+        else:
+            chain.append(version_key)
+
+        for spec in parse_fallbacks(database.version_fallbacks):
+            if spec.lower() == POLICY_LATEST:
+                chain.append(())
+            else:
+                spec_key = parse_version(spec)
+                if spec_key:
+                    chain.append(spec_key)
+
+        # Неявный хвост (кроме exact): ветка версии базы и последняя установленная
+        if policy != POLICY_EXACT or not version_key:
+            if version_key:
+                chain.append(version_key[:BRANCH_LENGTH])
+            chain.append(())
+
+        # Убираем дубли, сохраняя порядок
+        unique = []
+        for prefix in chain:
+            if prefix not in unique:
+                unique.append(prefix)
+        return unique
+
+    def resolve(self, database, client_type: Optional[str] = None) -> Optional[Path]:
+        """
+        Возвращает исполняемый файл платформы для базы
+
+        Args:
+            database: Объект Database1C
+            client_type: 'thin' / 'thick'; по умолчанию берется из базы
+
+        Returns:
+            Path к 1cv8.exe / 1cv8c.exe или None, если подходящих версий не установлено
+        """
+        client_type = client_type or database.client_type or 'thick'
+        arch = database.app_arch or 'x86'
+        cache_key = (database.id, client_type)
+        params = (
+            database.version,
+            arch,
+            database.version_policy,
+            database.version_fallbacks,
+        )
+
+        self.registry.refresh()
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] == params and cached[1] == self.registry.generation:
+            return cached[2]
+
+        other_arch = 'x86' if arch == 'x86_64' else 'x86_64'
+        result = None
+        for prefix in self.build_chain(database):
+            # Для клиент-серверных баз важнее совпадение версии, чем разрядности
+            result = (
+                self.registry.find_latest(prefix, arch, client_type)
+                or self.registry.find_latest(prefix, other_arch, client_type)
+            )
+            if result:
+                break
+
+        self._cache[cache_key] = (params, self.registry.generation, result)
+        return result
+
+    def invalidate(self, database_id: Optional[str] = None):
+        """Сбрасывает кэш разрешения для базы (или для всех баз)"""
+        if database_id is None:
+            self._cache.clear()
+        else:
+            for key in [key for key in self._cache if key[0] == database_id]:
+                del self._cache[key]
+
+
+_resolver: Optional[VersionResolver] = None
+
+
+def get_version_resolver() -> VersionResolver:
+    """Возвращает общий для приложения экземпляр VersionResolver"""
+    global _resolver
+    if _resolver is None:
+        _resolver = VersionResolver()
+    return _resolver
@@ -0,0 +1,126 @@
+"""
+Состояние дерева баз: развернутые папки и выбранная база, без зависимости от Qt.
+
+Состояние ведется по сигналам дерева (развернули/свернули папку, сменили базу под
+курсором), а не обходом модели перед перестройкой. Папка задается путем от корня
+("Рабочие/Магазины", "Недавние"), база — ее ID: оба ключа переживают перестройку
+модели, в отличие от индексов и QStandardItem.
+
+Состояние хранится в VIEW_STATE_PATH:
+    {"version": 1, "expanded": ["Рабочие", "Рабочие/Магазины"], "selected_id": "<ID>"}
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from config import VIEW_STATE_PATH
+
+
+FORMAT_VERSION = 1
+
+
+def folder_paths(bases) -> Set[str]:
+    """Пути всех папок, которые дерево построит для списка баз (с промежуточными)."""
+    paths = set()
+    for base in bases:
+        parts = base.folder.strip("/").split("/")
+        for depth in range(1, len(parts) + 1):
+            if parts[depth - 1]:
+                paths.add("/".join(parts[:depth]))
+    return paths
+
+
+class ViewStateStore:
+    """
+    Развернутые папки и выбранная база в JSON-файле
+    """
+
+    def __init__(self, path: Optional[Path] = VIEW_STATE_PATH):
+        """
+        Args:
+            path: Файл состояния; None — только в памяти
+        """
+        self.path = Path(path) if path else None
+        self.expanded: Set[str] = set()
+        self.selected_id: Optional[str] = None
+        self._dirty = False
+
+    def set_expanded(self, path: str, expanded: bool) -> bool:
+        """Отмечает папку развернутой или свернутой. Returns: True если состояние изменилось"""
+        if expanded == (path in self.expanded):
+            return False
+        if expanded:
+            self.expanded.add(path)
+        else:
+            self.expanded.discard(path)
+        self._dirty = True
+        return True
+
+    def select(self, base_id: Optional[str]):
+        if base_id != self.selected_id:
+            self.selected_id = base_id
+            self._dirty = True
+
+    def replace(self, expanded: Iterable[str], selected_id: Optional[str]):
+        """Заменяет состояние целиком (например, перенос из снимка дерева)"""
+        self.expanded = set(expanded)
+        self.selected_id = selected_id
+        self._dirty = True
+
+    def retain(self, paths: Set[str]) -> int:
+        """Забывает папки, которых больше нет. Returns: сколько путей удалено"""
+        stale = self.expanded - paths
+        if stale:
+            self.expanded -= stale
+            self._dirty = True
+        return len(stale)
+
+    def load(self) -> bool:
+        """Загружает состояние из файла. Returns: True если файл прочитан"""
+        if not self.path or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') != FORMAT_VERSION:
+                return False
+            self.expanded = {path for path in data.get('expanded', []) if isinstance(path, str) and path}
+            self.selected_id = data.get('selected_id') or None
+            self._dirty = False
+            return True
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️ Не удалось прочитать состояние дерева: {e}")
+            return False
+
+    def save(self) -> bool:
+        """Сохраняет состояние, если оно менялось (атомарно, через временный файл)"""
+        if not self.path or not self._dirty:
+            return False
+        data = {
+            'version': FORMAT_VERSION,
+            'expanded': sorted(self.expanded),
+            'selected_id': self.selected_id,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            return True
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить состояние дерева: {e}")
+            return False
+
+
+_store: Optional[ViewStateStore] = None
+
+
+def get_view_state_store() -> ViewStateStore:
+    """Возвращает общий для приложения экземпляр ViewStateStore (загружается при первом обращении)"""
+    global _store
+    if _store is None:
+        _store = ViewStateStore()
+        _store.load()
+    return _store
@@ -0,0 +1,71 @@
+"""
+Список окон 1С в порядке последнего использования (MRU).
+
+Обновляется событиями смены активного окна (см. gui/foreground_watcher.py):
+touch() — O(1), порядок хранится в OrderedDict (последнее использованное — в конце).
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+
+@dataclass
+class MruEntry:
+    """Окно, которое было активным"""
+    pid: int
+    hwnd: int
+    title: str
+    activated_at: float
+
+
+class WindowMRU:
+    """
+    Окна в порядке последней активации (по PID процесса)
+    """
+
+    def __init__(self, limit: int = 64):
+        self.limit = limit
+        self._entries: "OrderedDict[int, MruEntry]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def touch(self, pid: int, hwnd: int, title: str = '', when: Optional[float] = None):
+        """Отмечает окно процесса как только что активированное"""
+        entry = self._entries.pop(pid, None)
+        if entry is None:
+            entry = MruEntry(pid, hwnd, title, 0.0)
+        entry.hwnd = hwnd
+        entry.title = title or entry.title
+        entry.activated_at = time.time() if when is None else when
+        self._entries[pid] = entry
+        while len(self._entries) > self.limit:
+            self._entries.popitem(last=False)
+
+    def discard(self, pid: int):
+        self._entries.pop(pid, None)
+
+    def prune(self, alive_pids: Iterable[int]):
+        """Убирает завершившиеся процессы"""
+        alive = set(alive_pids)
+        for pid in [pid for pid in self._entries if pid not in alive]:
+            del self._entries[pid]
+
+    def entries(self) -> List[MruEntry]:
+        """Окна, последнее использованное — первым"""
+        return list(reversed(self._entries.values()))
+
+    def ranks(self) -> dict:
+        """{pid: позиция} для сортировки списка процессов за один проход"""
+        return {pid: index for index, pid in enumerate(reversed(self._entries))}
+
+    def previous(self, current_pid: Optional[int] = None) -> Optional[MruEntry]:
+        """
+        Окно для переключения "как Alt+Tab": последнее использованное, кроме current_pid
+        """
+        for entry in reversed(self._entries.values()):
+            if entry.pid != current_pid:
+                return entry
+        return None
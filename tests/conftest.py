@@ -0,0 +1,6 @@
+"""Модули лончера импортируются из src, как при запуске src/app.py"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
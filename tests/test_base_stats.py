@@ -0,0 +1,125 @@
+"""Статистика списка баз: инкрементальный sync против полного пересчета (services/base_stats.py)"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.database import Database1C
+from services import base_stats
+from services.base_stats import NO_VERSION, BaseStats, version_branch
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+VERSIONS = [None, '8.3.22.1750', '8.3.22.2000', '8.3.24.1500', '8.3.25.1374']
+CONNECTS = ['File="C:\\Bases\\{}";', 'Srvr="app01";Ref="{}";', 'Srvr="app02:1541";Ref="{}";']
+ARCHS = [None, 'x86', 'x86_64']
+CLIENTS = [None, 'thin', 'thick']
+
+
+@pytest.fixture(params=['numpy', 'counter'])
+def backend(request, monkeypatch):
+    """Группировка через NumPy и без него"""
+    if request.param == 'numpy':
+        monkeypatch.setattr(base_stats, 'np', pytest.importorskip('numpy'))
+    else:
+        monkeypatch.setattr(base_stats, 'np', None)
+    return request.param
+
+
+def random_base(rng, base_id):
+    base = Database1C(id=base_id, name=f"База {base_id}", folder='/', connect='')
+    randomize(rng, base)
+    return base
+
+
+def randomize(rng, base):
+    """Случайные значения полей, которые учитывает статистика"""
+    base.version = rng.choice(VERSIONS)
+    base.connect = rng.choice(CONNECTS).format(base.id)
+    base.app_arch = rng.choice(ARCHS)
+    base.client_type = rng.choice(CLIENTS)
+    base.last_run_time = rng.choice([None, NOW - timedelta(days=rng.randint(0, 400))])
+
+
+def snapshot(stats):
+    """Все ответы статистики: группы по каждому столбцу и давно не запускавшиеся базы"""
+    groups = {name: stats.group_counts(name) for name in BaseStats.COLUMNS}
+    old, never = stats.stale(90, now=NOW.timestamp())
+    return groups, [b.id for b in old], [b.id for b in never]
+
+
+def fresh(bases):
+    stats = BaseStats()
+    stats.sync(bases)
+    return stats
+
+
+class TestSync:
+
+    def test_counts(self, backend):
+        bases = [
+            Database1C(id='a', name="a", folder='/', connect='Srvr="app01";Ref="a";', version='8.3.22.1750'),
+            Database1C(id='b', name="b", folder='/', connect='Srvr="app01";Ref="b";', version='8.3.22.2000',
+                       app_arch='x86_64', client_type='thin'),
+            Database1C(id='c', name="c", folder='/', connect='File="C:\\c";'),
+        ]
+        stats = fresh(bases)
+        assert [(g.key, g.count) for g in stats.group_counts('branch')] == [('8.3.22', 2), (NO_VERSION, 1)]
+        assert [(g.key, g.count) for g in stats.group_counts('server')] == [('app01', 2), ('Файловая', 1)]
+        assert stats.group_counts('client_type')[0].share == pytest.approx(2 / 3)
+        assert BaseStats().group_counts('version') == []
+
+    def test_stale(self, backend):
+        bases = [
+            Database1C(id='old', name="old", folder='/', connect='', last_run_time=NOW - timedelta(days=200)),
+            Database1C(id='new', name="new", folder='/', connect='', last_run_time=NOW - timedelta(days=1)),
+            Database1C(id='older', name="older", folder='/', connect='', last_run_time=NOW - timedelta(days=300)),
+            Database1C(id='never', name="never", folder='/', connect=''),
+        ]
+        assert snapshot(fresh(bases))[1:] == (['older', 'old'], ['never'])
+
+    def test_unchanged_list(self, backend):
+        rng = random.Random(1)
+        bases = [random_base(rng, str(n)) for n in range(20)]
+        stats = fresh(bases)
+        assert stats.sync(bases) == 0
+
+    def test_sync_counts_changes(self, backend):
+        rng = random.Random(2)
+        bases = [random_base(rng, str(n)) for n in range(10)]
+        stats = fresh(bases)
+        bases[3].version = '8.3.99.1'
+        del bases[5]
+        bases.append(random_base(rng, 'new'))
+        assert stats.sync(bases) == 3
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_incremental_matches_full_rebuild(self, backend, seed):
+        rng = random.Random(seed)
+        bases = [random_base(rng, str(n)) for n in range(rng.randint(0, 30))]
+        next_id = len(bases)
+        stats = fresh(bases)
+        for _ in range(40):
+            action = rng.choice(['edit', 'edit', 'add', 'remove', 'shuffle', 'replace'])
+            if action == 'edit' and bases:
+                for base in rng.sample(bases, rng.randint(1, min(3, len(bases)))):
+                    randomize(rng, base)
+            elif action == 'add':
+                for _ in range(rng.randint(1, 4)):
+                    bases.insert(rng.randint(0, len(bases)), random_base(rng, str(next_id)))
+                    next_id += 1
+            elif action == 'remove' and bases:
+                del bases[rng.randrange(len(bases))]
+            elif action == 'shuffle':
+                rng.shuffle(bases)
+            elif action == 'replace':
+                # Список перечитан из файла: новые объекты с теми же значениями
+                bases = [Database1C(**vars(base)) for base in bases]
+            stats.sync(bases)
+            assert snapshot(stats) == snapshot(fresh(bases)), action
+
+
+def test_version_branch():
+    assert version_branch('8.3.22.1750') == '8.3.22'
+    assert version_branch(None) == NO_VERSION
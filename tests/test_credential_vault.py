@@ -0,0 +1,209 @@
+"""Хранилище паролей: файл AES-GCM, фраза и ключ-файл, перенос паролей из полей (services/credential_vault.py)"""
+
+import json
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+from models.database import Database1C  # noqa: E402
+from services import credential_vault  # noqa: E402
+from services.credential_vault import (  # noqa: E402
+    MODE_DEFAULT, MODE_DESIGNER, MODE_ENTERPRISE, MODE_STORAGE, PASSPHRASE_ENV,
+    CredentialError, CredentialVault, EncryptedFileBackend, TTLCache, launch_password,
+    move_passwords_to_vault, stored_password,
+)
+
+
+class DictBackend:
+    """Бэкенд в памяти (как keyring)"""
+
+    name = 'memory'
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, base_id, mode):
+        return self.entries.get((base_id, mode))
+
+    def set(self, base_id, mode, secret):
+        if secret:
+            self.entries[(base_id, mode)] = secret
+        else:
+            self.entries.pop((base_id, mode), None)
+
+
+@pytest.fixture(autouse=True)
+def no_passphrase(monkeypatch):
+    monkeypatch.delenv(PASSPHRASE_ENV, raising=False)
+
+
+@pytest.fixture
+def files(tmp_path):
+    return tmp_path / 'credentials.vault', tmp_path / 'credentials.key'
+
+
+def open_backend(files):
+    return EncryptedFileBackend(*files)
+
+
+class TestEncryptedFile:
+
+    def test_round_trip(self, files):
+        backend = open_backend(files)
+        backend.set('base-1', MODE_ENTERPRISE, "пароль 1")
+        backend.set('base-1', MODE_DESIGNER, "конфигуратор")
+
+        reopened = open_backend(files)
+        assert reopened.get('base-1', MODE_ENTERPRISE) == "пароль 1"
+        assert reopened.get('base-1', MODE_DESIGNER) == "конфигуратор"
+        assert reopened.get('base-1', MODE_STORAGE) is None
+        assert "пароль 1".encode() not in files[0].read_bytes()
+
+    def test_empty_secret_deletes_entry(self, files):
+        backend = open_backend(files)
+        backend.set('base-1', MODE_ENTERPRISE, "пароль")
+        backend.set('base-1', MODE_ENTERPRISE, None)
+        assert open_backend(files).get('base-1', MODE_ENTERPRISE) is None
+        assert json.loads(files[0].read_text(encoding='utf-8'))['entries'] == {}
+
+    def test_missing_entry_needs_no_key(self, files):
+        backend = open_backend(files)
+        backend.set('base-1', MODE_ENTERPRISE, "пароль")
+        files[1].unlink()
+        # Пароля нет — ключ не читается
+        assert open_backend(files).get('base-2', MODE_ENTERPRISE) is None
+
+    def test_tampered_ciphertext_is_rejected(self, files):
+        open_backend(files).set('base-1', MODE_ENTERPRISE, "пароль")
+        data = json.loads(files[0].read_text(encoding='utf-8'))
+        entry = data['entries']['base-1:ENTERPRISE']
+        raw = bytearray(credential_vault._unb64(entry['c']))
+        raw[0] ^= 1
+        entry['c'] = credential_vault._b64(bytes(raw))
+        files[0].write_text(json.dumps(data), encoding='utf-8')
+        with pytest.raises(CredentialError):
+            open_backend(files).get('base-1', MODE_ENTERPRISE)
+
+    def test_entry_moved_to_other_name_is_rejected(self, files):
+        # Имя записи — связанные данные AES-GCM: пароль одной базы не подставить другой
+        backend = open_backend(files)
+        backend.set('base-1', MODE_ENTERPRISE, "пароль")
+        data = json.loads(files[0].read_text(encoding='utf-8'))
+        data['entries']['base-2:ENTERPRISE'] = data['entries']['base-1:ENTERPRISE']
+        files[0].write_text(json.dumps(data), encoding='utf-8')
+        with pytest.raises(CredentialError):
+            open_backend(files).get('base-2', MODE_ENTERPRISE)
+
+    def test_wrong_key_file_is_rejected(self, files):
+        open_backend(files).set('base-1', MODE_ENTERPRISE, "пароль")
+        files[1].write_bytes(bytes(32))
+        with pytest.raises(CredentialError):
+            open_backend(files).get('base-1', MODE_ENTERPRISE)
+
+    def test_key_file_mode(self, files):
+        open_backend(files).set('base-1', MODE_ENTERPRISE, "пароль")
+        assert json.loads(files[0].read_text(encoding='utf-8'))['kdf'] is None
+        assert len(files[1].read_bytes()) == 32
+
+    def test_passphrase_mode(self, files, monkeypatch):
+        monkeypatch.setenv(PASSPHRASE_ENV, "фраза")
+        open_backend(files).set('base-1', MODE_ENTERPRISE, "пароль")
+        kdf = json.loads(files[0].read_text(encoding='utf-8'))['kdf']
+        assert kdf['name'] == 'scrypt' and kdf['salt']
+        assert not files[1].exists()
+        assert open_backend(files).get('base-1', MODE_ENTERPRISE) == "пароль"
+
+        monkeypatch.setenv(PASSPHRASE_ENV, "другая фраза")
+        with pytest.raises(CredentialError):
+            open_backend(files).get('base-1', MODE_ENTERPRISE)
+
+        monkeypatch.delenv(PASSPHRASE_ENV)
+        with pytest.raises(CredentialError, match=PASSPHRASE_ENV):
+            open_backend(files).get('base-1', MODE_ENTERPRISE)
+
+    def test_old_format_is_rejected(self, files):
+        files[0].write_text(json.dumps({'version': 1, 'salt': '', 'entries': {}}), encoding='utf-8')
+        with pytest.raises(CredentialError):
+            open_backend(files).get('base-1', MODE_ENTERPRISE)
+
+    def test_key_is_cached(self, files, monkeypatch):
+        backend = EncryptedFileBackend(*files, keys_cache=TTLCache(60))
+        backend.set('base-1', MODE_ENTERPRISE, "пароль")
+
+        def fail(_):
+            raise AssertionError("ключ уже в кэше")
+
+        monkeypatch.setattr(credential_vault, '_load_key_file', fail)
+        assert backend.get('base-1', MODE_ENTERPRISE) == "пароль"
+
+
+class TestTTLCache:
+
+    def test_entries_expire(self):
+        now = [100.0]
+        cache = TTLCache(10, clock=lambda: now[0])
+        cache.put('key', None)
+        assert 'key' in cache
+        now[0] = 110.0
+        assert 'key' not in cache
+        assert cache.get('key', 'нет') == 'нет'
+
+
+class TestPasswordsOfBases:
+
+    @pytest.fixture
+    def backend(self, monkeypatch):
+        backend = DictBackend()
+        monkeypatch.setattr(credential_vault, '_vault', CredentialVault(backend))
+        return backend
+
+    @staticmethod
+    def make_base(**values):
+        return Database1C(id='base-1', name="База", folder='/', connect='File="C:\\Base";', **values)
+
+    def test_move_fills_vault_and_clears_fields(self, backend):
+        base = self.make_base(pwd="общий", pwd_enterprise="пред", pwd_storage="хран")
+        assert move_passwords_to_vault(base) is True
+        assert (base.pwd, base.pwd_enterprise, base.pwd_storage) == (None, None, None)
+        assert backend.entries == {
+            ('base-1', MODE_DEFAULT): "общий",
+            ('base-1', MODE_ENTERPRISE): "пред",
+            ('base-1', MODE_STORAGE): "хран",
+        }
+        assert move_passwords_to_vault(base) is False
+
+    def test_move_without_replace_keeps_other_modes(self, backend):
+        backend.set('base-1', MODE_DESIGNER, "конфигуратор")
+        move_passwords_to_vault(self.make_base(pwd_enterprise="пред"))
+        assert backend.get('base-1', MODE_DESIGNER) == "конфигуратор"
+
+    def test_move_with_replace_clears_removed_passwords(self, backend):
+        backend.set('base-1', MODE_DESIGNER, "конфигуратор")
+        backend.set('base-1', MODE_STORAGE, "хран")
+        base = self.make_base(pwd_enterprise="новый")
+        # Настройки сохранены: пароль конфигуратора и хранилища стерты
+        assert move_passwords_to_vault(base, replace=True) is True
+        assert base.pwd_enterprise is None
+        assert backend.entries == {('base-1', MODE_ENTERPRISE): "новый"}
+
+    def test_failed_vault_keeps_field(self, monkeypatch):
+        class Broken(DictBackend):
+            def set(self, base_id, mode, secret):
+                raise CredentialError("хранилище недоступно")
+
+        monkeypatch.setattr(credential_vault, '_vault', CredentialVault(Broken()))
+        base = self.make_base(pwd_enterprise="пред")
+        assert move_passwords_to_vault(base) is False
+        assert base.pwd_enterprise == "пред"
+
+    def test_launch_password_prefers_field_then_vault_then_default(self, backend):
+        base = self.make_base()
+        vault = credential_vault.get_credential_vault()
+        vault.set('base-1', MODE_DEFAULT, "общий")
+        assert launch_password(base, MODE_DESIGNER) == "общий"
+        vault.set('base-1', MODE_DESIGNER, "конфигуратор")
+        assert launch_password(base, MODE_DESIGNER) == "конфигуратор"
+        base.pwd_configurator = "из общего списка"
+        assert stored_password(base, MODE_DESIGNER) == "из общего списка"
+        assert launch_password(base, 'IR_TOOLS') == "общий"
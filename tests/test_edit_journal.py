@@ -0,0 +1,219 @@
+"""Журнал правок списка баз: отмена, повтор, сжатие и восстановление после сбоя (services/edit_journal.py)"""
+
+import copy
+from datetime import datetime
+
+import pytest
+
+from models.database import Database1C
+from services.edit_journal import (
+    REPLAY_ALREADY, REPLAY_APPLIED, REPLAY_CONFLICT, EditJournal, JournalConflict, replay_operation,
+)
+
+
+def make_base(base_id, name=None, **values):
+    values.setdefault('folder', '/')
+    values.setdefault('connect', f'File="C:\\Bases\\{base_id}";')
+    return Database1C(id=base_id, name=name or f"База {base_id}", **values)
+
+
+def ids(bases):
+    return [b.id for b in bases]
+
+
+def edit(journal, bases, label, change, undoable=True):
+    """Правка bases функцией change одной записью журнала"""
+    capture = journal.begin(bases)
+    change(bases)
+    return journal.commit(label, capture, bases, undoable)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / 'ibases.v8i.journal.jsonl'
+
+
+@pytest.fixture
+def bases():
+    return [make_base('a'), make_base('b'), make_base('c')]
+
+
+def reopen(path, **kwargs):
+    journal = EditJournal(path, **kwargs)
+    journal.load()
+    return journal
+
+
+class TestUndoRedo:
+
+    def test_undo_and_redo_delete(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление: База b", lambda items: items.pop(1))
+        assert journal.undo(bases).label == "Удаление: База b"
+        assert ids(bases) == ['a', 'b', 'c']
+        journal.redo(bases)
+        assert ids(bases) == ['a', 'c']
+
+    def test_undo_restores_only_changed_fields(self, path, bases):
+        journal = EditJournal(path)
+        op = edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'version', '8.3.25.1374'))
+        assert op.changes[0].before == {'version': None}
+        bases[0].name = "Переименована извне в другом поле"
+        journal.undo(bases)
+        assert bases[0].version is None
+        assert bases[0].name == "Переименована извне в другом поле"
+
+    def test_new_edit_clears_redo(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        journal.undo(bases)
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'usr', 'Иванов'))
+        assert journal.redo_label is None
+
+    def test_undo_after_external_edit_is_dropped(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'version', '8.3.25.1374'))
+        # То же поле изменили извне (1CEStart, Ctrl+I)
+        bases[0].version = '8.3.26.1000'
+        with pytest.raises(JournalConflict):
+            journal.undo(bases)
+        assert bases[0].version == '8.3.26.1000'
+        assert journal.undo_label == "Настройки"
+
+        journal.drop_undo()
+        assert journal.undo_label is None
+        assert reopen(path).undo_label is None
+
+    def test_non_undoable_edit_keeps_stacks(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        journal.undo(bases)
+
+        def launch(items):
+            items[1].is_recent = True
+            items[1].last_run_time = datetime(2026, 10, 1, 9, 30)
+
+        edit(journal, bases, "В недавние", launch, undoable=False)
+        assert (journal.undo_label, journal.redo_label) == (None, "Удаление")
+        journal.redo(bases)
+        assert ids(bases) == ['b', 'c']
+        assert bases[0].is_recent
+
+    def test_stacks_survive_restart(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'usr', 'Иванов'))
+        journal.undo(bases)
+        restarted = reopen(path)
+        assert (restarted.undo_label, restarted.redo_label) == ("Удаление", "Настройки")
+
+    def test_undo_limit(self, path, bases):
+        journal = EditJournal(path, undo_limit=2)
+        for n in range(4):
+            edit(journal, bases, f"Правка {n}", lambda items, n=n: setattr(items[0], 'usr', f"u{n}"))
+        labels = []
+        while journal.undo_label:
+            labels.append(journal.undo(bases).label)
+        assert labels == ["Правка 3", "Правка 2"]
+        # После перезапуска стеки те же: старые правки за пределом стека не возвращаются
+        restarted = reopen(path, undo_limit=2)
+        assert (restarted.undo_label, restarted.redo_label) == (None, "Правка 2")
+
+
+class TestCompaction:
+
+    def test_compaction_keeps_undo_and_redo(self, path, bases):
+        journal = EditJournal(path, compact_lines=5)
+        for n in range(6):
+            edit(journal, bases, f"Правка {n}", lambda items, n=n: setattr(items[0], 'usr', f"u{n}"))
+            journal.mark_saved(journal.last_event)
+        journal.undo(bases)
+        journal.undo(bases)
+        journal.mark_saved(journal.last_event)
+        assert journal.needs_compaction
+        lines_before = len(path.read_text(encoding='utf-8').splitlines())
+
+        journal.compact()
+        lines_after = len(path.read_text(encoding='utf-8').splitlines())
+        # 6 правок + 2 отмены + saved
+        assert lines_after == 9 and lines_after < lines_before
+
+        restarted = reopen(path, compact_lines=5)
+        assert restarted.pending() == []
+        assert (restarted.undo_label, restarted.redo_label) == ("Правка 3", "Правка 4")
+        restarted.redo(bases)
+        restarted.redo(bases)
+        assert bases[0].usr == "u5"
+        assert restarted.redo_label is None
+
+    def test_no_compaction_with_unsaved_events(self, path, bases):
+        journal = EditJournal(path, compact_lines=1)
+        edit(journal, bases, "Правка", lambda items: setattr(items[0], 'usr', 'u'))
+        edit(journal, bases, "Правка", lambda items: setattr(items[0], 'usr', 'v'))
+        assert not journal.needs_compaction
+
+
+class TestReplay:
+    """Правки, записанные в журнал, но не в ibases.v8i (нет отметки saved)"""
+
+    def crash(self, path, bases):
+        """Сеанс с правками, завершенный до записи ibases.v8i; возвращает состояние файла"""
+        on_disk = [copy.copy(b) for b in bases]
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'version', '8.3.25.1374'))
+        edit(journal, bases, "Добавление", lambda items: items.append(make_base('d')))
+        journal.undo(bases)
+        return on_disk
+
+    def replay_all(self, path, bases):
+        return [replay_operation(op, bases, forward) for op, forward in reopen(path).pending()]
+
+    def test_replay_restores_unsaved_edits(self, path, bases):
+        expected = [copy.copy(b) for b in bases]
+        on_disk = self.crash(path, expected)
+        assert self.replay_all(path, on_disk) == [REPLAY_APPLIED] * 4
+        assert on_disk == expected
+
+    def test_replay_is_idempotent(self, path, bases):
+        expected = [copy.copy(b) for b in bases]
+        on_disk = self.crash(path, expected)
+        self.replay_all(path, on_disk)
+        # Повторный запуск без отметки saved: правки уже в файле. Добавление,
+        # отмененное в том же сеансе, проходит вперед и назад — итог тот же
+        results = self.replay_all(path, on_disk)
+        assert REPLAY_CONFLICT not in results
+        assert results[:2] == [REPLAY_ALREADY, REPLAY_ALREADY]
+        assert on_disk == expected
+        self.replay_all(path, on_disk)
+        assert on_disk == expected
+
+    def test_saved_marker_limits_replay(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        journal.mark_saved(journal.last_event)
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'usr', 'Иванов'))
+        assert [op.label for op, _ in reopen(path).pending()] == ["Настройки"]
+
+    def test_replay_conflict_leaves_bases(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Настройки", lambda items: setattr(items[0], 'version', '8.3.25.1374'))
+        on_disk = [make_base('a', version='8.3.26.1000'), make_base('b'), make_base('c')]
+        assert self.replay_all(path, on_disk) == [REPLAY_CONFLICT]
+        assert on_disk[0].version == '8.3.26.1000'
+
+    def test_non_undoable_edit_is_replayed(self, path, bases):
+        on_disk = [copy.copy(b) for b in bases]
+        journal = EditJournal(path)
+        edit(journal, bases, "В недавние", lambda items: setattr(items[2], 'is_recent', True), undoable=False)
+        restarted = reopen(path)
+        assert restarted.undo_label is None
+        assert [replay_operation(op, on_disk, forward) for op, forward in restarted.pending()] == [REPLAY_APPLIED]
+        assert on_disk[2].is_recent
+
+    def test_truncated_last_line_is_skipped(self, path, bases):
+        journal = EditJournal(path)
+        edit(journal, bases, "Удаление", lambda items: items.pop(0))
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"n": 2, "kind": "op", "seq"')
+        assert reopen(path).undo_label == "Удаление"
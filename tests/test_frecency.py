@@ -0,0 +1,132 @@
+"""Рейтинг запусков и папка "Недавние" (services/frecency.py)"""
+
+import math
+from datetime import datetime
+
+import pytest
+
+from models.database import Database1C
+from services.frecency import FrecencyStore, apply_recent_limit, logaddexp
+
+DAY = 86400.0
+NOW = datetime(2026, 10, 1, 12, 0).timestamp()
+
+
+def make_base(base_id, **values):
+    values.setdefault('folder', '/')
+    values.setdefault('connect', f'File="C:\\Bases\\{base_id}";')
+    return Database1C(id=base_id, name=f"База {base_id}", **values)
+
+
+def recent(base_id, folder='/Работа', last_run=None):
+    return make_base(
+        base_id, folder=folder, original_folder=folder, is_recent=True,
+        last_run_time=datetime.fromtimestamp(last_run) if last_run else None,
+    )
+
+
+def ids(bases):
+    return [b.id for b in bases]
+
+
+@pytest.fixture
+def store():
+    return FrecencyStore(half_life_days=7)
+
+
+class TestFrecencyStore:
+
+    def test_logaddexp(self):
+        assert logaddexp(-math.inf, 2.0) == 2.0
+        assert logaddexp(1000.0, 1000.0) == pytest.approx(1000.0 + math.log(2))
+
+    def test_frequent_beats_single_recent_launch(self, store):
+        for day in range(5):
+            store.record('often', when=NOW - day * DAY)
+        store.record('once', when=NOW)
+        assert store.top(2) == ['often', 'once']
+        assert store.score('once', NOW) == pytest.approx(1.0)
+
+    def test_old_launches_decay(self, store):
+        for n in range(3):
+            store.record('old', when=NOW - 60 * DAY - n)
+        store.record('new', when=NOW)
+        assert store.top(1) == ['new']
+        assert store.score('old', NOW) < 0.01
+
+    def test_modes_add_up(self, store):
+        store.record('a', 'ENTERPRISE', NOW)
+        store.record('a', 'DESIGNER', NOW)
+        store.record('b', 'ENTERPRISE', NOW)
+        assert store.top(2) == ['a', 'b']
+        assert store.get_stats('a') == {
+            'ENTERPRISE': {'count': 1, 'last': NOW},
+            'DESIGNER': {'count': 1, 'last': NOW},
+        }
+
+    def test_incremental_order_matches_full_sort(self, store):
+        for n, base_id in enumerate('abcdefabcaba'):
+            store.record(base_id, when=NOW + n * 3600)
+        expected = sorted('abcdef', key=lambda base_id: -store.score(base_id, NOW))
+        assert store.top(10) == expected
+
+    def test_top_skips_unknown_ids(self, store):
+        store.record('gone', when=NOW)
+        store.record('kept', when=NOW - DAY)
+        assert store.top(5, {'kept'}) == ['kept']
+
+    def test_forget(self, store):
+        store.record('a', when=NOW)
+        store.forget('a')
+        assert 'a' not in store and store.top(5) == []
+
+    def test_save_and_load(self, tmp_path):
+        path = tmp_path / 'frecency.json'
+        store = FrecencyStore(path, half_life_days=7)
+        store.record('a', when=NOW - DAY)
+        store.record('b', when=NOW)
+        assert store.save()
+        loaded = FrecencyStore(path, half_life_days=7)
+        assert loaded.load()
+        assert loaded.top(5) == ['b', 'a']
+        assert loaded.score('a', NOW) == pytest.approx(store.score('a', NOW))
+
+    def test_other_format_is_ignored(self, tmp_path):
+        path = tmp_path / 'frecency.json'
+        path.write_text('{"version": 0, "entries": {"a": {}}}', encoding='utf-8')
+        assert not FrecencyStore(path).load()
+        path.write_text('не json', encoding='utf-8')
+        assert not FrecencyStore(path).load()
+
+
+class TestApplyRecentLimit:
+
+    def test_recent_go_first_by_rating(self, store):
+        bases = [make_base('x'), recent('a'), make_base('y'), recent('b')]
+        store.record('a', when=NOW - DAY)
+        store.record('b', when=NOW)
+        assert apply_recent_limit(bases, store, limit=5) is False
+        assert ids(bases) == ['b', 'a', 'x', 'y']
+
+    def test_evicted_return_to_original_folder(self, store):
+        bases = [recent('a', '/Архив'), recent('b'), recent('c'), make_base('x')]
+        bases[0].folder = '/'
+        store.record('b', when=NOW)
+        store.record('c', when=NOW - DAY)
+        store.record('a', when=NOW - 30 * DAY)
+        assert apply_recent_limit(bases, store, limit=2) is True
+        assert ids(bases) == ['b', 'c', 'a', 'x']
+        evicted = bases[2]
+        assert (evicted.is_recent, evicted.folder, evicted.original_folder) == (False, '/Архив', None)
+
+    def test_recent_without_statistics_are_seeded(self, store):
+        bases = [recent('old', last_run=NOW - 10 * DAY), recent('new', last_run=NOW)]
+        apply_recent_limit(bases, store, limit=5)
+        assert ids(bases) == ['new', 'old']
+        assert store.get_stats('old') == {'ENTERPRISE': {'count': 1, 'last': NOW - 10 * DAY}}
+
+    def test_not_recent_bases_keep_order(self, store):
+        bases = [make_base(base_id) for base_id in 'dcba']
+        store.record('a', when=NOW)
+        assert apply_recent_limit(bases, store, limit=5) is False
+        assert ids(bases) == ['d', 'c', 'b', 'a']
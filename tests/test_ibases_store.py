@@ -0,0 +1,231 @@
+"""Трехстороннее слияние списков баз и проверка версии ibases.v8i (services/ibases_store.py)"""
+
+import copy
+import os
+
+import pytest
+
+from models.database import Database1C
+from services import ibases_store
+from services.base_reader import BaseReader
+from services.base_writer import BaseWriter
+from services.ibases_store import IbasesStore, merge_bases
+from services.tree_snapshot import stat_key
+
+
+SECOND_NS = 1_000_000_000
+
+
+def make_base(base_id, name=None, **values):
+    values.setdefault('folder', '/')
+    values.setdefault('connect', f'File="C:\\Bases\\{base_id}";')
+    return Database1C(id=base_id, name=name or f"База {base_id}", **values)
+
+
+def sides(bases):
+    """База слияния и независимые копии для "моей" и "их" стороны"""
+    return bases, [copy.copy(b) for b in bases], [copy.copy(b) for b in bases]
+
+
+def by_id(bases):
+    return {b.id: b for b in bases}
+
+
+def ids(bases):
+    return [b.id for b in bases]
+
+
+class TestMergeBases:
+
+    def test_no_changes(self):
+        base, mine, theirs = sides([make_base('a'), make_base('b')])
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['a', 'b']
+        assert conflicts == []
+
+    def test_change_on_disk_only_is_taken(self):
+        base, mine, theirs = sides([make_base('a', version='8.3.24.1500')])
+        theirs[0].version = '8.3.25.1374'
+        mine[0].original_folder = '/Рабочие'
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert result[0].version == '8.3.25.1374'
+        # Поля только в памяти остаются нашими
+        assert result[0].original_folder == '/Рабочие'
+        assert conflicts == []
+
+    def test_my_change_only_is_kept(self):
+        base, mine, theirs = sides([make_base('a', version='8.3.24.1500')])
+        mine[0].version = '8.3.25.1374'
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert result[0].version == '8.3.25.1374'
+        assert conflicts == []
+
+    def test_both_changed_different_fields_are_merged(self):
+        base, mine, theirs = sides([make_base('a', name="Старое", version='8.3.24.1500')])
+        mine[0].name = "Наше"
+        theirs[0].version = '8.3.25.1374'
+        theirs[0].usr = 'Иванов'
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert (result[0].name, result[0].version, result[0].usr) == ("Наше", '8.3.25.1374', 'Иванов')
+        assert conflicts == []
+
+    def test_both_changed_same_field_differently_is_conflict(self):
+        base, mine, theirs = sides([make_base('a', name="Старое", version='8.3.24.1500')])
+        mine[0].name = "Наше"
+        theirs[0].name = "С диска"
+        theirs[0].version = '8.3.25.1374'
+        result, conflicts = merge_bases(base, mine, theirs)
+        # В конфликтном поле остается наше значение, остальные поля сливаются
+        assert result[0].name == "Наше"
+        assert result[0].version == '8.3.25.1374'
+        assert conflicts == ["Наше"]
+
+    def test_both_changed_same_field_equally_is_not_conflict(self):
+        base, mine, theirs = sides([make_base('a', version='8.3.24.1500')])
+        mine[0].version = theirs[0].version = '8.3.25.1374'
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert result[0].version == '8.3.25.1374'
+        assert conflicts == []
+
+    def test_deleted_on_disk_unchanged_by_me_is_deleted(self):
+        base, mine, theirs = sides([make_base('a'), make_base('b')])
+        del theirs[0]
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['b']
+        assert conflicts == []
+
+    def test_deleted_on_disk_edited_by_me_is_kept(self):
+        base, mine, theirs = sides([make_base('a'), make_base('b')])
+        del theirs[0]
+        mine[0].name = "Переименована"
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['a', 'b']
+        assert by_id(result)['a'].name == "Переименована"
+        assert conflicts == ["Переименована"]
+
+    def test_deleted_by_me_unchanged_on_disk_is_deleted(self):
+        base, mine, theirs = sides([make_base('a'), make_base('b')])
+        del mine[0]
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['b']
+        assert conflicts == []
+
+    def test_deleted_by_me_edited_on_disk_is_kept(self):
+        base, mine, theirs = sides([make_base('a'), make_base('b')])
+        del mine[0]
+        theirs[0].version = '8.3.25.1374'
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['b', 'a']
+        assert by_id(result)['a'].version == '8.3.25.1374'
+        assert conflicts == ["База a"]
+
+    def test_concurrent_adds_keep_both(self):
+        base, mine, theirs = sides([make_base('a')])
+        mine.append(make_base('mine'))
+        theirs.insert(0, make_base('theirs'))
+        result, conflicts = merge_bases(base, mine, theirs)
+        # Сначала "мой" порядок, затем добавленные на диске
+        assert ids(result) == ['a', 'mine', 'theirs']
+        assert conflicts == []
+
+    def test_concurrent_add_with_same_id_keeps_mine(self):
+        base, mine, theirs = sides([make_base('a')])
+        mine.append(make_base('new', name="Наша"))
+        theirs.append(make_base('new', name="С диска"))
+        result, conflicts = merge_bases(base, mine, theirs)
+        assert ids(result) == ['a', 'new']
+        assert by_id(result)['new'].name == "Наша"
+        assert conflicts == []
+
+
+class TestChangedOnDisk:
+    """Проверка версии файла перед записью: stat, окно грубости mtime, хэш содержимого"""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / 'ibases.v8i'
+        path.write_bytes(b'[A]\r\nConnect=File="C:\\A";\r\n')
+        return path
+
+    @staticmethod
+    def set_mtime(path, mtime_ns):
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    @staticmethod
+    def loaded(path, marked_at_ns):
+        """Хранилище, загрузившее файл в момент marked_at_ns"""
+        store = IbasesStore(path)
+        store.mark_loaded([], stat_key(path))
+        store._marked_at_ns = marked_at_ns
+        return store
+
+    def test_old_unchanged_file_is_not_hashed(self, path, monkeypatch):
+        mtime = 1_700_000_000 * SECOND_NS
+        self.set_mtime(path, mtime)
+        store = self.loaded(path, mtime + 60 * SECOND_NS)
+
+        def fail(_):
+            raise AssertionError("хэш не нужен: stat совпал вне окна грубости mtime")
+
+        monkeypatch.setattr(ibases_store, 'file_digest', fail)
+        assert store._changed_on_disk() is False
+
+    def test_racy_file_with_same_content(self, path):
+        mtime = 1_700_000_000 * SECOND_NS
+        self.set_mtime(path, mtime)
+        store = self.loaded(path, mtime + SECOND_NS)
+        assert store._changed_on_disk() is False
+
+    def test_racy_file_rewritten_with_same_stat(self, path):
+        # Запись в пределах окна: тот же размер и mtime, другое содержимое
+        mtime = 1_700_000_000 * SECOND_NS
+        self.set_mtime(path, mtime)
+        store = self.loaded(path, mtime + SECOND_NS)
+        path.write_bytes(path.read_bytes().replace(b'[A]', b'[B]'))
+        self.set_mtime(path, mtime)
+        assert stat_key(path) == store._stat
+        assert store._changed_on_disk() is True
+
+    def test_touched_file_with_same_content(self, path):
+        mtime = 1_700_000_000 * SECOND_NS
+        self.set_mtime(path, mtime)
+        store = self.loaded(path, mtime + 60 * SECOND_NS)
+        self.set_mtime(path, mtime + 120 * SECOND_NS)
+        assert store._changed_on_disk() is False
+
+    def test_rewritten_file(self, path):
+        mtime = 1_700_000_000 * SECOND_NS
+        self.set_mtime(path, mtime)
+        store = self.loaded(path, mtime + 60 * SECOND_NS)
+        path.write_bytes(path.read_bytes() + b'[B]\r\nConnect=File="C:\\B";\r\n')
+        assert store._changed_on_disk() is True
+
+    def test_deleted_file(self, path):
+        store = self.loaded(path, 0)
+        path.unlink()
+        assert store._changed_on_disk() is False
+
+    def test_file_created_after_load(self, tmp_path):
+        path = tmp_path / 'ibases.v8i'
+        store = IbasesStore(path)
+        store.mark_loaded([], stat_key(path))
+        path.write_bytes(b'[A]\r\nConnect=File="C:\\A";\r\n')
+        assert store._changed_on_disk() is True
+
+
+def test_save_merges_concurrent_adds(tmp_path):
+    path = tmp_path / 'ibases.v8i'
+    BaseWriter(path).write_bases([make_base('a')])
+    bases = BaseReader(path).read_bases()
+    store = IbasesStore(path)
+    store.mark_loaded(bases, stat_key(path))
+
+    # Другой процесс добавил базу, пока наша правка была в памяти
+    BaseWriter(path).write_bases([make_base('a'), make_base('theirs')])
+    bases.append(make_base('mine'))
+    result = store.save(bases)
+
+    assert ids(result.merged) == ['a', 'mine', 'theirs']
+    assert result.conflicts == []
+    assert ids(BaseReader(path).read_bases()) == ['a', 'mine', 'theirs']
+    assert result.stat == stat_key(path)
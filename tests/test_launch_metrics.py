@@ -0,0 +1,110 @@
+"""Телеметрия запусков: перцентили, сводка по группам, файл метрик (services/launch_metrics.py)"""
+
+import pytest
+
+from models.database import Database1C
+from services.launch_metrics import (
+    FILE_SERVER, OUTCOME_ERROR, OUTCOME_OK, OUTCOME_TIMEOUT, STAGE_WINDOW,
+    LaunchMetricsLog, percentile, platform_version, server_name, start_trace, summarize,
+)
+
+
+def record(base_name, window=None, outcome=OUTCOME_OK, **values):
+    stages = {STAGE_WINDOW: window} if window is not None else {}
+    return dict(base_name=base_name, outcome=outcome, stages=stages, **values)
+
+
+class TestPercentile:
+
+    def test_empty(self):
+        assert percentile([], 50) is None
+
+    def test_single_value(self):
+        assert percentile([7.0], 0) == percentile([7.0], 95) == 7.0
+
+    def test_exact_positions(self):
+        values = [10.0, 20.0, 30.0, 40.0, 50.0]
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 50) == 30.0
+        assert percentile(values, 100) == 50.0
+
+    def test_linear_interpolation(self):
+        assert percentile([10.0, 20.0], 50) == 15.0
+        assert percentile([10.0, 20.0, 30.0, 40.0], 95) == pytest.approx(38.5)
+
+    def test_matches_numpy_linear(self):
+        numpy = pytest.importorskip('numpy')
+        values = sorted([3.0, 1.5, 9.0, 4.0, 4.0, 12.5, 0.5])
+        for q in (0, 10, 50, 90, 95, 99, 100):
+            assert percentile(values, q) == pytest.approx(float(numpy.percentile(values, q)))
+
+
+class TestSummarize:
+
+    def test_groups_sorted_by_p95(self):
+        records = (
+            [record("Быстрая", window=w) for w in (100.0, 200.0, 300.0)]
+            + [record("Медленная", window=w) for w in (1000.0, 3000.0)]
+        )
+        fast, slow = summarize(records, 'base_name')[::-1]
+        assert slow.key == "Медленная" and slow.p50 == 2000.0 and slow.max == 3000.0
+        assert fast.launches == 3 and fast.p50 == 200.0 and fast.p95 == pytest.approx(290.0)
+
+    def test_failures_are_not_timed(self):
+        records = [
+            record("База", window=500.0),
+            record("База", outcome=OUTCOME_ERROR),
+            record("База", window=9000.0, outcome=OUTCOME_TIMEOUT),
+        ]
+        (stats,) = summarize(records, 'base_name')
+        assert (stats.launches, stats.failures) == (3, 2)
+        assert stats.p50 == stats.p95 == stats.max == 500.0
+
+    def test_only_failures_go_last(self):
+        records = [record("Сбой", outcome=OUTCOME_ERROR), record("Норма", window=10.0)]
+        assert [s.key for s in summarize(records, 'base_name')] == ["Норма", "Сбой"]
+
+    def test_missing_key(self):
+        (stats,) = summarize([record("База", window=1.0)], 'server')
+        assert stats.key == '—'
+
+
+class TestLog:
+
+    def test_append_and_read(self, tmp_path):
+        log = LaunchMetricsLog(tmp_path / 'metrics' / 'launches.jsonl')
+        base = Database1C(id='a', name="База", folder='/', connect='Srvr="app01";Ref="buh";')
+        for _ in range(3):
+            trace = start_trace(base, 'ENTERPRISE')
+            trace.mark(STAGE_WINDOW)
+            trace.outcome = OUTCOME_OK
+            assert log.append(trace)
+        with open(log.path, 'a', encoding='utf-8') as f:
+            f.write('{"оборванная строка\n')
+
+        records = log.read()
+        assert len(records) == 3
+        assert records[0]['server'] == 'app01' and records[0]['ref'] == 'buh'
+        assert '_t0' not in records[0] and '_key' not in records[0]
+        assert len(log.read(limit=2)) == 2
+
+    def test_missing_file(self, tmp_path):
+        assert LaunchMetricsLog(tmp_path / 'нет.jsonl').read() == []
+
+    def test_repeated_mark_keeps_first(self):
+        trace = start_trace(Database1C(id='a', name="База", folder='/', connect=''), 'DESIGNER')
+        first = trace.mark(STAGE_WINDOW)
+        assert trace.mark(STAGE_WINDOW) == first
+
+
+class TestNames:
+
+    def test_platform_version(self):
+        assert platform_version(r'C:\Program Files\1cv8\8.3.24.1500\bin\1cv8.exe') == '8.3.24.1500'
+        base = Database1C(id='a', name="База", folder='/', connect='', version='8.3.25.1374')
+        assert platform_version(r'C:\Program Files\1cv8\common\1cestart.exe', base) == '8.3.25.1374'
+        assert platform_version(None) == 'авто'
+
+    def test_server_name(self):
+        assert server_name('Srvr="app01:1541";Ref="buh";') == 'app01:1541'
+        assert server_name('File="C:\\Bases\\buh";') == FILE_SERVER
@@ -0,0 +1,132 @@
+"""Нечеткий поиск баз: инкрементальный sync и ранжирование (services/search_index.py)"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.database import Database1C
+from services.search_index import SearchIndex, extract_ref, normalize
+
+
+def make_base(base_id, name, **values):
+    values.setdefault('folder', '/')
+    values.setdefault('connect', f'File="C:\\Bases\\{base_id}";')
+    return Database1C(id=base_id, name=name, **values)
+
+
+def found(index, query, **kwargs):
+    return [base.id for base, _ in index.search(query, **kwargs)]
+
+
+def ranked(index, query):
+    """Результаты с рангом; при равном ранге порядок зависит от порядка индексации"""
+    return sorted((base.id, round(score, 9)) for base, score in index.search(query))
+
+
+@pytest.fixture
+def bases():
+    return [
+        make_base('buh', "Бухгалтерия предприятия", folder='/Рабочие'),
+        make_base('zup', "Зарплата и управление персоналом", folder='/Рабочие'),
+        make_base('ut', "Управление торговлей", connect='Srvr="app01";Ref="trade_main";'),
+        make_base('buh-copy', "Копия бухгалтерии", folder='/Архив', version='8.3.25.1374'),
+    ]
+
+
+@pytest.fixture
+def index(bases):
+    index = SearchIndex()
+    index.sync(bases)
+    return index
+
+
+class TestNormalize:
+
+    def test_normalize(self):
+        assert normalize("  Ёлка_Бухгалтерия, (копия)! ") == "елка бухгалтерия копия"
+        assert normalize(None) == ''
+
+    def test_extract_ref(self):
+        assert extract_ref('Srvr="app01";Ref="trade_main";') == 'trade_main'
+        assert extract_ref('File="C:\\Bases\\buh";') == 'C:\\Bases\\buh'
+        assert extract_ref(None) == ''
+
+
+class TestSync:
+
+    def test_unchanged_list_is_not_reindexed(self, index, bases):
+        assert index.sync(bases) == 0
+        assert len(index) == 4
+
+    def test_only_changed_bases_are_reindexed(self, index, bases):
+        bases[2].name = "Розница"
+        bases.append(make_base('new', "Новая база"))
+        del bases[0]
+        assert index.sync(bases) == 3
+        assert found(index, "розница") == ['ut']
+        assert found(index, "торговлей") == []
+        assert 'buh' not in found(index, "бухгалтерия")
+        assert found(index, "новая") == ['new']
+
+    def test_recreated_objects_are_returned(self, index, bases):
+        # Список перечитан из файла: те же значения, новые объекты
+        reread = [Database1C(**vars(base)) for base in bases]
+        assert index.sync(reread) == 0
+        assert index.search("зарплата")[0][0] is reread[1]
+
+    def test_sync_matches_fresh_index(self, index, bases):
+        bases[1].folder = '/Архив'
+        bases[3].connect = 'Srvr="app02";Ref="buh_old";'
+        index.sync(bases)
+        fresh = SearchIndex()
+        fresh.sync(bases)
+        for query in ("архив", "buh old", "бух", "рабочие", "упр"):
+            assert ranked(index, query) == ranked(fresh, query), query
+
+
+class TestSearch:
+
+    def test_every_word_must_match(self, index):
+        assert found(index, "бух архив") == ['buh-copy']
+
+    def test_typo_is_tolerated(self, index):
+        assert 'buh' in found(index, "бухгалтерея")
+
+    def test_fields_besides_name(self, index):
+        assert found(index, "trade") == ['ut']
+        assert found(index, "8.3.25") == ['buh-copy']
+
+    def test_short_word_filters_by_word_start(self, index):
+        assert set(found(index, "у")) == {'zup', 'ut'}
+
+    def test_name_match_ranks_above_folder_match(self):
+        index = SearchIndex()
+        index.sync([
+            make_base('folder', "Склад", folder='/Торговля'),
+            make_base('name', "Торговля"),
+        ])
+        assert found(index, "торговля") == ['name', 'folder']
+
+    def test_recent_launch_wins_a_tie(self, bases):
+        bases[0].last_run_time = datetime.now() - timedelta(days=30)
+        bases[3].last_run_time = datetime.now() - timedelta(hours=1)
+        index = SearchIndex()
+        index.sync(bases)
+        results = index.search("бухгалтер")
+        assert [base.id for base, _ in results][:2] == ['buh-copy', 'buh']
+        assert results[0][1] > results[1][1]
+
+    def test_limit(self, index):
+        assert len(index.search("а", limit=1)) == 1
+        assert index.search("   ") == []
+
+    def test_many_candidates_keep_most_recent(self, monkeypatch):
+        monkeypatch.setattr(SearchIndex, 'MAX_SCORED', 3)
+        now = datetime.now()
+        bases = [
+            make_base(f"b{n}", f"База {n}", last_run_time=now - timedelta(days=n))
+            for n in range(10)
+        ]
+        index = SearchIndex()
+        index.sync(bases)
+        assert found(index, "база") == ['b0', 'b1', 'b2']
@@ -0,0 +1,147 @@
+"""Выбор версии платформы по политике exact/branch/latest и резервным версиям (services/version_resolver.py)"""
+
+import pytest
+
+from models.database import Database1C
+from services import launch_command
+from services.platform_registry import STARTER_EXE, THICK_CLIENT_EXE, THIN_CLIENT_EXE, PlatformRegistry
+from services.version_resolver import VersionResolver, parse_fallbacks
+
+
+def make_base(version=None, **values):
+    values.setdefault('folder', '/')
+    values.setdefault('connect', 'File="C:\\Bases\\a";')
+    return Database1C(id='a', name="База a", version=version, **values)
+
+
+def install(root, version, *exe_names):
+    bin_dir = root / version / 'bin'
+    bin_dir.mkdir(parents=True)
+    for exe_name in exe_names or (THICK_CLIENT_EXE, THIN_CLIENT_EXE):
+        (bin_dir / exe_name).touch()
+
+
+@pytest.fixture
+def roots(tmp_path):
+    x64 = tmp_path / 'Program Files' / '1cv8'
+    x86 = tmp_path / 'Program Files (x86)' / '1cv8'
+    x64.mkdir(parents=True)
+    x86.mkdir(parents=True)
+    return x64, x86
+
+
+@pytest.fixture
+def registry(roots):
+    x64, x86 = roots
+    install(x64, '8.3.25.1374')
+    install(x64, '8.3.25.1500')
+    install(x64, '8.3.24.1700')
+    install(x64, '8.3.26.1000', THICK_CLIENT_EXE)
+    install(x86, '8.3.23.2000')
+    (x64 / 'common').mkdir()
+    (x64 / 'common' / STARTER_EXE).touch()
+    return PlatformRegistry([(x64, 'x86_64'), (x86, 'x86')])
+
+
+def version_of(path):
+    return path.parent.parent.name if path else None
+
+
+class TestBuildChain:
+
+    @pytest.fixture
+    def resolver(self, registry):
+        return VersionResolver(registry)
+
+    def test_exact_has_no_implicit_tail(self, resolver):
+        base = make_base('8.3.25.1374')
+        assert resolver.build_chain(base) == [(8, 3, 25, 1374)]
+
+    def test_exact_with_fallbacks(self, resolver):
+        base = make_base('8.3.25.1374', version_fallbacks='8.3.24; 8.3.23.2000, latest')
+        assert resolver.build_chain(base) == [(8, 3, 25, 1374), (8, 3, 24), (8, 3, 23, 2000), ()]
+
+    def test_branch(self, resolver):
+        base = make_base('8.3.25.1374', version_policy='branch')
+        assert resolver.build_chain(base) == [(8, 3, 25), ()]
+
+    def test_latest(self, resolver):
+        base = make_base('8.3.25.1374', version_policy='LATEST', version_fallbacks='8.3.24')
+        assert resolver.build_chain(base) == [(), (8, 3, 24), (8, 3, 25)]
+
+    def test_no_version_means_latest(self, resolver):
+        assert resolver.build_chain(make_base()) == [()]
+
+    def test_parse_fallbacks(self):
+        assert parse_fallbacks(None) == []
+        assert parse_fallbacks(' 8.3.25 ;; latest,8.3 ') == ['8.3.25', 'latest', '8.3']
+
+
+class TestResolve:
+
+    @pytest.fixture
+    def resolver(self, registry):
+        return VersionResolver(registry)
+
+    def test_exact(self, resolver):
+        base = make_base('8.3.25.1374', app_arch='x86_64')
+        assert version_of(resolver.resolve(base)) == '8.3.25.1374'
+
+    def test_missing_exact_version_is_not_resolved(self, resolver):
+        assert resolver.resolve(make_base('8.3.25.9999', app_arch='x86_64')) is None
+
+    def test_exact_falls_back_to_listed_versions_only(self, resolver):
+        base = make_base('8.3.25.9999', app_arch='x86_64', version_fallbacks='8.3.24')
+        assert version_of(resolver.resolve(base)) == '8.3.24.1700'
+
+    def test_branch_takes_latest_of_branch(self, resolver):
+        base = make_base('8.3.25.1374', app_arch='x86_64', version_policy='branch')
+        assert version_of(resolver.resolve(base)) == '8.3.25.1500'
+
+    def test_latest_respects_client_type(self, resolver):
+        base = make_base('8.3.25.1374', app_arch='x86_64', version_policy='latest')
+        assert version_of(resolver.resolve(base, 'thick')) == '8.3.26.1000'
+        # В 8.3.26 нет тонкого клиента
+        assert version_of(resolver.resolve(base, 'thin')) == '8.3.25.1500'
+
+    def test_other_arch_when_version_matches(self, resolver):
+        # Версия важнее разрядности
+        base = make_base('8.3.23.2000', app_arch='x86_64')
+        assert version_of(resolver.resolve(base)) == '8.3.23.2000'
+
+    def test_result_is_cached_until_registry_changes(self, resolver, roots):
+        base = make_base('8.3.27.100', app_arch='x86_64')
+        assert resolver.resolve(base) is None
+        install(roots[0], '8.3.27.100')
+        resolver.registry.refresh(force=True)
+        assert version_of(resolver.resolve(base)) == '8.3.27.100'
+
+    def test_changed_settings_are_not_served_from_cache(self, resolver):
+        base = make_base('8.3.25.1374', app_arch='x86_64')
+        resolver.resolve(base)
+        base.version = '8.3.24.1700'
+        assert version_of(resolver.resolve(base)) == '8.3.24.1700'
+
+
+class TestResolveExecutable:
+    """Без установленной версии: толстый клиент — через 1cestart.exe, тонкий — не запускается"""
+
+    @pytest.fixture(autouse=True)
+    def resolver(self, registry, monkeypatch):
+        resolver = VersionResolver(registry)
+        monkeypatch.setattr(launch_command, 'get_version_resolver', lambda: resolver)
+        monkeypatch.setattr(launch_command, 'get_platform_registry', lambda: registry)
+        return resolver
+
+    def test_missing_version_thick_uses_starter(self):
+        path = launch_command.resolve_executable(make_base('8.3.25.9999', app_arch='x86_64'))
+        assert path.name == STARTER_EXE
+
+    def test_missing_version_thin_is_not_launched(self):
+        base = make_base('8.3.25.9999', app_arch='x86_64', client_type='thin')
+        assert launch_command.resolve_executable(base) is None
+
+    def test_designer_always_thick(self):
+        base = make_base('8.3.26.1000', app_arch='x86_64', client_type='thin')
+        assert launch_command.resolve_executable(base, 'ENTERPRISE') is None
+        assert launch_command.resolve_executable(base, 'DESIGNER').name == THICK_CLIENT_EXE